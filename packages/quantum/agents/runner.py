@@ -1,5 +1,9 @@
 import os
-from typing import List, Dict, Any, Tuple
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 import logging
 from packages.quantum.agents.core import BaseQuantAgent, AgentSignal
 
@@ -18,6 +22,27 @@ def is_agent_enabled(key: str, default: bool = True) -> bool:
     return default
 
 
+def agent_max_workers() -> int:
+    """QUANT_AGENTS_MAX_WORKERS (default 1 = serial): agents evaluated
+    concurrently per run_agents call. The scanner already evaluates symbols
+    in parallel, so it stays serial there unless raised explicitly."""
+    try:
+        return max(1, int(os.environ.get("QUANT_AGENTS_MAX_WORKERS", "1")))
+    except ValueError:
+        return 1
+
+
+def agent_context_view(base: Mapping[str, Any], overlay: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Read-only agent context: ``overlay`` keys shadow ``base`` keys.
+
+    Neither mapping is copied — agents only read their context, so the
+    per-candidate ``dict.copy()`` + update is replaced by a proxy. Mutation
+    attempts raise TypeError.
+    """
+    return MappingProxyType(ChainMap(overlay, base))
+
+
 def build_agent_pipeline(phase: str = "all") -> List[BaseQuantAgent]:
     """
     Builds the list of Quant Agents based on environment configuration.
@@ -96,24 +121,56 @@ class AgentRunner:
     """
 
     @staticmethod
-    def run_agents(context: Dict[str, Any], agents: List[BaseQuantAgent]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def _timed_evaluate(agent: BaseQuantAgent, context: Mapping[str, Any]):
+        started = time.perf_counter()
+        try:
+            result = agent.evaluate(context)
+        except Exception as e:
+            result = e
+        return result, (time.perf_counter() - started) * 1000
+
+    @staticmethod
+    def run_agents(
+        context: Mapping[str, Any],
+        agents: List[BaseQuantAgent],
+        max_workers: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Runs a list of agents against the provided context.
 
+        Agents are independent (each reads the context, none writes it), so
+        with ``max_workers`` > 1 (default: QUANT_AGENTS_MAX_WORKERS) they are
+        evaluated concurrently. Aggregation always follows ``agents`` order,
+        so the output does not depend on completion order.
+
         Returns:
             signals_json: Dict mapping agent_id -> serialized AgentSignal
-            summary_json: Dict containing overall_score, decision, top_reasons, etc.
+            summary_json: Dict containing overall_score, decision, top_reasons,
+                agent_timings_ms, etc.
         """
         agent_signals = {}
         vetoed = False
         valid_scores = []
         all_reasons = []
         merged_constraints = {}
+        agent_timings_ms = {}
+
+        workers = min(max_workers or agent_max_workers(), len(agents))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(
+                    lambda a: AgentRunner._timed_evaluate(a, context), agents
+                ))
+        else:
+            outcomes = [AgentRunner._timed_evaluate(a, context) for a in agents]
 
-        # 1. Run each agent
-        for agent in agents:
+        # 1. Collect each agent's outcome
+        for agent, (outcome, elapsed_ms) in zip(agents, outcomes):
+            agent_timings_ms[agent.id] = round(elapsed_ms, 3)
             try:
-                signal: AgentSignal = agent.evaluate(context)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                signal: AgentSignal = outcome
 
                 # Store signal
                 agent_signals[agent.id] = signal.model_dump()
@@ -180,7 +237,8 @@ class AgentRunner:
             "vetoed": vetoed,
             "top_reasons": top_reasons,
             "active_constraints": merged_constraints,
-            "agent_count": len(agents)
+            "agent_count": len(agents),
+            "agent_timings_ms": agent_timings_ms,
         }
 
         return agent_signals, summary
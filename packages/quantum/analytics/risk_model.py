@@ -4,6 +4,7 @@ import numpy as np
 import logging
 from typing import List, Dict, Any, Tuple
 from packages.quantum.models import SpreadPosition
+from packages.quantum.core.math_engine import coskew_zeros
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,8 @@ class SpreadRiskModel:
         Returns:
             mu: Expected return vector (n,)
             sigma: Covariance matrix (n, n)
-            coskew: Coskewness tensor (n, n, n) - currently zeros
+            coskew: Coskewness (zeros) - a CoskewFactor, or the dense (n, n, n)
+                tensor when COSKEW_TENSOR_FREE is off
             collateral: List of collateral requirement per spread
         """
         n = len(self.assets)
@@ -167,7 +169,7 @@ class SpreadRiskModel:
         sigma = Sigma_syst + diag_ridge
 
         # Coskew (Mock for now, as requested)
-        coskew = np.zeros((n, n, n))
+        coskew = coskew_zeros(n)
 
         return mu, sigma, coskew, list(collateral)
 
@@ -8,10 +8,21 @@ Replaces threshold mutation with out-of-sample validated parameter tuning.
 3. On VALIDATE: measure out-of-sample performance
 4. Only PROMOTE if validation performance improves with confidence
 
+Evaluation is columnar: trades become NumPy arrays once per cycle, every
+grid value of a parameter is a boolean mask row, and the bootstrap draws one
+seeded resample-count matrix over the validate set that scores every
+candidate in a single matrix product (paired: all candidates see the same
+resampled trades).
+
 Feature flags:
-  AUTOTUNE_ENABLED       (default "0")
-  AUTOTUNE_AUTOPROMOTE   (default "0")
-  AUTOTUNE_MIN_TRADES    (default "30")
+  AUTOTUNE_ENABLED            (default "0")
+  AUTOTUNE_AUTOPROMOTE        (default "0")
+  AUTOTUNE_MIN_TRADES         (default "30")
+  AUTOTUNE_VECTORIZED         (default ON; explicit 0/false/no/off restores
+                               the per-candidate list path with the
+                               independent 500-draw random.choices bootstrap)
+  AUTOTUNE_BOOTSTRAP_SAMPLES  (default "10000", vectorized path)
+  AUTOTUNE_BOOTSTRAP_SEED     (default "0" — reproducible promotions)
 """
 
 import logging
@@ -22,11 +33,20 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
 AUTOTUNE_ENABLED = os.environ.get("AUTOTUNE_ENABLED", "0") == "1"
 AUTOTUNE_AUTOPROMOTE = os.environ.get("AUTOTUNE_AUTOPROMOTE", "0") == "1"
 AUTOTUNE_MIN_TRADES = int(os.environ.get("AUTOTUNE_MIN_TRADES", "30"))
+AUTOTUNE_VECTORIZED = (
+    os.environ.get("AUTOTUNE_VECTORIZED", "1").strip().lower() not in _EXPLICIT_FALSY
+)
+AUTOTUNE_BOOTSTRAP_SAMPLES = int(os.environ.get("AUTOTUNE_BOOTSTRAP_SAMPLES", "10000"))
+AUTOTUNE_BOOTSTRAP_SEED = int(os.environ.get("AUTOTUNE_BOOTSTRAP_SEED", "0"))
 
 # Promotion thresholds
 MIN_IMPROVEMENT_PCT = 10.0      # Candidate must beat current by 10%+
@@ -34,6 +54,7 @@ MIN_CONFIDENCE = 0.70           # Bootstrap confidence threshold
 MAX_DRAWDOWN_INCREASE = 0.20    # Drawdown can't increase by > 20%
 MIN_VALIDATE_TRADES = 15        # Minimum trades in validation set
 MIN_WIN_RATE = 0.40             # Win rate floor for promotion
+CONFIDENCE_INTERVAL = (5.0, 95.0)  # Percentiles of bootstrapped P&L delta
 
 
 @dataclass
@@ -59,6 +80,90 @@ PARAMETER_SPACE = [
 ]
 
 
+def _candidate_grid(param: ParameterCandidate) -> List[float]:
+    """Grid values from min to max (inclusive) in ``step`` increments."""
+    candidates = []
+    v = param.min_value
+    while v <= param.max_value + 1e-9:
+        candidates.append(round(v, 4))
+        v += param.step
+    return candidates
+
+
+@dataclass
+class TradeColumns:
+    """Trade history as columnar arrays, converted once per cycle."""
+    pnl: np.ndarray     # pnl_realized
+    score: np.ndarray   # ev_predicted, falling back to pnl_predicted
+
+    @classmethod
+    def from_trades(cls, trades: List[Dict]) -> "TradeColumns":
+        return cls(
+            pnl=np.array(
+                [float(t.get("pnl_realized") or 0) for t in trades], dtype=float
+            ),
+            score=np.array(
+                [float(t.get("ev_predicted") or t.get("pnl_predicted") or 0) for t in trades],
+                dtype=float,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+
+def _param_masks(
+    cols: TradeColumns, param_name: str, values: np.ndarray
+) -> np.ndarray:
+    """(len(values), n_trades) mask: row i marks the trades taken at values[i].
+
+    Mirrors ``WalkForwardAutotune._filter_trades_by_param`` exactly.
+    """
+    n = len(cols)
+    if param_name == "min_score_threshold":
+        return cols.score[None, :] >= values[:, None]
+    if param_name == "max_positions_open":
+        keep = (values * n / 10).astype(int)
+        masks = np.arange(n)[None, :] < keep[:, None]
+        masks[keep <= 0] = True  # empty prefix falls back to every trade
+        return masks
+    return np.ones((len(values), n), dtype=bool)
+
+
+def _masked_metrics(pnl: np.ndarray, mask: np.ndarray) -> Dict[str, Any]:
+    """``_compute_metrics`` over the trades selected by ``mask``."""
+    pnls = pnl[mask]
+    total = len(pnls)
+    if not total:
+        return {
+            "total_pnl": 0, "win_rate": 0, "max_drawdown": 0,
+            "avg_pnl": 0, "trade_count": 0,
+        }
+    cumulative = np.cumsum(pnls)
+    peak = np.maximum.accumulate(np.maximum(cumulative, 0.0))
+    total_pnl = float(cumulative[-1])
+    return {
+        "total_pnl": round(total_pnl, 2),
+        "avg_pnl": round(total_pnl / total, 2),
+        "win_rate": round(int((pnls > 0).sum()) / total, 4),
+        "max_drawdown": round(float((peak - cumulative).max()), 2),
+        "trade_count": total,
+    }
+
+
+def _bootstrap_counts(n_trades: int, n_bootstrap: int, seed: int) -> np.ndarray:
+    """(n_bootstrap, n_trades) resample counts from ONE seeded index matrix.
+
+    Row b counts how often each trade was drawn in resample b, so any
+    per-candidate resampled total is ``counts @ (mask * pnl)``.
+    """
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, n_trades, size=(n_bootstrap, n_trades))
+    flat = idx + (np.arange(n_bootstrap) * n_trades)[:, None]
+    return np.bincount(flat.ravel(), minlength=n_bootstrap * n_trades) \
+        .reshape(n_bootstrap, n_trades).astype(np.int32)
+
+
 class WalkForwardAutotune:
     """Walk-forward parameter optimization with promotion/demotion rules."""
 
@@ -114,6 +219,16 @@ class WalkForwardAutotune:
         # Load current config
         current_config = self._load_current_config(user_id, cohort_name)
 
+        # Columnar once per cycle; the bootstrap draw is shared by every
+        # parameter (same validate set, same resamples).
+        train_cols = validate_cols = draws = None
+        if AUTOTUNE_VECTORIZED:
+            train_cols = TradeColumns.from_trades(train_set)
+            validate_cols = TradeColumns.from_trades(validate_set)
+            draws = _bootstrap_counts(
+                len(validate_cols), AUTOTUNE_BOOTSTRAP_SAMPLES, AUTOTUNE_BOOTSTRAP_SEED
+            )
+
         # Evaluate each parameter
         evaluations = []
         for param_def in PARAMETER_SPACE:
@@ -126,7 +241,12 @@ class WalkForwardAutotune:
                 step=param_def.step,
             )
 
-            result = self._evaluate_parameter(param, train_set, validate_set)
+            if AUTOTUNE_VECTORIZED:
+                result = self._evaluate_parameter_vectorized(
+                    param, train_cols, validate_cols, draws
+                )
+            else:
+                result = self._evaluate_parameter(param, train_set, validate_set)
             evaluations.append(result)
 
         # Apply promotion rules
@@ -181,11 +301,7 @@ class WalkForwardAutotune:
         current and candidate on the validate set.
         """
         # Generate candidate values
-        candidates = []
-        v = param.min_value
-        while v <= param.max_value + 1e-9:
-            candidates.append(round(v, 4))
-            v += param.step
+        candidates = _candidate_grid(param)
 
         # Find best on train set
         best_train_pnl = float("-inf")
@@ -246,6 +362,87 @@ class WalkForwardAutotune:
             "candidate_validate_trades": len(candidate_filtered),
         }
 
+    def _evaluate_parameter_vectorized(
+        self,
+        param: ParameterCandidate,
+        train: TradeColumns,
+        validate: TradeColumns,
+        draws: np.ndarray,
+    ) -> Dict[str, Any]:
+        """
+        Columnar ``_evaluate_parameter``: same selection rule, same output
+        keys, with every grid value scored at once.
+
+        Confidence is the paired bootstrap P(candidate total > current
+        total) over the shared resample matrix ``draws``; the interval is
+        the CONFIDENCE_INTERVAL percentiles of that P&L delta.
+        """
+        values = np.array(_candidate_grid(param), dtype=float)
+
+        # Best on train: first grid value with the highest P&L among those
+        # taking >= 3 trades (ties keep the lower value, like the loop).
+        train_masks = _param_masks(train, param.name, values)
+        train_pnl = train_masks @ train.pnl
+        eligible = train_masks.sum(axis=1) >= 3
+        best_value = param.current_value
+        if eligible.any():
+            best_value = float(values[np.argmax(np.where(eligible, train_pnl, -np.inf))])
+
+        # Row 0 = current, row 1 = chosen candidate, then the whole grid.
+        rows = np.concatenate(([param.current_value, best_value], values))
+        masks = _param_masks(validate, param.name, rows)
+        totals = draws @ (masks * validate.pnl).T  # (n_bootstrap, len(rows))
+        delta = totals[:, 1] - totals[:, 0]
+
+        current_metrics = _masked_metrics(validate.pnl, masks[0])
+        candidate_metrics = _masked_metrics(validate.pnl, masks[1])
+
+        confidence = 0.0
+        interval = [0.0, 0.0]
+        grid_confidence = np.zeros(len(values))
+        if masks[0].any() and len(draws):
+            # Every grid value against current in the same pass.
+            grid_confidence = (totals[:, 2:] > totals[:, [0]]).mean(axis=0)
+            grid_confidence[~masks[2:].any(axis=1)] = 0.0
+            if masks[1].any():
+                confidence = float((delta > 0).mean())
+                interval = [
+                    round(float(q), 2) for q in np.percentile(delta, CONFIDENCE_INTERVAL)
+                ]
+
+        improvement = 0.0
+        if current_metrics["total_pnl"] != 0:
+            improvement = (
+                (candidate_metrics["total_pnl"] - current_metrics["total_pnl"])
+                / abs(current_metrics["total_pnl"])
+                * 100
+            )
+        elif candidate_metrics["total_pnl"] > 0:
+            improvement = 100.0
+
+        return {
+            "parameter": param.name,
+            "current_value": param.current_value,
+            "candidate_value": best_value,
+            "current_validate_pnl": current_metrics["total_pnl"],
+            "candidate_validate_pnl": candidate_metrics["total_pnl"],
+            "current_win_rate": current_metrics["win_rate"],
+            "candidate_win_rate": candidate_metrics["win_rate"],
+            "current_max_drawdown": current_metrics["max_drawdown"],
+            "candidate_max_drawdown": candidate_metrics["max_drawdown"],
+            "improvement_pct": round(improvement, 2),
+            "confidence": round(confidence, 4),
+            "pnl_delta_interval": interval,
+            "grid_confidence": [
+                [float(v), round(float(c), 4)] for v, c in zip(values, grid_confidence)
+            ],
+            "bootstrap_samples": len(draws),
+            "train_trades": len(train),
+            "validate_trades": len(validate),
+            "current_validate_trades": int(current_metrics["trade_count"]),
+            "candidate_validate_trades": int(candidate_metrics["trade_count"]),
+        }
+
     def _filter_trades_by_param(
         self,
         trades: List[Dict],
@@ -69,6 +69,7 @@ from packages.quantum.services.universe_service import UniverseService
 from packages.quantum.services.analytics_service import AnalyticsService
 from packages.quantum.optimizer import router as optimizer_router
 from packages.quantum.market_data import calculate_portfolio_inputs, PolygonService
+from packages.quantum.core.math_engine import coskew_zeros
 # New Services for Cash-Aware Workflow
 from packages.quantum.services.workflow_orchestrator import run_morning_cycle, run_midday_cycle, run_weekly_report
 from packages.quantum.services.market_data_truth_layer import MarketDataTruthLayer
@@ -761,7 +762,7 @@ async def execute_rebalance(
              # Apply Regime Scaling
              sigma = sigma * (sigma_multiplier ** 2)
 
-             coskew = np.zeros((n, n, n))
+             coskew = coskew_zeros(n)
 
              # F-REBAL-COMPUTE: `external_risk_scaler` is not a parameter of
              # _compute_portfolio_weights (TypeError). The regime risk scaler
@@ -1109,7 +1110,7 @@ async def preview_rebalance(
                          if i==j: sigma[i, j] = 0.1
 
              sigma = sigma * (sigma_multiplier ** 2)
-             coskew = np.zeros((n, n, n))
+             coskew = coskew_zeros(n)
 
              target_weights, _, _, trace_id, _, _, _, _ = _compute_portfolio_weights(
                  mu, sigma, coskew, tickers, current_spreads, opt_req, user_id, total_val, cash
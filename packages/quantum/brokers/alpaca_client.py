@@ -14,10 +14,12 @@ import logging
 import os
 import random
 import time
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from packages.quantum.services.rate_governor import get_rate_governor
+
 logger = logging.getLogger(__name__)
 
 
@@ -147,19 +149,29 @@ class AlpacaClient:
         - Base 500ms, max 60s, up to 10 retries
         - Auto re-auth on 401/403 (once per call chain)
         - Broad transient detection: 429, 5xx, timeout, connection errors
+        - Every attempt acquires from the shared rate governor; a 429 blocks
+          the bucket for all callers
         """
         last_err = None
         auth_refreshed = False  # Only attempt re-auth once per call chain
         attempts_made = 0  # honest count — the raise message must never claim MAX_RETRIES on an early break
+        governor = get_rate_governor()
+        endpoint_class = (
+            "data" if getattr(fn, "__self__", None) is getattr(self, "_data_client", None)
+            else "trading"
+        )
 
         for attempt in range(self.MAX_RETRIES):
             attempts_made = attempt + 1
             try:
+                governor.acquire("alpaca", endpoint_class)
                 result = fn(*args, **kwargs)
                 return result
             except Exception as e:
                 last_err = e
                 err_str = str(e).lower()
+                if "429" in err_str or "too many requests" in err_str:
+                    governor.penalize("alpaca", endpoint_class)
 
                 # Check for auth errors first — try re-auth once
                 is_auth_error = any(k in err_str for k in self._AUTH_KEYWORDS)
@@ -574,6 +586,55 @@ class AlpacaClient:
         orders = self._call_with_retry(self._client.get_orders, req)
         return [self._serialize_order(o) for o in orders]
 
+    def list_orders(
+        self,
+        status: str = "all",
+        after: Optional[datetime] = None,
+        page_size: int = 500,
+        max_pages: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """List orders (legs nested) submitted after ``after``, paging
+        oldest-first until a short page or ``max_pages``.
+
+        Drives the bulk order-sync reconcile: a few calls replace one
+        get_order per pending order. The result may be truncated at
+        ``max_pages``; callers fall back to get_order for any id it lacks.
+        """
+        from alpaca.common.enums import Sort
+        from alpaca.trading.requests import GetOrdersRequest
+        from alpaca.trading.enums import QueryOrderStatus
+
+        status_map = {
+            "open": QueryOrderStatus.OPEN,
+            "closed": QueryOrderStatus.CLOSED,
+            "all": QueryOrderStatus.ALL,
+        }
+        out: List[Dict[str, Any]] = []
+        seen = set()
+        cursor = after
+        for _ in range(max_pages):
+            req = GetOrdersRequest(
+                status=status_map.get(status, QueryOrderStatus.ALL),
+                limit=page_size,
+                after=cursor,
+                direction=Sort.ASC,
+                nested=True,
+            )
+            page = self._call_with_retry(self._client.get_orders, req) or []
+            for order in page:
+                serialized = self._serialize_order(order)
+                if serialized["alpaca_order_id"] not in seen:
+                    seen.add(serialized["alpaca_order_id"])
+                    out.append(serialized)
+            if len(page) < page_size:
+                break
+            last = page[-1]
+            next_cursor = last.submitted_at or last.created_at
+            if next_cursor is None or next_cursor == cursor:
+                break
+            cursor = next_cursor
+        return out
+
     def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """Cancel an open order."""
         logger.info(f"[ALPACA] Cancelling order: {order_id}")
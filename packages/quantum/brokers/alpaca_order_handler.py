@@ -46,6 +46,10 @@ ACK_TIMEOUT_SECONDS = 10.0
 # never, so the precise window matters little — the price does.
 IDLE_WATCHDOG_SECONDS = 90
 
+# Bulk order sync: the closed-order sweep starts this far before the oldest
+# pending row's submitted_at (clock skew between our stamp and the broker's).
+BULK_SYNC_MARGIN_SECONDS = 300
+
 # Terminal broker-reject classification (06-12). Rejection reasons that can
 # never succeed by retrying — fail after the FIRST attempt, one alert, never
 # hammer the gateway. NOTE: the 06-12 "30-retry storm" reading was itself a
@@ -751,10 +755,49 @@ def _parse_iso_timestamp(ts: str) -> datetime:
         return datetime.now(timezone.utc)
 
 
+def _parse_submitted_at(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def fetch_broker_orders(
+    alpaca: AlpacaClient,
+    pending_rows: List[Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Bulk broker snapshot for the order sync: every OPEN order plus every
+    order submitted since the oldest pending row (less a margin), keyed by
+    alpaca_order_id.
+
+    A handful of paged ``list_orders`` calls replace one ``get_order`` per
+    pending row. The map is a cache, not the truth set: a pending row whose
+    order is absent (no parseable submitted_at, or the page cap truncated
+    the window) is fetched individually by ``poll_pending_orders``. RAISEs
+    on broker errors — the caller falls back to per-order polling.
+    """
+    stamps = [_parse_submitted_at(r.get("submitted_at")) for r in pending_rows]
+    stamps = [t for t in stamps if t is not None]
+    orders = alpaca.list_orders(status="open")
+    if stamps:
+        after = min(stamps) - timedelta(seconds=BULK_SYNC_MARGIN_SECONDS)
+        orders = list(orders) + list(alpaca.list_orders(status="closed", after=after))
+    return {
+        o["alpaca_order_id"]: o
+        for o in orders
+        if isinstance(o, dict) and o.get("alpaca_order_id")
+    }
+
+
 def poll_pending_orders(
     alpaca: AlpacaClient,
     supabase,
     user_id: str,
+    broker_orders: Optional[Dict[str, Dict[str, Any]]] = None,
+    alpaca_order_ids: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Check status of all submitted Alpaca orders and sync back.
@@ -766,6 +809,11 @@ def poll_pending_orders(
       the order ends watchdog_cancelled and its suggestion stays pending.
     - Retry on poll failures (transient)
     - Fill detection with position creation
+
+    ``broker_orders`` (from ``fetch_broker_orders`` or a trade-update event)
+    replaces the per-order ``get_order`` for every id it holds, and a still-
+    working order whose broker state is unchanged is not rewritten.
+    ``alpaca_order_ids`` narrows the poll to those orders.
     """
     # Get orders with Alpaca IDs that are still pending
     port_res = supabase.table("paper_portfolios") \
@@ -778,13 +826,14 @@ def poll_pending_orders(
     # Include needs_manual_review: the outer retry can exhaust while Alpaca
     # actually filled on a prior attempt. If alpaca_order_id is set, Alpaca's
     # record is authoritative and polling will reconcile the fill.
-    orders_res = supabase.table("paper_orders") \
-        .select("id, alpaca_order_id, status, submitted_at, broker_status, position_id, side, order_json, suggestion_id") \
+    orders_query = supabase.table("paper_orders") \
+        .select("id, alpaca_order_id, status, submitted_at, broker_status, filled_qty, position_id, side, order_json, suggestion_id") \
         .in_("status", ["submitted", "working", "partial", "needs_manual_review"]) \
         .in_("portfolio_id", p_ids) \
-        .not_.is_("alpaca_order_id", "null") \
-        .execute()
-    orders = orders_res.data or []
+        .not_.is_("alpaca_order_id", "null")
+    if alpaca_order_ids is not None:
+        orders_query = orders_query.in_("alpaca_order_id", list(alpaca_order_ids))
+    orders = orders_query.execute().data or []
 
     synced = 0
     fills = 0
@@ -792,6 +841,8 @@ def poll_pending_orders(
     cancels = 0
     unchanged = 0
     watchdog_cancels = 0
+    broker_fetches = 0
+    writes_skipped = 0
     errors = []
 
     now_utc = datetime.now(timezone.utc)
@@ -801,7 +852,10 @@ def poll_pending_orders(
         alpaca_id = order["alpaca_order_id"]
 
         try:
-            alpaca_order = alpaca.get_order(alpaca_id)
+            alpaca_order = (broker_orders or {}).get(alpaca_id)
+            if alpaca_order is None:
+                alpaca_order = alpaca.get_order(alpaca_id)
+                broker_fetches += 1
             alpaca_status = alpaca_order.get("status", "")
 
             # Map Alpaca status → internal
@@ -984,9 +1038,43 @@ def poll_pending_orders(
                     broker_failed_at or broker_canceled_at or now_utc.isoformat()
                 )
 
-            supabase.table("paper_orders").update(update).eq("id", order_id).execute()
+            # Bulk diff: a still-working order whose broker state matches the
+            # row has nothing to apply — skip the no-op rewrite.
+            if (
+                broker_orders is not None
+                and internal_status == "working"
+                and order.get("status") == "working"
+                and order.get("broker_status") == alpaca_status
+                and float(order.get("filled_qty") or 0) == filled_qty
+            ):
+                unchanged += 1
+                writes_skipped += 1
+                continue
+
+            # Compare-and-set on the status this poll read: the trade-update
+            # stream and the order_sync cron can reconcile the same order at
+            # once, and only the caller that moves the row may run the fill
+            # side effects below (position close/commit, GTC exit placement).
+            cas_res = supabase.table("paper_orders").update(update) \
+                .eq("id", order_id).eq("status", order["status"]).execute()
+            if not (cas_res.data or []):
+                logger.info(
+                    f"[ALPACA_HANDLER] Order already reconciled elsewhere: "
+                    f"order={order_id} status={order['status']}"
+                )
+                writes_skipped += 1
+                continue
             synced += 1
 
+            # New fill quantity (full or partial) moves equity and buying
+            # power — drop the cached account snapshot so the next risk
+            # gate reads the post-fill account instead of a ≤TTL-old one.
+            if filled_qty > float(order.get("filled_qty") or 0):
+                from packages.quantum.services.equity_state import (
+                    invalidate_account_snapshot,
+                )
+                invalidate_account_snapshot(user_id)
+
             # #101 Component 3: loud alert when the broker pre-rejects an
             # order. Pre-fix, 22 CSX close orders rejected silently over 36+
             # hours — only force_close + warn alerts fired, none surfacing
@@ -1162,6 +1250,8 @@ def poll_pending_orders(
         "fills": fills, "partials": partials,
         "cancels": cancels, "unchanged": unchanged,
         "watchdog_cancels": watchdog_cancels,
+        "broker_fetches": broker_fetches,
+        "writes_skipped": writes_skipped,
         "errors": errors,
     }
 
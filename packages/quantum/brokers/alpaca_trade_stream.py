@@ -0,0 +1,180 @@
+"""
+Alpaca trade-update stream consumer.
+
+Applies fills, partials and cancels as the broker reports them instead of
+waiting for the next alpaca_order_sync run. Each event carries the full
+serialized order, so it is reconciled through the same poll_pending_orders
+path (watchdog, residual-fill custody, rejection alerts, position
+open/close) scoped to that one order — no extra broker call.
+
+The consumer is source-agnostic: ``consume()`` takes any iterable of
+``{"event": str, "order": dict}`` events. ``alpaca_trade_update_source``
+adapts alpaca-py's TradingStream (websocket) to that shape; tests feed a
+plain list. The 5-minute order sync stays the safety net for anything the
+stream misses (disconnects, restarts).
+
+Environment variables:
+    ALPACA_TRADE_STREAM_ENABLED — explicit opt-in: exactly "1" runs the
+                                  stream; anything else leaves it off
+"""
+
+import logging
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from packages.quantum.brokers.alpaca_client import AlpacaClient
+from packages.quantum.brokers.alpaca_order_handler import poll_pending_orders
+
+logger = logging.getLogger(__name__)
+
+# Events that change an order's sync-relevant state. new/accepted/pending_*
+# carry nothing the next poll would apply.
+APPLIED_EVENTS = frozenset({
+    "fill", "partial_fill", "canceled", "expired", "rejected", "replaced",
+    "done_for_day",
+})
+
+_PENDING_STATUSES = ["submitted", "working", "partial", "needs_manual_review"]
+
+_STOP = object()
+
+
+def trade_stream_enabled() -> bool:
+    """BEHAVIORAL / explicit opt-in: DARK unless the value is exactly ``1``."""
+    return (os.environ.get("ALPACA_TRADE_STREAM_ENABLED") or "").strip() == "1"
+
+
+class TradeUpdateConsumer:
+    """Reconciles one paper_orders row per broker trade-update event."""
+
+    def __init__(self, alpaca: AlpacaClient, supabase) -> None:
+        self.alpaca = alpaca
+        self.supabase = supabase
+        self.counts: Dict[str, int] = {
+            "events": 0, "ignored": 0, "unknown_order": 0,
+            "applied": 0, "fills": 0, "errors": 0,
+        }
+
+    def handle(self, event: Dict[str, Any]) -> str:
+        """Apply one event. Returns ignored | unknown_order | applied | error."""
+        self.counts["events"] += 1
+        kind = str(event.get("event") or "")
+        order = event.get("order") or {}
+        alpaca_id = order.get("alpaca_order_id")
+        if kind not in APPLIED_EVENTS or not alpaca_id:
+            self.counts["ignored"] += 1
+            return "ignored"
+
+        try:
+            rows = self.supabase.table("paper_orders") \
+                .select("id, user_id") \
+                .eq("alpaca_order_id", alpaca_id) \
+                .in_("status", _PENDING_STATUSES) \
+                .execute().data or []
+            if not rows or not rows[0].get("user_id"):
+                # Not ours, already terminal, or a shadow order the sync
+                # never owns — nothing to apply.
+                self.counts["unknown_order"] += 1
+                return "unknown_order"
+
+            result = poll_pending_orders(
+                self.alpaca, self.supabase, rows[0]["user_id"],
+                broker_orders={alpaca_id: order},
+                alpaca_order_ids=[alpaca_id],
+            )
+        except Exception as e:
+            logger.error(f"[ALPACA_STREAM] {kind} apply failed: alpaca={alpaca_id} error={e}")
+            self.counts["errors"] += 1
+            return "error"
+
+        if result.get("errors"):
+            self.counts["errors"] += len(result["errors"])
+            return "error"
+        self.counts["applied"] += 1
+        self.counts["fills"] += int(result.get("fills") or 0)
+        return "applied"
+
+    def consume(self, source: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Apply every event from ``source`` until it is exhausted. A bad
+        event is counted and logged, never stops the stream."""
+        for event in source:
+            self.handle(event)
+        return dict(self.counts)
+
+
+def serialize_trade_update(data: Any) -> Dict[str, Any]:
+    """alpaca-py TradeUpdate → ``{"event", "order"}`` consumer event."""
+    event = getattr(data, "event", None)
+    return {
+        "event": str(getattr(event, "value", event) or ""),
+        "order": AlpacaClient._serialize_order(data.order),
+    }
+
+
+def alpaca_trade_update_source(
+    alpaca: AlpacaClient,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield trade-update events from Alpaca's websocket.
+
+    TradingStream runs its own event loop, so it lives on a daemon thread
+    and hands events over a queue; the generator ends when ``stop`` is set
+    or the stream thread exits.
+    """
+    from alpaca.trading.stream import TradingStream
+
+    events: "queue.Queue[Any]" = queue.Queue()
+    stop = stop or threading.Event()
+    stream = TradingStream(alpaca.api_key, alpaca.secret_key, paper=alpaca.paper)
+
+    async def _on_update(data):
+        events.put(serialize_trade_update(data))
+
+    def _run():
+        try:
+            stream.subscribe_trade_updates(_on_update)
+            stream.run()
+        except Exception as e:
+            logger.error(f"[ALPACA_STREAM] stream stopped: {e}")
+        finally:
+            events.put(_STOP)
+
+    threading.Thread(target=_run, name="alpaca-trade-stream", daemon=True).start()
+    try:
+        while not stop.is_set():
+            try:
+                item = events.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if item is _STOP:
+                return
+            yield item
+    finally:
+        try:
+            stream.stop()
+        except Exception as e:
+            logger.debug(f"[ALPACA_STREAM] stop failed: {e}")
+
+
+def run_trade_update_stream(stop: Optional[threading.Event] = None) -> Dict[str, Any]:
+    """Run the stream consumer until ``stop`` (or the stream) ends. No-op
+    unless ALPACA_TRADE_STREAM_ENABLED=1 and Alpaca is configured."""
+    if not trade_stream_enabled():
+        return {"status": "disabled"}
+
+    from packages.quantum.brokers.alpaca_client import get_alpaca_client
+    from packages.quantum.jobs.handlers.utils import get_admin_client
+
+    alpaca = get_alpaca_client()
+    if not alpaca:
+        return {"status": "no_alpaca_client"}
+    consumer = TradeUpdateConsumer(alpaca, get_admin_client())
+    counts = consumer.consume(alpaca_trade_update_source(alpaca, stop))
+    logger.info(f"[ALPACA_STREAM] stream ended: {counts}")
+    return {"status": "stopped", **counts}
+
+
+if __name__ == "__main__":
+    run_trade_update_stream()
@@ -1,6 +1,94 @@
+import os
+
 import numpy as np
 import pandas as pd
 
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+
+def is_tensor_free_coskew_enabled() -> bool:
+    """COSKEW_TENSOR_FREE — default ON; explicit 0/false/no/off restores the dense N×N×N tensor."""
+    raw = os.getenv("COSKEW_TENSOR_FREE", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+class CoskewFactor:
+    """
+    Coskewness kept as its factor: the centered T x N returns.
+
+    The dense tensor is M3[i,j,k] = sum_t R[t,i] R[t,j] R[t,k] / (T-1), so the
+    cubic form contracts without ever building it:
+        M3(w,w,w) = sum_t (R w)_t^3 / (T-1)          O(T*N)
+        grad      = 3 R^T (R w)^2 / (T-1)            O(T*N)
+    """
+
+    def __init__(self, centered: np.ndarray, scale: float):
+        self.centered = np.asarray(centered, dtype=float)
+        self.scale = float(scale)
+
+    @classmethod
+    def from_returns(cls, returns: np.ndarray) -> "CoskewFactor":
+        returns = np.asarray(returns, dtype=float)
+        centered = returns - np.mean(returns, axis=0)
+        return cls(centered, 1.0 / (len(returns) - 1))
+
+    @classmethod
+    def zeros(cls, n_assets: int) -> "CoskewFactor":
+        # No observations: contracts to 0 with a zero gradient.
+        return cls(np.zeros((0, n_assets)), 0.0)
+
+    @property
+    def n_assets(self) -> int:
+        return self.centered.shape[1]
+
+    def contract(self, w: np.ndarray) -> float:
+        if not self.centered.shape[0]:
+            return 0.0
+        p = self.centered @ w
+        return float(np.dot(p * p, p) * self.scale)
+
+    def gradient(self, w: np.ndarray) -> np.ndarray:
+        if not self.centered.shape[0]:
+            return np.zeros(self.n_assets)
+        p = self.centered @ w
+        return 3.0 * self.scale * (self.centered.T @ (p * p))
+
+    def to_tensor(self) -> np.ndarray:
+        c = self.centered
+        return np.einsum('ti,tj,tk->ijk', c, c, c) * self.scale
+
+
+def coskew_zeros(n_assets: int):
+    """Zero coskewness in whichever form the optimizer path is configured for."""
+    if is_tensor_free_coskew_enabled():
+        return CoskewFactor.zeros(n_assets)
+    return np.zeros((n_assets, n_assets, n_assets))
+
+
+def as_coskew_tensor(coskew) -> np.ndarray:
+    """Dense N×N×N tensor (for the polynomial/QCI builders, which index terms)."""
+    if isinstance(coskew, CoskewFactor):
+        return coskew.to_tensor()
+    return np.asarray(coskew)
+
+
+def coskew_contract(coskew, w: np.ndarray) -> float:
+    if isinstance(coskew, CoskewFactor):
+        return coskew.contract(w)
+    return float(np.einsum('ijk,i,j,k->', coskew, w, w, w))
+
+
+def coskew_gradient(coskew, w: np.ndarray) -> np.ndarray:
+    if isinstance(coskew, CoskewFactor):
+        return coskew.gradient(w)
+    # d/dw_m of sum C_ijk w_i w_j w_k, without assuming C is symmetric.
+    return (
+        np.einsum('mjk,j,k->m', coskew, w, w)
+        + np.einsum('imk,i,k->m', coskew, w, w)
+        + np.einsum('ijm,i,j->m', coskew, w, w)
+    )
+
+
 class PortfolioMath:
     def __init__(self, returns_df: pd.DataFrame):
         self.returns = returns_df.values # Matrix T x N
@@ -35,3 +123,12 @@ class PortfolioMath:
         centered = self.returns - np.mean(self.returns, axis=0)
         M3 = np.einsum('ti,tj,tk->ijk', centered, centered, centered)
         return M3 / (len(self.returns) - 1)
+
+    def get_coskewness_factor(self):
+        # Same moments as get_coskewness_tensor, O(T*N) memory.
+        return CoskewFactor.from_returns(self.returns)
+
+    def get_coskewness(self):
+        if is_tensor_free_coskew_enabled():
+            return self.get_coskewness_factor()
+        return self.get_coskewness_tensor()
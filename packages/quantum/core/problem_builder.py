@@ -1,3 +1,6 @@
+from packages.quantum.core.math_engine import as_coskew_tensor
+
+
 def build_polynomial(mu, sigma, coskew, lambda_risk=1.0, gamma_skew=0.0):
     """
     Constructs the polynomial terms for the objective function.
@@ -6,7 +9,7 @@ def build_polynomial(mu, sigma, coskew, lambda_risk=1.0, gamma_skew=0.0):
     Args:
         mu (1D): Expected returns
         sigma (2D): Covariance
-        coskew (3D): Co-skewness
+        coskew (3D): Co-skewness tensor or CoskewFactor
         lambda_risk: Penalty for variance (Risk Aversion)
         gamma_skew: Reward for positive skew (Tail Risk preference)
     """
@@ -35,6 +38,7 @@ def build_polynomial(mu, sigma, coskew, lambda_risk=1.0, gamma_skew=0.0):
     # 3. Cubic Terms (Skewness)
     # We want to MAXIMIZE Positive Skewness, so we MINIMIZE negative Skew.
     if gamma_skew != 0:
+        coskew = as_coskew_tensor(coskew)
         for i in range(num_assets):
             for j in range(num_assets):
                 for k in range(num_assets):
@@ -3,6 +3,8 @@ import time
 import requests
 import numpy as np
 
+from packages.quantum.core.math_engine import as_coskew_tensor
+
 try:
     from qci_client import QciClient
     _QCI_IMPORT_ERROR = None
@@ -74,6 +76,7 @@ class QciDiracAdapter:
 
         # 4. Skewness (Cubic) - The expensive part
         if gamma > 0:
+            coskew = as_coskew_tensor(coskew)
             for i in range(num_assets):
                 for j in range(num_assets):
                     for k in range(num_assets):
@@ -2,6 +2,12 @@ import numpy as np
 from scipy.optimize import minimize
 from typing import List, Dict, Any, Tuple
 
+from packages.quantum.core.math_engine import (
+    coskew_contract,
+    coskew_gradient,
+    is_tensor_free_coskew_enabled,
+)
+
 class SurrogateOptimizer:
     def solve(self, mu, sigma, coskew, constraints,
               current_weights: np.ndarray = None,
@@ -14,7 +20,7 @@ class SurrogateOptimizer:
         Args:
             mu: Expected returns (n,)
             sigma: Covariance matrix (n,n)
-            coskew: Coskewness tensor (n,n,n)
+            coskew: Coskewness tensor (n,n,n) or CoskewFactor (centered T x n returns)
             constraints: Dictionary of scalar constraints (risk_aversion, etc.)
             current_weights: Existing portfolio weights (n,) for turnover penalty.
             greek_sensitivities: Dict of greek sensitivity vectors (n,), e.g. {'delta': [...], 'vega': [...]}.
@@ -49,8 +55,8 @@ class SurrogateOptimizer:
             # Term 3: Skewness (maximize -> minimize negative)
             skew_term = 0
             if gamma != 0:
-                # np.einsum is the cleanest way to do cubic contraction
-                skew_term = -1.0 * gamma * np.einsum('ijk,i,j,k->', coskew, w, w, w)
+                # Cubic contraction: O(T*N) for a CoskewFactor, O(N^3) for a tensor
+                skew_term = -1.0 * gamma * coskew_contract(coskew, w)
 
             # Term 4: Turnover Penalty (minimize sum of squared changes)
             turnover_term = 0
@@ -60,6 +66,20 @@ class SurrogateOptimizer:
 
             return ret_term + var_term + skew_term + turnover_term
 
+        # Analytic gradient (SLSQP otherwise spends N objective calls per step
+        # on finite differences). Only under COSKEW_TENSOR_FREE: the kill
+        # switch restores the legacy finite-difference solve as well.
+        sigma_sym = np.asarray(sigma) + np.asarray(sigma).T
+
+        def objective_grad(weights):
+            w = np.array(weights)
+            grad = -1.0 * np.asarray(mu, dtype=float) + lamb * np.dot(sigma_sym, w)
+            if gamma != 0:
+                grad = grad - gamma * coskew_gradient(coskew, w)
+            if eta > 0 and current_weights is not None:
+                grad = grad + 2.0 * eta * (w - current_weights)
+            return grad
+
         # 2. Constraints
         cons = []
 
@@ -103,7 +123,8 @@ class SurrogateOptimizer:
 
         # 5. Run Optimization
         # V3: Increased maxiter for complex constraints
-        result = minimize(objective, init_guess, method='SLSQP', bounds=bounds, constraints=cons, options={'maxiter': 2000})
+        jac = objective_grad if is_tensor_free_coskew_enabled() else None
+        result = minimize(objective, init_guess, jac=jac, method='SLSQP', bounds=bounds, constraints=cons, options={'maxiter': 2000})
 
         if not result.success:
             # Fallback: Relax constraints? Or return current/equal weights?
@@ -1,4 +1,5 @@
 from typing import Dict, List, Optional, Any
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 from supabase import Client
 from postgrest.exceptions import APIError
@@ -16,6 +17,7 @@ from packages.quantum.models import RiskDashboardResponse, PortfolioSnapshot, Tr
 from packages.quantum.inbox.ranker import rank_suggestions
 from packages.quantum.market_data import PolygonService
 from packages.quantum.execution.transaction_cost_model import TransactionCostModel
+from packages.quantum.services.db_async import run_query, timed_endpoint
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +76,7 @@ def filter_staged_by_today_window(items: List[Dict], today_start: str, tomorrow_
 
 
 @router.get("/inbox")
+@timed_endpoint("inbox")
 async def get_inbox(
     user_id: str = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_user_client),
@@ -116,29 +119,47 @@ async def get_inbox(
                 .gte("created_at", today_start) \
                 .lt("created_at", tomorrow_start)
 
-        active_res = active_query.execute()
-        active_list = active_res.data or []
-
         # Fetch staged suggestions (all staged, then filter by today window)
         # v4-polish: Use updated_at to capture items staged today even if created earlier
-        staged_res = supabase.table(TRADE_SUGGESTIONS_TABLE) \
+        staged_query = supabase.table(TRADE_SUGGESTIONS_TABLE) \
             .select("*") \
             .eq("user_id", user_id) \
-            .eq("status", "staged") \
-            .execute()
-        staged_list = filter_staged_by_today_window(
-            staged_res.data or [],
-            today_start,
-            tomorrow_start
-        )
+            .eq("status", "staged")
 
         # Fetch all today's suggestions for completed bucket
-        today_res = supabase.table(TRADE_SUGGESTIONS_TABLE) \
+        today_query = supabase.table(TRADE_SUGGESTIONS_TABLE) \
             .select("*") \
             .eq("user_id", user_id) \
             .gte("created_at", today_start) \
-            .lt("created_at", tomorrow_start) \
-            .execute()
+            .lt("created_at", tomorrow_start)
+
+        # v4-polish: Use CashService for deployable_capital. Its broker read
+        # and fallback writes block, so it runs off the loop like the queries.
+        async def _deployable_capital() -> float:
+            try:
+                cash_service = CashService(supabase)
+                return await run_query(
+                    lambda: cash_service.get_deployable_capital_sync(user_id),
+                    "deployable_capital",
+                )
+            except Exception as e:
+                # Safe fallback: log warning and return 0
+                logger.warning(f"CashService.get_deployable_capital failed for user {user_id}: {e}")
+                return 0.0
+
+        # The reads are independent: issue them together, off the loop.
+        active_res, staged_res, today_res, deployable_capital = await asyncio.gather(
+            run_query(active_query, "active"),
+            run_query(staged_query, "staged"),
+            run_query(today_query, "today"),
+            _deployable_capital(),
+        )
+        active_list = active_res.data or []
+        staged_list = filter_staged_by_today_window(
+            staged_res.data or [],
+            today_start,
+            tomorrow_start
+        )
         today_list = today_res.data or []
 
         # v4: Explicit bucketing
@@ -172,16 +193,6 @@ async def get_inbox(
         # Compute Meta - total_ev_available only for executable suggestions
         total_ev = sum(s.get("ev", 0) for s in active_executable if s.get("ev"))
 
-        # v4-polish: Use CashService for deployable_capital (simplified async call)
-        deployable_capital = 0.0
-        try:
-            cash_service = CashService(supabase)
-            deployable_capital = await cash_service.get_deployable_capital(user_id)
-        except Exception as e:
-            # Safe fallback: log warning and return 0
-            logger.warning(f"CashService.get_deployable_capital failed for user {user_id}: {e}")
-            deployable_capital = 0.0
-
         return {
             # v4: New explicit buckets
             "active_executable": active_executable,
@@ -205,6 +216,7 @@ async def get_inbox(
         raise HTTPException(status_code=500, detail="Failed to fetch inbox")
 
 @router.post("/suggestions/{suggestion_id}/dismiss")
+@timed_endpoint("dismiss_suggestion")
 async def dismiss_suggestion(
     suggestion_id: str,
     body: DismissSuggestionRequest,
@@ -224,7 +236,10 @@ async def dismiss_suggestion(
 
     try:
         # Fetch existing to merge sizing_metadata
-        res = supabase.table(TRADE_SUGGESTIONS_TABLE).select("*").eq("id", suggestion_id).single().execute()
+        res = await run_query(
+            supabase.table(TRADE_SUGGESTIONS_TABLE).select("*").eq("id", suggestion_id).single(),
+            "suggestion",
+        )
         if not res.data:
             raise HTTPException(status_code=404, detail="Suggestion not found")
 
@@ -248,7 +263,10 @@ async def dismiss_suggestion(
             "sizing_metadata": sizing_metadata
         }
 
-        upd_res = supabase.table(TRADE_SUGGESTIONS_TABLE).update(update_payload).eq("id", suggestion_id).execute()
+        upd_res = await run_query(
+            supabase.table(TRADE_SUGGESTIONS_TABLE).update(update_payload).eq("id", suggestion_id),
+            "dismiss",
+        )
 
         if upd_res.data:
             return upd_res.data[0]
@@ -264,6 +282,7 @@ async def dismiss_suggestion(
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 @router.post("/suggestions/{suggestion_id}/refresh-quote")
+@timed_endpoint("refresh_quote")
 async def refresh_quote(
     suggestion_id: str,
     user_id: str = Depends(get_current_user),
@@ -274,7 +293,10 @@ async def refresh_quote(
 
     try:
         # Fetch suggestion
-        res = supabase.table(TRADE_SUGGESTIONS_TABLE).select("*").eq("id", suggestion_id).single().execute()
+        res = await run_query(
+            supabase.table(TRADE_SUGGESTIONS_TABLE).select("*").eq("id", suggestion_id).single(),
+            "suggestion",
+        )
         if not res.data:
             raise HTTPException(status_code=404, detail="Suggestion not found")
 
@@ -292,7 +314,7 @@ async def refresh_quote(
         # Get fresh quote
         poly = PolygonService()
         try:
-            quote = poly.get_recent_quote(symbol)
+            quote = await run_query(lambda: poly.get_recent_quote(symbol), "quote")
         except Exception as e:
             # Per edge case instructions: 502 with clear message
             print(f"Quote refresh failed for {symbol}: {e}")
@@ -343,6 +365,7 @@ async def refresh_quote(
 # --- Existing Endpoints (Preserved) ---
 
 @router.get("/journal/stats")
+@timed_endpoint("journal_stats")
 async def get_journal_stats(
     user_id: str = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_user_client)
@@ -361,7 +384,7 @@ async def get_journal_stats(
         }
 
     service = JournalService(supabase)
-    return service.get_journal_stats(user_id)
+    return await run_query(lambda: service.get_journal_stats(user_id), "journal_stats")
 
 @router.get("/risk/dashboard", response_model=RiskDashboardResponse)
 async def get_risk_dashboard(
@@ -385,6 +408,7 @@ async def get_risk_dashboard(
     return default_response
 
 @router.get("/portfolio/snapshot", response_model=PortfolioSnapshot)
+@timed_endpoint("portfolio_snapshot")
 async def get_portfolio_snapshot(
     user_id: str = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_user_client)
@@ -407,12 +431,14 @@ async def get_portfolio_snapshot(
 
     try:
         # Try to fetch latest snapshot
-        res = supabase.table("portfolio_snapshots") \
-            .select("*") \
-            .eq("user_id", user_id) \
-            .order("created_at", desc=True) \
-            .limit(1) \
-            .execute()
+        res = await run_query(
+            supabase.table("portfolio_snapshots")
+            .select("*")
+            .eq("user_id", user_id)
+            .order("created_at", desc=True)
+            .limit(1),
+            "snapshot",
+        )
 
         if res.data and len(res.data) > 0:
             raw_data = res.data[0]
@@ -460,6 +486,7 @@ async def get_portfolio_snapshot(
         return empty_snapshot
 
 @router.get("/rebalance/suggestions")
+@timed_endpoint("rebalance_suggestions")
 async def get_rebalance_suggestions(
     user_id: str = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_user_client)
@@ -474,13 +501,14 @@ async def get_rebalance_suggestions(
     # or just return empty for now as requested by prompt
     try:
         query = supabase.table(TRADE_SUGGESTIONS_TABLE).select("*").eq("user_id", user_id).eq("window", "rebalance")
-        res = query.order("created_at", desc=True).limit(50).execute()
+        res = await run_query(query.order("created_at", desc=True).limit(50), "suggestions")
         return {"suggestions": res.data or []}
     except Exception:
         return {"suggestions": []}
 
 
 @router.get("/journal/drift-summary")
+@timed_endpoint("drift_summary")
 async def get_drift_summary(
     user_id: str = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_user_client)
@@ -506,7 +534,10 @@ async def get_drift_summary(
 
     # 1. Try View
     try:
-        res = supabase.table("discipline_score_per_user").select("*").eq("user_id", user_id).single().execute()
+        res = await run_query(
+            supabase.table("discipline_score_per_user").select("*").eq("user_id", user_id).single(),
+            "discipline_view",
+        )
         data = res.data
         if data:
             # Check if data already matches the frontend shape
@@ -536,11 +567,13 @@ async def get_drift_summary(
     # 2. Fallback: Aggregate logs manually
     try:
         cutoff = (datetime.now() - timedelta(days=30)).isoformat()
-        res = supabase.table("execution_drift_logs") \
-            .select("*") \
-            .eq("user_id", user_id) \
-            .gte("created_at", cutoff) \
-            .execute()
+        res = await run_query(
+            supabase.table("execution_drift_logs")
+            .select("*")
+            .eq("user_id", user_id)
+            .gte("created_at", cutoff),
+            "drift_logs",
+        )
 
         logs = res.data or []
         if not logs:
@@ -568,6 +601,7 @@ async def get_drift_summary(
         return default_response
 
 @router.get("/progress/weekly")
+@timed_endpoint("weekly_progress")
 async def get_weekly_progress(
     user_id: str = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_user_client)
@@ -581,12 +615,14 @@ async def get_weekly_progress(
          raise HTTPException(status_code=503, detail="Database Context Unavailable")
 
     try:
-        res = supabase.table("weekly_snapshots") \
-            .select("*") \
-            .eq("user_id", user_id) \
-            .eq("week_id", week_id) \
-            .limit(1) \
-            .execute()
+        res = await run_query(
+            supabase.table("weekly_snapshots")
+            .select("*")
+            .eq("user_id", user_id)
+            .eq("week_id", week_id)
+            .limit(1),
+            "weekly_snapshot",
+        )
 
         if res.data and len(res.data) > 0:
             return res.data[0]
@@ -623,6 +659,7 @@ async def get_weekly_progress(
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 @router.get("/suggestions")
+@timed_endpoint("suggestions")
 async def get_suggestions(
     window: Optional[str] = None,
     user_id: str = Depends(get_current_user),
@@ -639,7 +676,7 @@ async def get_suggestions(
         if window:
             query = query.eq("window", window)
 
-        res = query.order("created_at", desc=True).limit(50).execute()
+        res = await run_query(query.order("created_at", desc=True).limit(50), "suggestions")
         rows = res.data or []
 
         # D1 surfacing: attach compute-on-read trade economics (reward:risk,
@@ -663,6 +700,7 @@ async def get_suggestions(
         return {"suggestions": []}
 
 @router.get("/weekly-reports")
+@timed_endpoint("weekly_reports")
 async def get_weekly_reports(
     user_id: str = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_user_client)
@@ -674,12 +712,14 @@ async def get_weekly_reports(
         return {"reports": []}
 
     try:
-        res = supabase.table(WEEKLY_REPORTS_TABLE) \
-            .select("*") \
-            .eq("user_id", user_id) \
-            .order("week_ending", desc=True) \
-            .limit(20) \
-            .execute()
+        res = await run_query(
+            supabase.table(WEEKLY_REPORTS_TABLE)
+            .select("*")
+            .eq("user_id", user_id)
+            .order("week_ending", desc=True)
+            .limit(20),
+            "reports",
+        )
         return {"reports": res.data or []}
     except Exception as e:
         print(f"Error fetching weekly reports: {e}")
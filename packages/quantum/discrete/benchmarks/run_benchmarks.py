@@ -20,6 +20,13 @@ from packages.quantum.discrete.benchmarks.scenarios import (
     Scenario
 )
 from packages.quantum.discrete.polynomial_builder import build_discrete_polynomial, DiscreteOptimizationRequest
+from packages.quantum.discrete.models import (
+    CandidateTrade,
+    DiscreteConstraints,
+    DiscreteParameters,
+    DiscreteSolveRequest,
+)
+from packages.quantum.discrete.solvers.classical import SEARCH_MODES, _ClassicalSolverInstance
 
 # Attempt to import QCI client, handle if missing
 try:
@@ -78,6 +85,46 @@ def run_classical_baseline(scenario: Scenario) -> Dict[str, Any]:
         "feasible": total_premium <= limit_cash
     }
 
+def run_classical_search(scenario: Scenario, search_mode: str) -> Dict[str, Any]:
+    """
+    ClassicalDiscreteSolver (greedy + timeboxed local search) on the scenario,
+    as binary selections with no greek constraints.
+    """
+    req = scenario.request
+    solve_req = DiscreteSolveRequest(
+        candidates=[
+            CandidateTrade(
+                id=c.id, symbol=c.id, side="buy", qty_max=1,
+                ev_per_unit=c.ev, premium_per_unit=c.premium,
+                delta=0.0, gamma=0.0, vega=0.0, tail_risk_contribution=c.tail_risk
+            )
+            for c in req.candidates
+        ],
+        constraints=DiscreteConstraints(
+            max_cash=req.max_cash if req.max_cash is not None else 1e12,
+            max_vega=1e12, max_delta_abs=1e12, max_gamma=1e12
+        ),
+        parameters=DiscreteParameters(
+            lambda_tail=req.lambda_tail, lambda_cash=req.lambda_cash,
+            lambda_vega=0.0, lambda_delta=0.0, lambda_gamma=0.0, mode="classical_only"
+        ),
+    )
+
+    resp = _ClassicalSolverInstance(solve_req, search_mode=search_mode).solve()
+    diag = resp.diagnostics
+    return {
+        "solver": f"classical_{search_mode}",
+        "selected_count": len(resp.selected_trades),
+        "total_ev": resp.metrics.expected_profit,
+        "total_premium": resp.metrics.total_premium,
+        "objective_value": resp.metrics.objective_value,
+        "search_energy": diag.get("search_energy"),
+        "runtime_ms": resp.metrics.runtime_ms,
+        "moves_attempted": diag.get("swaps_attempted", 0),
+        "moves_accepted": diag.get("swaps_accepted", 0),
+        "feasible": resp.metrics.total_premium <= solve_req.constraints.max_cash,
+    }
+
 def run_dirac_solver(
     scenario: Scenario,
     token: str,
@@ -236,7 +283,8 @@ def main():
         scenario_configs = [
             ("cash_tight_knapsack", 50, 1000.0),
             ("greek_tight", 40, 100.0),
-            ("tail_coupled", 30, 0.0)
+            ("tail_coupled", 30, 0.0),
+            ("cash_tight_knapsack", 500, 5000.0)
         ]
         max_dirac_calls = 0
         num_samples = 0
@@ -267,7 +315,8 @@ def main():
         scen_result = {
             "name": name,
             "description": scen.description,
-            "classical": run_classical_baseline(scen)
+            "classical": run_classical_baseline(scen),
+            "classical_search": {mode_: run_classical_search(scen, mode_) for mode_ in SEARCH_MODES}
         }
 
         # Run Dirac if mode allows and budget permits
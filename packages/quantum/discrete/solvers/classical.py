@@ -1,3 +1,5 @@
+import math
+import os
 import time
 import random
 from typing import List, Dict, Any, Tuple, Optional
@@ -14,6 +16,23 @@ from packages.quantum.discrete.models import (
 )
 from packages.quantum.discrete.solvers.postprocess import postprocess_and_score
 
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+SEARCH_MODES = ("anneal", "swap")
+
+# Annealing schedule: each restart cools geometrically from T0 (an average
+# uphill move accepted with p=0.5) to T0 * _ANNEAL_T_END_RATIO.
+_ANNEAL_RESTARTS = 4
+_ANNEAL_T_END_RATIO = 1e-4
+_ANNEAL_CHECK_EVERY = 256
+
+
+def is_anneal_search_enabled() -> bool:
+    """DISCRETE_CLASSICAL_ANNEAL — default ON; explicit 0/false/no/off restores the swap search."""
+    raw = os.getenv("DISCRETE_CLASSICAL_ANNEAL", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
 @dataclass
 class Solution:
     # Map of candidate_id -> quantity
@@ -38,12 +57,24 @@ class ClassicalDiscreteSolver:
         return solver_instance.solve()
 
 class _ClassicalSolverInstance:
-    def __init__(self, req: DiscreteSolveRequest, seed: int = 1337):
+    def __init__(
+        self,
+        req: DiscreteSolveRequest,
+        seed: int = 1337,
+        search_mode: Optional[str] = None,
+        time_limit: float = 0.050,
+    ):
         self.req = req
         self.candidates = req.candidates
         self.constraints = req.constraints
         self.params = req.parameters
         self.rng = random.Random(seed)
+        if search_mode is None:
+            search_mode = "anneal" if is_anneal_search_enabled() else "swap"
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"search_mode must be one of {SEARCH_MODES}, got {search_mode!r}")
+        self.search_mode = search_mode
+        self.time_limit = time_limit
 
         # Precompute lookups
         self.cand_map = {c.id: c for c in self.candidates}
@@ -57,8 +88,61 @@ class _ClassicalSolverInstance:
 
         # 2. Local Search (Timeboxed)
         # Limit: 50ms
-        time_limit = 0.050
+        if self.search_mode == "anneal":
+            best_sol, stats = self._anneal_search(current_sol, self.time_limit)
+        else:
+            best_sol, stats = self._swap_search(current_sol, self.time_limit)
+
+        # --- UNIFIED POST-PROCESSING ---
+        # Instead of returning best_sol directly, we pass it through postprocess_and_score.
+        # This ensures consistent scoring calculation (using shared objective function)
+        # and a final repair pass (just in case local search drifted or initial greedy had issues,
+        # though _is_feasible checks should prevent that. But strict fairness requires using the same final check).
+
+        qty_map_fixed, components, obj_val, check, diagnostics = postprocess_and_score(self.req, best_sol.quantities)
+
+        # Merge diagnostics
+        diagnostics.update(stats)
+        diagnostics.update({
+            "search_mode": self.search_mode,
+            "search_energy": best_sol.energy,
+            "initial_energy": current_sol.energy if stats["iterations"] == 0 else "N/A",
+        })
+
+        end_time = time.perf_counter()
+        runtime_ms = (end_time - start_time) * 1000.0
+
+        # Format response
+        selected_trades = []
+        for cid, qty in qty_map_fixed.items():
+            if qty > 0:
+                selected_trades.append(SelectedTrade(
+                    id=cid,
+                    qty=qty,
+                    reason="classical_solver"
+                ))
+
+        metrics = DiscreteSolveMetrics(
+            expected_profit=components["expected_profit"],
+            total_premium=components["total_premium"],
+            tail_risk_value=components["tail_risk_value"],
+            delta=components["delta"],
+            gamma=components["gamma"],
+            vega=components["vega"],
+            objective_value=obj_val,
+            runtime_ms=runtime_ms
+        )
+
+        return DiscreteSolveResponse(
+            status="ok",
+            strategy_used="classical",
+            selected_trades=selected_trades,
+            metrics=metrics,
+            diagnostics=diagnostics
+        )
 
+    def _swap_search(self, current_sol: Solution, time_limit: float) -> Tuple[Solution, Dict[str, Any]]:
+        """Greedy-descent random swaps; every move re-evaluates the full selection (O(n))."""
         best_sol = current_sol
 
         iterations = 0
@@ -116,53 +200,183 @@ class _ClassicalSolverInstance:
                 if current_sol.energy < best_sol.energy:
                     best_sol = current_sol
 
-        # --- UNIFIED POST-PROCESSING ---
-        # Instead of returning best_sol directly, we pass it through postprocess_and_score.
-        # This ensures consistent scoring calculation (using shared objective function)
-        # and a final repair pass (just in case local search drifted or initial greedy had issues,
-        # though _is_feasible checks should prevent that. But strict fairness requires using the same final check).
-
-        qty_map_fixed, components, obj_val, check, diagnostics = postprocess_and_score(self.req, best_sol.quantities)
-
-        # Merge diagnostics
-        diagnostics.update({
+        return best_sol, {
             "iterations": iterations,
             "swaps_attempted": swaps_attempted,
             "swaps_accepted": swaps_accepted,
-            "initial_energy": current_sol.energy if iterations == 0 else "N/A",
-        })
-
-        end_time = time.perf_counter()
-        runtime_ms = (end_time - start_time) * 1000.0
-
-        # Format response
-        selected_trades = []
-        for cid, qty in qty_map_fixed.items():
-            if qty > 0:
-                selected_trades.append(SelectedTrade(
-                    id=cid,
-                    qty=qty,
-                    reason="classical_solver"
-                ))
-
-        metrics = DiscreteSolveMetrics(
-            expected_profit=components["expected_profit"],
-            total_premium=components["total_premium"],
-            tail_risk_value=components["tail_risk_value"],
-            delta=components["delta"],
-            gamma=components["gamma"],
-            vega=components["vega"],
-            objective_value=obj_val,
-            runtime_ms=runtime_ms
-        )
+        }
+
+    def _anneal_search(self, init: Solution, time_limit: float) -> Tuple[Solution, Dict[str, Any]]:
+        """
+        Simulated annealing over unit swaps with O(1) move scoring.
+
+        The energy is a quadratic in six running aggregates (EV, premium, tail,
+        vega, gamma, delta), so a move that shifts the aggregates by v changes
+        each squared term by lambda * v * (2 * total + v) — no re-summation over
+        the selection. Feasibility is likewise checked on the shifted totals.
+        The budget is split across restarts: the first starts from the greedy
+        solution, later ones reheat from the best found so far.
+        """
+        n = len(self.candidates)
+        stats: Dict[str, Any] = {
+            "iterations": 0,
+            "swaps_attempted": 0,
+            "swaps_accepted": 0,
+            "restarts": 0,
+        }
+        if n == 0 or sum(init.quantities.values()) >= sum(c.qty_max for c in self.candidates):
+            # Nothing to swap in: every candidate is already at qty_max.
+            return init, stats
+
+        cands = self.candidates
+        ev = [c.ev_per_unit for c in cands]
+        prem = [c.premium_per_unit for c in cands]
+        tail = [c.tail_risk_contribution for c in cands]
+        vega = [c.vega for c in cands]
+        gamma = [c.gamma for c in cands]
+        delta = [c.delta for c in cands]
+        qmax = [c.qty_max for c in cands]
+
+        p = self.params
+        lt, lc, lv, lg, ld = p.lambda_tail, p.lambda_cash, p.lambda_vega, p.lambda_gamma, p.lambda_delta
+        con = self.constraints
+        target = con.target_delta if con.target_delta is not None else 0.0
+        max_cash = con.max_cash
+        max_vega = con.max_vega if con.max_vega is not None else math.inf
+        max_delta_abs = con.max_delta_abs
+        max_gamma = con.max_gamma
+
+        rng = self.rng
+        randrange = rng.randrange
+        random_ = rng.random
+        exp = math.exp
+
+        best_q = [init.quantities.get(cid, 0) for cid in self.cand_ids]
+        best_energy = init.energy
+
+        def delta_energy(dev, dp, dt, dv, dg, dd, P, T, V, G, D):
+            return (
+                dp - dev
+                + lt * dt * (2.0 * T + dt)
+                + lc * dp * (2.0 * P + dp)
+                + lv * dv * (2.0 * V + dv)
+                + lg * dg * (2.0 * G + dg)
+                + ld * dd * (2.0 * (D - target) + dd)
+            )
+
+        # T0: an average uphill swap is accepted with p=0.5.
+        P0, T0_, V0, G0, D0 = (init.total_premium, init.total_tail_risk, init.total_vega,
+                               init.total_gamma, init.total_delta)
+        active0 = [i for i in range(n) if best_q[i] > 0]
+        uphill = []
+        for _ in range(min(64, 4 * n) if active0 else 0):
+            i = active0[randrange(len(active0))]
+            j = randrange(n)
+            d_e = delta_energy(ev[j] - ev[i], prem[j] - prem[i], tail[j] - tail[i],
+                               vega[j] - vega[i], gamma[j] - gamma[i], delta[j] - delta[i],
+                               P0, T0_, V0, G0, D0)
+            if d_e > 0:
+                uphill.append(d_e)
+        t_start = (sum(uphill) / len(uphill)) / math.log(2.0) if uphill else 1.0
+        t_end = t_start * _ANNEAL_T_END_RATIO
+        log_ratio = math.log(t_end / t_start)
+
+        iterations = attempted = accepted = 0
+        search_start = time.perf_counter()
+        slice_s = time_limit / _ANNEAL_RESTARTS
+
+        for restart in range(_ANNEAL_RESTARTS):
+            slice_start = search_start + restart * slice_s
+            slice_end = slice_start + slice_s
+            if time.perf_counter() >= slice_end:
+                continue
+            stats["restarts"] += 1
 
-        return DiscreteSolveResponse(
-            status="ok",
-            strategy_used="classical",
-            selected_trades=selected_trades,
-            metrics=metrics,
-            diagnostics=diagnostics
-        )
+            q = list(best_q)
+            active: List[int] = [i for i in range(n) if q[i] > 0]
+            if not active:
+                # Nothing selected: no swap exists (as in the swap search).
+                break
+            slot = [-1] * n
+            for k, i in enumerate(active):
+                slot[i] = k
+            # Exact totals at each restart (no drift carried across restarts).
+            E_ = sum(ev[i] * q[i] for i in active)
+            P = sum(prem[i] * q[i] for i in active)
+            T = sum(tail[i] * q[i] for i in active)
+            V = sum(vega[i] * q[i] for i in active)
+            G = sum(gamma[i] * q[i] for i in active)
+            D = sum(delta[i] * q[i] for i in active)
+            energy = (-(E_ - P) + lt * T * T + lc * P * P + lv * V * V + lg * G * G
+                      + ld * (D - target) ** 2)
+
+            temp = t_start
+            while True:
+                iterations += 1
+                if iterations % _ANNEAL_CHECK_EVERY == 0:
+                    now = time.perf_counter()
+                    if now >= slice_end:
+                        break
+                    temp = t_start * exp(log_ratio * (now - slice_start) / slice_s)
+
+                # Swap one unit of an active candidate for one of any other
+                # (the same count-preserving neighbourhood as the swap search).
+                i = active[randrange(len(active))]
+                j = randrange(n)
+                if j == i or q[j] >= qmax[j]:
+                    continue
+                dev = ev[j] - ev[i]
+                dp = prem[j] - prem[i]
+                dt = tail[j] - tail[i]
+                dv = vega[j] - vega[i]
+                dg = gamma[j] - gamma[i]
+                dd = delta[j] - delta[i]
+
+                attempted += 1
+                if (
+                    P + dp > max_cash
+                    or V + dv > max_vega
+                    or abs(D + dd) > max_delta_abs
+                    or G + dg > max_gamma
+                ):
+                    continue
+
+                d_e = delta_energy(dev, dp, dt, dv, dg, dd, P, T, V, G, D)
+                if d_e > 0 and random_() >= exp(-d_e / temp):
+                    continue
+
+                accepted += 1
+                q[i] -= 1
+                if q[i] == 0:
+                    k = slot[i]
+                    last = active.pop()
+                    if last != i:
+                        active[k] = last
+                        slot[last] = k
+                    slot[i] = -1
+                if q[j] == 0:
+                    slot[j] = len(active)
+                    active.append(j)
+                q[j] += 1
+                E_ += dev
+                P += dp
+                T += dt
+                V += dv
+                G += dg
+                D += dd
+                energy += d_e
+                if energy < best_energy - 1e-12:
+                    best_energy = energy
+                    best_q = list(q)
+
+        stats.update({
+            "iterations": iterations,
+            "swaps_attempted": attempted,
+            "swaps_accepted": accepted,
+            "anneal_t_start": t_start,
+        })
+        best_quantities = {cid: qty for cid, qty in zip(self.cand_ids, best_q) if qty > 0}
+        return self._evaluate(best_quantities), stats
 
     def _greedy_init(self) -> Solution:
         # Sort candidates by EV/Premium ratio (or similar metric)
@@ -178,3 +178,56 @@ def test_local_search_improvement():
     # assert "B" not in selected_ids
     # assert "C" not in selected_ids
     # assert res.metrics.objective_value == -15.0
+
+def _random_request(n, seed=7):
+    import random
+    rng = random.Random(seed)
+    candidates = [
+        CandidateTrade(
+            id=f"t{i}", symbol="SPY", side="buy", qty_max=rng.randint(1, 3),
+            ev_per_unit=rng.uniform(10.0, 60.0), premium_per_unit=rng.uniform(10.0, 40.0),
+            delta=rng.uniform(-0.5, 0.5), gamma=rng.uniform(0.0, 0.05),
+            vega=rng.uniform(0.0, 0.3), tail_risk_contribution=rng.uniform(0.0, 5.0)
+        )
+        for i in range(n)
+    ]
+    return DiscreteSolveRequest(
+        candidates=candidates,
+        constraints=DiscreteConstraints(
+            max_cash=n * 4.0, max_vega=50.0, max_delta_abs=5.0, max_gamma=10.0
+        ),
+        parameters=DiscreteParameters(
+            lambda_tail=0.05, lambda_cash=0.001, lambda_vega=0.1,
+            lambda_delta=0.5, lambda_gamma=0.0, mode="classical_only"
+        ),
+    )
+
+def test_anneal_search_explores_more_and_stays_feasible():
+    from packages.quantum.discrete.solvers.classical import _ClassicalSolverInstance
+
+    req = _random_request(200)
+    swap = _ClassicalSolverInstance(req, search_mode="swap")
+    anneal = _ClassicalSolverInstance(req, search_mode="anneal")
+    greedy = anneal._greedy_init()
+
+    swap_best, swap_stats = swap._swap_search(swap._greedy_init(), 0.05)
+    best, stats = anneal._anneal_search(greedy, 0.05)
+
+    # O(1) move scoring: far more moves in the same budget.
+    assert stats["swaps_attempted"] > 5 * swap_stats["swaps_attempted"]
+    assert stats["restarts"] >= 1
+    # Best is tracked on the (exactly re-evaluated) energy and never regresses.
+    assert best.energy <= greedy.energy
+    assert anneal._is_feasible(best)
+    # Swaps preserve the greedy contract count.
+    assert sum(best.quantities.values()) == sum(greedy.quantities.values())
+
+def test_search_mode_kill_switch(basic_request, monkeypatch):
+    from packages.quantum.discrete.solvers.classical import _ClassicalSolverInstance
+
+    assert _ClassicalSolverInstance(basic_request).search_mode == "anneal"
+    monkeypatch.setenv("DISCRETE_CLASSICAL_ANNEAL", "off")
+    res = ClassicalDiscreteSolver().solve(basic_request)
+    assert res.diagnostics["search_mode"] == "swap"
+    with pytest.raises(ValueError):
+        _ClassicalSolverInstance(basic_request, search_mode="tabu")
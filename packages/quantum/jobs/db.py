@@ -1,4 +1,5 @@
 from typing import Optional, Dict, Any, List
+import logging
 import os
 from pathlib import Path
 from datetime import datetime, date
@@ -11,6 +12,8 @@ except ImportError:
     np = None
 from supabase import create_client, Client
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Environment Loading
 # ---------------------------------------------------------------------------
@@ -211,6 +214,45 @@ def claim_job_run(client: Client, worker_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+_filtered_claim_fallback_warned = False
+
+
+def claim_job_run_filtered(
+    client: Client,
+    worker_id: str,
+    job_names: Optional[List[str]] = None,
+    exclude_job_names: Optional[List[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Claims the oldest runnable row whose job_name is in ``job_names`` /
+    not in ``exclude_job_names`` (migration 20260725010000).
+
+    Falls back to the unfiltered claim_job_run when the RPC is not deployed,
+    so a worker started before the migration still drains the queue. The
+    fallback is logged once per process, not on every poll.
+    """
+    global _filtered_claim_fallback_warned
+    try:
+        response = client.rpc('claim_job_run_filtered', {
+            'p_worker_id': worker_id,
+            'p_job_names': job_names,
+            'p_exclude_job_names': exclude_job_names,
+        }).execute()
+    except Exception as e:
+        if not _filtered_claim_fallback_warned:
+            _filtered_claim_fallback_warned = True
+            logger.warning(
+                f"[worker] claim_job_run_filtered failed, falling back to the "
+                f"unfiltered claim: {e}"
+            )
+        return claim_job_run(client, worker_id)
+    data = response.data
+    if not data:
+        return None
+    if isinstance(data, list):
+        return data[0] if data else None
+    return data
+
+
 def complete_job_run(client: Client, job_id: str, result_json: Dict[str, Any]) -> None:
     """Mark job as succeeded with both finished_at and completed_at."""
     payload = _to_jsonable(result_json)
@@ -42,6 +42,8 @@ def enqueue_idempotent(
     ).execute()
 
     if res.data:
+        from packages.quantum.jobs.worker_pool import notify_job_enqueued
+        notify_job_enqueued(job_name)
         return UUID(res.data[0]["id"])
 
     # If duplicate, fetch existing
@@ -6,7 +6,9 @@ Runs every 5 minutes during market hours (9:30 AM - 4:00 PM Chicago, Mon-Fri).
 Polls Alpaca for status updates on submitted orders and syncs fills,
 cancellations, and rejections back to paper_orders.
 
-Uses the existing poll_pending_orders() from alpaca_order_handler.py.
+Uses the existing poll_pending_orders() from alpaca_order_handler.py, fed by
+one bulk broker sweep (fetch_broker_orders) instead of a get_order per order.
+Fills can also land between runs through brokers/alpaca_trade_stream.py.
 """
 
 import os
@@ -30,6 +32,13 @@ def _client_order_id_reconcile_enabled() -> bool:
     return raw not in ("0", "false", "no", "off")
 
 
+def _bulk_order_sync_enabled() -> bool:
+    """Bulk reconcile — default-ON (§3): unset/empty → ON; only an explicit
+    falsy value restores one broker get_order per pending order."""
+    raw = (os.environ.get("ALPACA_ORDER_SYNC_BULK") or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
 def _fleet_receipt_producer_enabled() -> bool:
     """Stale-order reconciliation-receipt producer gate (Lane A).
 
@@ -248,6 +257,7 @@ def run(payload: Dict[str, Any], ctx: Any = None) -> Dict[str, Any]:
             totals = {
                 "total_polled": 0, "fills": 0, "partials": 0,
                 "cancels": 0, "unchanged": 0, "users": 0,
+                "broker_fetches": 0, "writes_skipped": 0,
                 "orphans_repaired": 0,
                 "errors": 0,
                 "error_details": [],
@@ -287,7 +297,7 @@ def run(payload: Dict[str, Any], ctx: Any = None) -> Dict[str, Any]:
             ]
 
             pending_query = client.table("paper_orders") \
-                .select("user_id") \
+                .select("user_id, submitted_at") \
                 .in_("status", ["submitted", "working", "partial", "needs_manual_review"]) \
                 .not_.is_("alpaca_order_id", "null")
             if shadow_portfolio_ids:
@@ -295,16 +305,35 @@ def run(payload: Dict[str, Any], ctx: Any = None) -> Dict[str, Any]:
             pending_res = pending_query.execute()
             poll_user_ids = list({r["user_id"] for r in (pending_res.data or [])})
 
+            # Bulk reconcile: one paged broker sweep (open + closed since the
+            # oldest pending submit) serves every user's poll from memory;
+            # ids it lacks are still fetched one by one. A sweep failure
+            # falls back to per-order polling for the whole run.
+            broker_orders = None
+            if poll_user_ids and _bulk_order_sync_enabled():
+                from packages.quantum.brokers.alpaca_order_handler import fetch_broker_orders
+                try:
+                    broker_orders = fetch_broker_orders(alpaca, pending_res.data or [])
+                    totals["bulk_broker_orders"] = len(broker_orders)
+                except Exception as bulk_err:
+                    logger.warning(
+                        f"[ALPACA_SYNC] Bulk order fetch failed, polling per order: {bulk_err}"
+                    )
+
             if poll_user_ids:
                 totals["users"] = len(poll_user_ids)
                 for uid in poll_user_ids:
-                    result = poll_pending_orders(alpaca, client, uid)
+                    result = poll_pending_orders(
+                        alpaca, client, uid, broker_orders=broker_orders,
+                    )
                     for key in (
                         "total_polled",
                         "fills",
                         "partials",
                         "cancels",
                         "unchanged",
+                        "broker_fetches",
+                        "writes_skipped",
                     ):
                         totals[key] += result.get(key, 0)
                     poll_errors = result.get("errors") or []
@@ -757,8 +757,13 @@ class IntradayRiskMonitor:
         if not all_symbols:
             return positions
 
+        # Stress-grid inputs ride the same batch: the underlyings' spot.
+        underlying_by_pos = self._stress_underlyings(positions)
+        all_symbols.extend(sorted(set(underlying_by_pos.values())))
+
         # Batch fetch — routes options to Alpaca, equities to Polygon
         snapshots = truth_layer.snapshot_many(all_symbols)
+        self._annotate_stress_inputs(positions, snapshots, underlying_by_pos)
 
         # #2026-05-12 MTM-staleness PR-1: track positions whose in-memory
         # recompute fails (multi-leg with any incomplete leg quote → the
@@ -954,6 +959,55 @@ class IntradayRiskMonitor:
 
         return positions
 
+    # ── Stress-grid inputs ────────────────────────────────────────────
+    # The full-revaluation stress grid (risk.stress_grid, OBSERVE-ONLY) needs
+    # a spot per position and an IV per leg. Both come from THIS cycle's
+    # snapshot batch — no extra fetch — and live only on the in-memory rows
+    # (the fresh-mark persist writes named columns, never these keys). A
+    # missing value stays missing: the grid types that position unavailable.
+
+    @staticmethod
+    def _stress_underlyings(positions: List[Dict]) -> Dict[int, str]:
+        from packages.quantum.risk.stress_grid import is_stress_grid_enabled
+        from packages.quantum.services.options_utils import parse_option_symbol
+
+        if not is_stress_grid_enabled():
+            return {}
+        out: Dict[int, str] = {}
+        for pos in positions:
+            legs = [l for l in (pos.get("legs") or []) if isinstance(l, dict)]
+            if not legs:
+                continue
+            parsed = parse_option_symbol(legs[0].get("occ_symbol") or legs[0].get("symbol", ""))
+            if parsed and parsed.get("underlying"):
+                out[id(pos)] = parsed["underlying"]
+        return out
+
+    @staticmethod
+    def _annotate_stress_inputs(
+        positions: List[Dict], snapshots: Dict[str, Dict], underlying_by_pos: Dict[int, str]
+    ) -> None:
+        if not underlying_by_pos:
+            return
+        from packages.quantum.services.cache_key_builder import normalize_symbol
+
+        for pos in positions:
+            underlying = underlying_by_pos.get(id(pos))
+            if not underlying:
+                continue
+            snap = snapshots.get(normalize_symbol(underlying)) or {}
+            q = snap.get("quote", snap)
+            spot = usable_mid(q.get("bid"), q.get("ask"), float(q.get("mid") or q.get("last") or 0))
+            if spot is not None and spot > 0:
+                pos["underlying_price"] = spot
+            for leg in pos.get("legs") or []:
+                if not isinstance(leg, dict) or leg.get("iv") is not None:
+                    continue
+                sym = leg.get("occ_symbol") or leg.get("symbol", "")
+                iv = (snapshots.get(normalize_symbol(sym)) or {}).get("iv")
+                if iv is not None:
+                    leg["iv"] = iv
+
     # ── Equity estimation ─────────────────────────────────────────────
     # Delegates to packages.quantum.services.equity_state. Shims are kept
     # here so test doubles can override per-instance without reaching into
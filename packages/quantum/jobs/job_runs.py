@@ -8,6 +8,7 @@ from packages.quantum.jobs.db import (
     _to_jsonable,
 )
 from packages.quantum.jobs.origin import coerce_origin
+from packages.quantum.jobs.worker_pool import notify_job_enqueued
 
 class JobRunStore:
     def __init__(self):
@@ -74,6 +75,9 @@ class JobRunStore:
 
             res_data = self._data(res)
             if res_data:
+                # New queued row: wake any multi-slot DB-queue worker now
+                # instead of on its next poll.
+                notify_job_enqueued(job_name)
                 # res_data is typically a list from .select()
                 return res_data[0] if isinstance(res_data, list) else res_data
 
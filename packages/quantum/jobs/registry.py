@@ -1,8 +1,12 @@
+import ast
 import importlib
 import pkgutil
 import os
 import inspect
-from typing import Dict, Callable
+import sys
+import threading
+import time
+from typing import Any, Dict, Callable, List, Optional
 import logging
 
 # We will look for handlers in packages.quantum.jobs.handlers
@@ -10,28 +14,71 @@ HANDLERS_PACKAGE = "packages.quantum.jobs.handlers"
 
 logger = logging.getLogger(__name__)
 
-def discover_handlers() -> Dict[str, Callable]:
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+
+def is_lazy_registry_enabled() -> bool:
+    """JOB_REGISTRY_LAZY — default ON; explicit 0/false/no/off restores eager imports."""
+    raw = os.getenv("JOB_REGISTRY_LAZY", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def _handlers_dir() -> str:
+    return os.path.join(os.path.dirname(__file__), "handlers")
+
+
+def _check_contract(module_name: str, has_payload: bool, ctx_has_default: Optional[bool]) -> bool:
+    """Shared run(payload, ctx=None) contract check (eager and AST paths)."""
+    # 1. Must accept 'payload'
+    if not has_payload:
+        logger.error(f"Handler {module_name} violates contract: missing 'payload' parameter. Skipping.")
+        return False
+
+    # 2. 'ctx' is optional but if present must have default
+    if ctx_has_default is False:
+        logger.error(f"Handler {module_name} violates contract: 'ctx' parameter must have a default value (e.g. None). Skipping.")
+        return False
+
+    return True
+
+
+def discover_handlers(lazy: Optional[bool] = None) -> Dict[str, Callable]:
     """
     Scans the packages/quantum/jobs/handlers directory for modules defining:
       JOB_NAME = "..."
       def run(payload: dict, ctx=None) -> dict
 
+    Lazy mode (default, JOB_REGISTRY_LAZY): the registry comes from an AST
+    scan of the handler sources — no handler module is imported until its
+    job is first dispatched (see ``LazyHandler``). Modules whose JOB_NAME
+    or run() cannot be read statically are imported eagerly as before.
+
     Returns:
         dict[job_name, callable]
     """
+    if lazy is None:
+        lazy = is_lazy_registry_enabled()
+    if lazy:
+        return dict(_get_manifest().handlers)
+    return _discover_handlers_eager()
+
+
+def _discover_handlers_eager(module_names: Optional[List[str]] = None) -> Dict[str, Callable]:
     handlers = {}
 
     # Locate the handlers directory relative to this file
-    current_dir = os.path.dirname(__file__)
-    handlers_dir = os.path.join(current_dir, "handlers")
+    handlers_dir = _handlers_dir()
 
     if not os.path.exists(handlers_dir):
         logger.warning(f"Handlers directory not found: {handlers_dir}")
         return handlers
 
+    if module_names is None:
+        module_names = [m.name for m in pkgutil.iter_modules([handlers_dir])]
+
     # Iterate over modules in the handlers package
-    for module_info in pkgutil.iter_modules([handlers_dir]):
-        module_name = f"{HANDLERS_PACKAGE}.{module_info.name}"
+    for short_name in module_names:
+        module_name = f"{HANDLERS_PACKAGE}.{short_name}"
 
         try:
             module = importlib.import_module(module_name)
@@ -52,17 +99,11 @@ def discover_handlers() -> Dict[str, Callable]:
             # Enforce Contract: def run(payload: dict, ctx=None)
             sig = inspect.signature(handler_func)
             params = sig.parameters
-
-            # 1. Must accept 'payload'
-            if "payload" not in params:
-                logger.error(f"Handler {module_name} violates contract: missing 'payload' parameter. Skipping.")
-                continue
-
-            # 2. 'ctx' is optional but if present must have default
+            ctx_has_default = None
             if "ctx" in params:
-                if params["ctx"].default == inspect.Parameter.empty:
-                    logger.error(f"Handler {module_name} violates contract: 'ctx' parameter must have a default value (e.g. None). Skipping.")
-                    continue
+                ctx_has_default = params["ctx"].default != inspect.Parameter.empty
+            if not _check_contract(module_name, "payload" in params, ctx_has_default):
+                continue
 
             if job_name in handlers:
                 logger.warning(f"Duplicate job name detected: {job_name}. Overwriting previous handler.")
@@ -74,3 +115,267 @@ def discover_handlers() -> Dict[str, Callable]:
             continue
 
     return handlers
+
+
+# ---------------------------------------------------------------------------
+# Lazy registry
+# ---------------------------------------------------------------------------
+
+class LazyHandler:
+    """Stands in for a handler's ``run``; imports its module on first call.
+
+    ``inspect.signature`` (used by the runner to decide how to pass the
+    payload) resolves to the real function's signature, which also imports
+    the module — that only happens at dispatch time.
+    """
+
+    def __init__(self, job_name: str, module_name: str):
+        self.job_name = job_name
+        self.module_name = module_name
+        self._func: Optional[Callable] = None
+        self._lock = threading.Lock()
+        # Wall time of the first import, for the profile report.
+        self.import_seconds: Optional[float] = None
+
+    def resolve(self) -> Callable:
+        if self._func is None:
+            with self._lock:
+                if self._func is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self.module_name)
+                    self.import_seconds = time.perf_counter() - started
+                    self._func = getattr(module, "run")
+        return self._func
+
+    @property
+    def loaded(self) -> bool:
+        return self._func is not None
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        return inspect.signature(self.resolve())
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "lazy"
+        return f"<LazyHandler {self.job_name} -> {self.module_name} ({state})>"
+
+
+# Directory containing the top-level ``packages`` package.
+_SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _module_path(dotted: str) -> Optional[str]:
+    base = os.path.join(_SOURCE_ROOT, *dotted.split("."))
+    for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def _literal_job_name(dotted: str) -> Optional[str]:
+    """Module-level ``JOB_NAME = "..."`` of ``dotted``, read without importing it."""
+    path = _module_path(dotted)
+    if path is None:
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            if any(isinstance(t, ast.Name) and t.id == "JOB_NAME" for t in node.targets):
+                return node.value.value if isinstance(node.value.value, str) else None
+    return None
+
+
+def _scan_module(path: str) -> Optional[Dict[str, Any]]:
+    """Reads JOB_NAME and the run() parameters from a handler's AST.
+
+    ``JOB_NAME`` may be a string literal or re-exported with
+    ``from <module> import JOB_NAME`` (followed one level). Returns None
+    when the module does not define JOB_NAME. ``static`` is False when
+    either value cannot be resolved this way, in which case the caller
+    falls back to importing the module.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    job_name: Any = None
+    has_job_name = False
+    run_node: Optional[ast.AST] = None
+    run_assigned = False
+
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            for alias in node.names:
+                if (alias.asname or alias.name) == "JOB_NAME" and alias.name == "JOB_NAME":
+                    has_job_name = True
+                    job_name = _literal_job_name(node.module)
+        targets: List[ast.expr] = []
+        value = None
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id == "JOB_NAME":
+                has_job_name = True
+                job_name = value.value if isinstance(value, ast.Constant) and isinstance(value.value, str) else None
+            elif isinstance(target, ast.Name) and target.id == "run":
+                run_assigned, run_node = True, None
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "run":
+            run_node, run_assigned = node, False
+
+    if not has_job_name:
+        return None
+
+    info: Dict[str, Any] = {"job_name": job_name, "static": job_name is not None and not run_assigned}
+    if run_node is None:
+        info["has_run"] = run_assigned
+        return info
+
+    args = run_node.args
+    positional = args.posonlyargs + args.args
+    names = [a.arg for a in positional + args.kwonlyargs]
+    info["has_run"] = True
+    info["has_payload"] = "payload" in names
+    info["ctx_has_default"] = None
+    if "ctx" in names:
+        if "ctx" in [a.arg for a in args.kwonlyargs]:
+            idx = [a.arg for a in args.kwonlyargs].index("ctx")
+            info["ctx_has_default"] = args.kw_defaults[idx] is not None
+        else:
+            idx = [a.arg for a in positional].index("ctx")
+            info["ctx_has_default"] = idx >= len(positional) - len(args.defaults)
+    return info
+
+
+class HandlerManifest:
+    """JOB_NAME -> handler table built once per process by AST scan."""
+
+    def __init__(self):
+        self.handlers: Dict[str, Callable] = {}
+        self.modules: Dict[str, str] = {}
+        self.eager_modules: List[str] = []
+        self.rejected: List[str] = []
+        self.scan_seconds = 0.0
+
+    @classmethod
+    def build(cls, handlers_dir: Optional[str] = None) -> "HandlerManifest":
+        manifest = cls()
+        handlers_dir = handlers_dir or _handlers_dir()
+        started = time.perf_counter()
+
+        if not os.path.exists(handlers_dir):
+            logger.warning(f"Handlers directory not found: {handlers_dir}")
+            return manifest
+
+        fallback: List[str] = []
+        for module_info in pkgutil.iter_modules([handlers_dir]):
+            module_name = f"{HANDLERS_PACKAGE}.{module_info.name}"
+            path = os.path.join(handlers_dir, f"{module_info.name}.py")
+            try:
+                info = _scan_module(path) if os.path.exists(path) else {"static": False}
+            except (SyntaxError, OSError) as e:
+                logger.error(f"Failed to scan job handler module {module_name}: {e}")
+                manifest.rejected.append(module_name)
+                continue
+
+            if info is None:
+                continue
+            if not info.get("static"):
+                fallback.append(module_info.name)
+                continue
+            if not info.get("has_run"):
+                logger.warning(f"Module {module_name} has JOB_NAME but no run() function. Skipping.")
+                manifest.rejected.append(module_name)
+                continue
+            if not _check_contract(module_name, info["has_payload"], info["ctx_has_default"]):
+                manifest.rejected.append(module_name)
+                continue
+
+            job_name = info["job_name"]
+            if job_name in manifest.handlers:
+                logger.warning(f"Duplicate job name detected: {job_name}. Overwriting previous handler.")
+            manifest.handlers[job_name] = LazyHandler(job_name, module_name)
+            manifest.modules[job_name] = module_name
+
+        manifest.scan_seconds = time.perf_counter() - started
+
+        if fallback:
+            # Dynamic JOB_NAME / run: same behavior as the eager registry.
+            for job_name, func in _discover_handlers_eager(fallback).items():
+                manifest.handlers[job_name] = func
+                manifest.modules[job_name] = getattr(func, "__module__", "")
+            manifest.eager_modules = [f"{HANDLERS_PACKAGE}.{name}" for name in fallback]
+
+        return manifest
+
+
+_MANIFEST: Optional[HandlerManifest] = None
+_MANIFEST_LOCK = threading.Lock()
+
+
+def _get_manifest() -> HandlerManifest:
+    global _MANIFEST
+    if _MANIFEST is None:
+        with _MANIFEST_LOCK:
+            if _MANIFEST is None:
+                _MANIFEST = HandlerManifest.build()
+    return _MANIFEST
+
+
+def profile_handler_imports(job_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Import handlers one by one and report the wall time each one adds.
+
+    Times are incremental: a module shared by several handlers is charged
+    to the first handler that imports it, so run this in a fresh process
+    (``python -m packages.quantum.jobs.registry``) for a cold-start view.
+    """
+    manifest = _get_manifest()
+    names = job_names if job_names is not None else sorted(manifest.handlers)
+    rows = []
+    for job_name in names:
+        handler = manifest.handlers.get(job_name)
+        before = len(sys.modules)
+        started = time.perf_counter()
+        error = None
+        try:
+            if isinstance(handler, LazyHandler):
+                handler.resolve()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        rows.append({
+            "job_name": job_name,
+            "module": manifest.modules.get(job_name),
+            "import_seconds": round(time.perf_counter() - started, 4),
+            "new_modules": len(sys.modules) - before,
+            "error": error,
+        })
+    rows.sort(key=lambda r: r["import_seconds"], reverse=True)
+    return {
+        "scan_seconds": round(manifest.scan_seconds, 4),
+        "handlers": len(manifest.handlers),
+        "eager_modules": list(manifest.eager_modules),
+        "rejected_modules": list(manifest.rejected),
+        "total_import_seconds": round(sum(r["import_seconds"] for r in rows), 4),
+        "imports": rows,
+    }
+
+
+def _print_profile_report() -> None:
+    report = profile_handler_imports()
+    print(f"Manifest scan: {report['scan_seconds']:.4f}s for {report['handlers']} handlers")
+    if report["eager_modules"]:
+        print(f"Eager (non-static) modules: {report['eager_modules']}")
+    if report["rejected_modules"]:
+        print(f"Rejected modules: {report['rejected_modules']}")
+    print(f"{'job_name':<32} {'seconds':>8} {'modules':>8}  error")
+    for row in report["imports"]:
+        print(f"{row['job_name']:<32} {row['import_seconds']:>8.4f} {row['new_modules']:>8}  {row['error'] or ''}")
+    print(f"Total handler import time: {report['total_import_seconds']:.4f}s")
+
+
+if __name__ == "__main__":
+    _print_profile_report()
@@ -7,6 +7,8 @@ from typing import Any, Dict, Optional
 
 from packages.quantum.jobs.job_runs import JobRunStore
 from packages.quantum.jobs.registry import discover_handlers
+from packages.quantum.services.job_dag_executor import dispatch_ready_dependents
+from packages.quantum.services.rate_governor import rate_lane, rate_lane_for_job
 from packages.quantum.logging_setup import setup_logging
 
 # PR-0 (F-LOG-INFO-DROP): the workers start as a bare `rq worker` CLI, so this
@@ -177,12 +179,15 @@ def run_job_run(payload: Dict[str, Any], ctx: Optional[Any] = None) -> Dict[str,
         import inspect
         sig = inspect.signature(handler)
 
-        if "payload" in sig.parameters or any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()):
-            result = handler(payload=job_payload)
-        else:
-            # Legacy fallback: call without arguments
-            logger.info(f"Handler {job_name} does not accept payload. Calling without arguments.")
-            result = handler()
+        # Provider calls made by this job run in its rate-governor lane
+        # (exit/risk jobs preempt scans and backfills on shared quotas).
+        with rate_lane(rate_lane_for_job(job_name)):
+            if "payload" in sig.parameters or any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()):
+                result = handler(payload=job_payload)
+            else:
+                # Legacy fallback: call without arguments
+                logger.info(f"Handler {job_name} does not accept payload. Calling without arguments.")
+                result = handler()
 
         # 4. Success or Partial Failure
         final_result = result if isinstance(result, dict) else {"result": str(result)}
@@ -200,10 +205,11 @@ def run_job_run(payload: Dict[str, Any], ctx: Optional[Any] = None) -> Dict[str,
         if _outcome == "partial":
             logger.warning(f"Job {job_run_id} PARTIAL (units failed): {final_result}")
             store.mark_partial_failure(job_run_id, final_result)
-            return {"status": "partial", "job_run_id": job_run_id, "result": final_result}
         else:
             store.mark_succeeded(job_run_id, final_result)
-            return {"status": "succeeded", "job_run_id": job_run_id, "result": final_result}
+        # JOB_DAG_EXECUTION: release chained dependents now (no-op when off).
+        dispatch_ready_dependents(job, _outcome)
+        return {"status": _outcome, "job_run_id": job_run_id, "result": final_result}
 
     except RetryableJobError as e:
         # Handle manual retry request
@@ -1,4 +1,5 @@
 import os
+import signal
 import sys
 import socket
 import time
@@ -18,12 +19,20 @@ if repo_root not in sys.path:
 from packages.quantum.jobs.db import (
     create_supabase_admin_client,
     claim_job_run,
+    claim_job_run_filtered,
     complete_job_run,
     requeue_job_run,
     dead_letter_job_run
 )
 from packages.quantum.jobs.backoff import backoff_seconds
 from packages.quantum.jobs.registry import discover_handlers
+from packages.quantum.jobs.worker_pool import (
+    SlotWorker,
+    get_drain_seconds,
+    get_poll_seconds,
+    get_slot_config,
+    get_wakeup_channel,
+)
 
 class RetryableJobError(Exception):
     """Exception raised when a job fails but should be retried."""
@@ -68,6 +77,11 @@ def main():
     handlers["test_job"] = test_job_handler
     print(f"Registered handlers: {list(handlers.keys())}")
 
+    slots = get_slot_config()
+    if slots:
+        run_slot_worker(client, handlers, worker_id, slots)
+        return
+
     print("Worker loop started. Polling for jobs...")
     while True:
         try:
@@ -77,56 +91,7 @@ def main():
                 time.sleep(2)
                 continue
 
-            # Assuming job is a dict with keys matching table columns
-            # We need: id, job_name, payload, attempt (maybe)
-            # Adjust keys based on actual DB schema.
-            # Assuming: 'id', 'job_name', 'payload', 'attempt'
-
-            job_id = job.get('id')
-            job_name = job.get('job_name')
-            payload = job.get('payload', {})
-            # If attempt is not in job row, default to 1?
-            # The RPC/DB usually tracks attempt count.
-            # If claim_job_run increments it, we should get the current attempt.
-            attempt = job.get('attempt', 1)
-
-            print(f"Claimed job {job_id}: {job_name} (Attempt {attempt})")
-
-            if job_name not in handlers:
-                # Permanent failure: Missing handler
-                error = PermanentJobError(f"No handler found for job: {job_name}")
-                error_json = format_error_payload(error, job_name, attempt)
-                print(f"Dead lettering job {job_id}: Missing handler")
-                dead_letter_job_run(client, job_id, error_json)
-                continue
-
-            handler = handlers[job_name]
-
-            # Context can include worker info, client, etc.
-            context = {
-                "worker_id": worker_id,
-                "job_id": job_id,
-                "attempt": attempt
-            }
-
-            try:
-                result = handler(payload, context)
-                print(f"Job {job_id} completed successfully.")
-                complete_job_run(client, job_id, result or {})
-
-            except RetryableJobError as e:
-                print(f"Job {job_id} failed (Retryable): {e}")
-                backoff = backoff_seconds(attempt)
-                run_after = (datetime.now(timezone.utc) + timedelta(seconds=backoff)).isoformat()
-                error_json = format_error_payload(e, job_name, attempt)
-                requeue_job_run(client, job_id, run_after, error_json)
-
-            except Exception as e:
-                # Treat generic exceptions as dead letter or retryable?
-                # The prompt says: "on any other exception => dead_letter_job_run with stack trace"
-                print(f"Job {job_id} failed (Permanent/Unknown): {e}")
-                error_json = format_error_payload(e, job_name, attempt)
-                dead_letter_job_run(client, job_id, error_json)
+            execute_job(client, handlers, worker_id, job)
 
         except KeyboardInterrupt:
             print("Worker stopping...")
@@ -136,5 +101,94 @@ def main():
             traceback.print_exc()
             time.sleep(5) # Sleep before retrying loop to avoid tight loop on persistent errors
 
+def execute_job(client, handlers: Dict[str, Callable], worker_id: str, job: Dict[str, Any]) -> None:
+    """Runs one claimed job and records its outcome (complete/requeue/dead letter)."""
+    # Assuming job is a dict with keys matching table columns
+    # We need: id, job_name, payload, attempt (maybe)
+    # Adjust keys based on actual DB schema.
+    # Assuming: 'id', 'job_name', 'payload', 'attempt'
+
+    job_id = job.get('id')
+    job_name = job.get('job_name')
+    payload = job.get('payload', {})
+    # If attempt is not in job row, default to 1?
+    # The RPC/DB usually tracks attempt count.
+    # If claim_job_run increments it, we should get the current attempt.
+    attempt = job.get('attempt', 1)
+
+    print(f"Claimed job {job_id}: {job_name} (Attempt {attempt})")
+
+    if job_name not in handlers:
+        # Permanent failure: Missing handler
+        error = PermanentJobError(f"No handler found for job: {job_name}")
+        error_json = format_error_payload(error, job_name, attempt)
+        print(f"Dead lettering job {job_id}: Missing handler")
+        dead_letter_job_run(client, job_id, error_json)
+        return
+
+    handler = handlers[job_name]
+
+    # Context can include worker info, client, etc.
+    context = {
+        "worker_id": worker_id,
+        "job_id": job_id,
+        "attempt": attempt
+    }
+
+    try:
+        result = handler(payload, context)
+        print(f"Job {job_id} completed successfully.")
+        complete_job_run(client, job_id, result or {})
+
+    except RetryableJobError as e:
+        print(f"Job {job_id} failed (Retryable): {e}")
+        backoff = backoff_seconds(attempt)
+        run_after = (datetime.now(timezone.utc) + timedelta(seconds=backoff)).isoformat()
+        error_json = format_error_payload(e, job_name, attempt)
+        requeue_job_run(client, job_id, run_after, error_json)
+
+    except Exception as e:
+        # Treat generic exceptions as dead letter or retryable?
+        # The prompt says: "on any other exception => dead_letter_job_run with stack trace"
+        print(f"Job {job_id} failed (Permanent/Unknown): {e}")
+        error_json = format_error_payload(e, job_name, attempt)
+        dead_letter_job_run(client, job_id, error_json)
+
+def run_slot_worker(client, handlers: Dict[str, Callable], worker_id: str, slots: Dict[str, int]) -> None:
+    """Multi-slot mode (WORKER_SLOTS set): concurrent per-class slots,
+    wakeup-driven claims, graceful drain on SIGTERM/SIGINT."""
+
+    def _requeue_unstarted(job: Dict[str, Any]) -> None:
+        error = RetryableJobError("Worker draining before job started")
+        error_json = format_error_payload(error, job.get('job_name'), job.get('attempt', 1))
+        requeue_job_run(client, job.get('id'), datetime.now(timezone.utc).isoformat(), error_json)
+
+    worker = SlotWorker(
+        claim=lambda job_names, exclude: claim_job_run_filtered(
+            client, worker_id, job_names, exclude,
+        ),
+        execute=lambda job: execute_job(client, handlers, worker_id, job),
+        requeue=_requeue_unstarted,
+        slots=slots,
+        wakeup=get_wakeup_channel(),
+        poll_seconds=get_poll_seconds(),
+    )
+
+    def _stop(signum, frame):
+        print(f"Received signal {signum}; draining...")
+        worker.request_stop()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    print(f"Worker loop started with slots {slots}. Waiting for jobs...")
+    worker.run()
+
+    drain_seconds = get_drain_seconds()
+    still_running = worker.drain(drain_seconds)
+    if still_running:
+        print(f"Drain timed out after {drain_seconds}s; still running: {still_running}")
+    print(f"Worker stopped. Stats: {worker.stats}")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,384 @@
+"""Concurrent multi-slot execution for the DB-queue worker (``jobs/worker.py``).
+
+The serial worker claims one ``job_runs`` row, runs it to completion, and
+sleeps 2s whenever the queue is empty. A freshly enqueued job therefore
+waits up to 2s before anyone looks at it, and a long backfill or
+``intraday_risk_monitor`` run blocks every short exit job queued behind it.
+
+``SlotWorker`` runs claimed jobs on per-class thread pools:
+
+* Each job_name maps to a CLASS (``DEFAULT_JOB_CLASSES``, overridable with
+  ``WORKER_JOB_CLASSES="job_name=class,..."``). Each class gets its own
+  bounded slot count (``WORKER_SLOTS="default=4,long=1,exit=2"``). A job
+  never waits for a slot held by a job of another class.
+* Claims are per class: a class claims only while it has a free slot,
+  through ``claim_job_run_filtered`` scoped to that class's job names (the
+  default class excludes every name mapped elsewhere). A busy class
+  therefore never holds claims that another class's jobs are queued
+  behind. If the filtered RPC is missing, the claim falls back to the
+  unfiltered one and a job of a saturated class waits locally for its slot;
+  the total number of claimed jobs stays bounded by the slot total.
+* Claims happen on a WAKEUP, not on a timer: enqueue paths call
+  ``notify_job_enqueued()`` and a finished job frees a slot and wakes the
+  loop. ``poll_seconds`` remains as the fallback for enqueues that bypass
+  the notify path (SQL, other services).
+* ``JOB_WAKEUP_CHANNEL=redis`` carries wakeups across processes through a
+  Redis list (``REDIS_URL``). The default ``local`` channel is an
+  in-process event: the same interface, with no cross-process reach.
+* ``drain()`` stops claiming. A job that has not started is cancelled and
+  requeued immediately; the claim already counted as an attempt. Running
+  jobs get up to ``WORKER_DRAIN_SECONDS`` to finish.
+
+Slots are threads: handlers are I/O bound (Supabase, Polygon, Alpaca) and
+already run concurrently under RQ. The serial loop stays the default and
+is used whenever ``WORKER_SLOTS`` is unset.
+"""
+
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLASS = "default"
+
+# Used when WORKER_SLOTS names a class without a count, e.g. "default,long".
+DEFAULT_SLOTS: Dict[str, int] = {"default": 4, "long": 1, "exit": 2}
+
+# Jobs that run for minutes-to-hours, and jobs whose latency matters during
+# the session. Everything else shares the "default" class.
+DEFAULT_JOB_CLASSES: Dict[str, str] = {
+    "iv_historical_backfill": "long",
+    "walk_forward_autotune": "long",
+    "strategy_autotune": "long",
+    "paper_exit_evaluate": "exit",
+    "paper_auto_close": "exit",
+    "intraday_risk_monitor": "exit",
+}
+
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_DRAIN_SECONDS = 120.0
+
+WAKEUP_KEY = "job_runs:wakeup"
+# Bound the Redis wakeup list: one pending token is enough to wake a worker.
+_WAKEUP_LIST_MAX = 64
+
+
+def _parse_mapping(raw: str) -> Dict[str, str]:
+    out: Dict[str, str] = {}
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, sep, value = item.partition("=")
+        out[name.strip()] = value.strip() if sep else ""
+    return out
+
+
+def get_slot_config() -> Optional[Dict[str, int]]:
+    """WORKER_SLOTS="default=4,long=1,exit=2" — None (serial worker) when unset."""
+    raw = os.getenv("WORKER_SLOTS", "").strip()
+    if not raw:
+        return None
+    slots: Dict[str, int] = {}
+    for name, value in _parse_mapping(raw).items():
+        try:
+            slots[name] = max(1, int(value)) if value else DEFAULT_SLOTS.get(name, 1)
+        except ValueError:
+            logger.warning(f"Ignoring malformed WORKER_SLOTS item: {name}={value!r}")
+    slots.setdefault(DEFAULT_CLASS, DEFAULT_SLOTS[DEFAULT_CLASS])
+    return slots
+
+
+def get_job_classes() -> Dict[str, str]:
+    """DEFAULT_JOB_CLASSES merged with WORKER_JOB_CLASSES="job_name=class,..."."""
+    classes = dict(DEFAULT_JOB_CLASSES)
+    for name, cls in _parse_mapping(os.getenv("WORKER_JOB_CLASSES", "")).items():
+        if cls:
+            classes[name] = cls
+    return classes
+
+
+def _float_env(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def get_poll_seconds() -> float:
+    return _float_env("WORKER_POLL_SECONDS", DEFAULT_POLL_SECONDS)
+
+
+def get_drain_seconds() -> float:
+    return _float_env("WORKER_DRAIN_SECONDS", DEFAULT_DRAIN_SECONDS)
+
+
+# ---------------------------------------------------------------------------
+# Wakeup channel
+# ---------------------------------------------------------------------------
+
+class LocalWakeup:
+    """In-process wakeup: ``notify()`` releases the next ``wait()`` early."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """True when woken by ``notify`` (False on timeout)."""
+        woken = self._event.wait(timeout)
+        self._event.clear()
+        return woken
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class RedisWakeup(LocalWakeup):
+    """Cross-process wakeups over a Redis list.
+
+    A listener thread BLPOPs the list and converts every token into a local
+    ``notify()``, so slot-freed wakeups and enqueue wakeups share one wait.
+    Redis errors degrade to the poll fallback, never to a crash.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, key: str = WAKEUP_KEY):
+        super().__init__()
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self.key = key
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Reused by publish(); the client pools its own connections.
+        self._publish_conn = None
+
+    def _conn(self):
+        from redis import Redis
+        return Redis.from_url(self.redis_url, socket_timeout=5)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._listen, name="job-wakeup", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _listen(self) -> None:
+        conn = None
+        while not self._stopped.is_set():
+            try:
+                conn = conn or self._conn()
+                if conn.blpop([self.key], timeout=1):
+                    self.notify()
+            except Exception as e:
+                logger.debug(f"[WORKER] redis wakeup listener error: {e}")
+                conn = None
+                self._stopped.wait(DEFAULT_POLL_SECONDS)
+
+    def publish(self) -> None:
+        if self._publish_conn is None:
+            self._publish_conn = self._conn()
+        pipe = self._publish_conn.pipeline()
+        pipe.lpush(self.key, "1")
+        pipe.ltrim(self.key, 0, _WAKEUP_LIST_MAX - 1)
+        pipe.execute()
+
+
+_LOCAL_WAKEUP = LocalWakeup()
+# Publisher shared by every notify_job_enqueued() call in this process.
+_REDIS_PUBLISHER: Optional[RedisWakeup] = None
+
+
+def _wakeup_channel_name() -> str:
+    return os.getenv("JOB_WAKEUP_CHANNEL", "local").strip().lower() or "local"
+
+
+def get_wakeup_channel() -> LocalWakeup:
+    """Channel the worker waits on (JOB_WAKEUP_CHANNEL=local|redis)."""
+    if _wakeup_channel_name() == "redis":
+        return RedisWakeup()
+    return _LOCAL_WAKEUP
+
+
+def notify_job_enqueued(job_name: Optional[str] = None) -> None:
+    """Best-effort wakeup after a job_runs row is queued. Never raises."""
+    _LOCAL_WAKEUP.notify()
+    if _wakeup_channel_name() != "redis":
+        return
+    global _REDIS_PUBLISHER
+    try:
+        if _REDIS_PUBLISHER is None:
+            _REDIS_PUBLISHER = RedisWakeup()
+        _REDIS_PUBLISHER.publish()
+    except Exception as e:
+        if _REDIS_PUBLISHER is not None:
+            # Reconnect on the next enqueue.
+            _REDIS_PUBLISHER._publish_conn = None
+        logger.debug(f"[WORKER] wakeup publish failed for {job_name}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Slot worker
+# ---------------------------------------------------------------------------
+
+class SlotWorker:
+    """Claims jobs into per-class thread pools until stopped, then drains.
+
+    ``claim(job_names, exclude_job_names)`` returns one claimed job_runs row
+    restricted to those names, or None.
+    """
+
+    def __init__(
+        self,
+        claim: Callable[[Optional[List[str]], Optional[List[str]]], Optional[Dict[str, Any]]],
+        execute: Callable[[Dict[str, Any]], None],
+        requeue: Callable[[Dict[str, Any]], None],
+        slots: Dict[str, int],
+        job_classes: Optional[Dict[str, str]] = None,
+        wakeup: Optional[LocalWakeup] = None,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ):
+        self.claim = claim
+        self.execute = execute
+        self.requeue = requeue
+        self.slots = dict(slots)
+        self.slots.setdefault(DEFAULT_CLASS, DEFAULT_SLOTS[DEFAULT_CLASS])
+        self.job_classes = job_classes if job_classes is not None else get_job_classes()
+        self.wakeup = wakeup or LocalWakeup()
+        self.poll_seconds = poll_seconds
+        self.capacity = sum(self.slots.values())
+
+        self._pools = {
+            cls: concurrent.futures.ThreadPoolExecutor(max_workers=n, thread_name_prefix=f"job-{cls}")
+            for cls, n in self.slots.items()
+        }
+        self._lock = threading.Lock()
+        self._inflight: Dict[concurrent.futures.Future, Dict[str, Any]] = {}
+        self._stop = threading.Event()
+        # Observability only.
+        self.stats: Dict[str, int] = {"claimed": 0, "completed": 0, "requeued": 0, "wakeups": 0}
+        self._class_inflight: Dict[str, int] = {cls: 0 for cls in self.slots}
+        self._claim_filters = self._build_claim_filters()
+
+    def class_for(self, job_name: Optional[str]) -> str:
+        cls = self.job_classes.get(job_name or "", DEFAULT_CLASS)
+        return cls if cls in self._pools else DEFAULT_CLASS
+
+    def _build_claim_filters(self) -> Dict[str, Tuple[Optional[List[str]], Optional[List[str]]]]:
+        """class → (job_names, exclude_job_names) passed to ``claim``."""
+        by_class: Dict[str, List[str]] = {}
+        for name in self.job_classes:
+            cls = self.class_for(name)
+            if cls != DEFAULT_CLASS:
+                by_class.setdefault(cls, []).append(name)
+        filters: Dict[str, Tuple[Optional[List[str]], Optional[List[str]]]] = {
+            DEFAULT_CLASS: (None, sorted(n for names in by_class.values() for n in names) or None),
+        }
+        for cls in self.slots:
+            if cls != DEFAULT_CLASS:
+                # A class with no mapped job names never claims anything.
+                filters[cls] = (sorted(by_class.get(cls, [])), None)
+        return filters
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    def free_slots(self, cls: str) -> int:
+        with self._lock:
+            return self.slots[cls] - self._class_inflight[cls]
+
+    def request_stop(self) -> None:
+        self._stop.set()
+        self.wakeup.notify()
+
+    def run(self) -> None:
+        """Claim/dispatch loop; returns once ``request_stop`` was called."""
+        self.wakeup.start()
+        while not self._stop.is_set():
+            try:
+                self._claim_round()
+            except Exception as e:
+                logger.error(f"[WORKER] claim loop error: {e}")
+                self._stop.wait(5)
+                continue
+            if self.wakeup.wait(self.poll_seconds):
+                self.stats["wakeups"] += 1
+
+    def _claim_round(self) -> None:
+        """Claims for every class with a free slot until each is full or empty."""
+        open_classes = [cls for cls in self.slots if self._claim_filters[cls][0] != []]
+        while open_classes and not self._stop.is_set():
+            for cls in list(open_classes):
+                if self._stop.is_set() or self.in_flight() >= self.capacity:
+                    return
+                if self.free_slots(cls) <= 0:
+                    open_classes.remove(cls)
+                    continue
+                job_names, exclude = self._claim_filters[cls]
+                job = self.claim(job_names, exclude)
+                if not job:
+                    open_classes.remove(cls)
+                    continue
+                self._submit(job)
+
+    def _submit(self, job: Dict[str, Any]) -> None:
+        cls = self.class_for(job.get("job_name"))
+        with self._lock:
+            self.stats["claimed"] += 1
+            self._class_inflight[cls] += 1
+            future = self._pools[cls].submit(self._run_one, job)
+            self._inflight[future] = job
+        future.add_done_callback(self._on_done)
+
+    def _run_one(self, job: Dict[str, Any]) -> None:
+        try:
+            self.execute(job)
+        except Exception as e:
+            # execute() owns job-level error handling; this only guards the slot.
+            logger.error(f"[WORKER] job {job.get('id')} escaped its handler: {e}")
+
+    def _on_done(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            job = self._inflight.pop(future, None)
+            if job is not None:
+                self._class_inflight[self.class_for(job.get("job_name"))] -= 1
+                if not future.cancelled():
+                    self.stats["completed"] += 1
+        self.wakeup.notify()
+
+    def drain(self, timeout: float) -> List[Any]:
+        """Requeue not-yet-started jobs, wait for running ones.
+
+        Returns the ids of jobs still running when ``timeout`` expired.
+        """
+        self._stop.set()
+        self.wakeup.stop()
+        with self._lock:
+            pending = list(self._inflight.items())
+
+        running = []
+        for future, job in pending:
+            if future.cancel():
+                self.stats["requeued"] += 1
+                try:
+                    self.requeue(job)
+                except Exception as e:
+                    logger.error(f"[WORKER] drain requeue failed for {job.get('id')}: {e}")
+            else:
+                running.append(future)
+
+        _, not_done = concurrent.futures.wait(running, timeout=timeout)
+        for pool in self._pools.values():
+            pool.shutdown(wait=False)
+        with self._lock:
+            return [self._inflight[f].get("id") for f in not_done if f in self._inflight]
@@ -17,6 +17,7 @@ from packages.quantum.market_data_cache import get_cached_market_data, cache_mar
 from packages.quantum.services.market_data_cache import get_market_data_cache, TTL_QUOTES, TTL_SNAPSHOTS, TTL_OHLC
 from packages.quantum.services.cache_key_builder import make_cache_key_parts, normalize_symbol as normalize_option_symbol
 from packages.quantum.services.provider_guardrails import guardrail
+from packages.quantum.services.rate_governor import GovernedSession
 from packages.quantum.analytics.factors import calculate_trend, calculate_iv_rank
 
 logger = logging.getLogger(__name__)
@@ -76,7 +77,7 @@ class PolygonService:
         self.cache = get_market_data_cache()
 
         # Initialize Session with Connection Pooling
-        self.session = requests.Session()
+        self.session = GovernedSession("polygon")
 
         # Configure retry strategy
         retry_strategy = Retry(
@@ -151,6 +151,46 @@ def log_decision(
 
     return trace_id
 
+def _outcome_row(
+    trace_id: uuid.UUID,
+    realized_pl_1d: float,
+    realized_vol_1d: float,
+    surprise_score: float,
+    attribution_type: str = 'portfolio_snapshot',
+    related_id: Optional[uuid.UUID] = None,
+    counterfactual_pl_1d: Optional[float] = None,
+    counterfactual_available: bool = False,
+    status: str = OutcomeStatus.COMPLETE.value,
+    reason_codes: List[str] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    data = {
+        "trace_id": str(trace_id),
+        "realized_pl_1d": float(realized_pl_1d),
+        "realized_vol_1d": float(realized_vol_1d),
+        "surprise_score": float(surprise_score),
+        "attribution_type": attribution_type,
+        "created_at": datetime.now().isoformat(),
+        "status": status
+    }
+
+    if reason_codes is not None:
+         data["reason_codes"] = reason_codes
+    else:
+         data["reason_codes"] = []
+
+    if related_id:
+        data["related_id"] = str(related_id)
+
+    if counterfactual_available:
+        data["counterfactual_available"] = True
+        if counterfactual_pl_1d is not None:
+            data["counterfactual_pl_1d"] = float(counterfactual_pl_1d)
+
+    # Merge extra kwargs like counterfactual_reason
+    data.update(kwargs)
+    return data
+
 def log_outcome(
     trace_id: uuid.UUID,
     realized_pl_1d: float,
@@ -172,33 +212,48 @@ def log_outcome(
         return
 
     try:
-        data = {
-            "trace_id": str(trace_id),
-            "realized_pl_1d": float(realized_pl_1d),
-            "realized_vol_1d": float(realized_vol_1d),
-            "surprise_score": float(surprise_score),
-            "attribution_type": attribution_type,
-            "created_at": datetime.now().isoformat(),
-            "status": status
-        }
-
-        if reason_codes is not None:
-             data["reason_codes"] = reason_codes
-        else:
-             data["reason_codes"] = []
-
-        if related_id:
-            data["related_id"] = str(related_id)
-
-        if counterfactual_available:
-            data["counterfactual_available"] = True
-            if counterfactual_pl_1d is not None:
-                data["counterfactual_pl_1d"] = float(counterfactual_pl_1d)
-
-        # Merge extra kwargs like counterfactual_reason
-        data.update(kwargs)
+        data = _outcome_row(
+            trace_id, realized_pl_1d, realized_vol_1d, surprise_score,
+            attribution_type=attribution_type,
+            related_id=related_id,
+            counterfactual_pl_1d=counterfactual_pl_1d,
+            counterfactual_available=counterfactual_available,
+            status=status,
+            reason_codes=reason_codes,
+            **kwargs
+        )
 
         supabase.table("outcomes_log").insert(data).execute()
 
     except Exception as e:
         print(f"Logging Error: Failed to write to outcomes_log: {e}")
+
+def log_outcomes_bulk(outcomes: List[Dict[str, Any]], chunk_size: int = 500) -> int:
+    """
+    Insert many outcomes into outcomes_log (one request per chunk).
+
+    Each entry holds log_outcome's keyword arguments. Like log_outcome, the
+    first outcome written for a trace_id wins: rows whose trace_id already
+    exists are skipped (ON CONFLICT DO NOTHING), not overwritten. Keys a row
+    leaves out take the column default rather than NULL, as with a
+    single-row insert. Returns the number of rows inserted.
+    """
+    if not outcomes:
+        return 0
+    supabase = _get_supabase_client()
+    if not supabase:
+        return 0
+
+    rows = [_outcome_row(**o) for o in outcomes]
+    written = 0
+    for i in range(0, len(rows), chunk_size):
+        chunk = rows[i:i + chunk_size]
+        try:
+            res = supabase.table("outcomes_log").upsert(
+                chunk, on_conflict="trace_id", ignore_duplicates=True, default_to_null=False
+            ).execute()
+            data = getattr(res, "data", None)
+            written += len(data) if isinstance(data, list) else len(chunk)
+        except Exception as e:
+            print(f"Logging Error: Failed to write {len(chunk)} rows to outcomes_log: {e}")
+    return written
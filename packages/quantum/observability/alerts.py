@@ -4,9 +4,12 @@ Observability primitives per Loud-Error Doctrine v1.0.
 Reference: docs/loud_error_doctrine.md
 """
 
+import atexit
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -214,6 +217,7 @@ def alert(
     user_id: str | None = None,
     position_id: str | None = None,
     symbol: str | None = None,
+    defer: bool = False,
 ) -> None:
     """Write a risk_alerts row. Never raises.
 
@@ -241,6 +245,11 @@ def alert(
         user_id: Optional UUID for user-scoping the alert.
         position_id: Optional UUID for position-scoping.
         symbol: Optional ticker for symbol-scoping.
+        defer: Hot-path sites (scanner, provider guardrails) set this so
+            an ``info``/``warning`` row is queued to the buffered sink
+            instead of inserted on the caller's thread — see
+            ``_AlertSink``. ``high``/``critical`` rows are always written
+            synchronously (retry, egress, receipt), whatever ``defer`` says.
     """
     if severity not in _VALID_SEVERITIES:
         logger.warning(
@@ -278,6 +287,10 @@ def alert(
     if symbol is not None:
         record["symbol"] = symbol
 
+    if defer and severity in _DEFERRABLE_SEVERITIES and is_alert_sink_enabled():
+        get_alert_sink().submit(supabase, record)
+        return
+
     # Authoritative risk_alerts write with a right-sized retry on transient
     # stale-keepalive disconnects (loss-protection, 2026-06-30). ONLY transient
     # disconnects retry; any other exception breaks straight out to the
@@ -359,6 +372,243 @@ def alert(
     )
 
 
+# ── Buffered alert sink (hot-path alerts, 2026-10-16) ─────────────────────
+# A provider outage turns every guardrailed call and every scanned symbol into
+# a loud-error site; synchronously inserting each row put hundreds of blocking
+# DB writes on the scan's thread. alert(..., defer=True) instead queues
+# info/warning rows here: a bounded in-process buffer, coalesced per
+# (alert_type, severity, symbol, user_id) over a window into ONE row carrying a count,
+# written in batched inserts by a background flusher. Nothing is dropped
+# silently: overflow, a failed batch, and anything still buffered at
+# interpreter exit spill to the structured log (``alert_spilled``), and
+# lost rows count toward get_alert_write_failure_count().
+_DEFERRABLE_SEVERITIES = ("info", "warning")
+_ALERT_SINK_MAX_PENDING = 1000
+_ALERT_SINK_FLUSH_INTERVAL_S = 1.0
+_ALERT_SINK_COALESCE_WINDOW_S = 5.0
+_ALERT_SINK_BATCH_SIZE = 100
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+
+def is_alert_sink_enabled() -> bool:
+    """ALERT_SINK_BUFFERED — default ON; explicit 0/false/no/off makes
+    defer=True alerts write synchronously again."""
+    raw = os.getenv("ALERT_SINK_BUFFERED", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def _iso(ts: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(ts))
+
+
+class _AlertSink:
+    """Bounded, coalescing buffer of risk_alerts rows with a daemon flusher."""
+
+    def __init__(
+        self,
+        max_pending: int = _ALERT_SINK_MAX_PENDING,
+        flush_interval_s: float = _ALERT_SINK_FLUSH_INTERVAL_S,
+        coalesce_window_s: float = _ALERT_SINK_COALESCE_WINDOW_S,
+        batch_size: int = _ALERT_SINK_BATCH_SIZE,
+    ):
+        self.max_pending = max_pending
+        self.flush_interval_s = flush_interval_s
+        self.coalesce_window_s = coalesce_window_s
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        # key -> entry, in first-seen order (so due windows are a prefix).
+        self._pending: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.stats = {"submitted": 0, "coalesced": 0, "written": 0, "spilled": 0}
+
+    def submit(self, supabase: Any, record: dict) -> None:
+        """Queue ``record`` (never blocks on I/O, never raises)."""
+        key = (
+            id(supabase), record["alert_type"], record.get("severity"),
+            record.get("symbol"), record.get("user_id"),
+        )
+        now = time.time()
+        with self._lock:
+            self.stats["submitted"] += 1
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry["count"] += 1
+                entry["last_seen"] = now
+                self.stats["coalesced"] += 1
+                return
+            overflow = self._closed or len(self._pending) >= self.max_pending
+            if not overflow:
+                self._pending[key] = {
+                    "supabase": supabase,
+                    "record": record,
+                    "count": 1,
+                    "first_seen": now,
+                    "last_seen": now,
+                }
+                self._ensure_flusher()
+        if overflow:
+            self._spill(
+                [{"record": record, "count": 1}],
+                reason="closed" if self._closed else "overflow",
+            )
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, force: bool = True) -> int:
+        """Write buffered rows; ``force=False`` only takes closed windows.
+
+        Returns the number of rows written.
+        """
+        with self._flush_lock:
+            cutoff = time.time() - self.coalesce_window_s
+            with self._lock:
+                due = []
+                while self._pending:
+                    key, entry = next(iter(self._pending.items()))
+                    if not force and entry["first_seen"] > cutoff:
+                        break
+                    del self._pending[key]
+                    due.append(entry)
+            if not due:
+                return 0
+
+            by_client: "OrderedDict[int, list]" = OrderedDict()
+            for entry in due:
+                by_client.setdefault(id(entry["supabase"]), []).append(entry)
+
+            written = 0
+            for entries in by_client.values():
+                supabase = entries[0]["supabase"]
+                for i in range(0, len(entries), self.batch_size):
+                    batch = entries[i:i + self.batch_size]
+                    if self._insert_batch(supabase, [self._row(e) for e in batch]):
+                        written += len(batch)
+                    else:
+                        self._spill(batch, reason="write_failed")
+            with self._lock:
+                self.stats["written"] += written
+            return written
+
+    def close(self) -> None:
+        """Stop accepting rows and drain what is buffered (spilling failures)."""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self.flush(force=True)
+
+    def _ensure_flusher(self) -> None:
+        # Caller holds self._lock.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="alert-sink-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush(force=False)
+            except Exception:
+                logger.exception("alert_sink_flush_failed")
+
+    @staticmethod
+    def _row(entry: dict) -> dict:
+        record = entry["record"]
+        if entry["count"] <= 1:
+            return record
+        return {
+            **record,
+            "metadata": {
+                **record.get("metadata", {}),
+                "coalesced_count": entry["count"],
+                "first_seen_at": _iso(entry["first_seen"]),
+                "last_seen_at": _iso(entry["last_seen"]),
+            },
+        }
+
+    @staticmethod
+    def _insert_batch(supabase: Any, rows: list) -> bool:
+        # Same transient-only retry as the synchronous path; the sleeps are on
+        # the flusher thread, never on an alerting caller.
+        for backoff in (0.0,) + _ALERT_INSERT_RETRY_BACKOFFS:
+            if backoff:
+                time.sleep(backoff)
+            try:
+                supabase.table("risk_alerts").insert(rows).execute()
+                return True
+            except Exception as exc:  # noqa: BLE001 — classified below
+                if not _is_transient_disconnect(exc):
+                    logger.warning("alert_sink_batch_insert_failed", exc_info=True)
+                    return False
+        logger.warning("alert_sink_batch_insert_failed_after_retries")
+        return False
+
+    def _spill(self, entries: list, *, reason: str) -> None:
+        global _ALERT_WRITE_FAILURES
+        with self._lock:
+            self.stats["spilled"] += len(entries)
+        for entry in entries:
+            record = entry["record"]
+            _ALERT_WRITE_FAILURES += 1
+            logger.error(
+                "alert_spilled",
+                extra={
+                    "intended_alert_type": record["alert_type"],
+                    "intended_severity": record["severity"],
+                    "intended_message": record["message"][:200],
+                    "intended_symbol": record.get("symbol"),
+                    "intended_user_id": record.get("user_id"),
+                    "coalesced_count": entry["count"],
+                    "spill_reason": reason,
+                },
+            )
+
+
+_ALERT_SINK: _AlertSink | None = None
+_ALERT_SINK_LOCK = threading.Lock()
+
+
+def get_alert_sink() -> _AlertSink:
+    """The process-wide sink (created on first deferred alert)."""
+    global _ALERT_SINK
+    if _ALERT_SINK is None:
+        with _ALERT_SINK_LOCK:
+            if _ALERT_SINK is None:
+                _ALERT_SINK = _AlertSink()
+    return _ALERT_SINK
+
+
+def flush_alerts() -> int:
+    """Synchronously write every buffered deferred alert; returns rows written."""
+    if _ALERT_SINK is None:
+        return 0
+    return _ALERT_SINK.flush(force=True)
+
+
+def _shutdown_alert_sink() -> None:
+    if _ALERT_SINK is not None:
+        _ALERT_SINK.close()
+
+
+def _reset_alert_sink_after_fork() -> None:
+    # A forked worker must not flush (or hold locks of) the parent's buffer.
+    global _ALERT_SINK
+    _ALERT_SINK = None
+
+
+atexit.register(_shutdown_alert_sink)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_alert_sink_after_fork)
+
+
 # ── Shared admin Supabase singleton ───────────────────────────────
 # Used by modules that need to write risk_alerts but don't carry
 # a Supabase client through their call signatures (e.g., scheduler-
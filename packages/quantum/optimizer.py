@@ -10,7 +10,7 @@ import uuid
 from dataclasses import asdict
 
 # Core Imports
-from packages.quantum.core.math_engine import PortfolioMath
+from packages.quantum.core.math_engine import CoskewFactor, PortfolioMath
 from packages.quantum.core.surrogate import SurrogateOptimizer, optimize_for_compounding
 try:
     from packages.quantum.core.qci_adapter import QciDiracAdapter
@@ -100,7 +100,7 @@ def normalize_agent_constraints(agent_constraints: Optional[Dict[str, Any]]) ->
 def _compute_portfolio_weights(
     mu: np.ndarray,
     sigma: np.ndarray,
-    coskew: np.ndarray,
+    coskew: Union[np.ndarray, CoskewFactor],
     tickers: List[str],
     investable_assets: List[SpreadPosition],
     req: OptimizationRequest,
@@ -23,8 +23,19 @@ from packages.quantum.analytics.regime_integration import map_market_regime
 from packages.quantum.services.iv_repository import IVRepository
 from packages.quantum.services.iv_point_service import IVPointService
 from packages.quantum.services.market_data_truth_layer import MarketDataTruthLayer
+from packages.quantum.services.cycle_context import CycleContext
+from packages.quantum.services.option_chain import OptionChain, is_option_chain_columnar_enabled
 from packages.quantum.services.quote_provenance import QuoteProvenanceRecorder
 from packages.quantum.services.td_scan_capture import ScanEnvelopeRecorder
+from packages.quantum.services.scan_pipeline import (
+    ProviderLimiter,
+    SymbolPrefetcher,
+    get_prefetch_workers,
+    is_chain_prefetch_enabled,
+    is_scan_pipeline_enabled,
+    prefetch_sector_map,
+    run_pipelined,
+)
 from packages.quantum.services.oi_enrichment import enrich_selected_legs
 from packages.quantum.analytics import option_liquidity as _option_liquidity
 from packages.quantum.analytics.regime_engine_v3 import RegimeEngineV3, GlobalRegimeSnapshot, RegimeState
@@ -35,7 +46,7 @@ from packages.quantum.security.config import is_production
 from packages.quantum.services.earnings_calendar_service import EarningsCalendarService
 from packages.quantum.observability.feature_flags import is_iv_rank_none_routing_enabled
 from packages.quantum.observability.alerts import _is_transient_disconnect
-from packages.quantum.agents.runner import AgentRunner, build_agent_pipeline
+from packages.quantum.agents.runner import AgentRunner, agent_context_view, build_agent_pipeline
 
 # Surface V4 integration (optional, gated by env)
 def _is_surface_v4_enabled() -> bool:
@@ -1510,16 +1521,133 @@ def _chain_has_any_delta(
     return False
 
 
+def _option_chain_index(
+    calls: List[Dict[str, Any]], puts: List[Dict[str, Any]]
+) -> Optional[OptionChain]:
+    """Columnar strike/delta index over one expiry's strike-sorted calls/puts,
+    worth building for the condor grid's many lookups on that expiry.
+
+    None when OPTION_CHAIN_COLUMNAR is off or the chain cannot be indexed
+    (e.g. a non-numeric strike) — the selectors then scan the lists as before.
+    """
+    if not is_option_chain_columnar_enabled() or not (calls or puts):
+        return None
+    try:
+        return OptionChain.from_sides(calls, puts)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.debug(f"[OptionChain] index build failed, using list scans: {e}")
+        return None
+
+
+def _moneyness_for_target(op_type: str, target_delta: float) -> float:
+    """Strike/spot ratio standing in for a delta target on a greeks-less chain."""
+    moneyness = 1.0
+    if op_type == 'call':
+        if target_delta > 0.5: moneyness = 0.95
+        elif target_delta < 0.5: moneyness = 1.05
+    else:
+        if target_delta > 0.5: moneyness = 1.05
+        elif target_delta < 0.5: moneyness = 0.95
+    return moneyness
+
+
+def _best_contract_from_list(
+    candidates: List[Dict[str, Any]],
+    op_type: str,
+    target_delta: float,
+    current_price: float,
+    _delta
+) -> Dict[str, Any]:
+    """List-scan leg lookup for ``_select_legs_from_chain`` (strike-sorted
+    candidates of one type); the columnar path mirrors it on ChainSide."""
+    # 1b. Drop null-delta contracts before selection (fixes the #656
+    # regression). Providers (Alpaca AND Polygon, verified) omit greeks on
+    # illiquid deep-ITM/OTM strikes, so chains are PARTIAL-greeks. The O(1)
+    # has_delta check below reads candidates[0] (the deepest strike) — which
+    # is exactly the contract that lacks delta — and mis-flagged the WHOLE
+    # chain as delta-less, collapsing every credit/put vertical to the
+    # 3-bucket moneyness fallback (same-strike, width=0) for ~4 months.
+    # Filtering self-corrects has_delta AND removes the `_delta(x) or 0`
+    # contaminants that broke the bisect's strike<->delta monotonicity.
+    # PRESERVE the moneyness fallback only when this type is GENUINELY
+    # greeks-less (filtered list empty) — then fall back to the full list.
+    _delta_bearing = [c for c in candidates if _delta(c) is not None]
+    if _delta_bearing:
+        candidates = _delta_bearing
+
+    # 2. Find best contract (Delta or Moneyness)
+    # Note: Optimization - candidates are sorted by strike.
+
+    # After 1b, candidates[0] is delta-bearing whenever ANY contract of this
+    # type has greeks (the common partial-greeks case) -> has_delta=True and
+    # selection runs over clean, strike-sorted (delta-monotonic) contracts.
+    # Only a genuinely greeks-less type leaves candidates unfiltered -> the
+    # moneyness fallback is then reached correctly, not spuriously.
+    has_delta = candidates and _delta(candidates[0]) is not None
+
+    if has_delta:
+        target_d = abs(target_delta)
+
+        # Bolt Optimization: Use bisect (O(log N)) instead of min scan (O(N))
+        # Candidates sorted by strike.
+        # Calls: Delta decreases with strike. Negate delta to make ascending.
+        # Puts: Abs(Delta) increases with strike. Use as is.
+
+        if op_type == "call":
+            # Descending (0.9 -> 0.1) -> Ascending (-0.9 -> -0.1)
+            key_func = lambda x: -abs(_delta(x) or 0)
+            target_val = -target_d
+        else:
+            # Ascending (0.1 -> 0.9)
+            key_func = lambda x: abs(_delta(x) or 0)
+            target_val = target_d
+
+        # Find insertion point
+        idx = bisect_left(candidates, target_val, key=key_func)
+
+        # Find closest neighbor (idx-1 or idx)
+        best_contract = candidates[0]
+        best_diff = float('inf')
+
+        # Check left neighbor
+        if idx > 0:
+            c = candidates[idx - 1]
+            diff = abs(abs(_delta(c) or 0) - target_d)
+            if diff < best_diff:
+                best_diff = diff
+                best_contract = c
+
+        # Check right neighbor (insertion point)
+        if idx < len(candidates):
+            c = candidates[idx]
+            diff = abs(abs(_delta(c) or 0) - target_d)
+            if diff < best_diff:
+                best_diff = diff
+                best_contract = c
+    else:
+        target_k = current_price * _moneyness_for_target(op_type, target_delta)
+        # Binary search could be used here since sorted by strike, but min() is robust and fast enough for N=50
+        # Strike is always at top level
+        best_contract = min(candidates, key=lambda x: abs(x['strike'] - target_k))
+
+    return best_contract
+
+
 def _select_legs_from_chain(
     calls: List[Dict[str, Any]],
     puts: List[Dict[str, Any]],
     leg_defs: List[Dict[str, Any]],
-    current_price: float
+    current_price: float,
+    chain: Optional[OptionChain] = None
 ) -> tuple[List[Dict[str, Any]], float]:
     """
     Selects legs using pre-sorted call/put lists to avoid repeated filtering/sorting.
     calls: sorted by strike (asc)
     puts: sorted by strike (asc)
+    chain: optional OptionChain built from the same calls/puts; when given,
+    the delta/strike lookups use its indexes instead of scanning the lists.
+    Pass one that already exists (the condor grid's) — for a handful of legs
+    the list scans are cheaper than building an index.
 
     Bolt Optimization: Supports both Flat (PolygonService) and Nested (TruthLayer) schemas
     to avoid O(N) flattening overhead.
@@ -1563,83 +1691,17 @@ def _select_legs_from_chain(
         if not candidates:
              continue
 
-        # 1b. Drop null-delta contracts before selection (fixes the #656
-        # regression). Providers (Alpaca AND Polygon, verified) omit greeks on
-        # illiquid deep-ITM/OTM strikes, so chains are PARTIAL-greeks. The O(1)
-        # has_delta check below reads candidates[0] (the deepest strike) — which
-        # is exactly the contract that lacks delta — and mis-flagged the WHOLE
-        # chain as delta-less, collapsing every credit/put vertical to the
-        # 3-bucket moneyness fallback (same-strike, width=0) for ~4 months.
-        # Filtering self-corrects has_delta AND removes the `_delta(x) or 0`
-        # contaminants that broke the bisect's strike<->delta monotonicity.
-        # PRESERVE the moneyness fallback only when this type is GENUINELY
-        # greeks-less (filtered list empty) — then fall back to the full list.
-        _delta_bearing = [c for c in candidates if _delta(c) is not None]
-        if _delta_bearing:
-            candidates = _delta_bearing
-
-        # 2. Find best contract (Delta or Moneyness)
-        # Note: Optimization - candidates are sorted by strike.
-
-        # After 1b, candidates[0] is delta-bearing whenever ANY contract of this
-        # type has greeks (the common partial-greeks case) -> has_delta=True and
-        # selection runs over clean, strike-sorted (delta-monotonic) contracts.
-        # Only a genuinely greeks-less type leaves candidates unfiltered -> the
-        # moneyness fallback is then reached correctly, not spuriously.
-        has_delta = candidates and _delta(candidates[0]) is not None
-
-        if has_delta:
-            target_d = abs(target_delta)
-
-            # Bolt Optimization: Use bisect (O(log N)) instead of min scan (O(N))
-            # Candidates sorted by strike.
-            # Calls: Delta decreases with strike. Negate delta to make ascending.
-            # Puts: Abs(Delta) increases with strike. Use as is.
-
-            if op_type == "call":
-                # Descending (0.9 -> 0.1) -> Ascending (-0.9 -> -0.1)
-                key_func = lambda x: -abs(_delta(x) or 0)
-                target_val = -target_d
+        if chain is not None:
+            # Same selection as below, on the shared columnar index.
+            side_index = chain.side(op_type)
+            bearing = side_index.delta_bearing()
+            if len(bearing):
+                best_contract = bearing.pick(candidates, bearing.bisect_abs_delta(abs(target_delta)))
             else:
-                # Ascending (0.1 -> 0.9)
-                key_func = lambda x: abs(_delta(x) or 0)
-                target_val = target_d
-
-            # Find insertion point
-            idx = bisect_left(candidates, target_val, key=key_func)
-
-            # Find closest neighbor (idx-1 or idx)
-            best_contract = candidates[0]
-            best_diff = float('inf')
-
-            # Check left neighbor
-            if idx > 0:
-                c = candidates[idx - 1]
-                diff = abs(abs(_delta(c) or 0) - target_d)
-                if diff < best_diff:
-                    best_diff = diff
-                    best_contract = c
-
-            # Check right neighbor (insertion point)
-            if idx < len(candidates):
-                c = candidates[idx]
-                diff = abs(abs(_delta(c) or 0) - target_d)
-                if diff < best_diff:
-                    best_diff = diff
-                    best_contract = c
+                target_k = current_price * _moneyness_for_target(op_type, target_delta)
+                best_contract = side_index.pick(candidates, side_index.nearest_strike(target_k))
         else:
-            moneyness = 1.0
-            if op_type == 'call':
-                if target_delta > 0.5: moneyness = 0.95
-                elif target_delta < 0.5: moneyness = 1.05
-            else:
-                if target_delta > 0.5: moneyness = 1.05
-                elif target_delta < 0.5: moneyness = 0.95
-
-            target_k = current_price * moneyness
-            # Binary search could be used here since sorted by strike, but min() is robust and fast enough for N=50
-            # Strike is always at top level
-            best_contract = min(candidates, key=lambda x: abs(x['strike'] - target_k))
+            best_contract = _best_contract_from_list(candidates, op_type, target_delta, current_price, _delta)
 
         premium = _premium(best_contract) or 0.0
 
@@ -1817,33 +1879,55 @@ def _select_iron_condor_legs_param(
     _expiry,
     _gamma,
     _vega,
-    _theta
+    _theta,
+    chain: Optional[OptionChain] = None
 ) -> tuple[List[Dict[str, Any]], float]:
     """
     Parameterized iron condor constructor for EV-aware grid search.
     Only builds legs with valid NBBO (bid > 0, ask > 0, ask >= bid).
+    With ``chain`` (an OptionChain of the same calls/puts) the short and
+    wing lookups are binary searches instead of list scans.
 
     Returns (legs, total_cost) or ([], 0.0) if construction fails.
     """
     if not calls or not puts:
         return [], 0.0
 
-    # Select shorts by delta
-    short_call = min(calls, key=lambda x: abs(abs(_delta(x) or 0) - target_delta))
-    short_put = min(puts, key=lambda x: abs(abs(_delta(x) or 0) - target_delta))
+    if chain is not None:
+        call_side = chain.side("call")
+        put_side = chain.side("put")
+        short_call = call_side.pick(calls, call_side.nearest_abs_delta(target_delta))
+        short_put = put_side.pick(puts, put_side.nearest_abs_delta(target_delta))
 
-    # Select longs by strike offset
-    target_long_call_strike = short_call["strike"] + width
-    target_long_put_strike = short_put["strike"] - width
+        # Wings strictly beyond the shorts, nearest to short strike ± width
+        first_long_call = call_side.above(short_call["strike"])
+        last_long_put = put_side.below(short_put["strike"])
+        if first_long_call >= len(call_side) or last_long_put == 0:
+            return [], 0.0
 
-    valid_long_calls = [c for c in calls if c["strike"] > short_call["strike"]]
-    valid_long_puts = [p for p in puts if p["strike"] < short_put["strike"]]
+        long_call = call_side.pick(
+            calls, call_side.nearest_strike(short_call["strike"] + width, lo=first_long_call)
+        )
+        long_put = put_side.pick(
+            puts, put_side.nearest_strike(short_put["strike"] - width, hi=last_long_put)
+        )
+    else:
+        # Select shorts by delta
+        short_call = min(calls, key=lambda x: abs(abs(_delta(x) or 0) - target_delta))
+        short_put = min(puts, key=lambda x: abs(abs(_delta(x) or 0) - target_delta))
 
-    if not valid_long_calls or not valid_long_puts:
-        return [], 0.0
+        # Select longs by strike offset
+        target_long_call_strike = short_call["strike"] + width
+        target_long_put_strike = short_put["strike"] - width
+
+        valid_long_calls = [c for c in calls if c["strike"] > short_call["strike"]]
+        valid_long_puts = [p for p in puts if p["strike"] < short_put["strike"]]
 
-    long_call = min(valid_long_calls, key=lambda x: abs(x["strike"] - target_long_call_strike))
-    long_put = min(valid_long_puts, key=lambda x: abs(x["strike"] - target_long_put_strike))
+        if not valid_long_calls or not valid_long_puts:
+            return [], 0.0
+
+        long_call = min(valid_long_calls, key=lambda x: abs(x["strike"] - target_long_call_strike))
+        long_put = min(valid_long_puts, key=lambda x: abs(x["strike"] - target_long_put_strike))
 
     # Verify strike ordering
     if long_call["strike"] <= short_call["strike"] or long_put["strike"] >= short_put["strike"]:
@@ -1900,11 +1984,15 @@ def _select_best_iron_condor_ev_aware(
     calls: List[Dict[str, Any]],
     puts: List[Dict[str, Any]],
     condor_spread_threshold: float,
-    current_price: float = 0.0
+    current_price: float = 0.0,
+    chain: Optional[OptionChain] = None
 ) -> tuple[List[Dict[str, Any]], float, Dict[str, Any]]:
     """
     EV-aware grid search for iron condor selection.
 
+    ``chain`` is the OptionChain of the same calls/puts; when omitted it is
+    built here (once for the whole grid) unless OPTION_CHAIN_COLUMNAR is off.
+
     Iterates over (target_delta, width) combinations to find the
     condor with highest positive EV that meets all constraints:
     - All 4 legs have valid NBBO
@@ -1955,6 +2043,9 @@ def _select_best_iron_condor_ev_aware(
     if not _chain_has_any_delta(calls, puts, _delta):
         return [], 0.0, {"reason": "no_deltas_in_chain"}
 
+    if chain is None:
+        chain = _option_chain_index(calls, puts)
+
     best_ev_positive = None
     best_legs_positive = None
     best_cost_positive = None
@@ -1980,7 +2071,8 @@ def _select_best_iron_condor_ev_aware(
 
             legs, total_cost = _select_iron_condor_legs_param(
                 calls, puts, target_delta, width,
-                _delta, _bid, _ask, _ticker, _expiry, _gamma, _vega, _theta
+                _delta, _bid, _ask, _ticker, _expiry, _gamma, _vega, _theta,
+                chain=chain
             )
 
             if not legs:
@@ -3040,6 +3132,7 @@ def scan_for_opportunities(
     account_tier: Optional[str] = None,
     job_run_id: Optional[str] = None,
     regime_capture_sink: Optional[Dict[str, Any]] = None,
+    cycle_context: Optional[CycleContext] = None,
 ) -> Tuple[List[Dict[str, Any]], RejectionStats]:
     """
     Scans the provided symbols (or universe) for option trade opportunities.
@@ -3060,6 +3153,10 @@ def scan_for_opportunities(
     - symbols_processed: int
     - chains_loaded: int
     - chains_empty: int
+
+    ``cycle_context`` is the caller's per-cycle CycleContext (the midday
+    cycle shares one with its regime engine); without one the scan builds
+    its own, so bars/quotes/details are still fetched once per scan.
     """
     candidates = []
     # Tier 1C (2026-05-13): pass supabase + cycle_date so
@@ -3112,10 +3209,14 @@ def scan_for_opportunities(
     strategy_selector = StrategySelector()
     universe_service = UniverseService(supabase_client) if supabase_client else None
     execution_service = ExecutionService(supabase_client) if supabase_client else None
-    earnings_service = EarningsCalendarService(market_data)
 
     # Unified Regime Engine
-    truth_layer = MarketDataTruthLayer()
+    # The cycle owns one truth layer; the scan adopts it when the caller
+    # supplied a context so both read the same snapshot/bar caches.
+    if cycle_context is not None and cycle_context.truth_layer is not None:
+        truth_layer = cycle_context.truth_layer
+    else:
+        truth_layer = MarketDataTruthLayer()
     # Lane 4C: attach the per-cycle recorder at the truth-layer boundary
     # (where source/fallback/429 is KNOWN). Fail-soft: a stubbed truth
     # layer without the setter must never break the scan.
@@ -3124,10 +3225,23 @@ def scan_for_opportunities(
     except Exception:
         logger.debug("quote_provenance attach failed (non-fatal)",
                      exc_info=True)
+    iv_repository = IVRepository(supabase_client) if supabase_client else None
+    cycle_context = (cycle_context or CycleContext()).bind(
+        market_data=market_data,
+        truth_layer=truth_layer,
+        iv_repo=iv_repository,
+    )
+    # Earnings estimation reads ticker details too — through the cycle, so
+    # the sector map below reuses the same lookups.
+    earnings_service = EarningsCalendarService(cycle_context.polygon_view())
+    cycle_context.bind(earnings_service=earnings_service)
+    # Memoized bars/quotes for every consumer in this scan (regime engine,
+    # TA window, pipeline prefetch); chains and v4 snapshots pass through.
+    cycle_market_data = cycle_context.market_data_view()
     regime_engine = RegimeEngineV3(
         supabase_client=supabase_client,
-        market_data=truth_layer,
-        iv_repository=IVRepository(supabase_client) if supabase_client else None,
+        market_data=cycle_market_data,
+        iv_repository=iv_repository,
         iv_point_service=IVPointService(supabase_client) if supabase_client else None,
     )
 
@@ -3202,13 +3316,27 @@ def scan_for_opportunities(
         rejection_stats.universe_selection_source = "caller_supplied"
     print(f"[Scanner] Processing {len(symbols)} symbols...")
 
+    # Warm the cycle for the universe before the per-kind reads below:
+    # quotes, IV context and earnings (symbols the universe map has no date
+    # for) take one batch call each, ticker details run per symbol, all
+    # concurrently. The earnings / IV / sector / quote reads then hit the
+    # cycle memo. Best-effort: a failed warm-up leaves those reads to fetch.
+    try:
+        cycle_context.prefetch(
+            symbols,
+            iv_context=regime_engine.iv_repo is not None,
+            earnings_symbols=[s for s in symbols if not earnings_map.get(s)],
+        )
+    except Exception as e:
+        logger.warning(f"[Scanner] cycle prefetch failed (non-fatal): {e}")
+
     # Enrich Earnings Map via Service (Batch)
     try:
         # Find symbols missing earnings in Universe map
         missing_earnings = [s for s in symbols if not earnings_map.get(s)]
         if missing_earnings:
              logger.info(f"[Scanner] Fetching earnings for {len(missing_earnings)} symbols...")
-             fetched_map = earnings_service.get_earnings_map(missing_earnings)
+             fetched_map = cycle_context.get_earnings_map(missing_earnings)
 
              # Merge into main map (convert date objects to string if needed, or keep as obj)
              # Note: Universe map has strings (from DB), Service returns date objects.
@@ -3242,7 +3370,7 @@ def scan_for_opportunities(
     if regime_engine.iv_repo:
         try:
             logger.info(f"[Scanner] Batch fetching IV context for {len(symbols)} symbols...")
-            iv_context_map = regime_engine.iv_repo.get_iv_context_batch(symbols)
+            iv_context_map = cycle_context.get_iv_context_batch(symbols)
         except Exception as e:
             print(f"[Scanner] Failed to batch fetch IV context: {e}")
 
@@ -3285,12 +3413,21 @@ def scan_for_opportunities(
     _check_iv_pipeline_health(iv_context_map, symbols, supabase_client)
 
     # Batch Fetch Sector Data (for risk envelope concentration checks)
+    # Pipeline mode fetches details concurrently under the shared per-provider
+    # limiter instead of one blocking round trip per symbol in series.
+    pipeline_enabled = is_scan_pipeline_enabled()
+    provider_limiter = ProviderLimiter() if pipeline_enabled else None
     sector_map: Dict[str, str] = {}
     try:
-        for sym in symbols:
-            details = market_data.get_ticker_details(sym)
-            if details:
-                sector_map[sym] = details.get("sic_description") or details.get("sector") or "unknown"
+        if pipeline_enabled:
+            sector_map = prefetch_sector_map(
+                cycle_context.polygon_view(), symbols, provider_limiter, get_prefetch_workers()
+            )
+        else:
+            for sym in symbols:
+                sector = cycle_context.sector(sym)
+                if sector is not None:
+                    sector_map[sym] = sector
     except Exception as e:
         logger.warning(f"[Scanner] Failed to batch fetch sector data: {e}")
 
@@ -3299,9 +3436,10 @@ def scan_for_opportunities(
 
     # 3a. Batch Fetch Quotes (Optimization)
     # Fetch all quotes in one go to avoid N requests inside the loop
-    # truth_layer.snapshot_many handles batching automatically
+    # truth_layer.snapshot_many handles batching automatically; symbols the
+    # cycle already quoted (the global-regime basket) are not re-fetched.
     logger.info(f"[Scanner] Batch fetching quotes for {len(symbols)} symbols...")
-    quotes_map = truth_layer.snapshot_many(symbols)
+    quotes_map = cycle_context.snapshot_many(symbols)
 
     # Tier-aware universe pre-filter (saves Polygon option-chain calls
     # for symbols whose underlying price would produce contracts
@@ -3323,6 +3461,21 @@ def scan_for_opportunities(
     ta_end_date = now_dt
     ta_start_date = ta_end_date - timedelta(days=90)
 
+    # TA bars for the (tier-filtered) universe. The pipeline prefetcher
+    # streams them per symbol itself; the pooled path warms them here.
+    if not pipeline_enabled:
+        try:
+            cycle_context.prefetch(
+                symbols, details=False, quotes=False, iv_context=False,
+                earnings=False, bars=(ta_start_date, ta_end_date),
+            )
+        except Exception as e:
+            logger.warning(f"[Scanner] cycle bars prefetch failed (non-fatal): {e}")
+
+    # Quant Agents: built once per scan and shared by every worker thread
+    # (agents hold only env-derived config; evaluate() is read-only).
+    scanner_agents = build_agent_pipeline(phase="scanner")
+
     # Shared storage for multi-strategy candidate lists (keyed by symbol)
     _multi_strategy_candidates: Dict[str, List] = {}
 
@@ -3431,8 +3584,8 @@ def scan_for_opportunities(
                 bars = _cached_data["bars"]
                 closes = _cached_data["closes"]
             else:
-                # Fetch using Truth Layer (caches!)
-                bars = truth_layer.daily_bars(symbol, ta_start_date, ta_end_date)
+                # Fetch using Truth Layer (caches!) via the cycle memo
+                bars = cycle_market_data.daily_bars(symbol, ta_start_date, ta_end_date)
 
                 # History handling: tolerate list of objects or dict with 'prices'
                 closes = []
@@ -3609,7 +3762,7 @@ def scan_for_opportunities(
             attempted_strategy = suggestion["strategy"]
 
             # --- V3 Strategy Design Agent Override ---
-            design_agents = build_agent_pipeline(phase="scanner")
+            design_agents = scanner_agents
             if design_agents:
                 try:
                     agent_context = {
@@ -3859,6 +4012,25 @@ def scan_for_opportunities(
                 puts_sorted = sorted(puts_list, key=operator.itemgetter('strike'))
                 return calls_sorted, puts_sorted
 
+            # Per-expiry call/put split and OptionChain index, kept in
+            # _cached_data so the multi-strategy retries for this symbol (same
+            # cached chain, same expiry buckets) reuse them. The condor grid
+            # builds the index; the vertical leg selector only reuses one that
+            # exists, since its few lookups cost less than a build.
+            _expiry_splits: Dict[str, list] = (
+                _cached_data.setdefault("expiry_splits", {})
+                if _cached_data is not None else {}
+            )
+
+            def _expiry_calls_puts(exp, subset, build_index=False):
+                entry = _expiry_splits.get(exp)
+                if entry is None:
+                    entry = [*_split_chain_to_calls_puts(subset), None]
+                    _expiry_splits[exp] = entry
+                if build_index and entry[2] is None:
+                    entry[2] = _option_chain_index(entry[0], entry[1])
+                return entry[0], entry[1], entry[2]
+
             if is_condor_strategy:
                 # Multi-expiry condor search: try each expiry candidate
                 # Find the best viable candidate across all expiries
@@ -3872,12 +4044,15 @@ def scan_for_opportunities(
                 expiry_diagnostics = []
 
                 for exp_str, exp_subset in expiry_candidates:
-                    calls_sorted, puts_sorted = _split_chain_to_calls_puts(exp_subset)
+                    calls_sorted, puts_sorted, exp_index = _expiry_calls_puts(
+                        exp_str, exp_subset, build_index=True
+                    )
 
                     legs, total_cost, condor_meta = _select_best_iron_condor_ev_aware(
                         calls_sorted, puts_sorted,
                         condor_spread_threshold=CONDOR_MAX_LEG_SPREAD_PCT,
-                        current_price=current_price
+                        current_price=current_price,
+                        chain=exp_index,
                     )
 
                     # Record diagnostics for this expiry
@@ -3924,7 +4099,7 @@ def scan_for_opportunities(
                     condor_precomputed_ev = best_condor_ev
 
                     # Update calls/puts for later use (e.g., logging)
-                    calls_sorted, puts_sorted = _split_chain_to_calls_puts(chain_subset)
+                    calls_sorted, puts_sorted, _ = _expiry_calls_puts(expiry_selected, chain_subset)
                 else:
                     # No viable condor across any expiry - determine primary rejection reason
                     # Aggregate diagnostics to find most common failure mode
@@ -3982,7 +4157,9 @@ def scan_for_opportunities(
                         return None
             else:
                 # Non-condor path: use single expiry
-                calls_sorted, puts_sorted = _split_chain_to_calls_puts(chain_subset)
+                calls_sorted, puts_sorted, exp_index = _expiry_calls_puts(
+                    expiry_selected, chain_subset
+                )
 
                 # LOUD GUARD (H11 anti-silent-degrade): a genuinely greeks-less
                 # chain (zero delta ANYWHERE) must surface, not silently fall to
@@ -3998,6 +4175,7 @@ def scan_for_opportunities(
                             supabase_client,
                             alert_type="chain_greeks_absent",
                             severity="warning",
+                            defer=True,
                             symbol=symbol,
                             message=(
                                 f"option chain for {symbol} has zero greeks chain-wide; "
@@ -4017,7 +4195,10 @@ def scan_for_opportunities(
                     )
                     return None
 
-                legs, total_cost = _select_legs_from_chain(calls_sorted, puts_sorted, suggestion["legs"], current_price)
+                legs, total_cost = _select_legs_from_chain(
+                    calls_sorted, puts_sorted, suggestion["legs"], current_price,
+                    chain=exp_index,
+                )
 
             if not legs:
                 rej_stats.record(
@@ -4203,6 +4384,7 @@ def scan_for_opportunities(
                             supabase_client,
                             alert_type="chain_mechanics_formula_anomaly",
                             severity="warning",
+                            defer=True,
                             symbol=symbol,
                             message=(
                                 f"spread_pct {option_spread_pct:.1%} exceeds anomaly threshold "
@@ -4710,16 +4892,19 @@ def scan_for_opportunities(
             candidate_dict["probability_of_profit_source"] = pop_source or "unknown"
 
             # --- QUANT AGENTS V3 INTEGRATION ---
-            scanner_agents = build_agent_pipeline(phase="scanner")
             if scanner_agents:
                 try:
-                    # Build Agent Context
-                    agent_context = candidate_dict.copy()
-                    agent_context.update({
+                    # Build Agent Context: read-only view over the candidate
+                    # (no copy) with only this symbol's earnings slice.
+                    _agent_sym = candidate_dict.get("symbol")
+                    agent_context = agent_context_view(candidate_dict, {
                         "quote": quote,
                         "iv_rank": iv_rank,
                         "effective_regime": effective_regime_state.value,
-                        "earnings_map": earnings_map,
+                        "earnings_map": (
+                            {_agent_sym: earnings_map[_agent_sym]}
+                            if _agent_sym in earnings_map else {}
+                        ),
                         "timestamp": now_dt.isoformat() # Use hoisted timestamp
                     })
 
@@ -4860,20 +5045,48 @@ def scan_for_opportunities(
         rej_stats.record("all_strategies_rejected")
         return None
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
-        future_to_symbol = {
-            executor.submit(_process_symbol_multi, sym, drag_map, quotes_map, earnings_map, iv_context_map, rejection_stats): sym
-            for sym in symbols
-        }
-
-        for future in concurrent.futures.as_completed(future_to_symbol):
-            sym = future_to_symbol[future]
+    if pipeline_enabled:
+        # Staged pipeline: per-symbol bars/chain prefetch (provider-bounded)
+        # feeds evaluation as each symbol's data lands. Evaluation makes the
+        # same truth-layer calls as before — they are now cache hits.
+        prefetcher = SymbolPrefetcher(
+            cycle_market_data,
+            quotes_map,
+            (ta_start_date, ta_end_date),
+            min_expiry,
+            max_expiry,
+            provider_limiter,
+            prefetch_chains=is_chain_prefetch_enabled(),
+        )
+        for sym, future in run_pipelined(
+            symbols,
+            prefetcher,
+            lambda s: _process_symbol_multi(s, drag_map, quotes_map, earnings_map, iv_context_map, rejection_stats),
+            prefetch_workers=get_prefetch_workers(),
+            eval_workers=batch_size,
+        ):
             try:
                 result = future.result()
                 if result:
                     candidates.append(result)
             except Exception as exc:
                 print(f"[Scanner] Exception in thread for {sym}: {exc}")
+        logger.info(f"[Scanner] pipeline prefetch stats: {prefetcher.stats}")
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+            future_to_symbol = {
+                executor.submit(_process_symbol_multi, sym, drag_map, quotes_map, earnings_map, iv_context_map, rejection_stats): sym
+                for sym in symbols
+            }
+
+            for future in concurrent.futures.as_completed(future_to_symbol):
+                sym = future_to_symbol[future]
+                try:
+                    result = future.result()
+                    if result:
+                        candidates.append(result)
+                except Exception as exc:
+                    print(f"[Scanner] Exception in thread for {sym}: {exc}")
 
     # Sort by Unified Score descending
     # Bolt Determinism: Add symbol as tie-breaker for stable ordering across concurrent runs
@@ -4925,7 +5138,13 @@ def scan_for_opportunities(
     # Lane 4C: single batched provenance flush (sampling + cap + scrub
     # applied inside). LOUD counter on persist failure; typed no-op while
     # the option_quote_provenance migration is unapplied. Never breaks the
-    # scan return.
+    # scan return. Detached first: a cycle-shared truth layer outlives the
+    # scan and must not keep recording into a flushed recorder.
+    try:
+        truth_layer.set_provenance_recorder(None)
+    except Exception:
+        logger.debug("quote_provenance detach failed (non-fatal)",
+                     exc_info=True)
     try:
         _prov_counts = provenance_recorder.flush()
         if (_prov_counts.get("persist_failures")
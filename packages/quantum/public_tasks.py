@@ -13,6 +13,7 @@ from packages.quantum.jobs.rq_enqueue import enqueue_idempotent, BACKGROUND_QUEU
 from packages.quantum.jobs.job_runs import JobRunStore
 from packages.quantum.jobs.job_status_projection import project_job_status
 from packages.quantum.jobs.origin import resolve_request_origin
+from packages.quantum.services.job_dag_executor import dag_idempotency_key
 from packages.quantum.security.task_signing_v4 import verify_task_signature, TaskSignatureResult
 from packages.quantum.policies.go_live_policy import evaluate_go_live_gate
 from packages.quantum.core.rate_limiter import limiter
@@ -191,7 +192,13 @@ def enqueue_job_run(
     - If requires_manual_approval (micro_live): cancels auto-live jobs
 
     This ensures all attempted runs while paused are visible in the admin jobs page.
+
+    JOB_DAG_EXECUTION: a dependent fired on its upstream's completion is keyed
+    to the upstream's schedule slot instead of the fire time
+    (job_dag_executor.dag_idempotency_key).
     """
+    idempotency_key = dag_idempotency_key(origin, _extract_user_id(payload)) or idempotency_key
+
     # v4-L5: PAUSE GATE - check if trading is paused before enqueue
     from packages.quantum.ops_endpoints import is_trading_paused, get_global_ops_control
     is_paused, pause_reason = is_trading_paused()
@@ -8,7 +8,8 @@ Checks limits that the budget engine doesn't cover:
 2. Concentration limits (symbol, sector, expiry, correlation)
 3. Event concentration (earnings exposure)
 4. Loss envelopes (daily, weekly, per-symbol)
-5. Stress scenarios (SPY crash, VIX spike, correlation-one)
+5. Stress scenarios (SPY crash, VIX spike, correlation-one), plus an
+   observe-only full-revaluation grid (risk.stress_grid)
 
 All limits are configurable via env vars with sensible defaults.
 """
@@ -21,14 +22,24 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from packages.quantum.risk.position_model import (
+    OptionType,
     PositionNormalizationError,
     RiskClassification,
     _direction_sign,
+    _leg_symbol,
     aggregate_greeks,
     analyze_payoff,
     leg_full_contract_count,
     normalize_position,
 )
+from packages.quantum.risk.stress_grid import (
+    GridLeg,
+    GridPosition,
+    compute_stress_grid,
+    finite_positive,
+    is_stress_grid_enabled,
+    leg_iv,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -218,6 +229,14 @@ class EnvelopeCheckResult:
     # until #1259's stage-time greek population accrues real data.
     greek_cap_counterfactual: Dict[str, Any] = field(default_factory=dict)
 
+    # OBSERVE-ONLY full-revaluation stress grid (risk.stress_grid): every leg
+    # repriced under Black-Scholes across spot × vol × time decay; this is the
+    # JSON digest (worst book cells, per-position worst cell, typed
+    # unavailable positions). Feeds NO violation and never enters worst_case.
+    # Positions without a spot/leg IV this pass are typed unavailable and the
+    # book surface is omitted (available=False) — never a fabricated vol (H9).
+    stress_grid: Dict[str, Any] = field(default_factory=dict)
+
     def add_violation(self, v: EnvelopeViolation) -> None:
         self.violations.append(v)
         if v.severity in ("block", "force_close"):
@@ -239,6 +258,7 @@ class EnvelopeCheckResult:
             "greeks_coverage": self.greeks_coverage,
             "canonical_greeks": self.canonical_greeks,
             "greek_cap_counterfactual": self.greek_cap_counterfactual,
+            "stress_grid": self.stress_grid,
         }
 
 
@@ -1288,6 +1308,71 @@ def compute_stress_scenarios(
     return violations, results, unavailable
 
 
+def stress_grid_inputs(
+    positions: List[Dict],
+    as_of: Optional[date] = None,
+) -> tuple:
+    """Canonical GridPositions for the full-revaluation stress grid.
+
+    Each row goes through normalize_position (strike, type, expiry, signed
+    ratio × structure quantity × multiplier); spot is the row's
+    ``underlying_price`` and each leg's vol its ``iv`` (annotated in memory
+    by intraday_risk_monitor from the cycle's snapshot batch). A row that
+    cannot supply all of them is typed unavailable — never a fabricated
+    vol or spot (H9).
+
+    Returns (grid_positions, unavailable).
+    """
+    as_of = as_of or datetime.now(timezone.utc).date()
+    grid_positions: List[GridPosition] = []
+    unavailable: Dict[str, Dict[str, Any]] = {}
+
+    for n, pos in enumerate(positions or []):
+        pid = str(pos.get("id") or f"#{n}")
+        try:
+            canonical = normalize_position(pos)
+        except PositionNormalizationError as exc:
+            unavailable[pid] = {"reason": "unrepresentable", "detail": str(exc)}
+            continue
+
+        spot = finite_positive(pos.get("underlying_price"))
+        if spot is None:
+            unavailable[pid] = {"reason": "spot_missing", "missing_field": "underlying_price"}
+            continue
+
+        iv_by_symbol = {
+            _leg_symbol(leg): leg_iv(leg)
+            for leg in (pos.get("legs") or [])
+            if isinstance(leg, dict)
+        }
+        missing = [leg for leg in canonical.legs if iv_by_symbol.get(leg.occ_symbol) is None]
+        if missing:
+            unavailable[pid] = {
+                "reason": "iv_missing",
+                "missing_field": "iv",
+                "legs_missing": len(missing),
+            }
+            continue
+
+        years = (canonical.expiry - as_of).days / 365.0
+        grid_positions.append(GridPosition(
+            position_id=pid,
+            spot=spot,
+            legs=tuple(
+                GridLeg(
+                    strike=leg.strike,
+                    is_call=leg.option_type == OptionType.CALL,
+                    years=years,
+                    sigma=iv_by_symbol[leg.occ_symbol],
+                    weight=leg.total_contracts(canonical.structure_quantity) * leg.multiplier,
+                )
+                for leg in canonical.legs
+            ),
+        ))
+
+    return grid_positions, unavailable
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -1400,6 +1485,18 @@ def check_all_envelopes(
     for v in stress_violations:
         result.add_violation(v)
 
+    # 4b. Full-revaluation stress grid (OBSERVE-ONLY). Fail-soft: a
+    #     computation error here must NEVER break the envelope check.
+    if is_stress_grid_enabled():
+        try:
+            grid_positions, grid_unavailable = stress_grid_inputs(positions)
+            result.stress_grid = compute_stress_grid(
+                grid_positions, equity, unavailable=grid_unavailable
+            ).summary()
+        except Exception as exc:  # observe-only; never break the envelope check
+            logger.warning("[STRESS_GRID] observe-only grid failed: %s", exc)
+            result.stress_grid = {"available": False, "error": str(exc)}
+
     # 5. Compute sizing multiplier
     # Approaching weekly loss limit → reduce sizing proportionally
     if equity > 0 and weekly_pnl < 0:
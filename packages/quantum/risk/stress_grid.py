@@ -0,0 +1,332 @@
+"""
+Full-revaluation stress grid — non-linear book P&L under spot × vol × time.
+
+compute_stress_scenarios estimates "SPY down" / "VIX spike" from linear
+delta/vega sums clamped to the payoff floor. A short condor or vertical is
+not linear: gamma and the wings decide the loss, and a linear estimate is
+either a phantom (clamped) or an understatement. This module reprices EVERY
+leg of every open position under Black-Scholes across a configurable grid
+
+    spot shift (e.g. 41 steps over ±20%)
+  × vol shift  (e.g. 21 steps from -10 to +30 vol points)
+  × time decay (e.g. 0/1/2/5/10 calendar days)
+
+in one NumPy broadcast (legs × spot × vol × days), then reduces to
+per-position and book-level P&L surfaces and the worst cells.
+
+P&L is measured against the model value at the unshocked cell (spot shift
+0, vol shift 0, 0 days), so every surface is exactly 0 at the center and a
+model-vs-mark gap never shows up as stress P&L.
+
+This module is pure math over ``GridPosition`` inputs. risk_envelope
+(the canonical position-model consumer) builds them from the persisted
+rows — canonical legs plus ``underlying_price`` on the position and ``iv``
+on each leg, both already on the monitor's in-memory rows — and types a
+position it cannot price (no spot, a leg without IV, unrepresentable) as
+unavailable instead of fabricating a vol (H9). The BOOK surface exists
+only when every position is available (a partial sum is a fabricated
+total).
+
+OBSERVE-ONLY: check_all_envelopes attaches the summary as
+``EnvelopeCheckResult.stress_grid``; it feeds no violation. Kill switch
+RISK_STRESS_GRID (default ON; explicit 0/false/no/off disables).
+"""
+
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.special import ndtr
+
+logger = logging.getLogger(__name__)
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+# Vol never shocks below this (a -10pt shift on a 8% IV name is 1%, not -2%).
+MIN_SIGMA = 0.01
+
+# Worst book cells reported in the summary.
+WORST_CELLS = 5
+
+
+def is_stress_grid_enabled() -> bool:
+    """RISK_STRESS_GRID — default ON; explicit 0/false/no/off disables."""
+    raw = os.getenv("RISK_STRESS_GRID", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def _env_float(key: str, default: float) -> float:
+    try:
+        return float(os.environ.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.environ.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_days(key: str, default: Tuple[float, ...]) -> Tuple[float, ...]:
+    raw = os.environ.get(key)
+    if not raw:
+        return default
+    try:
+        return tuple(float(x) for x in raw.split(",") if x.strip())
+    except ValueError:
+        return default
+
+
+@dataclass
+class StressGridConfig:
+    """Grid axes. Spot/vol shifts are symmetric-agnostic linspaces."""
+
+    spot_range_pct: float = 0.20          # spot shifts span ±20%
+    spot_steps: int = 41
+    vol_shift_min: float = -0.10          # absolute vol points (0.10 = 10 vols)
+    vol_shift_max: float = 0.30
+    vol_steps: int = 21
+    decay_days: Tuple[float, ...] = (0.0, 1.0, 2.0, 5.0, 10.0)
+    rate: float = 0.0
+
+    @classmethod
+    def from_env(cls) -> "StressGridConfig":
+        return cls(
+            spot_range_pct=_env_float("RISK_STRESS_GRID_SPOT_RANGE", 0.20),
+            spot_steps=max(1, _env_int("RISK_STRESS_GRID_SPOT_STEPS", 41)),
+            vol_shift_min=_env_float("RISK_STRESS_GRID_VOL_MIN", -0.10),
+            vol_shift_max=_env_float("RISK_STRESS_GRID_VOL_MAX", 0.30),
+            vol_steps=max(1, _env_int("RISK_STRESS_GRID_VOL_STEPS", 21)),
+            decay_days=_env_days("RISK_STRESS_GRID_DAYS", (0.0, 1.0, 2.0, 5.0, 10.0)),
+            rate=_env_float("RISK_STRESS_GRID_RATE", 0.0),
+        )
+
+    def axes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        spot = np.linspace(-self.spot_range_pct, self.spot_range_pct, self.spot_steps)
+        vol = np.linspace(self.vol_shift_min, self.vol_shift_max, self.vol_steps)
+        days = np.asarray(self.decay_days or (0.0,), dtype=float)
+        # The center cell (0, 0, 0) is the P&L reference; make sure it is ON
+        # the grid even for even step counts.
+        spot = np.union1d(spot, [0.0])
+        vol = np.union1d(vol, [0.0])
+        days = np.union1d(days, [0.0])
+        return spot, vol, days
+
+
+@dataclass
+class StressGridResult:
+    """Surfaces are indexed [spot_shift, vol_shift, decay_days]."""
+
+    spot_shifts: np.ndarray
+    vol_shifts: np.ndarray
+    decay_days: np.ndarray
+    position_ids: List[str] = field(default_factory=list)
+    position_pnl: Optional[np.ndarray] = None       # (P, S, V, D) dollars
+    book_pnl: Optional[np.ndarray] = None           # (S, V, D) dollars, None if partial
+    unavailable: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    equity: float = 0.0
+    elapsed_ms: float = 0.0
+
+    def _cell(self, surface: np.ndarray, flat_index: int) -> Dict[str, Any]:
+        i, j, k = np.unravel_index(flat_index, surface.shape)
+        pnl = float(surface[i, j, k])
+        return {
+            "spot_shift": round(float(self.spot_shifts[i]), 4),
+            "vol_shift": round(float(self.vol_shifts[j]), 4),
+            "decay_days": float(self.decay_days[k]),
+            "pnl": round(pnl, 2),
+            "pnl_pct_equity": round(pnl / self.equity, 4) if self.equity > 0 else None,
+        }
+
+    def worst_cells(self, n: int = WORST_CELLS) -> List[Dict[str, Any]]:
+        """The ``n`` worst book cells, worst first ([] when the book is partial)."""
+        if self.book_pnl is None:
+            return []
+        flat = self.book_pnl.ravel()
+        n = min(n, flat.size)
+        idx = np.argpartition(flat, n - 1)[:n]
+        idx = idx[np.argsort(flat[idx], kind="stable")]
+        return [self._cell(self.book_pnl, int(f)) for f in idx]
+
+    def position_worst(self) -> Dict[str, Dict[str, Any]]:
+        if self.position_pnl is None:
+            return {}
+        out = {}
+        for p, pid in enumerate(self.position_ids):
+            surface = self.position_pnl[p]
+            out[pid] = self._cell(surface, int(np.argmin(surface)))
+        return out
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-safe digest for EnvelopeCheckResult (no full surfaces)."""
+        return {
+            "available": self.book_pnl is not None,
+            "grid": {
+                "spot_steps": int(self.spot_shifts.size),
+                "spot_range": [round(float(self.spot_shifts[0]), 4), round(float(self.spot_shifts[-1]), 4)],
+                "vol_steps": int(self.vol_shifts.size),
+                "vol_range": [round(float(self.vol_shifts[0]), 4), round(float(self.vol_shifts[-1]), 4)],
+                "decay_days": [float(d) for d in self.decay_days],
+            },
+            "positions_priced": len(self.position_ids),
+            "worst_cells": self.worst_cells(),
+            "position_worst": self.position_worst(),
+            "unavailable": self.unavailable,
+            "elapsed_ms": round(self.elapsed_ms, 2),
+        }
+
+
+class GridLeg(NamedTuple):
+    """One leg, already normalized. ``weight`` = signed contracts × multiplier."""
+
+    strike: float
+    is_call: bool
+    years: float        # time to expiry at the unshocked cell
+    sigma: float
+    weight: float
+
+
+class GridPosition(NamedTuple):
+    position_id: str
+    spot: float
+    legs: Tuple[GridLeg, ...]
+
+
+def finite_positive(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        out = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(out) or math.isinf(out) or out <= 0:
+        return None
+    return out
+
+
+def leg_iv(raw_leg: Mapping[str, Any]) -> Optional[float]:
+    """A persisted/annotated leg's implied vol, or None when MISSING."""
+    iv = raw_leg.get("iv")
+    if iv is None:
+        iv = raw_leg.get("implied_volatility")
+    if iv is None and isinstance(raw_leg.get("greeks"), Mapping):
+        iv = raw_leg["greeks"].get("iv")
+    return finite_positive(iv)
+
+
+def _bs_grid(s0, strike, tte, sigma, is_call, rate, spot_axis, vol_axis, day_axis):
+    """Black-Scholes value of each contract on the full grid, (U, S, V, D).
+
+    Separable terms are built on the small axes first — log-moneyness is
+    (U, S), sigma·sqrt(T) and the drift are (U, V, D), the discounted
+    strike is (U, D) — so the full-size arrays only see the d1/d2 sums,
+    two ndtr calls and the call formula. Puts come from parity on their
+    rows only; contracts past expiry at a decay step take intrinsic value.
+    """
+    c = lambda a: a[:, None]
+    log_m = np.log(c(s0) / c(strike)) + np.log1p(spot_axis)[None, :]            # (U, S)
+    T = c(tte) - (day_axis / 365.0)[None, :]                                    # (U, D)
+    expired = T <= 0
+    T_safe = np.where(expired, 1.0, T)
+    sig = np.maximum(c(sigma) + vol_axis[None, :], MIN_SIGMA)                   # (U, V)
+    sig_sqrt_T = sig[:, :, None] * np.sqrt(T_safe)[:, None, :]                  # (U, V, D)
+    drift = (rate + 0.5 * sig * sig)[:, :, None] * T_safe[:, None, :]           # (U, V, D)
+
+    d1 = log_m[:, :, None, None] + drift[:, None, :, :]
+    d1 /= sig_sqrt_T[:, None, :, :]
+    d2 = d1 - sig_sqrt_T[:, None, :, :]
+    n1 = ndtr(d1, out=d1)
+    n2 = ndtr(d2, out=d2)
+
+    S = (c(s0) * (1.0 + spot_axis)[None, :])[:, :, None, None]                 # (U, S, 1, 1)
+    k_disc = (c(strike) * np.exp(-rate * T_safe))[:, None, None, :]             # (U, 1, 1, D)
+    n1 *= S
+    n2 *= k_disc
+    value = np.subtract(n1, n2, out=n1)
+
+    puts = np.flatnonzero(~is_call)
+    if puts.size:
+        value[puts] += k_disc[puts] - S[puts]
+
+    if expired.any():
+        rows, days = np.nonzero(expired)
+        spot_grid = S[rows, :, 0, 0]                                            # (n, S)
+        k = c(strike[rows])
+        intrinsic = np.where(
+            c(is_call[rows]),
+            np.maximum(spot_grid - k, 0.0),
+            np.maximum(k - spot_grid, 0.0),
+        )
+        value[rows, :, :, days] = intrinsic[:, :, None]
+    return value
+
+
+def compute_stress_grid(
+    positions: Sequence[GridPosition],
+    equity: float = 0.0,
+    config: Optional[StressGridConfig] = None,
+    unavailable: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> StressGridResult:
+    """Reprice every leg across the grid; see module docstring.
+
+    ``unavailable`` carries positions the caller could not turn into a
+    GridPosition; any entry there withholds the book surface.
+    """
+    started = time.perf_counter()
+    config = config or StressGridConfig.from_env()
+    spot_axis, vol_axis, day_axis = config.axes()
+
+    result = StressGridResult(spot_axis, vol_axis, day_axis, equity=float(equity or 0.0))
+    result.unavailable = dict(unavailable or {})
+
+    # Unique contracts (identical strike/type/expiry/spot/IV legs across
+    # positions are priced once) and a (positions × contracts) weight matrix.
+    contracts: Dict[Tuple, int] = {}
+    weights: List[Dict[int, float]] = []
+    for pos in positions:
+        row: Dict[int, float] = {}
+        for leg in pos.legs:
+            key = (pos.spot, leg.strike, leg.years, leg.sigma, leg.is_call)
+            u = contracts.setdefault(key, len(contracts))
+            row[u] = row.get(u, 0.0) + leg.weight
+        result.position_ids.append(pos.position_id)
+        weights.append(row)
+
+    if result.position_ids:
+        cols = list(zip(*contracts.keys()))
+        s0_arr, strike_arr, tte_arr, sigma_arr = (np.asarray(v, dtype=float) for v in cols[:4])
+        call_arr = np.asarray(cols[4], dtype=bool)
+        values = _bs_grid(
+            s0_arr, strike_arr, tte_arr, sigma_arr, call_arr, config.rate,
+            spot_axis, vol_axis, day_axis,
+        )
+        center = values[
+            :,
+            int(np.flatnonzero(spot_axis == 0.0)[0]),
+            int(np.flatnonzero(vol_axis == 0.0)[0]),
+            int(np.flatnonzero(day_axis == 0.0)[0]),
+        ]
+
+        W = np.zeros((len(weights), len(contracts)))
+        for p, row in enumerate(weights):
+            for u, w in row.items():
+                W[p, u] = w
+        flat = values.reshape(len(contracts), -1)
+        pnl = W @ flat - (W @ center)[:, None]
+        result.position_pnl = pnl.reshape((len(weights),) + values.shape[1:])
+        if not result.unavailable:
+            result.book_pnl = result.position_pnl.sum(axis=0)
+
+    result.elapsed_ms = (time.perf_counter() - started) * 1000.0
+    if result.unavailable:
+        logger.info(
+            "[STRESS_GRID] positions unavailable (typed, no fabricated vol/spot): %s",
+            {k: v["reason"] for k, v in result.unavailable.items()},
+        )
+    return result
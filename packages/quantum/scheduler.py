@@ -134,7 +134,8 @@ def _format_schedule_slot(cron_kwargs: dict) -> str:
 
 
 def _fire_task(endpoint: str, scope: str, job_id: str, user_id: str = None,
-               schedule_slot: str = None):
+               schedule_slot: str = None, origin: str = None,
+               actor_class: str = None):
     """
     Fire a signed HTTP request to the given task endpoint.
 
@@ -146,6 +147,8 @@ def _fire_task(endpoint: str, scope: str, job_id: str, user_id: str = None,
     row. The origin headers are OUTSIDE the HMAC canonical string
     (v4:{ts}:{nonce}:{method}:{path}:{body_hash}:{scope}) — adding them
     changes neither the signature nor any schedule/trigger behavior.
+    ``origin`` / ``actor_class`` override the assertion for non-cron fires
+    (the job DAG fires dependents as origin 'event').
     """
     import json
     import uuid
@@ -197,8 +200,8 @@ def _fire_task(endpoint: str, scope: str, job_id: str, user_id: str = None,
         SCHEDULE_ID_HEADER,
         SCHEDULE_SLOT_HEADER,
     )
-    headers[ORIGIN_HEADER] = ORIGIN_SCHEDULER
-    headers[ACTOR_CLASS_HEADER] = "apscheduler_in_process"
+    headers[ORIGIN_HEADER] = origin or ORIGIN_SCHEDULER
+    headers[ACTOR_CLASS_HEADER] = actor_class or "apscheduler_in_process"
     headers[REQUEST_ID_HEADER] = str(uuid.uuid4())
     headers[SCHEDULE_ID_HEADER] = job_id
     if schedule_slot:
@@ -250,6 +253,49 @@ def _get_user_id() -> str:
     return os.environ.get("USER_ID", os.environ.get("TASK_USER_ID", ""))
 
 
+# Jobs that need user_id
+USER_ID_REQUIRED = {
+    "paper_exit_evaluate",
+    "paper_auto_execute",
+    "paper_mark_to_market",
+    "paper_learning_ingest",
+}
+
+
+def _job_user_id(job_id: str, user_id: str):
+    """user_id for jobs whose endpoint requires one, else None."""
+    needs_user = any(base in job_id for base in USER_ID_REQUIRED)
+    return user_id if needs_user else None
+
+
+def fire_dependent(job_id: str, parent_job: str, parent_job_run_id: str = None,
+                   schedule_slot: str = None):
+    """
+    Fire a chained job through its SCHEDULES endpoint once its upstream has
+    completed (JOB_DAG_EXECUTION, see services/job_dag_executor). Same
+    endpoint, scope and user_id as its cron fire; origin 'event'.
+    ``schedule_slot`` is the upstream run's slot, passed on so the enqueue
+    is keyed to it (a re-fired upstream cannot enqueue the job twice).
+    """
+    from packages.quantum.jobs.origin import ORIGIN_EVENT
+    from packages.quantum.services.job_dag_executor import DAG_ACTOR_PREFIX
+
+    entry = next((s for s in SCHEDULES if s[0] == job_id), None)
+    if entry is None:
+        logger.warning(f"[SCHEDULER] {job_id} has no schedule entry; not fired after {parent_job}")
+        return
+    _, _, endpoint, scope, _ = entry
+    logger.info(
+        f"[SCHEDULER] {job_id} ready after {parent_job} "
+        f"(run={parent_job_run_id}, slot={schedule_slot}) — firing"
+    )
+    _fire_task(
+        endpoint, scope, job_id, _job_user_id(job_id, _get_user_id()),
+        schedule_slot=schedule_slot,
+        origin=ORIGIN_EVENT, actor_class=f"{DAG_ACTOR_PREFIX}{parent_job}",
+    )
+
+
 def start_scheduler():
     """
     Start the background scheduler. Called once on FastAPI boot.
@@ -264,15 +310,15 @@ def start_scheduler():
 
     user_id = _get_user_id()
 
-    # Jobs that need user_id
-    USER_ID_REQUIRED = {
-        "paper_exit_evaluate",
-        "paper_auto_execute",
-        "paper_mark_to_market",
-        "paper_learning_ingest",
-    }
+    from packages.quantum.services.job_dag_executor import is_cron_driven
 
+    registered = 0
     for job_id, cron_kwargs, endpoint, scope, description in SCHEDULES:
+        if not is_cron_driven(job_id):
+            # JOB_DAG_EXECUTION: fired when its upstream completes.
+            logger.info(f"[SCHEDULER] {job_id} chained — no cron trigger (JOB_DAG_EXECUTION)")
+            continue
+
         trigger = CronTrigger(
             timezone=CHICAGO_TZ,
             day_of_week="mon-fri",
@@ -280,8 +326,7 @@ def start_scheduler():
         )
 
         # Determine if this job needs user_id
-        needs_user = any(base in job_id for base in USER_ID_REQUIRED)
-        job_user_id = user_id if needs_user else None
+        job_user_id = _job_user_id(job_id, user_id)
 
         _scheduler.add_job(
             _fire_task,
@@ -294,6 +339,7 @@ def start_scheduler():
             misfire_grace_time=300,  # Allow up to 5 min late
         )
 
+        registered += 1
         logger.info(f"[SCHEDULER] Registered: {job_id} ({description})")
 
     # Auto-retry job: scans for failed_retryable jobs and re-enqueues (max 1 retry)
@@ -312,7 +358,7 @@ def start_scheduler():
     )
 
     _scheduler.start()
-    logger.info(f"[SCHEDULER] Started with {len(SCHEDULES) + 1} jobs (Chicago timezone)")
+    logger.info(f"[SCHEDULER] Started with {registered + 1} jobs (Chicago timezone)")
 
 
 def _retry_failed_jobs():
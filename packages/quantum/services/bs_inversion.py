@@ -18,9 +18,11 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence, Union
 
+import numpy as np
 from scipy.optimize import brentq
+from scipy.special import ndtr
 from scipy.stats import norm
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,15 @@ TTE_MIN_DAYS = 1.0        # Skip when TTE < 1 day (gamma blowup region)
 MONEYNESS_DEEP = 0.20     # |log(S/K)| > 0.20 + price ~ intrinsic → skip
 DEEP_OTM_PRICE = 0.05     # Option price < $0.05 → numerical noise
 
+# Batch solver (``invert_iv_batch``). Converges far tighter than brentq's
+# xtol/rtol=1e-6, so batch and scalar results agree to within ~1e-6.
+BATCH_MAX_ITER = 100
+BATCH_XTOL = 1e-10
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
 
 def bs_call_price(
     S: float, K: float, T: float, r: float, q: float, sigma: float,
@@ -208,3 +219,187 @@ def invert_iv(
         return None
 
     return float(iv)
+
+
+# ---------------------------------------------------------------------------
+# Batch inversion
+# ---------------------------------------------------------------------------
+
+def _bs_price_vega_vec(
+    S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, q: np.ndarray,
+    sigma: np.ndarray, is_call: np.ndarray,
+):
+    """Vectorized BS price (call or put per element) and vega.
+
+    Callers only pass ``T > 0`` and ``sigma >= IV_MIN_BOUND`` so the
+    degenerate branches of the scalar pricers are never needed.
+    """
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    s_disc = S * np.exp(-q * T)
+    k_disc = K * np.exp(-r * T)
+    call = s_disc * ndtr(d1) - k_disc * ndtr(d2)
+    price = np.where(is_call, call, call - s_disc + k_disc)
+    vega = s_disc * sqrt_T * _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    return price, vega
+
+
+def _bracketed_solve_vec(price, S, K, T, r, q, is_call, f_lo, f_hi):
+    """Safeguarded Newton inside [IV_MIN_BOUND, IV_MAX_BOUND].
+
+    Every element has a sign change over the bracket. A Newton step that
+    leaves the current bracket (or has no vega) is replaced by bisection,
+    so each lane converges like brentq but typically in 3-6 iterations.
+    """
+    n = price.shape[0]
+    lo = np.full(n, IV_MIN_BOUND)
+    hi = np.full(n, IV_MAX_BOUND)
+    # Price is increasing in sigma: f_lo <= 0 means the root is above lo.
+    increasing = f_lo <= 0
+    # Brenner-Subrahmanyam ATM seed, clipped into the bracket.
+    sigma = np.clip(price / S * np.sqrt(2.0 * np.pi / T), IV_MIN_BOUND, IV_MAX_BOUND)
+    out = np.full(n, np.nan)
+    # brentq returns an endpoint whose objective is exactly zero.
+    out[f_lo == 0] = IV_MIN_BOUND
+    at_hi = (f_lo != 0) & (f_hi == 0)
+    out[at_hi] = IV_MAX_BOUND
+    active = np.flatnonzero(np.isnan(out))
+
+    for _ in range(BATCH_MAX_ITER):
+        if active.size == 0:
+            break
+        p, v = _bs_price_vega_vec(
+            S[active], K[active], T[active], r[active], q[active],
+            sigma[active], is_call[active],
+        )
+        f = p - price[active]
+        s = sigma[active]
+
+        below = np.where(increasing[active], f < 0, f > 0)
+        lo_a = np.where(below, s, lo[active])
+        hi_a = np.where(below, hi[active], s)
+        exact = f == 0
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            newton = s - f / v
+        use_newton = (v > 1e-12) & (newton > lo_a) & (newton < hi_a)
+        s_new = np.where(use_newton, newton, 0.5 * (lo_a + hi_a))
+
+        done = exact | (np.abs(s_new - s) < BATCH_XTOL) | ((hi_a - lo_a) < BATCH_XTOL)
+        out[active[done]] = np.where(exact[done], s[done], s_new[done])
+
+        lo[active] = lo_a
+        hi[active] = hi_a
+        sigma[active] = s_new
+        active = active[~done]
+
+    # Non-converged lanes (pathological inputs) keep their best bracket midpoint.
+    if active.size:
+        out[active] = 0.5 * (lo[active] + hi[active])
+    return out
+
+
+def _newton_fallback_vec(price, S, K, T, r, q, is_call, max_iter: int = 50):
+    """Vectorized ``_newton_fallback``: same seed, clamp and stopping rule."""
+    n = price.shape[0]
+    sigma = np.full(n, 0.5)
+    out = np.full(n, np.nan)
+    active = np.arange(n)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        p, v = _bs_price_vega_vec(
+            S[active], K[active], T[active], r[active], q[active],
+            sigma[active], is_call[active],
+        )
+        f = p - price[active]
+        flat = ~(v >= 1e-10)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            s_new = sigma[active] - f / v
+        converged = ~flat & (np.abs(s_new - sigma[active]) < 1e-6)
+
+        ok = converged & (s_new >= IV_MIN_BOUND) & (s_new <= IV_MAX_BOUND)
+        out[active[ok]] = s_new[ok]
+
+        sigma[active] = np.clip(s_new, IV_MIN_BOUND, IV_MAX_BOUND)
+        active = active[~(flat | converged)]
+
+    return out
+
+
+def invert_iv_batch(
+    prices: ArrayLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike,
+    rights: Union[str, Sequence[str], np.ndarray],
+    *,
+    bid: Optional[ArrayLike] = None,
+) -> np.ndarray:
+    """Vectorized ``invert_iv`` over arrays of contracts.
+
+    All inputs broadcast against each other (scalars allowed for the
+    shared ``S``/``r``/``q``). ``rights`` holds ``"call"``/``"put"`` per
+    element. Returns a float64 array with NaN exactly where the scalar
+    ``invert_iv`` returns None: the same edge-case skips are applied as
+    masks, bracketed lanes use a safeguarded Newton (bisection fallback)
+    in place of brentq, and unbracketed lanes run the same Newton
+    fallback. Values agree with the scalar path within brentq's 1e-6
+    tolerance.
+
+    ``bid`` may contain NaN for "not provided"; only ``bid <= 0`` skips.
+    """
+    prices_a, S_a, K_a, T_a, r_a, q_a = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (prices, S, K, T, r, q))
+    )
+    shape = prices_a.shape
+    is_call = np.broadcast_to(np.asarray(rights) == "call", shape)
+
+    price = prices_a.ravel()
+    S_f, K_f, T_f = S_a.ravel(), K_a.ravel(), T_a.ravel()
+    r_f, q_f = r_a.ravel(), q_a.ravel()
+    call_f = np.ascontiguousarray(is_call).ravel()
+    out = np.full(price.shape, np.nan)
+    if price.size == 0:
+        return out.reshape(shape)
+
+    # Edge-case skips, in the same terms as invert_iv.
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        log_m = np.log(S_f / K_f)
+    intrinsic = np.where(call_f, np.maximum(0.0, S_f - K_f), np.maximum(0.0, K_f - S_f))
+    skip = T_f < (TTE_MIN_DAYS / 365.0)
+    skip |= (np.abs(log_m) > MONEYNESS_DEEP) & (price <= intrinsic * 1.01)
+    skip |= price < DEEP_OTM_PRICE
+    if bid is not None:
+        bid_f = np.broadcast_to(np.asarray(bid, dtype=float), shape).ravel()
+        skip |= bid_f <= 0
+    skip |= ~np.isfinite(price) | ~np.isfinite(log_m)
+
+    idx = np.flatnonzero(~skip)
+    if idx.size == 0:
+        return out.reshape(shape)
+
+    args = (price[idx], S_f[idx], K_f[idx], T_f[idx], r_f[idx], q_f[idx], call_f[idx])
+    n = idx.size
+    p_lo, _ = _bs_price_vega_vec(*args[1:6], np.full(n, IV_MIN_BOUND), args[6])
+    p_hi, _ = _bs_price_vega_vec(*args[1:6], np.full(n, IV_MAX_BOUND), args[6])
+    f_lo = p_lo - args[0]
+    f_hi = p_hi - args[0]
+
+    bracketed = ~(f_lo * f_hi > 0)
+    iv = np.full(n, np.nan)
+    if bracketed.any():
+        b = bracketed
+        iv[b] = _bracketed_solve_vec(*(a[b] for a in args), f_lo[b], f_hi[b])
+    if (~bracketed).any():
+        nb = ~bracketed
+        iv[nb] = _newton_fallback_vec(*(a[nb] for a in args))
+
+    iv[~((iv >= IV_MIN_BOUND) & (iv <= IV_MAX_BOUND))] = np.nan
+    out[idx] = iv
+    return out.reshape(shape)
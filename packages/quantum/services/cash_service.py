@@ -39,6 +39,13 @@ class CashService:
         Returns:
             float: deployable capital in dollars (>= 0)
         """
+        return self.get_deployable_capital_sync(user_id)
+
+    def get_deployable_capital_sync(self, user_id: str) -> float:
+        """Blocking body of ``get_deployable_capital``: the broker
+        ``get_account`` read and the Supabase fallback / alert writes run on
+        the calling thread. Async endpoints run it off the event loop via
+        ``db_async.run_query``."""
         from packages.quantum.services.equity_state import (
             get_alpaca_options_buying_power,
         )
@@ -0,0 +1,341 @@
+"""Per-cycle symbol data shared by the midday cycle, its scan and regime engine.
+
+One midday cycle used to ask providers for the same facts several times:
+ticker details for the scanner's sector map and again for the earnings
+service; daily bars for the TA window and the V3 symbol snapshot; basket
+quotes for the global regime and the universe quotes for the scan. Each
+subsystem owned its own fetch.
+
+``CycleContext`` is created once per cycle and passed explicitly. It memoizes
+every lookup by ``(kind, key)`` for the cycle's lifetime, fetches missing
+keys in bulk where the provider has a batch call (quotes, IV context,
+earnings), and counts hits / misses / errors per kind and per key — one
+place to measure a cycle's I/O. ``prefetch`` warms a universe up front:
+the batch kinds and the per-symbol details / bars run concurrently, so the
+scan's own lookups afterwards are memo hits.
+
+Subsystems that expect a provider object take a view instead of changing
+their signatures: ``market_data_view()`` (the truth layer with ``daily_bars``
+and ``snapshot_many`` memoized — fits RegimeEngineV3/V4 and the scan
+prefetcher) and ``polygon_view()`` (PolygonService with ``get_ticker_details``
+and ``get_last_financials_date`` memoized — fits EarningsCalendarService and
+the sector prefetch). Every other attribute passes through untouched.
+
+Results are never fabricated: a failed fetch is counted, re-raised to the
+caller exactly as before, and not memoized (the next lookup retries).
+``CYCLE_CONTEXT_ENABLED=0`` keeps the views and accounting but disables the
+memo, so every lookup reaches the provider as in the legacy path.
+"""
+
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+KINDS = ("details", "financials", "bars", "quotes", "iv_context", "earnings")
+
+# Absent from a batch response: memoized so the cycle does not ask again.
+_ABSENT = object()
+
+DEFAULT_DETAIL_WORKERS = 8
+
+
+def is_cycle_context_enabled() -> bool:
+    """CYCLE_CONTEXT_ENABLED — default ON; explicit 0/false/no/off disables
+    the per-cycle memo (every lookup reaches the provider)."""
+    raw = os.getenv("CYCLE_CONTEXT_ENABLED", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def _day(value: Any) -> str:
+    return value.strftime("%Y-%m-%d") if hasattr(value, "strftime") else str(value)
+
+
+class CycleContext:
+    """Memoized, accounted symbol data for one cycle. Thread-safe."""
+
+    def __init__(
+        self,
+        *,
+        market_data=None,
+        truth_layer=None,
+        iv_repo=None,
+        earnings_service=None,
+        memoize: Optional[bool] = None,
+    ) -> None:
+        self.market_data = market_data
+        self.truth_layer = truth_layer
+        self.iv_repo = iv_repo
+        self.earnings_service = earnings_service
+        self.memoize = is_cycle_context_enabled() if memoize is None else memoize
+        self.created_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._memo: Dict[str, Dict[Any, Any]] = {kind: {} for kind in KINDS}
+        self._inflight: Dict[tuple, threading.Lock] = {}
+        self._counts: Dict[str, Counter] = {kind: Counter() for kind in KINDS}
+        self._key_hits: Dict[str, Counter] = {kind: Counter() for kind in KINDS}
+        self._fetch_seconds: Dict[str, float] = {kind: 0.0 for kind in KINDS}
+
+    def bind(self, **services: Any) -> "CycleContext":
+        """Attach providers a caller owns without replacing ones already set
+        (the orchestrator binds the truth layer, the scanner the rest)."""
+        for name, service in services.items():
+            if service is not None and getattr(self, name, None) is None:
+                setattr(self, name, service)
+        return self
+
+    # -- accounting ---------------------------------------------------------
+
+    def _hit_locked(self, kind: str, key: Any) -> Any:
+        self._counts[kind]["hits"] += 1
+        self._key_hits[kind][key] += 1
+        return self._memo[kind][key]
+
+    def _record_fetch(self, kind: str, started: float, misses: int, ok: bool) -> None:
+        with self._lock:
+            self._counts[kind]["misses"] += misses
+            self._counts[kind]["calls"] += 1
+            if not ok:
+                self._counts[kind]["errors"] += 1
+            self._fetch_seconds[kind] += time.monotonic() - started
+
+    def stats(self, top: int = 5) -> Dict[str, Any]:
+        """Per-kind hits/misses/provider calls/errors/fetch time, plus the
+        most re-used keys (the duplicate calls the context absorbed)."""
+        with self._lock:
+            kinds = {}
+            for kind in KINDS:
+                counts = self._counts[kind]
+                if not counts:
+                    continue
+                kinds[kind] = {
+                    "hits": counts["hits"],
+                    "misses": counts["misses"],
+                    "calls": counts["calls"],
+                    "errors": counts["errors"],
+                    "keys": len(self._memo[kind]),
+                    "fetch_ms": round(self._fetch_seconds[kind] * 1000, 1),
+                    "top_keys": [
+                        [str(k), n] for k, n in self._key_hits[kind].most_common(top)
+                    ],
+                }
+            return {
+                "memoized": self.memoize,
+                "age_ms": round((time.monotonic() - self.created_at) * 1000, 1),
+                "kinds": kinds,
+            }
+
+    # -- memo primitives ----------------------------------------------------
+
+    def _one(self, kind: str, key: Any, fetch: Callable[[], Any]) -> Any:
+        """Memoized single-key lookup; concurrent callers of the same key
+        share one provider call."""
+        if not self.memoize:
+            return self._fetch_one(kind, key, fetch)
+        with self._lock:
+            if key in self._memo[kind]:
+                return self._hit_locked(kind, key)
+            gate = self._inflight.setdefault((kind, key), threading.Lock())
+        with gate:
+            with self._lock:
+                if key in self._memo[kind]:
+                    return self._hit_locked(kind, key)
+            try:
+                value = self._fetch_one(kind, key, fetch)
+            except Exception:
+                with self._lock:
+                    self._inflight.pop((kind, key), None)
+                raise
+            with self._lock:
+                self._memo[kind][key] = value
+                self._inflight.pop((kind, key), None)
+            return value
+
+    def _fetch_one(self, kind: str, key: Any, fetch: Callable[[], Any]) -> Any:
+        started = time.monotonic()
+        try:
+            value = fetch()
+        except Exception:
+            self._record_fetch(kind, started, 1, ok=False)
+            raise
+        self._record_fetch(kind, started, 1, ok=True)
+        return value
+
+    def _many(
+        self,
+        kind: str,
+        keys: Iterable[str],
+        fetch_batch: Callable[[List[str]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Memoized batch lookup: one provider call for every missing key.
+        Keys absent from the response are omitted (and not asked again)."""
+        keys = list(dict.fromkeys(keys))
+        out: Dict[str, Any] = {}
+        missing: List[str] = []
+        with self._lock:
+            for key in keys:
+                if self.memoize and key in self._memo[kind]:
+                    out[key] = self._hit_locked(kind, key)
+                else:
+                    missing.append(key)
+        if missing:
+            started = time.monotonic()
+            try:
+                fetched = fetch_batch(missing) or {}
+            except Exception:
+                self._record_fetch(kind, started, len(missing), ok=False)
+                raise
+            self._record_fetch(kind, started, len(missing), ok=True)
+            with self._lock:
+                for key in missing:
+                    value = fetched.get(key, _ABSENT)
+                    if self.memoize:
+                        self._memo[kind][key] = value
+                    out[key] = value
+                # Responses keyed differently from the request (provider
+                # normalization) are kept too.
+                for key, value in fetched.items():
+                    if key not in out:
+                        out[key] = value
+                        if self.memoize:
+                            self._memo[kind][key] = value
+        return {k: v for k, v in out.items() if v is not _ABSENT}
+
+    # -- lookups ------------------------------------------------------------
+
+    def get_ticker_details(self, symbol: str) -> Dict[str, Any]:
+        return self._one("details", symbol, lambda: self.market_data.get_ticker_details(symbol))
+
+    def get_last_financials_date(self, symbol: str):
+        return self._one(
+            "financials", symbol, lambda: self.market_data.get_last_financials_date(symbol)
+        )
+
+    def sector(self, symbol: str) -> Optional[str]:
+        details = self.get_ticker_details(symbol)
+        if details:
+            return details.get("sic_description") or details.get("sector") or "unknown"
+        return None
+
+    def daily_bars(self, symbol: str, start_date, end_date) -> List[Dict[str, Any]]:
+        key = (symbol, _day(start_date), _day(end_date))
+        return self._one(
+            "bars", key, lambda: self.truth_layer.daily_bars(symbol, start_date, end_date)
+        )
+
+    def snapshot_many(self, symbols: Iterable[str]) -> Dict[str, Any]:
+        return self._many("quotes", symbols, self.truth_layer.snapshot_many)
+
+    def get_iv_context_batch(self, symbols: Iterable[str]) -> Dict[str, Any]:
+        if self.iv_repo is None:
+            return {}
+        return self._many("iv_context", symbols, self.iv_repo.get_iv_context_batch)
+
+    def get_earnings_map(self, symbols: Iterable[str]) -> Dict[str, Any]:
+        if self.earnings_service is None:
+            return {}
+        return self._many("earnings", symbols, self.earnings_service.get_earnings_map)
+
+    # -- bulk prefetch ------------------------------------------------------
+
+    def prefetch(
+        self,
+        symbols: List[str],
+        *,
+        details: bool = True,
+        quotes: bool = True,
+        iv_context: bool = True,
+        earnings: bool = True,
+        earnings_symbols: Optional[Iterable[str]] = None,
+        bars: Optional[Tuple[Any, Any]] = None,
+        max_workers: int = DEFAULT_DETAIL_WORKERS,
+    ) -> None:
+        """Warm the cycle for a universe.
+
+        Quotes, IV context and earnings take one batch call each (earnings
+        for ``earnings_symbols`` when given — the symbols the caller has no
+        date for). Details and, with ``bars=(start, end)``, daily bars have
+        no batch endpoint and run per symbol. Everything is submitted to one
+        pool, so the batch calls overlap each other and the per-symbol
+        fetches. Warm-up only: errors are logged, not memoized, and the
+        consumers' own lookups retry.
+        """
+        if not symbols:
+            return
+        tasks: List[Tuple[str, Callable[[], Any]]] = []
+        if quotes and self.truth_layer is not None:
+            tasks.append(("quotes", lambda: self.snapshot_many(symbols)))
+        if iv_context and self.iv_repo is not None:
+            tasks.append(("iv_context", lambda: self.get_iv_context_batch(symbols)))
+        if earnings and self.earnings_service is not None:
+            wanted = list(symbols if earnings_symbols is None else earnings_symbols)
+            if wanted:
+                tasks.append(("earnings", lambda: self.get_earnings_map(wanted)))
+        if details and self.market_data is not None:
+            tasks += [("details", lambda s=s: self.get_ticker_details(s)) for s in symbols]
+        if bars is not None and self.truth_layer is not None:
+            start, end = bars
+            tasks += [("bars", lambda s=s: self.daily_bars(s, start, end)) for s in symbols]
+        if not tasks:
+            return
+
+        started = time.monotonic()
+        failed: Counter = Counter()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(tasks))),
+            thread_name_prefix="cycle-prefetch",
+        ) as pool:
+            futures = [(kind, pool.submit(fn)) for kind, fn in tasks]
+            for kind, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    failed[kind] += 1
+                    logger.debug(f"[CycleContext] {kind} prefetch failed: {e}")
+        if failed:
+            logger.warning(f"[CycleContext] prefetch failures: {dict(failed)}")
+        logger.info(
+            f"[CycleContext] prefetched {len(symbols)} symbols "
+            f"({len(tasks)} tasks) in {time.monotonic() - started:.2f}s"
+        )
+
+    # -- provider views -----------------------------------------------------
+
+    def market_data_view(self) -> "CycleView":
+        """The truth layer with daily_bars/snapshot_many served by the cycle."""
+        return CycleView(self.truth_layer, {
+            "daily_bars": self.daily_bars,
+            "snapshot_many": self.snapshot_many,
+        })
+
+    def polygon_view(self) -> "CycleView":
+        """PolygonService with details/financials served by the cycle."""
+        return CycleView(self.market_data, {
+            "get_ticker_details": self.get_ticker_details,
+            "get_last_financials_date": self.get_last_financials_date,
+        })
+
+
+class CycleView:
+    """Provider proxy: ``overrides`` are served by the CycleContext, every
+    other attribute is the wrapped provider's own."""
+
+    def __init__(self, target: Any, overrides: Dict[str, Callable[..., Any]]) -> None:
+        self._target = target
+        self._overrides = overrides
+
+    def __getattr__(self, name: str) -> Any:
+        overrides = self.__dict__.get("_overrides") or {}
+        if name in overrides:
+            return overrides[name]
+        return getattr(self.__dict__.get("_target"), name)
+
+    def __bool__(self) -> bool:
+        return self._target is not None
@@ -0,0 +1,221 @@
+"""Range-aware daily-bar store behind ``MarketDataTruthLayer.daily_bars``.
+
+The truth layer used to cache bars under the exact ``{symbol}_{start}_{end}``
+key, so the scanner's 90-day TA window, the 150-day ``get_trend`` window,
+the 365-day ``iv_context`` window and RegimeEngineV4's 30/100-day windows
+each paid a separate Polygon ``/v2/aggs`` round trip for the same symbol on
+the same day.
+
+This store keeps ONE contiguous, date-sorted series per symbol together with
+the calendar range it covers:
+
+* a request inside the covered range is a slice (bisect on the date column);
+* a request that extends past the covered range fetches ONLY the missing
+  head (``[start, covered_start)``) and/or tail (``[covered_end, end]``) and
+  merges it in. The tail re-fetch starts AT ``covered_end`` so a partial
+  intraday bar captured earlier is replaced by the provider's current view;
+* the first fetch for a symbol is widened back to ``min_lookback_days``
+  (default 400, enough for ``iv_context``) so every later window in the same
+  cycle is a memory lookup instead of a head fetch.
+
+Series live in the shared ``MarketDataCache`` under the
+``daily_bars_series`` namespace with the truth layer's daily-bar TTL. The TTL
+is anchored at the FIRST fetch and is not refreshed by head/tail merges, so a
+series can never outlive the staleness the exact-key cache allowed.
+
+Entries are replaced wholesale (never mutated in place) so lock-free readers
+always see a consistent ``(start, end, bars)`` triple; fetch+merge runs under
+the cache's per-key in-flight lock so concurrent scanner threads asking for
+the same symbol collapse into one provider call.
+
+Kill switch: ``DAILY_BAR_STORE_ENABLED`` (default ON; only an explicit falsy
+value disables it and restores the exact-key cache path).
+"""
+
+import bisect
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE = "daily_bars_series"
+DEFAULT_MIN_LOOKBACK_DAYS = 400
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+# fetch(symbol, seg_start, seg_end) -> bars, [] when the provider answered
+# with no bars, or None when every provider failed (coverage NOT extended).
+BarFetcher = Callable[[str, date, date], Optional[List[Dict[str, Any]]]]
+
+
+def is_daily_bar_store_enabled() -> bool:
+    """DAILY_BAR_STORE_ENABLED — default ON; explicit 0/false/no/off disables."""
+    raw = os.getenv("DAILY_BAR_STORE_ENABLED", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def get_min_lookback_days() -> int:
+    """DAILY_BAR_STORE_MIN_LOOKBACK_DAYS — first-fetch widening (0 disables)."""
+    try:
+        return max(0, int(os.getenv(
+            "DAILY_BAR_STORE_MIN_LOOKBACK_DAYS", str(DEFAULT_MIN_LOOKBACK_DAYS)
+        )))
+    except ValueError:
+        return DEFAULT_MIN_LOOKBACK_DAYS
+
+
+def _as_date(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _merge(
+    older: List[Dict[str, Any]],
+    newer: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Merge two bar lists by ``date``; ``newer`` wins on overlap."""
+    by_date: Dict[str, Dict[str, Any]] = {}
+    for bar in older:
+        by_date[bar["date"]] = bar
+    for bar in newer:
+        by_date[bar["date"]] = bar
+    return [by_date[d] for d in sorted(by_date)]
+
+
+class DailyBarStore:
+    """Per-symbol contiguous daily-bar series with head/tail back-fill."""
+
+    def __init__(self, cache, ttl_seconds: int, namespace: str = NAMESPACE):
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        # Observability only — never consulted for routing.
+        self.stats: Dict[str, int] = {"hits": 0, "fetches": 0, "fetch_failures": 0}
+
+    def get_range(
+        self,
+        symbol: str,
+        start: Union[date, datetime],
+        end: Union[date, datetime],
+        fetch: BarFetcher,
+    ) -> List[Dict[str, Any]]:
+        """Bars for ``symbol`` with ``start <= date <= end`` (ascending)."""
+        start_d, end_d = _as_date(start), _as_date(end)
+        if end_d < start_d:
+            return []
+
+        entry = self.cache.get(self.namespace, symbol)
+        if self._covers(entry, start_d, end_d):
+            self.stats["hits"] += 1
+            return self._slice(entry, start_d, end_d)
+
+        with self.cache.inflight_lock(self.namespace, symbol):
+            # Double-check inside the lock: another thread may have filled it.
+            entry = self.cache.get(self.namespace, symbol)
+            if self._covers(entry, start_d, end_d):
+                self.stats["hits"] += 1
+                return self._slice(entry, start_d, end_d)
+
+            entry = self._extend(symbol, entry, start_d, end_d, fetch)
+            if entry is None:
+                return []
+            return self._slice(entry, start_d, end_d)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _covers(entry: Optional[Dict[str, Any]], start_d: date, end_d: date) -> bool:
+        if not entry:
+            return False
+        return (
+            entry["start"] <= start_d.isoformat()
+            and end_d.isoformat() <= entry["end"]
+        )
+
+    @staticmethod
+    def _slice(entry: Dict[str, Any], start_d: date, end_d: date) -> List[Dict[str, Any]]:
+        dates = entry["dates"]
+        lo = bisect.bisect_left(dates, start_d.isoformat())
+        hi = bisect.bisect_right(dates, end_d.isoformat())
+        return entry["bars"][lo:hi]
+
+    def _fetch(self, fetch: BarFetcher, symbol: str, seg_start: date, seg_end: date):
+        self.stats["fetches"] += 1
+        try:
+            bars = fetch(symbol, seg_start, seg_end)
+        except Exception as e:
+            logger.warning(f"[DAILY_BARS] store fetch failed for {symbol}: {e}")
+            bars = None
+        if bars is None:
+            self.stats["fetch_failures"] += 1
+        return bars
+
+    def _extend(
+        self,
+        symbol: str,
+        entry: Optional[Dict[str, Any]],
+        start_d: date,
+        end_d: date,
+        fetch: BarFetcher,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the missing head/tail and store the merged series.
+
+        Returns the entry to slice from (possibly the unchanged old entry
+        when a segment fetch failed), or None when nothing is available.
+        """
+        if not entry:
+            lookback = get_min_lookback_days()
+            fetch_start = min(start_d, end_d - timedelta(days=lookback)) if lookback else start_d
+            bars = self._fetch(fetch, symbol, fetch_start, end_d)
+            if not bars:
+                # Failures and empty answers are not stored, matching the
+                # exact-key cache which never cached an empty bar list.
+                return None
+            return self._store(symbol, fetch_start.isoformat(), end_d.isoformat(),
+                               bars, expires_at=time.time() + self.ttl_seconds)
+
+        cov_start, cov_end = entry["start"], entry["end"]
+        bars = entry["bars"]
+        new_start, new_end = cov_start, cov_end
+
+        if start_d.isoformat() < cov_start:
+            head_end = date.fromisoformat(cov_start) - timedelta(days=1)
+            head = self._fetch(fetch, symbol, start_d, head_end)
+            if head is not None:
+                bars = _merge(head, bars)
+                new_start = start_d.isoformat()
+
+        if end_d.isoformat() > cov_end:
+            tail = self._fetch(fetch, symbol, date.fromisoformat(cov_end), end_d)
+            if tail is not None:
+                bars = _merge(bars, tail)
+                new_end = end_d.isoformat()
+
+        if (new_start, new_end) == (cov_start, cov_end):
+            return entry
+        return self._store(symbol, new_start, new_end, bars, expires_at=entry["expires_at"])
+
+    def _store(
+        self,
+        symbol: str,
+        start_s: str,
+        end_s: str,
+        bars: List[Dict[str, Any]],
+        expires_at: float,
+    ) -> Dict[str, Any]:
+        bars = sorted(bars, key=lambda b: b["date"])
+        entry = {
+            "start": start_s,
+            "end": end_s,
+            "bars": bars,
+            "dates": [b["date"] for b in bars],
+            "expires_at": expires_at,
+        }
+        remaining = int(expires_at - time.time())
+        if remaining > 0:
+            self.cache.set(self.namespace, symbol, entry, ttl_seconds=remaining)
+        return entry
@@ -0,0 +1,181 @@
+"""Non-blocking Supabase (PostgREST) access for async FastAPI endpoints.
+
+The supabase-py client is synchronous: an ``async def`` endpoint that calls
+``.execute()`` directly holds the uvicorn event loop for the whole round
+trip, so concurrent users' requests queue behind each other. ``run_query``
+runs the blocking ``.execute()`` on a bounded, dedicated thread pool and
+awaits it; independent queries are issued together with ``asyncio.gather``.
+
+The pool is separate from the loop's default executor (``asyncio.to_thread``)
+so a burst of dashboard reads cannot starve the orchestrator's threaded work,
+and bounded so a burst cannot open unbounded connections to PostgREST.
+
+Timing: ``track_request(endpoint)`` (or the ``@timed_endpoint`` decorator)
+scopes one HTTP request. Every query run inside it is timed (label, ms, ok);
+on exit one ``[DB_IO]`` line is logged with the query count, summed DB time
+and wall time, and the wall time is added to a per-endpoint window reported
+by ``stats()`` (p50 / p99).
+
+Errors are untouched: an exception from ``.execute()`` (e.g. postgrest
+``APIError``) is re-raised to the endpoint exactly as before.
+
+``DB_ASYNC_ENABLED=0`` runs every query inline on the loop (legacy, still
+timed). ``DB_ASYNC_MAX_WORKERS`` (default 16) bounds the pool.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+DEFAULT_MAX_WORKERS = 16
+
+# Wall-time samples kept per endpoint for stats().
+STATS_WINDOW = 512
+
+
+def is_db_async_enabled() -> bool:
+    """DB_ASYNC_ENABLED — default ON; explicit 0/false/no/off runs Supabase
+    queries inline on the event loop (legacy blocking behaviour)."""
+    raw = os.getenv("DB_ASYNC_ENABLED", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def db_max_workers() -> int:
+    try:
+        return max(1, int(os.getenv("DB_ASYNC_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=db_max_workers(), thread_name_prefix="db-io"
+                )
+    return _executor
+
+
+class RequestTimings:
+    """Queries timed during one request."""
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self.started = time.monotonic()
+        self.queries: List[Dict[str, Any]] = []
+
+    def record(self, label: str, ms: float, ok: bool) -> None:
+        self.queries.append({"label": label, "ms": round(ms, 1), "ok": ok})
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "queries": len(self.queries),
+            "db_ms": round(sum(q["ms"] for q in self.queries), 1),
+            "wall_ms": round((time.monotonic() - self.started) * 1000, 1),
+            "detail": list(self.queries),
+        }
+
+
+_current: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    "db_request_timings", default=None
+)
+_stats_lock = threading.Lock()
+_wall_ms: Dict[str, Deque[float]] = {}
+
+
+@contextmanager
+def track_request(endpoint: str) -> Iterator[RequestTimings]:
+    """Time every ``run_query`` of one request and log a ``[DB_IO]`` line.
+
+    Tasks spawned by ``asyncio.gather`` inherit the context, so their
+    queries land in the same RequestTimings."""
+    timings = RequestTimings(endpoint)
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+        summary = timings.summary()
+        with _stats_lock:
+            window = _wall_ms.setdefault(endpoint, deque(maxlen=STATS_WINDOW))
+            window.append(summary["wall_ms"])
+        logger.info(
+            f"[DB_IO] endpoint={endpoint} queries={summary['queries']} "
+            f"db_ms={summary['db_ms']} wall_ms={summary['wall_ms']}"
+        )
+
+
+def timed_endpoint(endpoint: str):
+    """Decorator form of ``track_request`` for an async route handler
+    (``functools.wraps`` keeps the signature FastAPI injects from)."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with track_request(endpoint):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Per-endpoint request wall time over the recent window."""
+    with _stats_lock:
+        windows = {name: sorted(samples) for name, samples in _wall_ms.items() if samples}
+    return {
+        name: {
+            "requests": len(ordered),
+            "p50_ms": _percentile(ordered, 50),
+            "p99_ms": _percentile(ordered, 99),
+            "max_ms": ordered[-1],
+        }
+        for name, ordered in windows.items()
+    }
+
+
+def _execute(query: Any) -> Any:
+    return query() if callable(query) and not hasattr(query, "execute") else query.execute()
+
+
+async def run_query(query: Any, label: str = "query") -> Any:
+    """Await a PostgREST query (a builder with ``.execute()``, or a zero-arg
+    callable doing blocking Supabase work) without blocking the event loop.
+
+    Returns what ``.execute()`` returns; its exceptions propagate unchanged.
+    """
+    timings = _current.get()
+    started = time.monotonic()
+    ok = False
+    try:
+        if is_db_async_enabled():
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(_get_executor(), _execute, query)
+        else:
+            result = _execute(query)
+        ok = True
+        return result
+    finally:
+        if timings is not None:
+            timings.record(label, (time.monotonic() - started) * 1000, ok)
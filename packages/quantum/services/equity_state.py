@@ -17,11 +17,24 @@ Callers get `Optional[float]`:
 The `RISK_EQUITY_SOURCE=legacy` env flag routes back to the pre-fix
 behavior for 72 hours as a rip-cord. Scheduled for removal once stable.
 See audit plan Phase 3 Q3 for the sequencing rule.
+
+Equity, last equity, options buying power and daily P&L are all derived
+from ONE `AccountStateSnapshot` per user (a single `get_account()` read),
+so every equity-derived gate in a cycle reads the same broker state and a
+cold cycle costs one round trip instead of one per quantity. Misses are
+single-flight: concurrent threads asking for the same user wait for one
+fetch and share its result (or its exception). The snapshot lives for
+`EQUITY_STATE_TTL_SECONDS` (default 60) and is dropped on broker fills via
+`invalidate_account_snapshot`. Weekly P&L reads portfolio history — a
+different endpoint — through the same single-flight cache.
 """
 
 import logging
 import os
+import threading
 import time
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
@@ -44,12 +57,116 @@ EQUITY_SOURCE = os.environ.get("RISK_EQUITY_SOURCE", "alpaca").lower()
 # promoted live account. If that invariant changes (e.g., hot-reload of
 # `ALPACA_PAPER` without restart), extend the cache key with
 # `:paper` / `:live` — not needed today.
-_ALPACA_EQUITY_CACHE: Dict[str, Tuple[float, float]] = {}      # user_id → (ts, equity)
-_ALPACA_WEEKLY_PNL_CACHE: Dict[str, Tuple[float, float]] = {}  # user_id → (ts, weekly_pnl)
-_ALPACA_OBP_CACHE: Dict[str, Tuple[float, float]] = {}         # user_id → (ts, options_buying_power)
-_ALPACA_DAILY_PNL_CACHE: Dict[str, Tuple[float, float]] = {}   # user_id → (ts, equity−last_equity)
-_ALPACA_LAST_EQUITY_CACHE: Dict[str, Tuple[float, float]] = {} # user_id → (ts, last_equity)
-_ALPACA_STATE_TTL_SECONDS = 60
+
+
+def _ttl_from_env() -> float:
+    try:
+        return max(0.0, float(os.environ.get("EQUITY_STATE_TTL_SECONDS", "60")))
+    except ValueError:
+        return 60.0
+
+
+_ALPACA_STATE_TTL_SECONDS = _ttl_from_env()
+
+
+class _SingleFlightCache:
+    """Per-key TTL cache whose misses are filled by exactly one caller.
+
+    Concurrent callers for a key that is being filled wait on the same
+    Future and receive its value or exception. A ``None`` fill (broker
+    client unavailable) and a raised fill are not cached. ``invalidate``
+    bumps the key's generation so a fetch already in flight cannot cache
+    state read before the invalidation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._generation: Dict[str, int] = {}
+
+    def get(self, key: str, fill: Callable[[], Any]) -> Any:
+        with self._lock:
+            cached = self._values.get(key)
+            if cached and (time.monotonic() - cached[0]) < _ALPACA_STATE_TTL_SECONDS:
+                return cached[1]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                generation = self._generation.get(key, 0)
+        if not leader:
+            return future.result()
+
+        try:
+            value = fill()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            if value is not None and self._generation.get(key, 0) == generation:
+                self._values[key] = (time.monotonic(), value)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+            self._generation[key] = self._generation.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._generation.clear()
+
+
+@dataclass(frozen=True)
+class AccountStateSnapshot:
+    """One `get_account()` read for a user. Field accessors return the raw
+    payload value as float, `None` when the field is absent (a missing
+    field is not 0); validation stays with each public helper."""
+
+    user_id: str
+    fetched_at: float  # time.monotonic() of the read
+    account: Dict[str, Any]
+
+    def field(self, name: str) -> Optional[float]:
+        raw = self.account.get(name)
+        return None if raw is None else float(raw)
+
+
+_ACCOUNT_SNAPSHOTS = _SingleFlightCache()  # user_id → AccountStateSnapshot
+_WEEKLY_PNL = _SingleFlightCache()         # user_id → weekly_pnl
+
+
+def get_account_snapshot(user_id: str) -> Optional[AccountStateSnapshot]:
+    """Cached (single-flight) account snapshot for `user_id`.
+
+    `None` when no Alpaca client is configured. Broker errors propagate so
+    each caller keeps its own failure handling (alert severity, logging)."""
+    return _ACCOUNT_SNAPSHOTS.get(user_id, lambda: _fetch_account_snapshot(user_id))
+
+
+def invalidate_account_snapshot(user_id: str) -> None:
+    """Drop the user's cached account state — call when a broker fill lands
+    so the next equity / buying-power read sees the post-fill account."""
+    _ACCOUNT_SNAPSHOTS.invalidate(user_id)
+    _WEEKLY_PNL.invalidate(user_id)
+
+
+def _fetch_account_snapshot(user_id: str) -> Optional[AccountStateSnapshot]:
+    from packages.quantum.brokers.alpaca_client import get_alpaca_client
+    alpaca = get_alpaca_client()
+    if not alpaca:
+        return None
+    acct = alpaca.get_account()
+    return AccountStateSnapshot(
+        user_id=user_id, fetched_at=time.monotonic(), account=acct or {},
+    )
 
 
 # ── Public API ─────────────────────────────────────────────────────
@@ -124,18 +241,12 @@ def get_alpaca_daily_pnl(user_id: str, supabase: Any = None) -> Optional[float]:
     either field is missing/non-positive — callers fall back to the proxy,
     never fabricate.
     """
-    now = time.monotonic()
-    cached = _ALPACA_DAILY_PNL_CACHE.get(user_id)
-    if cached and (now - cached[0]) < _ALPACA_STATE_TTL_SECONDS:
-        return cached[1]
     try:
-        from packages.quantum.brokers.alpaca_client import get_alpaca_client
-        alpaca = get_alpaca_client()
-        if not alpaca:
+        snap = get_account_snapshot(user_id)
+        if snap is None:
             return None
-        acct = alpaca.get_account()
-        equity_raw = acct.get("equity")
-        last_raw = acct.get("last_equity")
+        equity_raw = snap.account.get("equity")
+        last_raw = snap.account.get("last_equity")
         if equity_raw is None or last_raw is None:
             # None-preserving (Anti-pattern 8): a missing field is not 0.
             # LOUD (2026-06-12): this path returned silently for every
@@ -156,9 +267,7 @@ def get_alpaca_daily_pnl(user_id: str, supabase: Any = None) -> Optional[float]:
         last_equity = float(last_raw)
         if equity <= 0 or last_equity <= 0:
             return None
-        daily = equity - last_equity
-        _ALPACA_DAILY_PNL_CACHE[user_id] = (now, daily)
-        return daily
+        return equity - last_equity
     except Exception as e:
         logger.warning(
             f"[EQUITY_STATE] Alpaca daily P&L fetch failed for {user_id[:8]}: {e}"
@@ -306,18 +415,12 @@ def get_alpaca_last_equity(user_id: str, supabase: Any = None) -> Optional[float
     equity stops a bad open-position mark from depressing the denominator and
     inflating the loss % (06-17: −285/1865 = −15.3% vs −15/2136 = −0.7%). None
     when Alpaca is unavailable or the field is missing/non-positive."""
-    now = time.monotonic()
-    cached = _ALPACA_LAST_EQUITY_CACHE.get(user_id)
-    if cached and (now - cached[0]) < _ALPACA_STATE_TTL_SECONDS:
-        return cached[1]
     try:
-        from packages.quantum.brokers.alpaca_client import get_alpaca_client
-        alpaca = get_alpaca_client()
-        if not alpaca:
+        snap = get_account_snapshot(user_id)
+        if snap is None:
             return None
-        acct = alpaca.get_account()
-        raw = acct.get("last_equity")
-        if raw is None:
+        le = snap.field("last_equity")
+        if le is None:
             logger.warning(
                 "[EQUITY_STATE] get_account() missing 'last_equity' for %s — "
                 "clean-denominator base unavailable; daily/weekly envelope skips "
@@ -325,10 +428,8 @@ def get_alpaca_last_equity(user_id: str, supabase: Any = None) -> Optional[float
                 user_id[:8],
             )
             return None
-        le = float(raw)
         if le <= 0:
             return None
-        _ALPACA_LAST_EQUITY_CACHE[user_id] = (now, le)
         return le
     except Exception as e:
         logger.warning(
@@ -402,20 +503,13 @@ def reconcile_realized(
 # ── Alpaca-authoritative internals ─────────────────────────────────
 
 def _fetch_alpaca_equity(user_id: str, supabase: Any = None) -> Optional[float]:
-    now = time.monotonic()
-    cached = _ALPACA_EQUITY_CACHE.get(user_id)
-    if cached and (now - cached[0]) < _ALPACA_STATE_TTL_SECONDS:
-        return cached[1]
     try:
-        from packages.quantum.brokers.alpaca_client import get_alpaca_client
-        alpaca = get_alpaca_client()
-        if not alpaca:
+        snap = get_account_snapshot(user_id)
+        if snap is None:
             return None
-        acct = alpaca.get_account()
-        equity = float(acct.get("equity") or 0)
+        equity = snap.field("equity") or 0.0
         if equity <= 0:
             return None
-        _ALPACA_EQUITY_CACHE[user_id] = (now, equity)
         return equity
     except Exception as e:
         logger.warning(
@@ -438,27 +532,19 @@ def _fetch_alpaca_equity(user_id: str, supabase: Any = None) -> Optional[float]:
 
 
 def _fetch_alpaca_options_buying_power(user_id: str, supabase: Any = None) -> Optional[float]:
-    now = time.monotonic()
-    cached = _ALPACA_OBP_CACHE.get(user_id)
-    if cached and (now - cached[0]) < _ALPACA_STATE_TTL_SECONDS:
-        return cached[1]
     try:
-        from packages.quantum.brokers.alpaca_client import get_alpaca_client
-        alpaca = get_alpaca_client()
-        if not alpaca:
+        snap = get_account_snapshot(user_id)
+        if snap is None:
             return None
-        acct = alpaca.get_account()
-        raw = acct.get("options_buying_power")
-        if raw is None:
+        obp = snap.field("options_buying_power")
+        if obp is None:
             logger.warning(
                 f"[EQUITY_STATE] options_buying_power field missing "
                 f"for {user_id[:8]} — account may not have options approval"
             )
             return None
-        obp = float(raw)
         if obp < 0:
             obp = 0.0
-        _ALPACA_OBP_CACHE[user_id] = (now, obp)
         return obp
     except Exception as e:
         logger.warning(
@@ -501,32 +587,29 @@ def _fetch_alpaca_options_buying_power(user_id: str, supabase: Any = None) -> Op
         return None
 
 
+def _read_weekly_pnl() -> Optional[float]:
+    from packages.quantum.brokers.alpaca_client import get_alpaca_client
+    alpaca = get_alpaca_client()
+    if not alpaca:
+        return None
+    from alpaca.trading.requests import GetPortfolioHistoryRequest
+    req = GetPortfolioHistoryRequest(period="1W", timeframe="1D")
+    hist = alpaca._call_with_retry(
+        alpaca._client.get_portfolio_history, req,
+    )
+    eq_series = list(getattr(hist, "equity", None) or [])
+    if len(eq_series) >= 2:
+        return float(eq_series[-1]) - float(eq_series[0])
+    if len(eq_series) == 1:
+        # Single data point (e.g., Monday before first close): no
+        # prior equity to compare. Treat as flat week.
+        return 0.0
+    return None
+
+
 def _fetch_alpaca_weekly_pnl(user_id: str, supabase: Any = None) -> Optional[float]:
-    now = time.monotonic()
-    cached = _ALPACA_WEEKLY_PNL_CACHE.get(user_id)
-    if cached and (now - cached[0]) < _ALPACA_STATE_TTL_SECONDS:
-        return cached[1]
     try:
-        from packages.quantum.brokers.alpaca_client import get_alpaca_client
-        alpaca = get_alpaca_client()
-        if not alpaca:
-            return None
-        from alpaca.trading.requests import GetPortfolioHistoryRequest
-        req = GetPortfolioHistoryRequest(period="1W", timeframe="1D")
-        hist = alpaca._call_with_retry(
-            alpaca._client.get_portfolio_history, req,
-        )
-        eq_series = list(getattr(hist, "equity", None) or [])
-        if len(eq_series) >= 2:
-            weekly_pnl = float(eq_series[-1]) - float(eq_series[0])
-        elif len(eq_series) == 1:
-            # Single data point (e.g., Monday before first close): no
-            # prior equity to compare. Treat as flat week.
-            weekly_pnl = 0.0
-        else:
-            return None
-        _ALPACA_WEEKLY_PNL_CACHE[user_id] = (now, weekly_pnl)
-        return weekly_pnl
+        return _WEEKLY_PNL.get(user_id, _read_weekly_pnl)
     except Exception as e:
         logger.warning(
             f"[EQUITY_STATE] Alpaca weekly P&L fetch failed for {user_id[:8]}: {e}"
@@ -599,7 +682,5 @@ def _compute_weekly_pnl_legacy(supabase: Any) -> float:
 
 def _reset_caches_for_testing() -> None:
     """Reset the per-user caches between tests. Not for production use."""
-    _ALPACA_EQUITY_CACHE.clear()
-    _ALPACA_WEEKLY_PNL_CACHE.clear()
-    _ALPACA_OBP_CACHE.clear()
-    _ALPACA_DAILY_PNL_CACHE.clear()
+    _ACCOUNT_SNAPSHOTS.clear()
+    _WEEKLY_PNL.clear()
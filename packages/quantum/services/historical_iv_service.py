@@ -20,10 +20,12 @@ responsible for verifying writes via independent DB count.
 from __future__ import annotations
 
 import logging
+import math
+import os
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from packages.quantum.services.bs_inversion import invert_iv
+from packages.quantum.services.bs_inversion import invert_iv, invert_iv_batch
 from packages.quantum.services.iv_point_service import IVPointService
 from packages.quantum.services.cache_key_builder import normalize_symbol as _normalize_option_symbol
 
@@ -41,6 +43,23 @@ ATM_STRIKE_RANGE_PCT = 0.20
 DTE_MIN = 2
 DTE_MAX = 365
 
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+# (price, spot, strike, T, right, exp_str) — one contract awaiting inversion.
+_InversionRow = Tuple[float, float, float, float, str, str]
+
+
+def is_batch_iv_inversion_enabled() -> bool:
+    """HISTORICAL_IV_BATCH_INVERSION — default ON.
+
+    When on, contracts are collected first and inverted with one
+    ``invert_iv_batch`` call (per date, or per window for the backfill
+    path). Explicit 0/false/no/off restores the per-contract scalar
+    ``invert_iv`` loop.
+    """
+    raw = os.getenv("HISTORICAL_IV_BATCH_INVERSION", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
 
 class HistoricalIVService:
     """Reconstructs ATM IV30 points for historical dates.
@@ -61,6 +80,37 @@ class HistoricalIVService:
         self.r = risk_free_rate
         self.q = dividend_yield
 
+    def _invert_rows(self, rows: List[_InversionRow]) -> List[Optional[float]]:
+        """IV per row (None where inversion is skipped), in row order."""
+        if not rows:
+            return []
+        if not is_batch_iv_inversion_enabled():
+            return [
+                invert_iv(price=price, S=spot, K=strike, T=T,
+                          r=self.r, q=self.q, right=right)
+                for price, spot, strike, T, right, _ in rows
+            ]
+        prices, spots, strikes, tes, rights, _ = zip(*rows)
+        ivs = invert_iv_batch(prices, spots, strikes, tes, self.r, self.q, rights)
+        return [None if math.isnan(iv) else float(iv) for iv in ivs]
+
+    @staticmethod
+    def _chain_from_rows(
+        rows: List[_InversionRow], ivs: List[Optional[float]],
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "details": {
+                    "strike_price": strike,
+                    "contract_type": right,
+                    "expiration_date": exp_str,
+                },
+                "implied_volatility": float(iv),
+            }
+            for (_, _, strike, _, right, exp_str), iv in zip(rows, ivs)
+            if iv is not None
+        ]
+
     # ---- Polygon thin wrappers (one responsibility each) ------------
 
     def get_historical_contracts(
@@ -242,7 +292,7 @@ class HistoricalIVService:
         Returns whatever inverted successfully — possibly empty if no
         contracts had usable prices on the date.
         """
-        chain: List[Dict[str, Any]] = []
+        rows: List[_InversionRow] = []
 
         for right in ("call", "put"):
             try:
@@ -278,28 +328,9 @@ class HistoricalIVService:
                 if price is None or price <= 0:
                     continue
 
-                iv = invert_iv(
-                    price=price,
-                    S=spot,
-                    K=float(strike),
-                    T=T,
-                    r=self.r,
-                    q=self.q,
-                    right=right,
-                )
-                if iv is None:
-                    continue
-
-                chain.append({
-                    "details": {
-                        "strike_price": float(strike),
-                        "contract_type": right,
-                        "expiration_date": exp_str,
-                    },
-                    "implied_volatility": float(iv),
-                })
+                rows.append((price, spot, float(strike), T, right, exp_str))
 
-        return chain
+        return self._chain_from_rows(rows, self._invert_rows(rows))
 
     # ---- Public entry point ----------------------------------------
 
@@ -405,7 +436,9 @@ class HistoricalIVService:
             Per-date strike filtering (ATM ± ``ATM_STRIKE_RANGE_PCT``
             of THAT date's spot) and DTE filtering (DTE_MIN..DTE_MAX
             from THAT date) are applied client-side after the window
-            fetch. Same code path through ``invert_iv`` +
+            fetch. Same code path through ``invert_iv`` (batched via
+            ``invert_iv_batch`` across the whole window unless
+            HISTORICAL_IV_BATCH_INVERSION=0) +
             ``IVPointService.compute_atm_iv_target_from_chain``. Output
             for any single date matches what the per-date method would
             produce against the same Polygon state.
@@ -498,18 +531,20 @@ class HistoricalIVService:
         # Per-date interpolation from cached chain + OHLC. Mirrors
         # reconstruct_chain_at_date's behavior with per-date strike
         # and DTE filters applied client-side.
-        results: Dict[date, Optional[Dict[str, Any]]] = {}
+        # Pass 1 collects every (date, contract) needing inversion so the
+        # whole window is inverted in one vectorized batch.
+        rows_per_date: Dict[date, List[_InversionRow]] = {}
         for d in target_dates:
             spot = spots.get(d)
             if spot is None or spot <= 0:
-                results[d] = None
                 continue
 
             d_str = d.strftime("%Y-%m-%d")
             d_strike_min = spot * (1 - ATM_STRIKE_RANGE_PCT)
             d_strike_max = spot * (1 + ATM_STRIKE_RANGE_PCT)
 
-            chain: List[Dict[str, Any]] = []
+            rows: List[_InversionRow] = []
+            rows_per_date[d] = rows
             for right in ("call", "put"):
                 for c in contracts_per_right.get(right, []):
                     occ = c.get("ticker")
@@ -537,26 +572,25 @@ class HistoricalIVService:
                     if price is None or price <= 0:
                         continue
 
-                    iv = invert_iv(
-                        price=price,
-                        S=spot,
-                        K=strike_f,
-                        T=T,
-                        r=self.r,
-                        q=self.q,
-                        right=right,
-                    )
-                    if iv is None:
-                        continue
+                    rows.append((price, spot, strike_f, T, right, exp_str))
+
+        all_rows = [row for rows in rows_per_date.values() for row in rows]
+        all_ivs = self._invert_rows(all_rows)
+
+        # Pass 2: per-date chains (original contract order) + interpolation.
+        chains: Dict[date, List[Dict[str, Any]]] = {}
+        offset = 0
+        for d, rows in rows_per_date.items():
+            chains[d] = self._chain_from_rows(rows, all_ivs[offset:offset + len(rows)])
+            offset += len(rows)
 
-                    chain.append({
-                        "details": {
-                            "strike_price": strike_f,
-                            "contract_type": right,
-                            "expiration_date": exp_str,
-                        },
-                        "implied_volatility": float(iv),
-                    })
+        results: Dict[date, Optional[Dict[str, Any]]] = {}
+        for d in target_dates:
+            spot = spots.get(d)
+            if d not in chains:
+                results[d] = None
+                continue
+            chain = chains[d]
 
             if not chain:
                 logger.info(
@@ -0,0 +1,155 @@
+"""
+Event-driven execution of JobDependencyService.JOB_CHAIN.
+
+By default every chained job fires on its own cron slot and the dependency
+service only checks afterwards whether the ordering held, so the end-of-day
+chain (mark-to-market → progression eval → learning ingest → post-trade
+learning → policy lab → promotion check) spreads over hours of slot slack
+and a long upstream run can leave a downstream job reading stale inputs.
+
+With JOB_DAG_EXECUTION=1 the chain is driven by completions instead:
+
+- the scheduler registers cron triggers only for chain ROOTS (jobs without a
+  ``depends_on``) and for jobs outside the chain;
+- when the runner finishes a job_runs row as succeeded or partial (the same
+  statuses ``is_dependency_met`` accepts), every direct dependent is fired
+  at once through its own signed task endpoint — so payload, idempotency key
+  and pause / readiness gates are exactly those of the cron fire. Sibling
+  dependents are fired concurrently and run on separate workers.
+
+A failed, retried or dead-lettered run fires nothing: its dependents wait for
+the retry to succeed, and the day orchestrator's missed-job check reports
+them if it never does.
+
+Chain nodes are SCHEDULES ids, not handler names: the morning and afternoon
+exit evaluations both run handler ``paper_exit_evaluate``. The node of a run
+is the ``schedule_id`` stamped into ``payload.origin`` when it names a chain
+job (both cron and DAG fires set it), else the run's ``job_name``.
+
+Idempotency: the task endpoints key runs by fire time (day, or UTC hour for
+exit evaluation), which a cron fire pins to its slot but a completion-driven
+fire does not — a re-fired or late-retried upstream would land its
+dependents in a new bucket and enqueue them twice. Every dependent fire
+therefore carries the upstream run's ``schedule_slot`` (the chain root's cron
+slot, passed down link by link), and ``dag_idempotency_key`` re-keys the
+enqueue on (UTC day, chain node, user, slot).
+
+Fires go over HTTP to SCHEDULER_BASE_URL, which must reach the API from the
+worker process.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from packages.quantum.jobs.origin import ORIGIN_EVENT
+from packages.quantum.services.job_dependency_service import JobDependencyService
+
+logger = logging.getLogger(__name__)
+
+# Terminal statuses that release dependents (mirrors is_dependency_met).
+COMPLETED_STATUSES = frozenset({"succeeded", "partial"})
+
+# trigger_actor_class prefix of a dependent fire ("job_dag:<parent node>").
+DAG_ACTOR_PREFIX = "job_dag:"
+
+
+def is_job_dag_enabled() -> bool:
+    """JOB_DAG_EXECUTION — default OFF (cron fires every chained job)."""
+    return os.environ.get("JOB_DAG_EXECUTION", "0") == "1"
+
+
+def is_cron_driven(job_id: str) -> bool:
+    """Whether the scheduler should register a cron trigger for ``job_id``.
+
+    In DAG mode chained jobs are fired by their upstream's completion."""
+    return not (is_job_dag_enabled() and JobDependencyService.has_dependency(job_id))
+
+
+def _origin_of(job: Dict[str, Any]) -> Dict[str, Any]:
+    payload = job.get("payload")
+    origin = payload.get("origin") if isinstance(payload, dict) else None
+    return origin if isinstance(origin, dict) else {}
+
+
+def chain_node_for(job: Dict[str, Any]) -> str:
+    """The JOB_CHAIN node a job_runs row executed."""
+    job_name = str(job.get("job_name") or "")
+    schedule_id = _origin_of(job).get("schedule_id")
+    if schedule_id and schedule_id in JobDependencyService.JOB_CHAIN:
+        return schedule_id
+    return job_name
+
+
+def dag_idempotency_key(origin: Optional[Dict[str, Any]], user_id: Optional[str]) -> Optional[str]:
+    """Slot-scoped idempotency key for a dependent fire, else None.
+
+    Only an event-origin fire from this executor that carries both its chain
+    node (``schedule_id``) and the upstream ``schedule_slot`` is re-keyed;
+    anything else keeps the endpoint's own key.
+    """
+    if not isinstance(origin, dict) or origin.get("origin") != ORIGIN_EVENT:
+        return None
+    actor = str(origin.get("trigger_actor_class") or "")
+    schedule_id = origin.get("schedule_id")
+    schedule_slot = origin.get("schedule_slot")
+    if not (actor.startswith(DAG_ACTOR_PREFIX) and schedule_id and schedule_slot):
+        return None
+    day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return f"{day}-dag-{schedule_id}-{user_id or 'all'}-{schedule_slot}"
+
+
+def dispatch_ready_dependents(
+    job: Dict[str, Any],
+    status: str,
+    *,
+    fire: Optional[Callable[[str, str, Optional[str], Optional[str]], Any]] = None,
+) -> List[str]:
+    """Fire every direct dependent of a just-completed job run.
+
+    ``fire(job_id, parent_node, parent_job_run_id, schedule_slot)`` defaults
+    to ``scheduler.fire_dependent``; ``schedule_slot`` is the run's own
+    ``payload.origin.schedule_slot``. Returns the dependents fired. Never
+    raises: a dispatch failure must not fail the upstream job that succeeded.
+    """
+    if not is_job_dag_enabled() or status not in COMPLETED_STATUSES:
+        return []
+
+    node = chain_node_for(job)
+    dependents = JobDependencyService.dependents_of(node)
+    if not dependents:
+        return []
+
+    try:
+        if fire is None:
+            from packages.quantum.scheduler import fire_dependent as fire
+        parent_run_id = str(job["id"]) if job.get("id") else None
+        schedule_slot = _origin_of(job).get("schedule_slot")
+        if not schedule_slot:
+            logger.warning(
+                f"[JOB_DAG] {node} run {parent_run_id} has no schedule_slot; "
+                f"dependents keep their endpoint idempotency keys"
+            )
+
+        fired: List[str] = []
+        with ThreadPoolExecutor(
+            max_workers=len(dependents), thread_name_prefix="job-dag"
+        ) as pool:
+            futures = {
+                pool.submit(fire, dependent, node, parent_run_id, schedule_slot): dependent
+                for dependent in dependents
+            }
+            for future, dependent in futures.items():
+                try:
+                    future.result()
+                    fired.append(dependent)
+                except Exception as e:
+                    logger.error(f"[JOB_DAG] {node} → {dependent} fire failed: {e}")
+
+        logger.info(f"[JOB_DAG] {node} {status} → fired {fired}")
+        return fired
+    except Exception as e:
+        logger.error(f"[JOB_DAG] dispatch after {node} failed (non-fatal): {e}")
+        return []
@@ -41,6 +41,20 @@ class JobDependencyService:
     def __init__(self, supabase):
         self.supabase = supabase
 
+    @classmethod
+    def dependents_of(cls, job_name: str) -> List[str]:
+        """Jobs that depend directly on ``job_name``, in declaration order."""
+        return [
+            name for name, cfg in cls.JOB_CHAIN.items()
+            if cfg["depends_on"] == job_name
+        ]
+
+    @classmethod
+    def has_dependency(cls, job_name: str) -> bool:
+        """True when ``job_name`` is a non-root link of the chain."""
+        chain = cls.JOB_CHAIN.get(job_name)
+        return bool(chain and chain["depends_on"])
+
     def is_dependency_met(self, job_name: str, trade_date: str) -> bool:
         """Check if the job's dependency has completed successfully today."""
         chain = self.JOB_CHAIN.get(job_name)
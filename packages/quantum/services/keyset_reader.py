@@ -0,0 +1,291 @@
+"""Keyset-paginated streaming reads with a local snapshot cache.
+
+Research readers used to page Supabase tables with ``.range()`` offset loops:
+every page makes Postgres walk and discard all earlier rows, so page N costs
+O(N) and a full read O(N²); and every nightly run re-downloaded the whole
+history.
+
+``KeysetPager`` pages by a cursor instead: ``ORDER BY k1, k2 ... LIMIT n``
+with ``(k1, k2, ...) > last_seen`` expressed as a PostgREST ``or`` filter, so
+every page is an index seek. Rows are streamed as a generator.
+
+Keyset paging is only correct on cursor columns that are NOT NULL — a NULL
+never compares greater than the cursor, so rows with a NULL cursor value
+would be skipped silently (NULLs sort last, past the final page's cursor).
+Before the first page the pager probes each cursor column for a NULL under
+the same filters (one ``LIMIT 1`` query per column) and raises
+``KeysetCursorError`` rather than return a partial read; callers fall back to
+offset paging.
+
+``SnapshotCache`` keeps pulled rows in a local sqlite file, one partition per
+(table, columns, cursor, filters), with the partition's high-water mark (the
+greatest cursor seen). A later ``sync`` fetches only rows past the mark (or
+from ``lookback_seconds`` before a timestamp mark, to pick up rows committed
+late with an earlier ``created_at``), upserts them by cursor and streams the
+whole partition. It is only sound for APPEND-ONLY tables: rows updated in
+place after they were cached are not re-read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 1000
+
+Filters = Sequence[Tuple[str, Any]]
+
+
+class KeysetCursorError(RuntimeError):
+    """A cursor column held NULL: keyset paging cannot be trusted here."""
+
+
+def _quote(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value)
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def keyset_filter(keys: Sequence[str], cursor: Sequence[Any]) -> str:
+    """PostgREST ``or`` expression for ``(keys) > (cursor)`` (lexicographic):
+    ``k1.gt.v1,and(k1.eq.v1,k2.gt.v2),...``."""
+    terms = []
+    for i, key in enumerate(keys):
+        ties = [f"{keys[j]}.eq.{_quote(cursor[j])}" for j in range(i)]
+        seek = f"{key}.gt.{_quote(cursor[i])}"
+        terms.append(f"and({','.join(ties + [seek])})" if ties else seek)
+    return ",".join(terms)
+
+
+def _rows(response: Any) -> List[Dict[str, Any]]:
+    data = getattr(response, "data", None)
+    return [dict(r) for r in data] if isinstance(data, list) else []
+
+
+class KeysetPager:
+    """Stream a table in cursor order, one index seek per page.
+
+    ``filters`` are equality filters; ``since`` is an optional
+    ``(column, value)`` lower bound (``>=``). ``pages`` / ``n_rows`` /
+    ``last_key`` are updated as the generator is consumed.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        table: str,
+        columns: str,
+        keys: Sequence[str],
+        filters: Filters = (),
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        after: Optional[Sequence[Any]] = None,
+        since: Optional[Tuple[str, Any]] = None,
+    ) -> None:
+        if not keys:
+            raise ValueError("keyset paging needs at least one cursor column")
+        self.client = client
+        self.table = table
+        self.columns = columns
+        self.keys = tuple(keys)
+        self.filters = list(filters)
+        self.page_size = page_size
+        self.since = since
+        self.last_key: Optional[Tuple[Any, ...]] = tuple(after) if after is not None else None
+        self.pages = 0
+        self.n_rows = 0
+
+    def _base(self, columns: str) -> Any:
+        query = self.client.table(self.table).select(columns)
+        for col, val in self.filters:
+            query = query.eq(col, val)
+        return query
+
+    def _check_not_null(self) -> None:
+        for col in self.keys:
+            if _rows(self._base(col).is_(col, "null").limit(1).execute()):
+                raise KeysetCursorError(f"{self.table}: NULL in cursor column {col}")
+
+    def _page(self) -> List[Dict[str, Any]]:
+        query = self._base(self.columns)
+        if self.since is not None:
+            query = query.gte(*self.since)
+        if self.last_key is not None:
+            query = query.or_(keyset_filter(self.keys, self.last_key))
+        for col in self.keys:
+            query = query.order(col)
+        return _rows(query.limit(self.page_size).execute())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._check_not_null()
+        while True:
+            batch = self._page()
+            self.pages += 1
+            for row in batch:
+                key = tuple(row.get(k) for k in self.keys)
+                if any(v is None for v in key):
+                    raise KeysetCursorError(
+                        f"{self.table}: NULL in cursor column(s) {self.keys}"
+                    )
+                self.last_key = key
+                self.n_rows += 1
+                yield row
+            if len(batch) < self.page_size:
+                return
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+class SnapshotCache:
+    """Local sqlite snapshot of append-only table partitions."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS partitions ("
+                " partition TEXT PRIMARY KEY, tbl TEXT NOT NULL, spec TEXT NOT NULL,"
+                " high_water TEXT, synced_at TEXT)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS rows ("
+                " partition TEXT NOT NULL, row_key TEXT NOT NULL, row TEXT NOT NULL,"
+                " PRIMARY KEY (partition, row_key))"
+            )
+
+    def close(self) -> None:
+        self._db.close()
+
+    @staticmethod
+    def partition_key(table: str, columns: str, keys: Sequence[str], filters: Filters) -> str:
+        spec = json.dumps(
+            {"table": table, "columns": columns, "keys": list(keys),
+             "filters": sorted([list(f) for f in filters], key=str)},
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(spec.encode()).hexdigest()[:32]
+
+    def high_water(self, partition: str) -> Optional[Tuple[Any, ...]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT high_water FROM partitions WHERE partition = ?", (partition,)
+            ).fetchone()
+        return tuple(json.loads(row[0])) if row and row[0] else None
+
+    def _store(self, partition: str, table: str, keys: Sequence[str], rows: List[Dict[str, Any]],
+               high_water: Optional[Tuple[Any, ...]]) -> None:
+        payload = [
+            (partition, json.dumps([r.get(k) for k in keys], default=str),
+             json.dumps(r, default=str))
+            for r in rows
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT INTO rows (partition, row_key, row) VALUES (?, ?, ?)"
+                " ON CONFLICT (partition, row_key) DO UPDATE SET row = excluded.row",
+                payload,
+            )
+            self._db.execute(
+                "INSERT INTO partitions (partition, tbl, spec, high_water, synced_at)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (partition) DO UPDATE SET"
+                " high_water = COALESCE(excluded.high_water, partitions.high_water),"
+                " synced_at = excluded.synced_at",
+                (partition, table, json.dumps(list(keys)),
+                 json.dumps(list(high_water), default=str) if high_water else None,
+                 datetime.now(timezone.utc).isoformat()),
+            )
+
+    def cached_rows(self, partition: str) -> Iterator[Dict[str, Any]]:
+        """Cached rows in insertion order (cursor order, except rows a
+        lookback picked up late)."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT row FROM rows WHERE partition = ? ORDER BY rowid", (partition,)
+            ).fetchall()
+        for (text,) in rows:
+            yield json.loads(text)
+
+    def sync(
+        self,
+        client: Any,
+        table: str,
+        columns: str,
+        keys: Sequence[str],
+        filters: Filters = (),
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        lookback_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Pull rows past the partition's high-water mark into the cache.
+
+        Returns ``{"partition", "fetched", "pages", "incremental"}``. Errors
+        (including ``KeysetCursorError``) propagate and leave the cache as it
+        was before the failing page.
+        """
+        partition = self.partition_key(table, columns, keys, filters)
+        mark = self.high_water(partition)
+        after, since = mark, None
+        if mark is not None and lookback_seconds:
+            first = _parse_ts(mark[0])
+            if first is not None:
+                after = None
+                since = (keys[0], (first - timedelta(seconds=lookback_seconds)).isoformat())
+        pager = KeysetPager(
+            client, table, columns, keys, filters,
+            page_size=page_size, after=after, since=since,
+        )
+        batch: List[Dict[str, Any]] = []
+        fetched = 0
+        for row in pager:
+            batch.append(row)
+            if len(batch) >= page_size:
+                fetched += len(batch)
+                self._store(partition, table, keys, batch, self._max(mark, pager.last_key))
+                mark = self._max(mark, pager.last_key)
+                batch = []
+        fetched += len(batch)
+        self._store(partition, table, keys, batch, self._max(mark, pager.last_key))
+        return {
+            "partition": partition,
+            "fetched": fetched,
+            "pages": pager.pages,
+            "incremental": after is not None or since is not None,
+        }
+
+    @staticmethod
+    def _max(a: Optional[Tuple[Any, ...]], b: Optional[Tuple[Any, ...]]) -> Optional[Tuple[Any, ...]]:
+        if a is None or b is None:
+            return a if b is None else b
+        try:
+            return max(a, b)
+        except TypeError:
+            return b
+
+    def read(
+        self,
+        client: Any,
+        table: str,
+        columns: str,
+        keys: Sequence[str],
+        filters: Filters = (),
+        **sync_kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """``sync`` then stream the whole cached partition."""
+        info = self.sync(client, table, columns, keys, filters, **sync_kwargs)
+        return self.cached_rows(info["partition"])
@@ -1,14 +1,36 @@
 """
 Market Data Cache Service
 Implements a TTL cache with namespaces, file fallback, robust key generation, and in-flight locking.
+
+Memory is bounded per namespace: each namespace has a maximum entry count and
+an approximate byte budget, enforced by LRU eviction on insert. A background
+sweeper (started for the process-wide singleton) drops expired entries that
+are never read again, and per-namespace hit/miss/eviction counters are
+exposed through ``get_stats`` so TTLs can be judged on actual payoff.
+
+Persistence (``persist=True``) has two modes, chosen by ``persist_mode`` or
+MARKET_DATA_CACHE_PERSIST_MODE:
+
+* ``append_log`` (default): ``set`` appends one JSON line to
+  ``<file_path>.log`` outside the global lock. Once the log holds more
+  records than ``compact_min_records`` and twice the live entry count, it is
+  compacted: live entries are written to ``<file_path>.tmp``, atomically
+  renamed over ``file_path`` and the log is truncated. Entries dropped by
+  LRU eviction or TTL expiry append a tombstone so replay cannot resurrect
+  them. Load = snapshot + log replay (last record wins), so restarts stay
+  warm.
+* ``json``: legacy full ``json.dump`` of the whole cache on every ``set``.
 """
 import os
+import sys
 import time
 import json
 import logging
 import hashlib
 import threading
-from typing import Dict, Any, Optional, Union, List
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Union, List, Tuple
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -19,25 +41,136 @@ TTL_SNAPSHOTS = 300     # 5 minutes
 TTL_OHLC = 43200        # 12 hours
 TTL_EARNINGS = 86400    # 24 hours
 
+# Per-namespace bounds: (max_entries, max_bytes). Bytes are an estimate (see
+# _approx_size), not an exact RSS accounting. Override with
+# MARKET_DATA_CACHE_LIMITS="option_chain=100:134217728,snapshot_many=5000".
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_NAMESPACE_LIMITS: Dict[str, Tuple[int, int]] = {
+    "option_chain": (200, 512 * 1024 * 1024),
+    "snapshot_many": (20000, 128 * 1024 * 1024),
+    "CHAIN": (200, 256 * 1024 * 1024),
+    "daily_bars_series": (2000, 128 * 1024 * 1024),
+}
+DEFAULT_SWEEP_INTERVAL_SECONDS = 60
+
+PERSIST_MODE_APPEND_LOG = "append_log"
+PERSIST_MODE_JSON = "json"
+DEFAULT_COMPACT_MIN_RECORDS = 1000
+
+# Lists/dicts larger than this are size-estimated from a sample.
+_SIZE_SAMPLE = 8
+
+
+def _approx_size(value: Any, _depth: int = 0) -> int:
+    """
+    Cheap recursive size estimate in bytes.
+
+    Large containers are extrapolated from their first few elements so a
+    5k-contract chain costs a handful of getsizeof calls, not 5k * fields.
+    """
+    size = sys.getsizeof(value)
+    if _depth > 4:
+        return size
+    if isinstance(value, dict):
+        n = len(value)
+        if n == 0:
+            return size
+        items = value.items() if n <= _SIZE_SAMPLE else list(value.items())[:_SIZE_SAMPLE]
+        sampled = sum(_approx_size(k, _depth + 1) + _approx_size(v, _depth + 1) for k, v in items)
+        return size + sampled * n // min(n, _SIZE_SAMPLE)
+    if isinstance(value, (list, tuple)):
+        n = len(value)
+        if n == 0:
+            return size
+        sampled = sum(_approx_size(v, _depth + 1) for v in value[:_SIZE_SAMPLE])
+        return size + sampled * n // min(n, _SIZE_SAMPLE)
+    return size
+
+
+def _parse_limits_env(raw: str) -> Dict[str, Tuple[int, int]]:
+    """Parses ``ns=entries[:bytes],...``; malformed items are skipped."""
+    limits: Dict[str, Tuple[int, int]] = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        ns, _, spec = item.partition("=")
+        entries_s, _, bytes_s = spec.partition(":")
+        try:
+            max_entries = int(entries_s)
+            max_bytes = int(bytes_s) if bytes_s else DEFAULT_MAX_BYTES
+        except ValueError:
+            logger.warning(f"Ignoring malformed MARKET_DATA_CACHE_LIMITS item: {item!r}")
+            continue
+        limits[ns.strip()] = (max_entries, max_bytes)
+    return limits
+
+
+def _new_ns_stats() -> Dict[str, int]:
+    return {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+
 class MarketDataCache:
     """
     Thread-safe in-memory cache with optional file persistence.
     Supports namespaced keys with individual TTLs.
     """
 
-    def __init__(self, file_path: Optional[str] = None, persist: bool = False):
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        persist: bool = False,
+        namespace_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        default_limits: Tuple[int, int] = (DEFAULT_MAX_ENTRIES, DEFAULT_MAX_BYTES),
+        persist_mode: Optional[str] = None,
+        compact_min_records: int = DEFAULT_COMPACT_MIN_RECORDS,
+    ):
         self._memory_cache: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.RLock()
         self._inflight_locks: Dict[str, threading.Lock] = {}
         self._inflight_counts: Dict[str, int] = {} # Ref counting for cleanup
         self._inflight_registry_lock = threading.Lock()
 
+        # LRU bookkeeping: namespace -> OrderedDict(full_key -> approx bytes),
+        # least recently used first. Kept beside _memory_cache so the persisted
+        # entry format is unchanged.
+        self._lru: Dict[str, "OrderedDict[str, int]"] = {}
+        self._ns_bytes: Dict[str, int] = {}
+        self._ns_stats: Dict[str, Dict[str, int]] = {}
+        self._default_limits = default_limits
+        self._namespace_limits = dict(DEFAULT_NAMESPACE_LIMITS)
+        self._namespace_limits.update(_parse_limits_env(os.getenv("MARKET_DATA_CACHE_LIMITS", "")))
+        if namespace_limits:
+            self._namespace_limits.update(namespace_limits)
+
+        self._sweeper_thread: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+
         self.persist = persist
         # Default to a file in the same directory if not provided
         self.file_path = file_path or os.path.join(os.path.dirname(__file__), "market_data_v2.json")
 
+        mode = (persist_mode or os.getenv("MARKET_DATA_CACHE_PERSIST_MODE") or PERSIST_MODE_APPEND_LOG)
+        mode = mode.strip().lower()
+        if mode not in (PERSIST_MODE_APPEND_LOG, PERSIST_MODE_JSON):
+            logger.warning(f"Unknown market data cache persist mode {mode!r}; using {PERSIST_MODE_APPEND_LOG}.")
+            mode = PERSIST_MODE_APPEND_LOG
+        self.persist_mode = mode
+        self.log_path = f"{self.file_path}.log"
+        self.compact_min_records = compact_min_records
+        # Serializes writes to the log/snapshot files. Never held together
+        # with a blocking wait on self._lock by other threads' readers.
+        self._persist_lock = threading.Lock()
+        self._log_fh = None
+        self._log_records = 0
+        # Keys removed by eviction/expiry since the last flush; tombstoned in
+        # the append log outside self._lock. None when there is no log.
+        self._tombstones: Optional[List[str]] = None
+
         if self.persist:
             self._load_from_file()
+            if self.persist_mode == PERSIST_MODE_APPEND_LOG:
+                self._tombstones = []
 
     def _get_namespaced_key(self, namespace: str, key_parts: Union[str, List[Any]]) -> str:
         """
@@ -54,23 +187,38 @@ class MarketDataCache:
         hashed = hashlib.md5(raw_key.encode()).hexdigest()
         return f"{namespace}:{hashed}"
 
+    def get_limits(self, namespace: str) -> Tuple[int, int]:
+        """(max_entries, max_bytes) for a namespace."""
+        return self._namespace_limits.get(namespace, self._default_limits)
+
     def get(self, namespace: str, key_parts: Union[str, List[Any]]) -> Optional[Any]:
         full_key = self._get_namespaced_key(namespace, key_parts)
 
         with self._lock:
+            stats = self._ns_stats.setdefault(namespace, _new_ns_stats())
             entry = self._memory_cache.get(full_key)
 
             if not entry:
+                stats["misses"] += 1
                 return None
 
-            if time.time() > entry['expiry']:
-                del self._memory_cache[full_key]
-                return None
+            if time.time() <= entry['expiry']:
+                stats["hits"] += 1
+                lru = self._lru.get(namespace)
+                if lru is not None and full_key in lru:
+                    lru.move_to_end(full_key)
+                return entry['data']
 
-            return entry['data']
+            self._remove_locked(full_key, namespace)
+            stats["expired"] += 1
+            stats["misses"] += 1
+        self._flush_tombstones()
+        return None
 
     def set(self, namespace: str, key_parts: Union[str, List[Any]], value: Any, ttl_seconds: int = 300) -> None:
         full_key = self._get_namespaced_key(namespace, key_parts)
+        # Estimate outside the lock: it walks (a sample of) the payload.
+        size = _approx_size(value)
 
         with self._lock:
             self._memory_cache[full_key] = {
@@ -78,9 +226,109 @@ class MarketDataCache:
                 'expiry': time.time() + ttl_seconds,
                 'set_at': time.time()
             }
+            self._track_locked(full_key, namespace, size)
+            self._enforce_limits_locked(namespace, keep=full_key)
 
-            if self.persist:
+            if self.persist and self.persist_mode == PERSIST_MODE_JSON:
                 self._save_to_file_safe()
+            entry = self._memory_cache[full_key]
+
+        # Append-log persistence runs outside the global lock so readers and
+        # other writers never wait on disk I/O.
+        if self.persist and self.persist_mode == PERSIST_MODE_APPEND_LOG:
+            self._append_log({"k": full_key, "e": entry})
+            self._flush_tombstones()
+
+    # ------------------------------------------------------------------
+    # LRU bookkeeping (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _track_locked(self, full_key: str, namespace: str, size: int) -> None:
+        lru = self._lru.setdefault(namespace, OrderedDict())
+        previous = lru.pop(full_key, 0)
+        lru[full_key] = size
+        self._ns_bytes[namespace] = self._ns_bytes.get(namespace, 0) - previous + size
+
+    def _remove_locked(self, full_key: str, namespace: str) -> None:
+        if self._memory_cache.pop(full_key, None) is not None and self._tombstones is not None:
+            self._tombstones.append(full_key)
+        lru = self._lru.get(namespace)
+        if lru is not None:
+            size = lru.pop(full_key, 0)
+            self._ns_bytes[namespace] = self._ns_bytes.get(namespace, 0) - size
+
+    def _enforce_limits_locked(self, namespace: str, keep: Optional[str] = None) -> None:
+        """Evicts least-recently-used entries until the namespace fits its bounds.
+
+        ``keep`` (the entry just inserted) is never evicted, so a single
+        payload larger than the byte budget is still cached on its own.
+        """
+        max_entries, max_bytes = self.get_limits(namespace)
+        lru = self._lru.get(namespace)
+        if not lru:
+            return
+        stats = self._ns_stats.setdefault(namespace, _new_ns_stats())
+        while len(lru) > max_entries or self._ns_bytes.get(namespace, 0) > max_bytes:
+            oldest = next(iter(lru))
+            if oldest == keep:
+                if len(lru) == 1:
+                    break
+                lru.move_to_end(oldest)
+                continue
+            self._remove_locked(oldest, namespace)
+            stats["evictions"] += 1
+
+    def sweep_expired(self) -> int:
+        """Drops every expired entry; returns how many were removed."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            expired = [k for k, v in self._memory_cache.items() if v['expiry'] <= now]
+            for full_key in expired:
+                namespace = full_key.split(":", 1)[0]
+                self._remove_locked(full_key, namespace)
+                self._ns_stats.setdefault(namespace, _new_ns_stats())["expired"] += 1
+                removed += 1
+            if removed and self.persist and self.persist_mode == PERSIST_MODE_JSON:
+                self._save_to_file_safe()
+        if removed:
+            self._flush_tombstones()
+            logger.debug(f"Market data cache sweep removed {removed} expired entries.")
+        return removed
+
+    def start_sweeper(self, interval_seconds: float = DEFAULT_SWEEP_INTERVAL_SECONDS) -> None:
+        """
+        Starts a daemon thread calling sweep_expired every interval.
+        Idempotent. The thread holds only a weak reference to the cache, so it
+        exits on its own once the cache is garbage collected.
+        """
+        if interval_seconds <= 0:
+            return
+        if self._sweeper_thread is not None and self._sweeper_thread.is_alive():
+            return
+        self._sweeper_stop.clear()
+        self_ref = weakref.ref(self)
+        stop = self._sweeper_stop
+
+        def _run():
+            while not stop.wait(interval_seconds):
+                cache = self_ref()
+                if cache is None:
+                    return
+                try:
+                    cache.sweep_expired()
+                except Exception as e:
+                    logger.warning(f"Market data cache sweep failed: {e}")
+                del cache
+
+        self._sweeper_thread = threading.Thread(
+            target=_run, name="market-data-cache-sweeper", daemon=True
+        )
+        self._sweeper_thread.start()
+
+    def stop_sweeper(self) -> None:
+        self._sweeper_stop.set()
+        self._sweeper_thread = None
 
     @contextmanager
     def inflight_lock(self, namespace: str, key_parts: Union[str, List[Any]]):
@@ -118,26 +366,147 @@ class MarketDataCache:
                          del self._inflight_counts[full_key]
 
     def _load_from_file(self):
-        """Loads cache from file if it exists."""
+        """Loads cache from the snapshot file (plus the append log) if they exist."""
+        data: Dict[str, Dict[str, Any]] = {}
         if os.path.exists(self.file_path):
             try:
                 with open(self.file_path, 'r') as f:
                     data = json.load(f)
-
-                with self._lock:
-                    now = time.time()
-                    # Prune expired on load
-                    count = 0
-                    for k, v in data.items():
-                        if v.get('expiry', 0) > now:
-                            self._memory_cache[k] = v
-                            count += 1
-                    logger.info(f"Loaded {count} entries from market data cache.")
             except Exception as e:
                 logger.warning(f"Failed to load cache from file: {e}")
+                data = {}
+
+        if self.persist_mode == PERSIST_MODE_APPEND_LOG:
+            self._log_records = self._replay_log(data)
+
+        with self._lock:
+            now = time.time()
+            # Prune expired on load
+            count = 0
+            for k, v in data.items():
+                if v.get('expiry', 0) > now:
+                    self._memory_cache[k] = v
+                    namespace = k.split(":", 1)[0]
+                    self._track_locked(k, namespace, _approx_size(v.get('data')))
+                    count += 1
+            for namespace in list(self._lru):
+                self._enforce_limits_locked(namespace)
+            if data:
+                logger.info(f"Loaded {count} entries from market data cache.")
+
+    def _replay_log(self, data: Dict[str, Dict[str, Any]]) -> int:
+        """Applies append-log records onto ``data``; returns the record count.
+
+        A torn trailing line (crash mid-write) is skipped, not fatal.
+        """
+        if not os.path.exists(self.log_path):
+            return 0
+        records = 0
+        deleted: Dict[str, float] = {}
+        try:
+            with open(self.log_path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        logger.warning("Skipping torn market data cache log record.")
+                        continue
+                    records += 1
+                    if "d" in rec:
+                        # Tombstone: drop the key unless a newer set won.
+                        prev = data.get(rec["d"])
+                        if prev is not None and prev.get("set_at", 0) <= rec.get("t", 0):
+                            del data[rec["d"]]
+                        deleted[rec["d"]] = max(deleted.get(rec["d"], 0), rec.get("t", 0))
+                    elif "clear" in rec:
+                        prefix = f"{rec['clear']}:"
+                        for k in [k for k in data if k.startswith(prefix)]:
+                            del data[k]
+                    elif "k" in rec and "e" in rec:
+                        # Appends race outside the global lock; keep the
+                        # newest write for a key regardless of line order.
+                        set_at = rec["e"].get("set_at", 0)
+                        if set_at <= deleted.get(rec["k"], -1):
+                            continue
+                        prev = data.get(rec["k"])
+                        if prev is None or set_at >= prev.get("set_at", 0):
+                            data[rec["k"]] = rec["e"]
+        except Exception as e:
+            logger.warning(f"Failed to replay market data cache log: {e}")
+        return records
+
+    def _flush_tombstones(self) -> None:
+        """Appends a delete record for every key evicted or expired since the
+        last flush, so a restart does not replay them back into memory."""
+        if self._tombstones is None:
+            return
+        with self._lock:
+            pending, self._tombstones = self._tombstones, []
+        if pending:
+            now = time.time()
+            self._append_log(*({"d": k, "t": now} for k in pending))
+
+    def _append_log(self, *records: Dict[str, Any]) -> None:
+        """Appends records to the log, compacting when it has grown stale."""
+        try:
+            lines = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to save cache to file: {e}")
+            return
+
+        with self._persist_lock:
+            try:
+                if self._log_fh is None:
+                    self._log_fh = open(self.log_path, 'a')
+                self._log_fh.write(lines)
+                self._log_fh.flush()
+                self._log_records += len(records)
+            except Exception as e:
+                logger.error(f"Failed to append to cache log: {e}")
+                return
+
+            if self._log_records >= max(self.compact_min_records, 2 * len(self._memory_cache)):
+                self._compact_locked()
+
+    def compact(self) -> None:
+        """Writes a fresh snapshot and truncates the append log."""
+        with self._persist_lock:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Snapshot live entries via tmp file + atomic rename, then reset the log.
+
+        Caller holds self._persist_lock. The in-memory dict is copied under
+        self._lock (pointer copy only); serialization happens outside it.
+        Any set() that lands after the copy appends to the fresh log.
+        """
+        now = time.time()
+        with self._lock:
+            live = {k: v for k, v in self._memory_cache.items() if v['expiry'] > now}
+
+        tmp_path = f"{self.file_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(live, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+
+            if self._log_fh is not None:
+                self._log_fh.close()
+            self._log_fh = open(self.log_path, 'w')
+            self._log_records = 0
+        except Exception as e:
+            logger.error(f"Failed to compact market data cache: {e}")
 
     def _save_to_file_safe(self):
         """Persists current cache to file, swallowing errors."""
+        if self.persist_mode == PERSIST_MODE_APPEND_LOG:
+            self.compact()
+            return
         try:
             # Atomic write pattern could be better, but simple write is okay for now
             with open(self.file_path, 'w') as f:
@@ -151,18 +520,39 @@ class MarketDataCache:
             keys_to_delete = [k for k in self._memory_cache if k.startswith(prefix)]
             for k in keys_to_delete:
                 del self._memory_cache[k]
-            if self.persist:
+            self._lru.pop(namespace, None)
+            self._ns_bytes.pop(namespace, None)
+            if self.persist and self.persist_mode == PERSIST_MODE_JSON:
                 self._save_to_file_safe()
+        if self.persist and self.persist_mode == PERSIST_MODE_APPEND_LOG:
+            self._append_log({"clear": namespace})
 
-    def get_stats(self) -> Dict[str, int]:
-        """Returns basic stats about the cache."""
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns basic stats about the cache, plus per-namespace counters."""
         with self._lock:
             total_items = len(self._memory_cache)
             now = time.time()
             active_items = sum(1 for v in self._memory_cache.values() if v['expiry'] > now)
+
+            namespaces: Dict[str, Dict[str, Any]] = {}
+            for namespace in sorted(set(self._lru) | set(self._ns_stats)):
+                counters = self._ns_stats.get(namespace, _new_ns_stats())
+                lookups = counters["hits"] + counters["misses"]
+                max_entries, max_bytes = self.get_limits(namespace)
+                namespaces[namespace] = {
+                    "entries": len(self._lru.get(namespace, ())),
+                    "approx_bytes": self._ns_bytes.get(namespace, 0),
+                    "max_entries": max_entries,
+                    "max_bytes": max_bytes,
+                    **counters,
+                    "hit_rate": round(counters["hits"] / lookups, 4) if lookups else None,
+                }
+
             return {
                 "total_entries": total_items,
-                "active_entries": active_items
+                "active_entries": active_items,
+                "approx_bytes": sum(self._ns_bytes.values()),
+                "namespaces": namespaces,
             }
 
 # Global instance
@@ -177,4 +567,13 @@ def get_market_data_cache(persist: bool = False) -> MarketDataCache:
             cache_dir = os.path.dirname(__file__)
             cache_file = os.path.join(cache_dir, "market_data_v2.json")
             _CACHE_INSTANCE = MarketDataCache(file_path=cache_file, persist=persist)
+            # The singleton lives for the whole worker process: sweep expired
+            # entries that are never read again so they don't pin memory.
+            try:
+                interval = float(os.getenv(
+                    "MARKET_DATA_CACHE_SWEEP_SECONDS", str(DEFAULT_SWEEP_INTERVAL_SECONDS)
+                ))
+            except ValueError:
+                interval = DEFAULT_SWEEP_INTERVAL_SECONDS
+            _CACHE_INSTANCE.start_sweeper(interval)
     return _CACHE_INSTANCE
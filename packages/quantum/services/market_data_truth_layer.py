@@ -11,12 +11,15 @@ from urllib3.util.retry import Retry
 import logging
 import re
 from typing import List, Dict, Optional, Any, Union, Tuple
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import concurrent.futures
+import contextvars
 from pydantic import BaseModel
 
 from packages.quantum.services.market_data_cache import get_market_data_cache
+from packages.quantum.services.daily_bar_store import DailyBarStore, is_daily_bar_store_enabled
 from packages.quantum.services.cache_key_builder import normalize_symbol
+from packages.quantum.services.rate_governor import GovernedSession
 from packages.quantum.analytics.factors import calculate_iv_rank, calculate_trend
 
 # Use a module-level logger
@@ -722,7 +725,7 @@ class MarketDataTruthLayer:
         self.cache = get_market_data_cache()
 
         # Initialize Session with Connection Pooling
-        self.session = requests.Session()
+        self.session = GovernedSession("polygon")
 
         # Configure retry strategy
         retry_strategy = Retry(
@@ -752,6 +755,7 @@ class MarketDataTruthLayer:
         self.ttl_snapshot = int(os.environ.get("SNAPSHOT_CACHE_TTL", "60"))
         self.ttl_option_chain = int(os.environ.get("OPTION_CHAIN_CACHE_TTL", "300"))
         self.ttl_daily_bars = 43200  # 12 hours
+        self.bar_store = DailyBarStore(self.cache, self.ttl_daily_bars)
 
         # Lane 4C (2026-07-17): optional per-cycle quote-provenance recorder
         # (services.quote_provenance.QuoteProvenanceRecorder). Attached by the
@@ -994,7 +998,11 @@ class MarketDataTruthLayer:
         chunks = [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_chunk = {executor.submit(fetch_chunk, chunk): chunk for chunk in chunks}
+            # copy_context: each chunk keeps the caller's rate-governor lane.
+            future_to_chunk = {
+                executor.submit(contextvars.copy_context().run, fetch_chunk, chunk): chunk
+                for chunk in chunks
+            }
 
             for future in concurrent.futures.as_completed(future_to_chunk):
                 try:
@@ -1922,13 +1930,26 @@ class MarketDataTruthLayer:
         Polygon is primary because Alpaca paper accounts lack SIP data
         access, causing 'subscription does not permit querying recent SIP
         data' errors on equity bars.
+
+        Served from the per-symbol DailyBarStore (one contiguous series per
+        symbol, sliced per request, only missing head/tail days fetched).
+        DAILY_BAR_STORE_ENABLED=0 restores the exact-range cache below.
         """
         # Normalize
         symbol = self.normalize_symbol(ticker)
 
-        # Cache key
         s_str = start_date.strftime("%Y-%m-%d")
         e_str = end_date.strftime("%Y-%m-%d")
+
+        if is_daily_bar_store_enabled():
+            bars = self.bar_store.get_range(
+                symbol, start_date, end_date, self._fetch_daily_bars_range
+            )
+            if bars:
+                _record_daily_bars_to_context(symbol, s_str, e_str, bars)
+            return bars
+
+        # Cache key
         cache_key = f"{symbol}_{s_str}_{e_str}"
 
         cached = self.cache.get("daily_bars", cache_key)
@@ -1936,12 +1957,36 @@ class MarketDataTruthLayer:
             _record_daily_bars_to_context(symbol, s_str, e_str, cached)
             return cached
 
+        bars = self._fetch_daily_bars_range(symbol, start_date, end_date)
+        if not bars:
+            return []
+
+        _record_daily_bars_to_context(symbol, s_str, e_str, bars)
+        self.cache.set("daily_bars", cache_key, bars, self.ttl_daily_bars)
+        return bars
+
+    def _fetch_daily_bars_range(
+        self,
+        symbol: str,
+        start: Union[date, datetime],
+        end: Union[date, datetime],
+    ) -> Optional[List[Dict]]:
+        """
+        Provider fetch for one inclusive date range of an already-normalized
+        symbol. Returns the bars, [] when a provider answered with no bars
+        (weekend/holiday segment), or None when every provider failed.
+        """
+        s_str = start.strftime("%Y-%m-%d")
+        e_str = end.strftime("%Y-%m-%d")
+        answered = False
+
         # --- Polygon primary ---
         bars = []
         endpoint = f"/v2/aggs/ticker/{symbol}/range/1/day/{s_str}/{e_str}"
         params = {"adjusted": "true", "sort": "asc", "limit": 50000}
         try:
             data = self._make_request(endpoint, params)
+            answered = data is not None
             if data and "results" in data:
                 for r in data["results"]:
                     dt = datetime.fromtimestamp(r["t"] / 1000.0)
@@ -1965,18 +2010,20 @@ class MarketDataTruthLayer:
                 from packages.quantum.brokers.alpaca_client import get_alpaca_client
                 alpaca = get_alpaca_client()
                 if alpaca:
-                    bars = alpaca.get_stock_bars(symbol, start_date, end_date)
+                    start_dt = start if isinstance(start, datetime) else datetime.combine(start, datetime.min.time())
+                    end_dt = end if isinstance(end, datetime) else min(
+                        datetime.combine(end, datetime.max.time()), datetime.now()
+                    )
+                    bars = alpaca.get_stock_bars(symbol, start_dt, end_dt)
+                    answered = True
                     if bars:
                         logger.info(f"[DAILY_BARS] Alpaca fallback returned {len(bars)} bars for {symbol}")
             except Exception as e:
                 logger.warning(f"[DAILY_BARS] Alpaca bars fallback also failed for {symbol}: {e}")
 
-        if not bars:
-            return []
-
-        _record_daily_bars_to_context(symbol, s_str, e_str, bars)
-        self.cache.set("daily_bars", cache_key, bars, self.ttl_daily_bars)
-        return bars
+        if bars:
+            return bars
+        return [] if answered else None
 
     def get_trend(self, symbol: str) -> str:
         """Determines trend using simple moving averages (100 days)."""
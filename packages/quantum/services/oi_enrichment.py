@@ -385,9 +385,10 @@ def make_default_fetcher() -> Optional[Callable[[str], OIRecord]]:
     alpaca_secret = os.getenv("ALPACA_SECRET_KEY", "")
     if alpaca_key and alpaca_secret:
         try:
-            import requests
-            return alpaca_contracts_oi_fetcher(
-                requests.Session(), alpaca_key, alpaca_secret)
+            from packages.quantum.services.rate_governor import GovernedSession
+            # The contracts endpoint spends the trading-API quota.
+            session = GovernedSession("alpaca", classify=lambda url: "trading")
+            return alpaca_contracts_oi_fetcher(session, alpaca_key, alpaca_secret)
         except Exception:  # noqa: BLE001
             logger.debug("oi_enrichment: alpaca fetcher build failed",
                          exc_info=True)
@@ -0,0 +1,339 @@
+"""Columnar option chain with strike / delta indexes for scanner leg selection.
+
+Chains reach the scanner as lists of contract dicts in one of two schemas —
+nested (MarketDataTruthLayer: ``greeks`` / ``quote`` sub-dicts, ``expiry``,
+``right``) or flat (PolygonService: top-level ``delta`` / ``bid``,
+``expiration``, ``type``). The leg selectors used to rescan those lists for
+every lookup: the EV-aware condor search runs one delta ``min`` scan per
+short leg and one strike scan per wing for every target-delta × width combo.
+
+``OptionChain`` reads the contracts once into a NumPy struct-of-arrays
+(strike, right, expiry, bid, ask, delta, gamma, vega, theta, IV, OI), sorted
+by expiry, then right, then strike. ``side(right, expiry)`` returns a
+``ChainSide`` over one block, with binary-search lookups by strike and by
+|delta|. Lookups reproduce the list scans exactly, including their
+tie-breaking (the first minimum in strike order wins), so a selector that
+switches to the index picks the same contracts.
+
+The chain does not hold the contract dicts. Each row carries ``index``, its
+position among the input contracts of the same right, and the selectors
+build legs from the caller's own lists, so leg payloads are unchanged. The
+columns are an index over those lists, not a replacement for them. Missing
+or non-numeric values are NaN in the columns; nothing is imputed.
+
+``OPTION_CHAIN_COLUMNAR=0`` restores the per-combo list scans.
+"""
+
+import math
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+RIGHTS = ("call", "put")
+
+COLUMNS = ("strike", "bid", "ask", "delta", "gamma", "vega", "theta", "iv", "oi")
+
+_EMPTY: Dict[str, Any] = {}
+
+
+def is_option_chain_columnar_enabled() -> bool:
+    """OPTION_CHAIN_COLUMNAR — default ON; explicit 0/false/no/off restores
+    the per-combo list scans in the scanner's leg selectors."""
+    raw = os.getenv("OPTION_CHAIN_COLUMNAR", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def is_nested_schema(contracts: Sequence[Dict[str, Any]]) -> bool:
+    """Same sniff as the scanner: the first contract decides the schema."""
+    sample = contracts[0] if contracts else None
+    return sample is not None and isinstance(sample.get("greeks"), dict)
+
+
+def _num(value: Any) -> float:
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    """``values`` as a float array, None and non-numeric entries as NaN.
+
+    One C-level conversion for the common all-numeric / None column; only a
+    column holding something else pays for the per-value ``_num`` fallback.
+    """
+    try:
+        col = np.array(values, dtype=float)
+        if col.shape == (len(values),):
+            return col
+    except (TypeError, ValueError):
+        pass
+    return np.array([_num(v) for v in values], dtype=float).reshape(len(values))
+
+
+def _first_present(primary: List[Any], fallback: List[Any]) -> List[Any]:
+    return [b if a is None else a for a, b in zip(primary, fallback)]
+
+
+def _raw_nested(contracts: Sequence[Dict[str, Any]]) -> Tuple[List[Any], Dict[str, List[Any]]]:
+    greeks = [c.get("greeks") or _EMPTY for c in contracts]
+    quotes = [c.get("quote") or _EMPTY for c in contracts]
+    raw = {
+        "bid": [q.get("bid") for q in quotes],
+        "ask": [q.get("ask") for q in quotes],
+        "iv": [c.get("iv") for c in contracts],
+        "oi": _first_present(
+            [c.get("oi") for c in contracts], [c.get("open_interest") for c in contracts]
+        ),
+    }
+    for name in ("delta", "gamma", "vega", "theta"):
+        raw[name] = [g.get(name) for g in greeks]
+    return [c.get("expiry") for c in contracts], raw
+
+
+def _raw_flat(contracts: Sequence[Dict[str, Any]]) -> Tuple[List[Any], Dict[str, List[Any]]]:
+    raw = {
+        name: [c.get(name) for c in contracts]
+        for name in ("bid", "ask", "delta", "gamma", "vega", "theta")
+    }
+    raw["iv"] = _first_present(
+        [c.get("iv") for c in contracts], [c.get("implied_volatility") for c in contracts]
+    )
+    raw["oi"] = _first_present(
+        [c.get("open_interest") for c in contracts], [c.get("oi") for c in contracts]
+    )
+    return [c.get("expiration") for c in contracts], raw
+
+
+def _nearest(values: np.ndarray, target: float, lo: int, hi: int) -> Optional[int]:
+    """Index of the first minimum of ``|values - target|`` over ``[lo, hi)``
+    of an ascending array — ``min(..., key=...)`` semantics in O(log N)."""
+    if lo >= hi:
+        return None
+    i = lo + int(np.searchsorted(values[lo:hi], target, side="left"))
+    best = None
+    if i > lo:
+        # First occurrence of the left neighbour's value.
+        best = max(lo, int(np.searchsorted(values, values[i - 1], side="left")))
+    if i < hi and (best is None or abs(values[i] - target) < abs(values[best] - target)):
+        best = i
+    return best
+
+
+class ChainSide:
+    """One right (optionally one expiry) of a chain, ascending by strike.
+
+    Column attributes are NumPy arrays of equal length; ``index[i]`` is the
+    position of row ``i`` among the chain's input contracts of this right.
+    """
+
+    def __init__(self, right: str, index: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.right = right
+        self.index = index
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+        self._abs_delta_order: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._delta_bearing: Optional["ChainSide"] = None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def pick(self, contracts: Sequence[Dict[str, Any]], position: int) -> Dict[str, Any]:
+        """The contract at ``position`` of this side, from the list of this
+        right the chain was built from."""
+        return contracts[int(self.index[position])]
+
+    # -- strike index -------------------------------------------------------
+
+    def above(self, strike: float) -> int:
+        """First position with a strike strictly above ``strike``."""
+        return int(np.searchsorted(self.strike, strike, side="right"))
+
+    def below(self, strike: float) -> int:
+        """Number of positions with a strike strictly below ``strike``."""
+        return int(np.searchsorted(self.strike, strike, side="left"))
+
+    def nearest_strike(self, target: float, lo: int = 0, hi: Optional[int] = None) -> Optional[int]:
+        """Position of the strike closest to ``target`` within ``[lo, hi)``;
+        ties go to the lower strike."""
+        return _nearest(self.strike, target, lo, len(self) if hi is None else hi)
+
+    # -- delta index --------------------------------------------------------
+
+    def nearest_abs_delta(self, target: float) -> Optional[int]:
+        """Position minimizing ``| |delta| - target |`` with a missing delta
+        read as 0 (the condor selector's ``_delta(x) or 0``); ties go to the
+        lower strike."""
+        if not len(self):
+            return None
+        if self._abs_delta_order is None:
+            abs_delta = np.abs(np.nan_to_num(self.delta, nan=0.0))
+            order = np.argsort(abs_delta, kind="stable")
+            self._abs_delta_order = (abs_delta[order], order)
+        values, order = self._abs_delta_order
+        i = int(np.searchsorted(values, target, side="left"))
+        best = None
+        if i > 0:
+            # Stable sort: the first of equal |delta| values is the lowest strike.
+            best = int(np.searchsorted(values, values[i - 1], side="left"))
+        if i < len(values):
+            if best is None:
+                best = i
+            else:
+                left, right = abs(values[best] - target), abs(values[i] - target)
+                if right < left or (right == left and order[i] < order[best]):
+                    best = i
+        return int(order[best])
+
+    def delta_bearing(self) -> "ChainSide":
+        """The rows that carry a delta (same order); cached."""
+        if self._delta_bearing is None:
+            keep = ~np.isnan(self.delta)
+            if keep.all():
+                self._delta_bearing = self
+            else:
+                self._delta_bearing = ChainSide(
+                    self.right,
+                    self.index[keep],
+                    {name: getattr(self, name)[keep] for name in COLUMNS},
+                )
+        return self._delta_bearing
+
+    def bisect_abs_delta(self, target: float) -> Optional[int]:
+        """``_select_legs_from_chain``'s delta bisect: assumes |delta| is
+        monotonic in strike (falling for calls, rising for puts), checks the
+        two neighbours of the insertion point; ties go to the left one."""
+        if not len(self):
+            return None
+        abs_delta = np.abs(self.delta)
+        if self.right == "call":
+            i = int(np.searchsorted(-abs_delta, -target, side="left"))
+        else:
+            i = int(np.searchsorted(abs_delta, target, side="left"))
+        best = 0
+        best_diff = math.inf
+        if i > 0:
+            best, best_diff = i - 1, abs(abs_delta[i - 1] - target)
+        if i < len(self) and abs(abs_delta[i] - target) < best_diff:
+            best = i
+        return best
+
+
+class OptionChain:
+    """Struct-of-arrays option chain, sorted by (expiry, right, strike).
+
+    Rows with equal sort keys keep their input order, so a side built from a
+    strike-sorted list lines up with that list position for position.
+    """
+
+    def __init__(self, contracts: Sequence[Dict[str, Any]], rights: Sequence[int], nested: Optional[bool] = None):
+        if nested is None:
+            nested = is_nested_schema(contracts)
+        self.nested = nested
+        n = len(contracts)
+
+        strike = _column([c["strike"] for c in contracts])
+        if np.isnan(strike).any():
+            raise ValueError("option chain has a missing or non-numeric strike")
+        expiry_raw, raw = (_raw_nested if nested else _raw_flat)(contracts)
+        right = np.asarray(rights, dtype=np.int8).reshape(n)
+
+        # Factorize expiries through a dict (one hash per row) and rank the
+        # few distinct values, rather than sorting n strings.
+        codes: Dict[str, int] = {}
+        first_code = np.fromiter(
+            (codes.setdefault(str(e or ""), len(codes)) for e in expiry_raw), dtype=np.int64, count=n
+        )
+        self.expiries: List[str] = sorted(codes)
+        rank = np.empty(len(codes), dtype=np.int64)
+        rank[[codes[e] for e in self.expiries]] = np.arange(len(codes))
+        expiry_code = rank[first_code]
+
+        # Position among the input contracts of the same right.
+        index = np.empty(n, dtype=np.int64)
+        for code in range(len(RIGHTS)):
+            rows = np.flatnonzero(right == code)
+            index[rows] = np.arange(len(rows))
+
+        position = np.arange(n)
+        order = np.lexsort((position, strike, right, expiry_code))
+
+        self.position = position[order]
+        self.index = index[order]
+        self.right = right[order]
+        self.expiry_code = expiry_code[order]
+        self.columns: Dict[str, np.ndarray] = {"strike": strike[order]}
+        for name in COLUMNS[1:]:
+            self.columns[name] = _column(raw[name])[order]
+
+        # Contiguous (expiry, right) blocks of the sorted arrays.
+        block = self.expiry_code * len(RIGHTS) + self.right
+        starts = np.flatnonzero(np.r_[True, block[1:] != block[:-1]]) if n else np.array([], int)
+        stops = np.r_[starts[1:], n] if n else starts
+        self._blocks: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        for start, stop in zip(starts, stops):
+            key = (self.expiries[self.expiry_code[start]], RIGHTS[self.right[start]])
+            self._blocks[key] = (int(start), int(stop))
+        self._sides: Dict[Tuple[Optional[str], str], ChainSide] = {}
+
+    @classmethod
+    def from_sides(
+        cls, calls: Sequence[Dict[str, Any]], puts: Sequence[Dict[str, Any]]
+    ) -> "OptionChain":
+        """Build from already split call / put lists (the scanner's shape);
+        ``side(right).index`` then indexes ``calls`` / ``puts``."""
+        contracts = list(calls) + list(puts)
+        rights = [0] * len(calls) + [1] * len(puts)
+        return cls(contracts, rights, nested=is_nested_schema(contracts))
+
+    @classmethod
+    def from_contracts(cls, contracts: Sequence[Dict[str, Any]]) -> "OptionChain":
+        """Build from a mixed chain; the right comes from ``type`` / ``right``.
+        Contracts that are neither call nor put are dropped, and
+        ``side(right).index`` counts only the contracts of that right."""
+        calls, puts = [], []
+        for c in contracts:
+            kind = c.get("type") or c.get("right")
+            if kind == "call":
+                calls.append(c)
+            elif kind == "put":
+                puts.append(c)
+        return cls.from_sides(calls, puts)
+
+    def __len__(self) -> int:
+        return len(self.right)
+
+    def side(self, right: str, expiry: Optional[str] = None) -> ChainSide:
+        """``right`` rows of one expiry (or of all expiries, merged by
+        strike), ascending by strike. Cached per (expiry, right)."""
+        key = (expiry, right)
+        side = self._sides.get(key)
+        if side is not None:
+            return side
+        if expiry is not None:
+            start, stop = self._blocks.get((expiry, right), (0, 0))
+            rows = slice(start, stop)
+        else:
+            code = RIGHTS.index(right)
+            spans = [span for (_, r), span in self._blocks.items() if r == right]
+            if len(spans) == 1:
+                rows = slice(*spans[0])
+            else:
+                picked = np.flatnonzero(self.right == code)
+                rows = picked[np.lexsort((self.position[picked], self.columns["strike"][picked]))]
+        side = ChainSide(right, self.index[rows], {name: col[rows] for name, col in self.columns.items()})
+        self._sides[key] = side
+        return side
+
+    def nbytes(self) -> int:
+        """Bytes held by the chain's arrays."""
+        return int(
+            sum(col.nbytes for col in self.columns.values())
+            + self.right.nbytes + self.expiry_code.nbytes
+            + self.position.nbytes + self.index.nbytes
+        )
@@ -1,3 +1,4 @@
+import os
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
@@ -6,11 +7,23 @@ import numpy as np
 from supabase import Client
 from packages.quantum.market_data import PolygonService, extract_underlying_symbol, normalize_option_symbol
 from packages.quantum.analytics.surprise import compute_surprise
-from packages.quantum.nested_logging import log_outcome
+from packages.quantum.nested_logging import log_outcome, log_outcomes_bulk
 from packages.quantum.services.options_utils import get_contract_multiplier
 from packages.quantum.common_enums import OutcomeStatus
 from packages.quantum.services.provider_guardrails import get_circuit_breaker
 
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+# Values per in_() filter: PostgREST puts them in the URL, so keep it bounded.
+_IN_CHUNK_SIZE = 100
+
+
+def is_outcome_batch_enabled() -> bool:
+    """OUTCOME_AGGREGATOR_BATCH — default ON; explicit 0/false/no/off restores per-trace queries."""
+    raw = os.getenv("OUTCOME_AGGREGATOR_BATCH", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
 class OutcomeAggregator:
     def __init__(self, supabase: Client, polygon_service: PolygonService):
         self.supabase = supabase
@@ -26,6 +39,11 @@ class OutcomeAggregator:
         decisions = self._fetch_decisions(start_time, end_time)
         print(f"Found {len(decisions)} candidate decisions.")
 
+        if is_outcome_batch_enabled():
+            processed_count = self._run_batch(decisions)
+            print(f"Updated {processed_count} outcomes.")
+            return processed_count
+
         processed_count = 0
         for decision in decisions:
             trace_id = decision.get("trace_id")
@@ -50,6 +68,117 @@ class OutcomeAggregator:
         print(f"Updated {processed_count} outcomes.")
         return processed_count
 
+    def _run_batch(self, decisions: List[Dict]) -> int:
+        """
+        Set-based variant of the per-decision loop in run().
+
+        Existing outcomes, inference logs, suggestions and executions for the
+        whole window are loaded with chunked in_() queries (a handful of
+        round trips instead of four or five per trace_id), joined in memory,
+        and the outcomes are written in bulk. Linking rules and fail-soft
+        semantics match the per-trace fetchers: a failed context query reads
+        as "nothing found". A failed outcomes_log existence lookup skips the
+        window instead — reading it as "no outcomes yet" would recompute
+        every outcome already logged.
+        """
+        pending: List[Dict] = []
+        seen = set()
+        for decision in decisions:
+            trace_id = decision.get("trace_id")
+            # One outcome per trace_id (the per-trace loop skips later
+            # duplicates because the first write makes _outcome_exists true).
+            if trace_id and trace_id not in seen:
+                seen.add(trace_id)
+                pending.append(decision)
+
+        trace_ids = [d["trace_id"] for d in pending]
+        existing_rows = self._select_in(
+            "outcomes_log", "trace_id", "trace_id", trace_ids, strict=True
+        )
+        if existing_rows is None:
+            print(f"Skipping outcome window: outcomes_log lookup failed for {len(trace_ids)} traces.")
+            return 0
+        existing = {row.get("trace_id") for row in existing_rows}
+        pending = [d for d in pending if d["trace_id"] not in existing]
+        if not pending:
+            return 0
+        trace_ids = [d["trace_id"] for d in pending]
+
+        inference_by_trace: Dict[str, Dict] = {}
+        for row in self._select_in(
+            "inference_log",
+            "trace_id, predicted_sigma, inputs_snapshot, symbol_universe",
+            "trace_id",
+            trace_ids,
+        ):
+            inference_by_trace.setdefault(row.get("trace_id"), row)
+
+        suggestions_by_trace: Dict[str, List[Dict]] = {}
+        for row in self._select_in(
+            "trade_suggestions",
+            "id, trace_id, status, ticker, order_json, direction, created_at",
+            "trace_id",
+            trace_ids,
+        ):
+            suggestions_by_trace.setdefault(row.get("trace_id"), []).append(row)
+
+        # Executions: by suggestion_id first, trace_id as the fallback.
+        suggestion_ids = [s["id"] for rows in suggestions_by_trace.values() for s in rows]
+        executions_by_suggestion: Dict[str, List[Dict]] = {}
+        for row in self._select_in("trade_executions", "*", "suggestion_id", suggestion_ids):
+            executions_by_suggestion.setdefault(row.get("suggestion_id"), []).append(row)
+
+        def linked_executions(trace_id: str) -> List[Dict]:
+            return [
+                e
+                for s in suggestions_by_trace.get(trace_id, [])
+                for e in executions_by_suggestion.get(s["id"], [])
+            ]
+
+        fallback_ids = [t for t in trace_ids if not linked_executions(t)]
+        executions_by_trace: Dict[str, List[Dict]] = {}
+        for row in self._select_in("trade_executions", "*", "trace_id", fallback_ids):
+            executions_by_trace.setdefault(row.get("trace_id"), []).append(row)
+
+        outcome_rows: List[Dict[str, Any]] = []
+        for decision in pending:
+            trace_id = decision["trace_id"]
+            executions = linked_executions(trace_id) or executions_by_trace.get(trace_id, [])
+            self._process_single_outcome(
+                decision,
+                inference_by_trace.get(trace_id),
+                suggestions_by_trace.get(trace_id, []),
+                executions,
+                outcome_rows=outcome_rows,
+            )
+
+        log_outcomes_bulk(outcome_rows)
+        return len(pending)
+
+    def _select_in(
+        self, table: str, columns: str, column: str, values: List[str], strict: bool = False
+    ) -> Optional[List[Dict]]:
+        """Rows where column is in values, queried in chunks of _IN_CHUNK_SIZE.
+
+        A failed chunk is logged and skipped; with ``strict`` it makes the
+        whole lookup return None, so the caller can tell "none found" from
+        "could not check".
+        """
+        rows: List[Dict] = []
+        for i in range(0, len(values), _IN_CHUNK_SIZE):
+            chunk = values[i:i + _IN_CHUNK_SIZE]
+            try:
+                res = self.supabase.table(table) \
+                    .select(columns) \
+                    .in_(column, chunk) \
+                    .execute()
+                rows.extend(res.data or [])
+            except Exception as e:
+                print(f"Error fetching {table} batch ({len(chunk)} ids): {e}")
+                if strict:
+                    return None
+        return rows
+
     def _fetch_decisions(self, start_time: datetime, end_time: datetime) -> List[Dict]:
         """
         Fetch decision logs that represent actionable events.
@@ -140,9 +269,15 @@ class OutcomeAggregator:
         decision: Dict,
         inference_log: Optional[Dict],
         suggestions: List[Dict],
-        executions: List[Dict]
+        executions: List[Dict],
+        outcome_rows: Optional[List[Dict[str, Any]]] = None,
     ):
+        """
+        Computes and writes one outcome. With outcome_rows, the log_outcome
+        arguments are appended there for a bulk write instead.
+        """
         trace_id = decision["trace_id"]
+        emit = log_outcome if outcome_rows is None else (lambda **row: outcome_rows.append(row))
 
         realized_pnl_1d = 0.0
         realized_vol_1d = 0.0
@@ -263,7 +398,7 @@ class OutcomeAggregator:
             reason_codes.append("missing_context")
 
         if status == OutcomeStatus.INCOMPLETE:
-            log_outcome(
+            emit(
                 trace_id=uuid.UUID(trace_id),
                 realized_pl_1d=0.0,
                 realized_vol_1d=0.0,
@@ -321,7 +456,7 @@ class OutcomeAggregator:
                  cf_args['counterfactual_available'] = False
                  cf_args['counterfactual_reason'] = cf_reason
 
-        log_outcome(
+        emit(
             trace_id=uuid.UUID(trace_id),
             realized_pl_1d=realized_pnl_1d,
             realized_vol_1d=safe_realized_vol,
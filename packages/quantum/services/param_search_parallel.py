@@ -0,0 +1,220 @@
+"""Process-pool execution for ``ParamSearchRunner``.
+
+The serial search runs every param set (and, in walk-forward mode, every
+fold of every param set) one after another, and each ``run_single`` asks
+PolygonService for its own history window — a different cache key per
+fold, so a 200-point walk-forward grid is thousands of sequential
+backtests plus hundreds of provider round trips.
+
+This module:
+
+1. fetches the underlying/ticker history ONCE for the widest window any run
+   in the search can ask for (``HistorySnapshot.prefetch``) and serves every
+   ``get_historical_prices`` call by slicing it, with the same date window
+   PolygonService would have requested;
+2. ships the snapshot to each worker process once (pool initializer), where
+   it backs a private ``BacktestEngine`` — workers never touch the network;
+3. flattens the search into independent tasks (one per param set, or one
+   per (param set, fold) in walk-forward mode) and maps them over a
+   process pool. ``Executor.map`` returns results in submission order, so
+   ``best_params`` tie-breaking and fold order match the serial loop.
+
+Determinism: every ``run_single`` seeds its own ``random.Random(seed)``
+from the request, so a task's output does not depend on which worker ran
+it or when.
+
+Kill switch: ``PARAM_SEARCH_PARALLEL`` (default ON; explicit 0/false/no/off
+restores the serial loop). ``PARAM_SEARCH_WORKERS`` caps the pool size
+(default: CPU count).
+"""
+
+import concurrent.futures
+import logging
+import os
+import pickle
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+# v4 dual-import shim: support both package and PYTHONPATH imports
+try:
+    from packages.quantum.market_data import extract_underlying_symbol
+    from packages.quantum.services.backtest_engine import BacktestEngine
+    from packages.quantum.services.cache_key_builder import normalize_symbol as normalize_option_symbol
+    from packages.quantum.services.options_utils import get_contract_multiplier
+    from packages.quantum.services.walkforward_runner import WalkForwardRunner
+except ImportError:
+    from market_data import extract_underlying_symbol
+    from services.backtest_engine import BacktestEngine
+    from services.cache_key_builder import normalize_symbol as normalize_option_symbol
+    from services.options_utils import get_contract_multiplier
+    from services.walkforward_runner import WalkForwardRunner
+
+logger = logging.getLogger(__name__)
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+# Extra calendar days fetched beyond the widest run window. Covers the
+# weekend roll of a fold's end date shifting its provider window earlier.
+SNAPSHOT_SLACK_DAYS = 7
+
+# PolygonService pads every window by this many days before ``days``.
+_PROVIDER_PAD_DAYS = 30
+
+
+def is_parallel_param_search_enabled() -> bool:
+    """PARAM_SEARCH_PARALLEL — default ON; explicit 0/false/no/off disables."""
+    raw = os.getenv("PARAM_SEARCH_PARALLEL", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def get_param_search_workers() -> int:
+    default = os.cpu_count() or 1
+    try:
+        return max(1, int(os.getenv("PARAM_SEARCH_WORKERS", str(default))))
+    except ValueError:
+        return default
+
+
+def _roll_weekend(to_date: datetime) -> datetime:
+    # Same Sat/Sun -> Friday roll as PolygonService.get_historical_prices.
+    if to_date.weekday() >= 5:
+        to_date = to_date - timedelta(days=to_date.weekday() - 4)
+    return to_date
+
+
+class HistorySnapshot:
+    """Read-only, picklable stand-in for ``PolygonService.get_historical_prices``.
+
+    Holds one pre-fetched daily series per symbol and answers
+    ``get_historical_prices(symbol, days, to_date)`` with the slice the
+    provider would have returned for that window.
+    """
+
+    def __init__(self, series: Dict[str, Dict[str, List[Any]]]):
+        self.series = series
+
+    @classmethod
+    def prefetch(
+        cls,
+        polygon,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        lookback_days: int,
+    ) -> "HistorySnapshot":
+        """Fetch ``ticker`` (and its underlying, for options) once.
+
+        The window covers every ``run_single`` inside
+        ``[start_date, end_date]``: the engine asks for
+        ``start - lookback_days`` minus its own padding.
+        """
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        days = (end_dt - start_dt).days + lookback_days + 10 + SNAPSHOT_SLACK_DAYS
+
+        symbols = [ticker]
+        if get_contract_multiplier(ticker) == 100:
+            symbols.append(extract_underlying_symbol(ticker))
+
+        series: Dict[str, Dict[str, List[Any]]] = {}
+        for sym in symbols:
+            hist = polygon.get_historical_prices(sym, days=days, to_date=end_dt)
+            if hist and hist.get("dates"):
+                series[normalize_option_symbol(sym)] = {
+                    "dates": list(hist.get("dates", [])),
+                    "prices": list(hist.get("prices", [])),
+                    "volumes": list(hist.get("volumes", [0] * len(hist["dates"]))),
+                }
+        return cls(series)
+
+    def get_historical_prices(
+        self, symbol: str, days: int = 252, to_date: datetime = None
+    ) -> Optional[Dict]:
+        symbol = normalize_option_symbol(symbol)
+        data = self.series.get(symbol)
+        if not data:
+            return None
+
+        to_date = _roll_weekend(to_date or datetime.now())
+        from_str = (to_date - timedelta(days=days + _PROVIDER_PAD_DAYS)).strftime("%Y-%m-%d")
+        to_str = to_date.strftime("%Y-%m-%d")
+
+        idx = [i for i, d in enumerate(data["dates"]) if from_str <= d <= to_str]
+        if not idx:
+            return None
+        lo, hi = idx[0], idx[-1] + 1
+        prices = data["prices"][lo:hi]
+        return {
+            "symbol": symbol,
+            "prices": prices,
+            "volumes": data["volumes"][lo:hi],
+            "returns": [
+                (prices[i] - prices[i - 1]) / prices[i - 1] for i in range(1, len(prices))
+            ],
+            "dates": data["dates"][lo:hi],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+# One engine per worker process, built once by the pool initializer.
+_WORKER_ENGINE: Optional[BacktestEngine] = None
+
+# ("single", request, config) or ("fold", request, config, fold_index, fold)
+SearchTask = Tuple[Any, ...]
+
+
+def _init_worker(snapshot: HistorySnapshot) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = BacktestEngine(polygon_service=snapshot)
+
+
+def _run_task(task: SearchTask) -> Any:
+    return run_task(_WORKER_ENGINE, task)
+
+
+def run_task(engine: BacktestEngine, task: SearchTask) -> Any:
+    """Execute one search task against ``engine`` (in-process or in a worker)."""
+    kind, request, config = task[0], task[1], task[2]
+    if kind == "fold":
+        fold_index, fold = task[3], task[4]
+        return WalkForwardRunner(engine).run_fold(request, config, fold_index, fold)
+    return engine.run_single(
+        request.ticker,
+        request.start_date,
+        request.end_date,
+        config,
+        request.cost_model,
+        request.seed,
+        request.initial_equity
+    )
+
+
+def run_tasks(
+    tasks: List[SearchTask],
+    snapshot: HistorySnapshot,
+    max_workers: int,
+) -> List[Any]:
+    """Run ``tasks`` on a process pool; results are in task order.
+
+    If the pool cannot be used at all (unpicklable payload, workers killed),
+    the search degrades to running the same tasks in-process against the
+    same snapshot. Exceptions raised by a backtest itself propagate, as
+    they do in the serial loop.
+    """
+    workers = max(1, min(max_workers, len(tasks)))
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(snapshot,),
+        ) as pool:
+            return list(pool.map(_run_task, tasks))
+    except (BrokenProcessPool, pickle.PicklingError) as e:
+        logger.warning(f"[PARAM_SEARCH] process pool unavailable ({e}); running in-process")
+
+    engine = BacktestEngine(polygon_service=snapshot)
+    return [run_task(engine, task) for task in tasks]
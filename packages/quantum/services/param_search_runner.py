@@ -3,9 +3,36 @@ import itertools
 import random
 from pydantic import BaseModel
 
-from strategy_profiles import BacktestRequestV3, StrategyConfig
-from services.backtest_engine import BacktestEngine, BacktestRunResult
-from services.walkforward_runner import WalkForwardRunner, WalkForwardResult
+# v4 dual-import shim: support both package and PYTHONPATH imports
+try:
+    from packages.quantum.strategy_profiles import BacktestRequestV3, StrategyConfig
+except ImportError:
+    from strategy_profiles import BacktestRequestV3, StrategyConfig
+
+try:
+    from packages.quantum.services.backtest_engine import BacktestEngine, BacktestRunResult
+except ImportError:
+    from services.backtest_engine import BacktestEngine, BacktestRunResult
+
+try:
+    from packages.quantum.services.walkforward_runner import WalkForwardRunner, WalkForwardResult
+except ImportError:
+    from services.walkforward_runner import WalkForwardRunner, WalkForwardResult
+
+try:
+    from packages.quantum.services.param_search_parallel import (
+        HistorySnapshot,
+        get_param_search_workers,
+        is_parallel_param_search_enabled,
+        run_tasks,
+    )
+except ImportError:
+    from services.param_search_parallel import (
+        HistorySnapshot,
+        get_param_search_workers,
+        is_parallel_param_search_enabled,
+        run_tasks,
+    )
 
 class ParamSearchResult(BaseModel):
     # Each item tuple: (params, result_object)
@@ -14,9 +41,11 @@ class ParamSearchResult(BaseModel):
     best_params: Dict[str, Any]
 
 class ParamSearchRunner:
-    def __init__(self, engine: BacktestEngine):
+    def __init__(self, engine: BacktestEngine, max_workers: Optional[int] = None):
         self.engine = engine
         self.wf_runner = WalkForwardRunner(engine)
+        # None -> PARAM_SEARCH_WORKERS / CPU count at run time.
+        self.max_workers = max_workers
 
     def run_search(
         self,
@@ -63,37 +92,44 @@ class ParamSearchRunner:
                  param_sets = [{}]
 
         # 2. Run
+        configs = [self._apply_params(base_config, params) for params in param_sets]
+        workers = self.max_workers or get_param_search_workers()
+        if is_parallel_param_search_enabled() and workers > 1:
+            outputs = self._run_parallel(request, configs, workers)
+        else:
+            outputs = None
+
         results = []
         best_metric = -float('inf')
         best_params = {}
 
-        for params in param_sets:
-            # Apply overrides
-            config_copy = base_config.model_copy()
-            for k, v in params.items():
-                if hasattr(config_copy, k):
-                    setattr(config_copy, k, v)
-
+        for idx, (params, config_copy) in enumerate(zip(param_sets, configs)):
             run_output = None
             current_metric = -float('inf')
 
             if request.run_mode == "walk_forward":
                 # Run Walk Forward
-                wf_res = self.wf_runner.run_walk_forward(request, config_copy)
+                if outputs is not None:
+                    wf_res = outputs[idx]
+                else:
+                    wf_res = self.wf_runner.run_walk_forward(request, config_copy)
                 run_output = wf_res
                 current_metric = wf_res.aggregate_metrics.get("sharpe", 0)
 
             else:
                 # Run Single
-                run_res = self.engine.run_single(
-                    request.ticker,
-                    request.start_date,
-                    request.end_date,
-                    config_copy,
-                    request.cost_model,
-                    request.seed,
-                    request.initial_equity
-                )
+                if outputs is not None:
+                    run_res = outputs[idx]
+                else:
+                    run_res = self.engine.run_single(
+                        request.ticker,
+                        request.start_date,
+                        request.end_date,
+                        config_copy,
+                        request.cost_model,
+                        request.seed,
+                        request.initial_equity
+                    )
                 run_output = run_res
                 current_metric = run_res.metrics.get("sharpe", 0)
 
@@ -110,3 +146,58 @@ class ParamSearchRunner:
             results=results,
             best_params=best_params
         )
+
+    @staticmethod
+    def _apply_params(base_config: StrategyConfig, params: Dict[str, Any]) -> StrategyConfig:
+        # Apply overrides
+        config_copy = base_config.model_copy()
+        for k, v in params.items():
+            if hasattr(config_copy, k):
+                setattr(config_copy, k, v)
+        return config_copy
+
+    def _run_parallel(
+        self,
+        request: BacktestRequestV3,
+        configs: List[StrategyConfig],
+        workers: int
+    ) -> Optional[List[Any]]:
+        """
+        Run every param set (walk-forward: every fold of every param set)
+        on a process pool against one shared history snapshot.
+
+        Returns one output per config, in config order, or None when there
+        is nothing to parallelize (caller uses the serial loop).
+        """
+        walk_forward = request.run_mode == "walk_forward"
+        folds = self.wf_runner.plan_folds(request) if walk_forward else []
+
+        if walk_forward:
+            tasks = [
+                ("fold", request, config, i, fold)
+                for config in configs
+                for i, fold in enumerate(folds)
+            ]
+        else:
+            tasks = [("single", request, config) for config in configs]
+        if len(tasks) < 2:
+            return None
+
+        snapshot = HistorySnapshot.prefetch(
+            self.engine.polygon,
+            request.ticker,
+            request.start_date,
+            request.end_date,
+            lookback_days=self.engine.lookback_window * 2,
+        )
+        task_outputs = run_tasks(tasks, snapshot, workers)
+
+        if not walk_forward:
+            return task_outputs
+
+        # Regroup fold outputs per param set, preserving fold order.
+        n_folds = len(folds)
+        return [
+            self.wf_runner.assemble(request, task_outputs[c * n_folds:(c + 1) * n_folds])
+            for c in range(len(configs))
+        ]
@@ -246,6 +246,7 @@ def guardrail(provider: str, max_retries: int = 2, backoff_base: float = 1.0, fa
                     _get_admin_supabase(),
                     alert_type=f"{provider}_circuit_open",
                     severity="warning",
+                    defer=True,
                     message=f"Circuit OPEN for {provider}, returning fallback for {func.__qualname__}",
                     metadata={
                         "provider": provider,
@@ -311,6 +312,7 @@ def guardrail(provider: str, max_retries: int = 2, backoff_base: float = 1.0, fa
                 _get_admin_supabase(),
                 alert_type=f"{provider}_retries_exhausted",
                 severity="warning",
+                defer=True,
                 message=f"Provider {provider} failed after retries for {func.__qualname__}: {safe_error}",
                 metadata={
                     "provider": provider,
@@ -0,0 +1,453 @@
+"""Process-wide token-bucket rate governor for outbound provider calls.
+
+Rate handling used to be reactive only: ``MarketDataTruthLayer._make_request``
+retries 429s, ``provider_guardrails`` trips a breaker after failures, and the
+OI enricher keeps a private limiter. Every client (PolygonService, the truth
+layer, the historical IV service, AlpacaClient) spent the same quotas
+independently from many threads, so a scan overlapping a backfill produced
+429 storms.
+
+The governor keeps one token bucket per ``(provider, endpoint_class)``; every
+outbound call acquires a token first. Calls carry a priority lane
+(``exit`` > ``risk`` > ``scan`` > ``backfill``) from a contextvar:
+
+- a lower lane may only take a token while the bucket stays above that
+  lane's reserve, so backfills can never drain the headroom exits need;
+- within a process, a lower lane also yields while a higher lane is waiting
+  on the same bucket.
+
+A 429 from the provider empties the bucket and blocks it for ``Retry-After``
+(or 1s), so every thread backs off together instead of each retrying alone.
+
+Only buckets with a documented provider limit are metered by default. The
+rest (Polygon: paid plans publish no per-second cap) are UNMETERED until an
+operator sets ``RATE_GOVERNOR_<PROVIDER>_<CLASS>_RPS``: they never wait for
+tokens, but still honour the 429 block above.
+
+Backends (RATE_GOVERNOR_BACKEND=local|redis, default local): ``redis`` shares
+the buckets across worker processes through an atomic Lua script on
+``REDIS_URL``. Redis errors degrade to the local buckets, never to a crash.
+
+The governor throttles but never refuses: an acquire that cannot be granted
+within its max wait returns False and the caller proceeds (counted in
+``stats()``), exactly as before the governor existed.
+"""
+
+import contextlib
+import contextvars
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+LANES = ("exit", "risk", "scan", "backfill")
+DEFAULT_LANE = "scan"
+
+# Fraction of a bucket's burst a lane must leave untouched for higher lanes.
+LANE_RESERVE = {"exit": 0.0, "risk": 0.1, "scan": 0.25, "backfill": 0.5}
+
+# (provider, endpoint_class) -> (tokens per second, burst), for documented
+# limits only. Alpaca documents 200 requests/minute per account for both
+# trading and market data. Any other bucket is unmetered unless
+# RATE_GOVERNOR_<PROVIDER>_<CLASS>_RPS is set (_BURST defaults to 2x RPS).
+DEFAULT_BUCKETS: Dict[Tuple[str, str], Tuple[float, float]] = {
+    ("alpaca", "trading"): (3.0, 10.0),
+    ("alpaca", "data"): (3.0, 10.0),
+}
+
+DEFAULT_MAX_WAIT_SECONDS = 20.0
+DEFAULT_PENALTY_SECONDS = 1.0
+_REDIS_RETRY_SECONDS = 30.0
+_REDIS_KEY_PREFIX = "rate_governor:"
+
+# Jobs whose provider calls run in a non-default lane (see rate_lane_for_job).
+JOB_RATE_LANES = {
+    "paper_exit_evaluate": "exit",
+    "paper_auto_close": "exit",
+    "suggestions_close": "exit",
+    "intraday_risk_monitor": "risk",
+    "paper_mark_to_market": "risk",
+    "refresh_ledger_marks_v4": "risk",
+    "alpaca_order_sync": "risk",
+    "iv_historical_backfill": "backfill",
+    "iv_daily_refresh": "backfill",
+    "universe_sync": "backfill",
+}
+
+_LANE: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "rate_governor_lane", default=DEFAULT_LANE
+)
+
+
+def is_rate_governor_enabled() -> bool:
+    """RATE_GOVERNOR — default ON; explicit 0/false/no/off makes every
+    acquire return immediately (legacy, ungoverned calls)."""
+    raw = os.getenv("RATE_GOVERNOR", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        v = float(raw)
+    except (TypeError, ValueError):
+        return default
+    return v if v > 0 else default
+
+
+def bucket_spec(provider: str, endpoint_class: str) -> Optional[Tuple[float, float]]:
+    """(rate, burst) for a bucket with env overrides applied; None when the
+    bucket is unmetered."""
+    prefix = f"RATE_GOVERNOR_{provider}_{endpoint_class}".upper()
+    default = DEFAULT_BUCKETS.get((provider, endpoint_class))
+    rate = _env_float(f"{prefix}_RPS", default[0] if default else 0.0)
+    if rate <= 0:
+        return None
+    return rate, _env_float(f"{prefix}_BURST", default[1] if default else 2.0 * rate)
+
+
+def current_lane() -> str:
+    return _LANE.get()
+
+
+@contextlib.contextmanager
+def rate_lane(lane: str) -> Iterator[str]:
+    """Run the enclosed provider calls in ``lane``. Unknown lanes keep the
+    current one."""
+    if lane not in LANE_RESERVE:
+        yield _LANE.get()
+        return
+    token = _LANE.set(lane)
+    try:
+        yield lane
+    finally:
+        _LANE.reset(token)
+
+
+def rate_lane_for_job(job_name: Optional[str]) -> str:
+    return JOB_RATE_LANES.get(job_name or "", DEFAULT_LANE)
+
+
+def classify_polygon_endpoint(url: str) -> str:
+    """Endpoint class of a Polygon URL: quotes | aggs | reference."""
+    path = urlsplit(url).path
+    if path.startswith(("/v3/snapshot", "/v2/snapshot", "/v3/quotes", "/v2/last", "/v3/trades")):
+        return "quotes"
+    if path.startswith("/v2/aggs"):
+        return "aggs"
+    return "reference"
+
+
+def retry_after_seconds(value: Any) -> Optional[float]:
+    """Parse a Retry-After header in seconds; None when absent or a date."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds >= 0 else None
+
+
+class _LocalBucket:
+    """In-process token bucket. Callers hold the governor lock.
+
+    ``rate=None`` is an unmetered bucket: only a 429 block makes it wait."""
+
+    def __init__(self, rate: Optional[float], burst: float, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+        self.blocked_until = 0.0
+
+    @property
+    def metered(self) -> bool:
+        return self.rate is not None
+
+    def take(self, reserve: float, now: float) -> float:
+        """Take one token above ``reserve`` → 0.0, else seconds to wait."""
+        if not self.metered:
+            return max(0.0, self.blocked_until - now)
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens - 1.0 >= reserve - 1e-9:
+            self.tokens -= 1.0
+            return 0.0
+        return (reserve + 1.0 - self.tokens) / self.rate
+
+    def penalize(self, seconds: float, now: float) -> None:
+        self.tokens = 0.0
+        self.updated = now
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+# KEYS[1] bucket hash; ARGV rate, burst, now, reserve. Returns the wait in
+# seconds as a string (Lua numbers would be truncated to integers).
+_REDIS_TAKE = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local reserve = tonumber(ARGV[4])
+local tokens = tonumber(redis.call('HGET', KEYS[1], 't'))
+local ts = tonumber(redis.call('HGET', KEYS[1], 'ts'))
+local blocked = tonumber(redis.call('HGET', KEYS[1], 'b') or '0') or 0
+if tokens == nil or ts == nil then
+  tokens = burst
+  ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if now < blocked then
+  wait = blocked - now
+elseif tokens - 1 >= reserve - 1e-9 then
+  tokens = tokens - 1
+else
+  wait = (reserve + 1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 't', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], 3600)
+return tostring(wait)
+"""
+
+
+class _RedisBuckets:
+    """Buckets shared across processes; every method may raise."""
+
+    def __init__(self, redis_url: Optional[str] = None) -> None:
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self._conn = None
+        self._script = None
+
+    def _client(self):
+        if self._conn is None:
+            from redis import Redis
+            self._conn = Redis.from_url(self.redis_url, socket_timeout=2)
+            self._script = self._conn.register_script(_REDIS_TAKE)
+        return self._conn
+
+    def take(self, key: Tuple[str, str], rate: float, burst: float, reserve: float) -> float:
+        self._client()
+        wait = self._script(
+            keys=[_REDIS_KEY_PREFIX + ":".join(key)],
+            args=[rate, burst, time.time(), reserve],
+        )
+        return float(wait)
+
+    def penalize(self, key: Tuple[str, str], seconds: float) -> None:
+        now = time.time()
+        self._client().hset(
+            _REDIS_KEY_PREFIX + ":".join(key),
+            mapping={"t": 0, "ts": now, "b": now + seconds},
+        )
+
+
+class RateGovernor:
+    """Token buckets keyed by (provider, endpoint_class) with priority lanes."""
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        *,
+        max_wait: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        redis_buckets: Optional[_RedisBuckets] = None,
+    ) -> None:
+        backend = (backend or os.getenv("RATE_GOVERNOR_BACKEND", "local")).strip().lower()
+        self.backend = "redis" if backend == "redis" else "local"
+        self.max_wait = (max_wait if max_wait is not None
+                         else _env_float("RATE_GOVERNOR_MAX_WAIT_SECONDS", DEFAULT_MAX_WAIT_SECONDS))
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._buckets: Dict[Tuple[str, str], _LocalBucket] = {}
+        self._waiting: Dict[Tuple[str, str], list] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._redis = (redis_buckets or _RedisBuckets()) if self.backend == "redis" else None
+        self._redis_down_until = 0.0
+
+    # -- internals (caller holds self._cond) -------------------------------
+
+    def _stat(self, key: Tuple[str, str]) -> Dict[str, float]:
+        name = ":".join(key)
+        stat = self._stats.get(name)
+        if stat is None:
+            stat = self._stats[name] = {
+                "granted": 0, "waited": 0, "wait_seconds": 0.0,
+                "timeouts": 0, "throttled": 0, "redis_errors": 0,
+            }
+        return stat
+
+    def _local(self, key: Tuple[str, str]) -> _LocalBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = bucket_spec(*key) or (None, 0.0)
+            bucket = self._buckets[key] = _LocalBucket(rate, burst, self._clock())
+        return bucket
+
+    def _redis_usable(self) -> bool:
+        return self._redis is not None and self._clock() >= self._redis_down_until
+
+    def _redis_failed(self, key: Tuple[str, str], err: Exception) -> None:
+        logger.debug(f"[RATE_GOVERNOR] redis backend error, using local buckets: {err}")
+        self._redis_down_until = self._clock() + _REDIS_RETRY_SECONDS
+        self._stat(key)["redis_errors"] += 1
+
+    def _take(self, key: Tuple[str, str], lane_idx: int, reserve_frac: float) -> float:
+        """One grant attempt: 0.0 when granted, else seconds to wait.
+
+        Lane precedence and the local bucket are evaluated under the lock;
+        the Redis round trip (up to its 2s socket timeout) runs with the
+        lock RELEASED so other buckets and lanes are never serialized
+        behind the network. Called and returns with self._cond held.
+        """
+        bucket = self._local(key)
+        if bucket.metered and any(self._waiting[key][:lane_idx]):
+            # A higher lane is queued on this bucket: yield to it.
+            return 1.0 / bucket.rate
+        reserve = reserve_frac * bucket.burst
+        if not (bucket.metered and self._redis_usable()):
+            return bucket.take(reserve, self._clock())
+
+        rate, burst = bucket.rate, bucket.burst
+        self._cond.release()
+        try:
+            wait, err = self._redis.take(key, rate, burst, reserve), None
+        except Exception as e:
+            wait, err = None, e
+        finally:
+            self._cond.acquire()
+        if err is None:
+            return wait
+        self._redis_failed(key, err)
+        return bucket.take(reserve, self._clock())
+
+    # -- public API ---------------------------------------------------------
+
+    def acquire(
+        self,
+        provider: str,
+        endpoint_class: str,
+        lane: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Block until a token is granted (True) or ``timeout`` elapses
+        (False — the caller proceeds ungoverned). Never raises."""
+        if not is_rate_governor_enabled():
+            return True
+        lane = lane if lane in LANE_RESERVE else _LANE.get()
+        lane_idx = LANES.index(lane)
+        key = (provider, endpoint_class)
+        deadline = self._clock() + (self.max_wait if timeout is None else timeout)
+        started = None
+        with self._cond:
+            self._waiting.setdefault(key, [0] * len(LANES))
+            stat = self._stat(key)
+            try:
+                while True:
+                    wait = self._take(key, lane_idx, LANE_RESERVE[lane])
+                    now = self._clock()
+                    if wait <= 0:
+                        stat["granted"] += 1
+                        if started is not None:
+                            stat["waited"] += 1
+                            stat["wait_seconds"] += now - started
+                        return True
+                    if now >= deadline:
+                        stat["timeouts"] += 1
+                        return False
+                    if started is None:
+                        started = now
+                        self._waiting[key][lane_idx] += 1
+                    self._cond.wait(min(wait, deadline - now))
+            finally:
+                if started is not None:
+                    self._waiting[key][lane_idx] -= 1
+                    self._cond.notify_all()
+
+    def penalize(self, provider: str, endpoint_class: str, retry_after: Optional[float] = None) -> None:
+        """Record a provider 429: empty the bucket and block it for
+        ``retry_after`` seconds (default 1s). Never raises."""
+        if not is_rate_governor_enabled():
+            return
+        seconds = retry_after if retry_after is not None else DEFAULT_PENALTY_SECONDS
+        key = (provider, endpoint_class)
+        with self._cond:
+            self._stat(key)["throttled"] += 1
+            bucket = self._local(key)
+            bucket.penalize(seconds, self._clock())
+            share = bucket.metered and self._redis_usable()
+            self._cond.notify_all()
+        if not share:
+            return
+        # Network write outside the lock (see _take).
+        try:
+            self._redis.penalize(key, seconds)
+        except Exception as e:
+            with self._cond:
+                self._redis_failed(key, e)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._cond:
+            return {name: dict(stat) for name, stat in self._stats.items()}
+
+
+_GOVERNOR: Optional[RateGovernor] = None
+_GOVERNOR_LOCK = threading.Lock()
+
+
+def get_rate_governor() -> RateGovernor:
+    global _GOVERNOR
+    if _GOVERNOR is None:
+        with _GOVERNOR_LOCK:
+            if _GOVERNOR is None:
+                _GOVERNOR = RateGovernor()
+    return _GOVERNOR
+
+
+def _reset_after_fork() -> None:
+    global _GOVERNOR, _GOVERNOR_LOCK
+    _GOVERNOR = None
+    _GOVERNOR_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class GovernedSession(requests.Session):
+    """requests.Session whose every request acquires from the governor and
+    feeds provider 429s back into it."""
+
+    def __init__(
+        self,
+        provider: str = "polygon",
+        classify: Callable[[str], str] = classify_polygon_endpoint,
+        governor: Optional[RateGovernor] = None,
+    ) -> None:
+        super().__init__()
+        self.provider = provider
+        self._classify = classify
+        self._governor = governor
+
+    def request(self, method, url, *args, **kwargs):
+        governor = self._governor or get_rate_governor()
+        endpoint_class = self._classify(url)
+        governor.acquire(self.provider, endpoint_class)
+        response = super().request(method, url, *args, **kwargs)
+        if response.status_code == 429:
+            governor.penalize(
+                self.provider,
+                endpoint_class,
+                retry_after_seconds(response.headers.get("Retry-After")),
+            )
+        return response
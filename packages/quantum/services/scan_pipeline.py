@@ -0,0 +1,242 @@
+"""Staged, pipelined symbol processing for ``scan_for_opportunities``.
+
+Before: a serial ``get_ticker_details`` loop filled ``sector_map`` (one
+blocking Polygon round trip per symbol, 100+ in a row), then a 20-thread
+pool ran ``_process_symbol_multi`` where every thread made its chain, bar
+and snapshot calls one after another.
+
+Now the scan runs in two overlapping stages:
+
+1. PREFETCH (I/O) — per symbol, on an I/O pool: the TA-window daily bars
+   (which also warms the DailyBarStore for later windows) and, when the
+   symbol would reach the chain step, its option chain with the exact
+   arguments ``process_symbol`` uses, so the evaluation's call is a cache
+   hit. Calls are bounded PER PROVIDER (``ProviderLimiter``) independently
+   of pool size, so raising UNIVERSE_SCAN_LIMIT never raises the burst
+   against one quota. Sector details are prefetched the same way.
+2. EVALUATE — each symbol is handed to the evaluation pool the moment its
+   prefetch completes (not after the whole universe), so a chain is read
+   seconds after it was fetched and cannot age out of the 300s chain TTL
+   or be LRU-evicted on large universes.
+
+Prefetch is warm-up only: it swallows every error and never returns data to
+the evaluator, which still makes (now cached) calls through the same truth
+layer methods. Decisions are therefore identical to the legacy path; only
+the timing of provider calls moves. ``SCANNER_PIPELINE_ENABLED=0`` restores
+the legacy serial-details + single-pool path.
+"""
+
+import concurrent.futures
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_EXPLICIT_FALSY = {"0", "false", "no", "off"}
+
+# Max concurrent in-flight calls per provider class. Overridable with
+# SCANNER_PROVIDER_CONCURRENCY="polygon=8,chain=6".
+DEFAULT_PROVIDER_CONCURRENCY: Dict[str, int] = {
+    "polygon": 8,   # /v2/aggs bars + reference ticker details
+    "chain": 6,     # option chain snapshots (Alpaca primary, Polygon fallback)
+}
+DEFAULT_PREFETCH_WORKERS = 16
+
+# process_symbol rejects with insufficient_history below this many closes,
+# before it ever reaches the chain step.
+MIN_CLOSES_FOR_CHAIN = 50
+
+
+def is_scan_pipeline_enabled() -> bool:
+    """SCANNER_PIPELINE_ENABLED — default ON; explicit 0/false/no/off disables."""
+    raw = os.getenv("SCANNER_PIPELINE_ENABLED", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def is_chain_prefetch_enabled() -> bool:
+    """SCANNER_PREFETCH_CHAINS — default ON.
+
+    Chains are prefetched for every symbol that would reach the chain step
+    on quote + history grounds; a symbol the selector then verdicts
+    HOLD/CASH pays one chain call it previously skipped. Disable to trade
+    that quota back for wall-time.
+    """
+    raw = os.getenv("SCANNER_PREFETCH_CHAINS", "")
+    return raw.strip().lower() not in _EXPLICIT_FALSY
+
+
+def _parse_concurrency_env(raw: str) -> Dict[str, int]:
+    limits: Dict[str, int] = {}
+    for item in raw.split(","):
+        name, sep, value = item.partition("=")
+        if not sep:
+            continue
+        try:
+            limits[name.strip()] = max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring malformed SCANNER_PROVIDER_CONCURRENCY item: {item!r}")
+    return limits
+
+
+def get_prefetch_workers() -> int:
+    try:
+        return max(1, int(os.getenv("SCANNER_PREFETCH_WORKERS", str(DEFAULT_PREFETCH_WORKERS))))
+    except ValueError:
+        return DEFAULT_PREFETCH_WORKERS
+
+
+class ProviderLimiter:
+    """Per-provider bounded semaphores shared by every prefetch thread."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        merged = dict(DEFAULT_PROVIDER_CONCURRENCY)
+        merged.update(_parse_concurrency_env(os.getenv("SCANNER_PROVIDER_CONCURRENCY", "")))
+        if limits:
+            merged.update(limits)
+        self.limits = merged
+        self._semaphores = {name: threading.BoundedSemaphore(n) for name, n in merged.items()}
+
+    @contextmanager
+    def slot(self, provider: str):
+        sem = self._semaphores.get(provider)
+        if sem is None:
+            yield
+            return
+        with sem:
+            yield
+
+
+def spot_for_chain(snapshot_item: Optional[Dict[str, Any]]) -> Tuple[bool, Optional[float]]:
+    """Mirrors process_symbol's quote handling for the chain call.
+
+    Returns ``(viable, spot)``: ``viable`` is False when process_symbol would
+    fall back to the PolygonService quote (its spot would then differ, so
+    the chain is left to the evaluator), ``spot`` is the value process_symbol
+    passes as ``option_chain(spot=...)``.
+    """
+    if not snapshot_item:
+        return False, None
+    q = snapshot_item.get("quote", {}) or {}
+    price = q.get("last") or q.get("mid")
+    bid, ask = q.get("bid"), q.get("ask")
+    current = price
+    if current is None and bid is not None and ask is not None and bid > 0 and ask > 0:
+        current = (float(bid) + float(ask)) / 2.0
+    if not current:
+        return False, None
+    return True, price or bid
+
+
+def prefetch_sector_map(
+    market_data,
+    symbols: List[str],
+    limiter: ProviderLimiter,
+    max_workers: int,
+) -> Dict[str, str]:
+    """Concurrent replacement for the serial ``get_ticker_details`` loop.
+
+    Same mapping as the legacy loop; a failing symbol is simply absent
+    (callers read ``sector_map.get(sym, "unknown")``) instead of aborting
+    the remaining symbols.
+    """
+    def _one(sym: str) -> Optional[str]:
+        with limiter.slot("polygon"):
+            details = market_data.get_ticker_details(sym)
+        if details:
+            return details.get("sic_description") or details.get("sector") or "unknown"
+        return None
+
+    sector_map: Dict[str, str] = {}
+    if not symbols:
+        return sector_map
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_one, sym): sym for sym in symbols}
+        for future in concurrent.futures.as_completed(futures):
+            sym = futures[future]
+            try:
+                sector = future.result()
+            except Exception as e:
+                logger.warning(f"[Scanner] Sector details failed for {sym}: {e}")
+                continue
+            if sector is not None:
+                sector_map[sym] = sector
+    # Deterministic insertion order regardless of completion order.
+    return {sym: sector_map[sym] for sym in symbols if sym in sector_map}
+
+
+class SymbolPrefetcher:
+    """Warms the truth-layer caches for one symbol (stage 1)."""
+
+    def __init__(
+        self,
+        truth_layer,
+        quotes_map: Dict[str, Any],
+        bars_window: Tuple[Any, Any],
+        min_expiry: str,
+        max_expiry: str,
+        limiter: ProviderLimiter,
+        prefetch_chains: bool = True,
+    ):
+        self.truth_layer = truth_layer
+        self.quotes_map = quotes_map
+        self.bars_start, self.bars_end = bars_window
+        self.min_expiry = min_expiry
+        self.max_expiry = max_expiry
+        self.limiter = limiter
+        self.prefetch_chains = prefetch_chains
+        self.stats: Dict[str, int] = {"bars": 0, "chains": 0, "errors": 0}
+
+    def __call__(self, symbol: str) -> None:
+        try:
+            viable, spot = spot_for_chain(self.quotes_map.get(symbol))
+            if not viable:
+                return
+            with self.limiter.slot("polygon"):
+                bars = self.truth_layer.daily_bars(symbol, self.bars_start, self.bars_end)
+            self.stats["bars"] += 1
+
+            if not self.prefetch_chains or not isinstance(bars, list):
+                return
+            closes = [b.get("close") for b in bars if b.get("close") is not None]
+            if len(closes) < MIN_CLOSES_FOR_CHAIN:
+                return
+            with self.limiter.slot("chain"):
+                self.truth_layer.option_chain(
+                    symbol, min_expiry=self.min_expiry, max_expiry=self.max_expiry, spot=spot
+                )
+            self.stats["chains"] += 1
+        except Exception as e:
+            # Warm-up only: the evaluator repeats the call and owns the error.
+            self.stats["errors"] += 1
+            logger.debug(f"[Scanner] prefetch failed for {symbol}: {e}")
+
+
+def run_pipelined(
+    symbols: List[str],
+    prefetch: Callable[[str], None],
+    evaluate: Callable[[str], Any],
+    prefetch_workers: int,
+    eval_workers: int,
+) -> Iterator[Tuple[str, concurrent.futures.Future]]:
+    """Runs prefetch → evaluate per symbol; yields ``(symbol, eval_future)``.
+
+    A symbol enters the evaluation pool as soon as its own prefetch is done.
+    Futures are yielded in completion order; callers own ``future.result()``
+    error handling exactly as with the legacy single pool.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=prefetch_workers, thread_name_prefix="scan-prefetch"
+    ) as io_pool, concurrent.futures.ThreadPoolExecutor(
+        max_workers=eval_workers, thread_name_prefix="scan-eval"
+    ) as eval_pool:
+        prefetch_futures = {io_pool.submit(prefetch, sym): sym for sym in symbols}
+        eval_futures: Dict[concurrent.futures.Future, str] = {}
+        for future in concurrent.futures.as_completed(prefetch_futures):
+            sym = prefetch_futures[future]
+            eval_futures[eval_pool.submit(evaluate, sym)] = sym
+
+        for future in concurrent.futures.as_completed(eval_futures):
+            yield eval_futures[future], future
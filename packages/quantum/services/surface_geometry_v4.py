@@ -30,10 +30,12 @@ from __future__ import annotations
 import hashlib
 import logging
 import math
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from packages.quantum.observability.canonical import (
@@ -63,6 +65,16 @@ MIN_STRIKES_PER_EXPIRY = 3
 # SVI fitting parameters
 SVI_FIT_MAX_ITERS = 200
 SVI_FIT_TOLERANCE = 1e-6
+SVI_FIT_RESTARTS = 3
+
+# Coordinate-descent trial steps per parameter (a, b, rho, m, sigma)
+_SVI_STEP_DELTAS = (
+    (-0.01, -0.005, 0.005, 0.01),
+    (-0.02, -0.01, 0.01, 0.02),
+    (-0.1, -0.05, 0.05, 0.1),
+    (-0.05, -0.02, 0.02, 0.05),
+    (-0.02, -0.01, 0.01, 0.02),
+)
 
 # Repair loop max iterations
 MAX_REPAIR_ITERS = 5
@@ -338,6 +350,12 @@ def _simple_rng(seed: int):
         yield state / m
 
 
+def is_svi_vectorized_enabled() -> bool:
+    """SVI_FIT_VECTORIZED — default ON; explicit 0/false/no/off uses the Python loop."""
+    raw = os.getenv("SVI_FIT_VECTORIZED", "")
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
+
+
 def fit_svi(
     k_obs: List[float],
     w_obs: List[float],
@@ -349,6 +367,156 @@ def fit_svi(
 
     Deterministic: seeded by hash of inputs.
     """
+    if is_svi_vectorized_enabled():
+        return _fit_svi_vectorized(k_obs, w_obs, symbol, expiry)
+    return _fit_svi_python(k_obs, w_obs, symbol, expiry)
+
+
+def _svi_mse_batch(
+    k: np.ndarray,
+    w: np.ndarray,
+    params: np.ndarray,
+) -> np.ndarray:
+    """
+    MSE of every candidate parameter vector against every strike at once.
+
+    params has shape (..., 5) = (a, b, rho, m, sigma); returns shape (...).
+    Operation order matches svi_total_variance and the error sum is a
+    left-to-right running sum (cumsum), so each value is bit-identical to
+    the scalar compute_mse loop. Any negative w_pred -> +inf.
+    """
+    a = params[..., 0:1]
+    b = params[..., 1:2]
+    rho = params[..., 2:3]
+    m = params[..., 3:4]
+    sigma = params[..., 4:5]
+
+    diff = k - m
+    w_pred = a + b * (rho * diff + np.sqrt(diff * diff + sigma * sigma))
+    err = w_pred - w
+    total = np.cumsum(err * err, axis=-1)[..., -1]
+    mse = total / k.shape[0]
+    return np.where(np.any(w_pred < 0, axis=-1), np.inf, mse)
+
+
+def _fit_svi_vectorized(
+    k_obs: List[float],
+    w_obs: List[float],
+    symbol: str = "",
+    expiry: str = "",
+) -> Optional[SVIParams]:
+    """
+    NumPy SVI fit: the same seeded coordinate descent as _fit_svi_python,
+    with all restarts run in lockstep and, per coordinate step, every
+    (restart x trial value) candidate scored against every strike in one
+    array op.
+
+    Tolerance vs the Python path: exact. Trial generation, tie-breaking
+    (first strictly-better trial wins == argmin first occurrence with the
+    current value at index 0), per-restart early exit and the global
+    first-best selection all mirror the loop, and _svi_mse_batch is
+    bit-identical per candidate. Pinned by the equivalence test.
+    """
+    n = len(k_obs)
+    if n < 3:
+        return None
+
+    seed = _deterministic_seed(symbol, expiry, k_obs, w_obs)
+    rng = _simple_rng(seed)
+
+    w_mean = sum(w_obs) / n
+    k_mean = sum(k_obs) / n
+    k_var = sum((k - k_mean) ** 2 for k in k_obs) / n if n > 1 else 0.01
+
+    # Starting points for every restart, drawn in the loop's RNG order.
+    starts = [(
+        max(0.001, w_mean * 0.8),
+        max(0.01, 0.1),
+        0.0,
+        k_mean,
+        max(0.01, math.sqrt(k_var) if k_var > 0 else 0.1),
+    )]
+    for _ in range(1, SVI_FIT_RESTARTS):
+        starts.append((
+            max(0.001, w_mean * (0.5 + next(rng))),
+            max(0.01, 0.05 + 0.15 * next(rng)),
+            -0.5 + next(rng),
+            k_mean + (next(rng) - 0.5) * 0.2,
+            max(0.01, 0.05 + 0.2 * next(rng)),
+        ))
+
+    k = np.asarray(k_obs, dtype=float)
+    w = np.asarray(w_obs, dtype=float)
+    params = np.array(starts, dtype=float)              # (R, 5)
+    n_restarts = params.shape[0]
+    deltas = np.array(_SVI_STEP_DELTAS, dtype=float)    # (5, 4)
+
+    active = np.ones(n_restarts, dtype=bool)
+    best_mse = np.full(n_restarts, np.inf)
+    best_params = params.copy()
+    rows = np.arange(n_restarts)
+
+    for _ in range(SVI_FIT_MAX_ITERS):
+        if not active.any():
+            break
+        improved = np.zeros(n_restarts, dtype=bool)
+        mse = None
+
+        for param_idx in range(5):
+            current = params[:, param_idx]
+            trials = current[:, None] + deltas[param_idx][None, :]
+            if param_idx in (0, 1, 4):   # a, b, sigma floors
+                trials = np.maximum(0.001, trials)
+            elif param_idx == 2:         # rho in (-1, 1)
+                trials = np.maximum(-0.99, np.minimum(0.99, trials))
+            values = np.concatenate([current[:, None], trials], axis=1)  # (R, 5)
+
+            candidates = np.repeat(params[:, None, :], values.shape[1], axis=1)
+            candidates[:, :, param_idx] = values
+            scores = _svi_mse_batch(k, w, candidates)   # (R, 5)
+
+            choice = np.argmin(scores, axis=1)
+            chosen = values[rows, choice]
+            params[:, param_idx] = np.where(active, chosen, current)
+            improved |= active & (choice != 0)
+            mse = scores[rows, choice]
+
+        better = active & (mse < best_mse)
+        best_mse = np.where(better, mse, best_mse)
+        best_params[better] = params[better]
+
+        active &= improved & ~(mse < SVI_FIT_TOLERANCE)
+
+    # First restart reaching the overall minimum == the loop's global best.
+    winner = int(np.argmin(best_mse))
+    final_mse = float(best_mse[winner])
+    a, b, rho, m, sigma = (float(x) for x in best_params[winner])
+
+    if final_mse == float('inf') or b < 0 or sigma <= 0 or abs(rho) >= 1:
+        return None
+
+    return SVIParams(
+        a=a,
+        b=b,
+        rho=rho,
+        m=m,
+        sigma=sigma,
+        fit_rmse=math.sqrt(final_mse) if final_mse < float('inf') else 0.0,
+    )
+
+
+def _fit_svi_python(
+    k_obs: List[float],
+    w_obs: List[float],
+    symbol: str = "",
+    expiry: str = "",
+) -> Optional[SVIParams]:
+    """
+    Reference pure-Python SVI fit (coordinate descent).
+
+    Kept as the oracle for the vectorized path and as the
+    SVI_FIT_VECTORIZED=0 fallback.
+    """
     n = len(k_obs)
     if n < 3:
         return None
@@ -382,7 +550,7 @@ def fit_svi(
         return total / n
 
     # Coordinate descent with random restarts
-    for restart in range(3):
+    for restart in range(SVI_FIT_RESTARTS):
         if restart > 0:
             # Perturb initial values
             a = max(0.001, w_mean * (0.5 + next(rng)))
@@ -268,11 +268,26 @@ class WalkForwardRunner:
         base_config: StrategyConfig
     ) -> WalkForwardResult:
 
+        folds = self.plan_folds(request)
+
+        # Use initial equity for stats normalization on each fold or cumulatively?
+        # Standard WF practice is to treat the OOS periods as a continuous simulation.
+        # But for simpler implementation, we reset equity each fold for the engine,
+        # and then aggregate the trades to compute global metrics.
+        fold_outputs = [
+            self.run_fold(request, base_config, i, fold)
+            for i, fold in enumerate(folds)
+        ]
+        return self.assemble(request, fold_outputs)
+
+    @staticmethod
+    def plan_folds(request: BacktestRequestV3) -> List[Dict[str, str]]:
+        """Fold windows for ``request`` (raises when walk_forward is missing)."""
         wf_config = request.walk_forward
         if not wf_config:
             raise ValueError("WalkForwardConfig is missing")
 
-        folds = generate_folds(
+        return generate_folds(
             request.start_date,
             request.end_date,
             wf_config.train_days,
@@ -282,162 +297,184 @@ class WalkForwardRunner:
             wf_config.embargo_days
         )
 
-        fold_results = []
-        # Equity tracking for aggregation is complex; simplified to just summing PnL for metrics
-        # Ideally we'd stitch daily equity curves.
+    def run_fold(
+        self,
+        request: BacktestRequestV3,
+        base_config: StrategyConfig,
+        i: int,
+        fold: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Tune on the train window, then run the test window, for ONE fold.
+
+        Folds are independent of each other (each resets equity), so
+        ParamSearchRunner can execute them concurrently and hand the
+        ordered outputs to ``assemble``.
+
+        Returns:
+            Dict with ``fold_result`` plus fold-tagged ``trades``/``events``.
+        """
+        wf_config = request.walk_forward
 
-        oos_trades = []
-        oos_events = []
+        # 1. TRAIN: Optimize parameters
+        # v4: Use train_start_engine (includes warmup) for engine execution
+        best_score = -999.0
+        best_params: Dict[str, Any] = {"conviction_floor": base_config.conviction_floor}
+        best_train_metrics: Dict[str, Any] = {}
 
-        # Use initial equity for stats normalization on each fold or cumulatively?
-        # Standard WF practice is to treat the OOS periods as a continuous simulation.
-        # But for simpler implementation, we reset equity each fold for the engine,
-        # and then aggregate the trades to compute global metrics.
+        # v4: Determine objective metric (default: sharpe)
+        objective_metric = getattr(wf_config, "objective_metric", None) or "sharpe"
+        min_trades = getattr(wf_config, "min_trades_per_fold", 5)
+        max_combinations = getattr(wf_config, "max_tune_combinations", 50)
+
+        # v4: Check if tune_grid is provided
+        tune_grid = getattr(wf_config, "tune_grid", None)
+
+        if tune_grid:
+            # v4: Generate param combinations from tune_grid
+            param_names = list(tune_grid.keys())
+            param_values = [tune_grid[k] for k in param_names]
+            all_combinations = list(itertools.product(*param_values))
 
-        for i, fold in enumerate(folds):
-            # 1. TRAIN: Optimize parameters
-            # v4: Use train_start_engine (includes warmup) for engine execution
-            best_score = -999.0
-            best_params: Dict[str, Any] = {"conviction_floor": base_config.conviction_floor}
-            best_train_metrics: Dict[str, Any] = {}
-
-            # v4: Determine objective metric (default: sharpe)
-            objective_metric = getattr(wf_config, "objective_metric", None) or "sharpe"
-            min_trades = getattr(wf_config, "min_trades_per_fold", 5)
-            max_combinations = getattr(wf_config, "max_tune_combinations", 50)
-
-            # v4: Check if tune_grid is provided
-            tune_grid = getattr(wf_config, "tune_grid", None)
-
-            if tune_grid:
-                # v4: Generate param combinations from tune_grid
-                param_names = list(tune_grid.keys())
-                param_values = [tune_grid[k] for k in param_names]
-                all_combinations = list(itertools.product(*param_values))
-
-                # Apply max_tune_combinations cap
-                combinations = all_combinations[:max_combinations]
-
-                for combo in combinations:
-                    train_config = base_config.model_copy()
-                    combo_params = dict(zip(param_names, combo))
-
-                    # Apply params where hasattr
-                    for k, v in combo_params.items():
-                        if hasattr(train_config, k):
-                            setattr(train_config, k, v)
-
-                    res = self.engine.run_single(
-                        request.ticker,
-                        fold["train_start_engine"],
-                        fold["train_end"],
-                        train_config,
-                        request.cost_model,
-                        request.seed,
-                        initial_equity=100000.0
-                    )
-
-                    # v4: Enforce min_trades_per_fold
-                    if len(res.trades) < min_trades:
-                        continue
-
-                    # Score using objective_metric
-                    score = _compute_objective_score(res.metrics or {}, objective_metric)
-                    if score > best_score:
-                        best_score = score
-                        best_params = combo_params.copy()
-                        best_train_metrics = copy.deepcopy(res.metrics) if res.metrics else {}
-
-            else:
-                # Fallback: Simple grid for conviction_floor only
-                candidates = [0.5, 0.6, 0.7, 0.8, 0.9]
-
-                for thresh in candidates:
-                    train_config = base_config.model_copy()
-                    train_config.conviction_floor = thresh
-
-                    res = self.engine.run_single(
-                        request.ticker,
-                        fold["train_start_engine"],
-                        fold["train_end"],
-                        train_config,
-                        request.cost_model,
-                        request.seed,
-                        initial_equity=100000.0
-                    )
-
-                    # v4: Enforce min_trades_per_fold
-                    if len(res.trades) < min_trades:
-                        continue
-
-                    # Score using objective_metric
-                    score = _compute_objective_score(res.metrics or {}, objective_metric)
-                    if score > best_score:
-                        best_score = score
-                        best_params = {"conviction_floor": thresh}
-                        best_train_metrics = copy.deepcopy(res.metrics) if res.metrics else {}
-
-            # v5: Fallback when no tuning candidate passed min_trades_per_fold
-            tuning_fallback = False
-            if not best_train_metrics and best_score == -999.0:
-                # Run ONE fallback with base_config (ignore min_trades for this run)
-                fallback_res = self.engine.run_single(
+            # Apply max_tune_combinations cap
+            combinations = all_combinations[:max_combinations]
+
+            for combo in combinations:
+                train_config = base_config.model_copy()
+                combo_params = dict(zip(param_names, combo))
+
+                # Apply params where hasattr
+                for k, v in combo_params.items():
+                    if hasattr(train_config, k):
+                        setattr(train_config, k, v)
+
+                res = self.engine.run_single(
                     request.ticker,
                     fold["train_start_engine"],
                     fold["train_end"],
-                    base_config,
+                    train_config,
                     request.cost_model,
                     request.seed,
                     initial_equity=100000.0
                 )
-                tuning_fallback = True
-                best_params = {"fallback": True}
-                best_train_metrics = copy.deepcopy(fallback_res.metrics) if fallback_res.metrics else {}
 
-            # 2. TEST: Run with best params
-            test_config = base_config.model_copy()
-            for k, v in best_params.items():
-                if hasattr(test_config, k):
-                    setattr(test_config, k, v)
+                # v4: Enforce min_trades_per_fold
+                if len(res.trades) < min_trades:
+                    continue
+
+                # Score using objective_metric
+                score = _compute_objective_score(res.metrics or {}, objective_metric)
+                if score > best_score:
+                    best_score = score
+                    best_params = combo_params.copy()
+                    best_train_metrics = copy.deepcopy(res.metrics) if res.metrics else {}
+
+        else:
+            # Fallback: Simple grid for conviction_floor only
+            candidates = [0.5, 0.6, 0.7, 0.8, 0.9]
+
+            for thresh in candidates:
+                train_config = base_config.model_copy()
+                train_config.conviction_floor = thresh
 
-            test_res = self.engine.run_single(
+                res = self.engine.run_single(
+                    request.ticker,
+                    fold["train_start_engine"],
+                    fold["train_end"],
+                    train_config,
+                    request.cost_model,
+                    request.seed,
+                    initial_equity=100000.0
+                )
+
+                # v4: Enforce min_trades_per_fold
+                if len(res.trades) < min_trades:
+                    continue
+
+                # Score using objective_metric
+                score = _compute_objective_score(res.metrics or {}, objective_metric)
+                if score > best_score:
+                    best_score = score
+                    best_params = {"conviction_floor": thresh}
+                    best_train_metrics = copy.deepcopy(res.metrics) if res.metrics else {}
+
+        # v5: Fallback when no tuning candidate passed min_trades_per_fold
+        tuning_fallback = False
+        if not best_train_metrics and best_score == -999.0:
+            # Run ONE fallback with base_config (ignore min_trades for this run)
+            fallback_res = self.engine.run_single(
                 request.ticker,
-                fold["test_start"],
-                fold["test_end"],
-                test_config,
+                fold["train_start_engine"],
+                fold["train_end"],
+                base_config,
                 request.cost_model,
                 request.seed,
-                initial_equity=request.initial_equity  # Using request equity base for correct trade sizing if pct based
+                initial_equity=100000.0
             )
+            tuning_fallback = True
+            best_params = {"fallback": True}
+            best_train_metrics = copy.deepcopy(fallback_res.metrics) if fallback_res.metrics else {}
+
+        # 2. TEST: Run with best params
+        test_config = base_config.model_copy()
+        for k, v in best_params.items():
+            if hasattr(test_config, k):
+                setattr(test_config, k, v)
+
+        test_res = self.engine.run_single(
+            request.ticker,
+            fold["test_start"],
+            fold["test_end"],
+            test_config,
+            request.cost_model,
+            request.seed,
+            initial_equity=request.initial_equity  # Using request equity base for correct trade sizing if pct based
+        )
 
-            # v4: Store full train_metrics alongside train_sharpe for backward compat
-            # v5: Ensure train_sharpe is never the sentinel -999.0
-            train_sharpe = best_train_metrics.get("sharpe", 0.0)
-            if train_sharpe == -999.0:
-                train_sharpe = 0.0
-
-            fold_results.append({
-                "fold_index": i,
-                "train_window": f"{fold['train_start']} to {fold['train_end']}",
-                "test_window": f"{fold['test_start']} to {fold['test_end']}",
-                "optimized_params": best_params,
-                "train_sharpe": train_sharpe,  # backward compat, never sentinel
-                "train_metrics": best_train_metrics,  # v4: full metrics dict
-                "test_metrics": test_res.metrics if test_res.metrics else {},
-                "trades_count": len(test_res.trades),
-                "tuning_fallback": tuning_fallback  # v5: explicit flag for UI/debug
-            })
-
-            # Collect trades and tag with fold index
-            for t in test_res.trades:
-                t_tagged = t.copy()
-                t_tagged["fold_index"] = i
-                oos_trades.append(t_tagged)
-
-            for e in test_res.events:
-                e_tagged = e.copy()
-                e_tagged["fold_index"] = i
-                oos_events.append(e_tagged)
+        # v4: Store full train_metrics alongside train_sharpe for backward compat
+        # v5: Ensure train_sharpe is never the sentinel -999.0
+        train_sharpe = best_train_metrics.get("sharpe", 0.0)
+        if train_sharpe == -999.0:
+            train_sharpe = 0.0
+
+        fold_result = {
+            "fold_index": i,
+            "train_window": f"{fold['train_start']} to {fold['train_end']}",
+            "test_window": f"{fold['test_start']} to {fold['test_end']}",
+            "optimized_params": best_params,
+            "train_sharpe": train_sharpe,  # backward compat, never sentinel
+            "train_metrics": best_train_metrics,  # v4: full metrics dict
+            "test_metrics": test_res.metrics if test_res.metrics else {},
+            "trades_count": len(test_res.trades),
+            "tuning_fallback": tuning_fallback  # v5: explicit flag for UI/debug
+        }
+
+        # Tag trades and events with fold index
+        trades = []
+        for t in test_res.trades:
+            t_tagged = t.copy()
+            t_tagged["fold_index"] = i
+            trades.append(t_tagged)
+
+        events = []
+        for e in test_res.events:
+            e_tagged = e.copy()
+            e_tagged["fold_index"] = i
+            events.append(e_tagged)
+
+        return {"fold_result": fold_result, "trades": trades, "events": events}
+
+    def assemble(
+        self,
+        request: BacktestRequestV3,
+        fold_outputs: List[Dict[str, Any]]
+    ) -> WalkForwardResult:
+        """Aggregate ``run_fold`` outputs (in fold order) into a WalkForwardResult."""
+        fold_results = [out["fold_result"] for out in fold_outputs]
+        # Equity tracking for aggregation is complex; simplified to just summing PnL for metrics
+        # Ideally we'd stitch daily equity curves.
+        oos_trades = [t for out in fold_outputs for t in out["trades"]]
+        oos_events = [e for out in fold_outputs for e in out["events"]]
 
         # Aggregate Metrics based on concatenated OOS trades
         # Use helper
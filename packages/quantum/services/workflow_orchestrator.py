@@ -69,6 +69,7 @@ from .options_utils import group_spread_positions, format_occ_symbol_readable, c
 # insufficient_history=True (table had zero rows for entire lifetime);
 # the take-profit rationale code below always took that branch.
 from .market_data_truth_layer import MarketDataTruthLayer
+from .cycle_context import CycleContext
 from .analytics_service import AnalyticsService
 from packages.quantum.services.risk_budget_engine import RiskBudgetEngine
 from packages.quantum.services.analytics.small_account_compounder import SmallAccountCompounder, CapitalTier, SizingConfig
@@ -2292,9 +2293,11 @@ async def run_midday_cycle(supabase: Client, user_id: str, deployable_capital_ov
     truth_layer = MarketDataTruthLayer()
     iv_repo = IVRepository(supabase)
     iv_point_service = IVPointService(supabase)
+    # Per-cycle memo shared with the scan (services/cycle_context.py)
+    cycle_context = CycleContext(truth_layer=truth_layer, iv_repo=iv_repo)
     regime_engine = RegimeEngineV3(
         supabase_client=supabase,
-        market_data=truth_layer,
+        market_data=cycle_context.market_data_view(),
         iv_repository=iv_repo,
         iv_point_service=iv_point_service,
     )
@@ -2657,9 +2660,14 @@ async def run_midday_cycle(supabase: Client, user_id: str, deployable_capital_ov
             account_tier=_midday_tier.name,
             job_run_id=job_run_id,
             regime_capture_sink=_rv4_symbol_sink,
+            cycle_context=cycle_context,
         )
 
         print(f"Scanner returned {len(scout_results)} raw opportunities.")
+        try:
+            logger.info("[CYCLE_IO] midday user=%s %s", user_id, cycle_context.stats())
+        except Exception:
+            logger.debug("[CYCLE_IO] stats failed (non-fatal)", exc_info=True)
 
         # Regime-V4 observe seam (default OFF): assemble the capture envelope from
         # the values the live cycle ALREADY produced (pure extraction). Rides on
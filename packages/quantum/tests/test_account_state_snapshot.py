@@ -0,0 +1,146 @@
+"""
+Consolidated, single-flight broker account snapshot (services/equity_state).
+
+Pins:
+- equity, last equity, options buying power and daily P&L for a user all
+  derive from ONE get_account() read per TTL window
+- concurrent cold reads for a user collapse into a single broker call and
+  share its result; a broker error reaches every waiter and is not cached
+- invalidate_account_snapshot (called on fills) forces the next read to
+  refetch, including when the invalidation lands mid-fetch
+- EQUITY_STATE_TTL_SECONDS configures the window
+"""
+
+import importlib
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from packages.quantum.services import equity_state
+
+USER_ID = "snapshot-user"
+
+ACCOUNT = {
+    "equity": "10250.00",
+    "last_equity": "10000.00",
+    "options_buying_power": "4200.00",
+}
+
+
+class _Broker:
+    """Counts get_account() reads; optionally blocks or fails."""
+
+    def __init__(self, account=None, delay=0.0, error=None):
+        self.account = dict(account or ACCOUNT)
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, user_id):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return equity_state.AccountStateSnapshot(
+            user_id=user_id, fetched_at=time.monotonic(), account=dict(self.account),
+        )
+
+
+class TestAccountStateSnapshot(unittest.TestCase):
+    def setUp(self):
+        os.environ.pop("RISK_EQUITY_SOURCE", None)
+        os.environ.pop("EQUITY_STATE_TTL_SECONDS", None)
+        importlib.reload(equity_state)
+        equity_state._reset_caches_for_testing()
+
+    def tearDown(self):
+        os.environ.pop("EQUITY_STATE_TTL_SECONDS", None)
+        importlib.reload(equity_state)
+
+    def _patch(self, broker):
+        return patch.object(equity_state, "_fetch_account_snapshot", broker)
+
+    def test_all_account_quantities_share_one_read(self):
+        broker = _Broker()
+        with self._patch(broker):
+            self.assertEqual(equity_state.get_alpaca_equity(USER_ID), 10250.0)
+            self.assertEqual(equity_state.get_alpaca_last_equity(USER_ID), 10000.0)
+            self.assertEqual(equity_state.get_alpaca_daily_pnl(USER_ID), 250.0)
+            self.assertEqual(equity_state._fetch_alpaca_options_buying_power(USER_ID), 4200.0)
+        self.assertEqual(broker.calls, 1)
+
+    def test_concurrent_cold_reads_are_single_flight(self):
+        broker = _Broker(delay=0.2)
+        results = []
+        with self._patch(broker):
+            threads = [
+                threading.Thread(target=lambda: results.append(equity_state.get_account_snapshot(USER_ID)))
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(broker.calls, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_error_reaches_waiters_and_is_not_cached(self):
+        broker = _Broker(delay=0.1, error=RuntimeError("503"))
+        errors = []
+
+        def read():
+            try:
+                equity_state.get_account_snapshot(USER_ID)
+            except RuntimeError as e:
+                errors.append(e)
+
+        with self._patch(broker):
+            threads = [threading.Thread(target=read) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual((broker.calls, len(errors)), (1, 4))
+
+            broker.error = None
+            self.assertIsNotNone(equity_state.get_account_snapshot(USER_ID))
+        self.assertEqual(broker.calls, 2)
+
+    def test_invalidate_forces_refetch(self):
+        broker = _Broker()
+        with self._patch(broker):
+            equity_state.get_alpaca_equity(USER_ID)
+            broker.account["equity"] = "9800.00"
+            self.assertEqual(equity_state.get_alpaca_equity(USER_ID), 10250.0)
+            equity_state.invalidate_account_snapshot(USER_ID)
+            self.assertEqual(equity_state.get_alpaca_equity(USER_ID), 9800.0)
+        self.assertEqual(broker.calls, 2)
+
+    def test_invalidate_during_fetch_does_not_cache_stale_state(self):
+        broker = _Broker(delay=0.2)
+        with self._patch(broker):
+            reader = threading.Thread(target=equity_state.get_account_snapshot, args=(USER_ID,))
+            reader.start()
+            time.sleep(0.05)
+            equity_state.invalidate_account_snapshot(USER_ID)
+            reader.join()
+            equity_state.get_account_snapshot(USER_ID)
+        self.assertEqual(broker.calls, 2)
+
+    def test_ttl_is_configurable(self):
+        os.environ["EQUITY_STATE_TTL_SECONDS"] = "0"
+        importlib.reload(equity_state)
+        broker = _Broker()
+        with self._patch(broker):
+            equity_state.get_alpaca_equity(USER_ID)
+            equity_state.get_alpaca_equity(USER_ID)
+        self.assertEqual(broker.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
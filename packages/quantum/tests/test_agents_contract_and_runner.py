@@ -156,3 +156,52 @@ def test_pipeline_integration_with_runner():
         assert "regime_agent" in signals
         # Just check it ran without error
         assert summary["vetoed"] is False # Default regime is Normal -> score 90 -> no veto
+
+
+import threading
+
+from packages.quantum.agents.runner import agent_context_view
+
+
+class _SlowAgent(MockAgent):
+    """Records the context it saw; waits on a shared barrier so the test
+    only completes if every agent runs at the same time."""
+
+    def __init__(self, id_val, score, barrier, seen, **kw):
+        super().__init__(id_val, score, **kw)
+        self._barrier = barrier
+        self._seen = seen
+
+    def evaluate(self, context):
+        self._barrier.wait(timeout=5)
+        self._seen.append(context["symbol"])
+        return super().evaluate(context)
+
+
+def test_runner_concurrent_preserves_order_and_times_agents():
+    barrier = threading.Barrier(3)
+    seen = []
+    agents = [
+        _SlowAgent("a1", 80.0, barrier, seen, reasons=["first"]),
+        _SlowAgent("a2", 60.0, barrier, seen, constraints={"limit": 1}),
+        _SlowAgent("a3", 40.0, barrier, seen, reasons=["third"]),
+    ]
+
+    signals, summary = AgentRunner.run_agents({"symbol": "SPY"}, agents, max_workers=3)
+
+    assert seen == ["SPY"] * 3
+    assert list(signals) == ["a1", "a2", "a3"]
+    assert summary["overall_score"] == 60.0
+    assert summary["top_reasons"] == ["[a1] first", "[a3] third"]
+    assert set(summary["agent_timings_ms"]) == {"a1", "a2", "a3"}
+    assert all(ms >= 0 for ms in summary["agent_timings_ms"].values())
+
+
+def test_agent_context_view_is_read_only_overlay():
+    candidate = {"symbol": "SPY", "iv_rank": 10.0}
+    context = agent_context_view(candidate, {"iv_rank": 55.0, "earnings_map": {}})
+
+    assert context["iv_rank"] == 55.0 and context.get("symbol") == "SPY"
+    with pytest.raises(TypeError):
+        context["symbol"] = "QQQ"
+    assert candidate == {"symbol": "SPY", "iv_rank": 10.0}
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
 from packages.quantum.services.bs_inversion import (
@@ -19,6 +20,7 @@ from packages.quantum.services.bs_inversion import (
     bs_call_price,
     bs_put_price,
     invert_iv,
+    invert_iv_batch,
 )
 
 
@@ -138,3 +140,64 @@ def test_invert_iv_handles_put_round_trip_with_dividends():
     recovered = invert_iv(price, S, K, T, r, q, "put")
     assert recovered is not None
     assert abs(recovered - sigma) < 1e-4
+
+
+# ---- Batch inversion ---------------------------------------------
+
+def test_invert_iv_batch_matches_scalar_round_trip():
+    """Batch over ROUND_TRIP_CASES equals the scalar path within brentq tol."""
+    cols = list(zip(*ROUND_TRIP_CASES))
+    S, K, T, r, q, sigma, rights = (np.array(c) for c in cols)
+    prices = np.array([
+        (bs_call_price if rt == "call" else bs_put_price)(*row[:6])
+        for row, rt in zip(ROUND_TRIP_CASES, rights)
+    ])
+
+    batch = invert_iv_batch(prices, S, K, T, r, q, rights)
+
+    for i, row in enumerate(ROUND_TRIP_CASES):
+        scalar = invert_iv(prices[i], *row[:5], row[6])
+        assert abs(batch[i] - scalar) < 1e-5
+        assert abs(batch[i] - sigma[i]) < 1e-4
+
+
+def test_invert_iv_batch_nan_exactly_where_scalar_none():
+    """Every edge-case skip (and Newton-fallback lane) mirrors invert_iv."""
+    S = 100.0
+    short_T = 0.5 / 365
+    T = 30 / 365
+    cases = [
+        # (price, K, T, right, bid)
+        (bs_call_price(S, 100, short_T, 0.045, 0.0, 0.30), 100.0, short_T, "call", None),
+        (50.0, 100.0, T, "call", None),                  # deep ITM (S=150) at intrinsic
+        (DEEP_OTM_PRICE * 0.5, 105.0, T, "call", None),  # price floor
+        (bs_call_price(S, 100, T, 0.045, 0.0, 0.2), 100.0, T, "call", 0.0),  # zero bid
+        (bs_call_price(S, 100, T, 0.045, 0.0, 0.2), 100.0, T, "call", 1.0),
+        (60.0, 100.0, T, "call", None),                  # above BS(σ=5): no bracket
+        (bs_put_price(S, 110, T, 0.045, 0.0, 0.35), 110.0, T, "put", None),
+    ]
+    spots = np.array([S, 150.0, S, S, S, S, S])
+    prices = np.array([c[0] for c in cases])
+    strikes = np.array([c[1] for c in cases])
+    tes = np.array([c[2] for c in cases])
+    rights = [c[3] for c in cases]
+    bids = np.array([np.nan if c[4] is None else c[4] for c in cases])
+
+    batch = invert_iv_batch(prices, spots, strikes, tes, 0.045, 0.0, rights, bid=bids)
+
+    for i, (price, K, T_i, right, bid) in enumerate(cases):
+        scalar = invert_iv(price, spots[i], K, T_i, 0.045, 0.0, right, bid=bid)
+        if scalar is None:
+            assert math.isnan(batch[i]), f"case {i}: expected NaN, got {batch[i]}"
+        else:
+            assert abs(batch[i] - scalar) < 1e-5, f"case {i}"
+
+
+def test_invert_iv_batch_broadcasts_and_handles_empty():
+    assert invert_iv_batch([], 100.0, [], [], 0.045, 0.0, []).shape == (0,)
+
+    T = 30 / 365
+    price = bs_call_price(100.0, 100.0, T, 0.045, 0.0, 0.25)
+    out = invert_iv_batch([price, price], 100.0, 100.0, T, 0.045, 0.0, "call")
+    assert out.shape == (2,)
+    assert np.allclose(out, 0.25, atol=1e-6)
@@ -0,0 +1,90 @@
+"""Tensor-free coskewness (core/math_engine.CoskewFactor).
+
+Proves: (1) the factor's cubic contraction and gradient equal the dense
+N×N×N tensor's, (2) SurrogateOptimizer reaches the same weights from either
+form with a skew preference that matters, (3) zero coskewness and the
+polynomial builders accept the factor, (4) the kill switch restores tensors
+and the finite-difference SLSQP solve.
+"""
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from packages.quantum.core.math_engine import (
+    CoskewFactor,
+    PortfolioMath,
+    as_coskew_tensor,
+    coskew_gradient,
+    coskew_zeros,
+)
+from packages.quantum.core import surrogate
+from packages.quantum.core.problem_builder import build_polynomial
+from packages.quantum.core.surrogate import SurrogateOptimizer
+
+
+def _math(n_assets=12, n_obs=200, seed=3):
+    rng = np.random.default_rng(seed)
+    returns = rng.standard_t(4, size=(n_obs, n_assets)) * 0.01 + 0.0003
+    return PortfolioMath(pd.DataFrame(returns, columns=[f"A{i}" for i in range(n_assets)]))
+
+
+def test_factor_matches_dense_tensor():
+    pm = _math()
+    factor = pm.get_coskewness_factor()
+    tensor = pm.get_coskewness_tensor()
+    w = np.random.default_rng(0).random(pm.n_assets)
+
+    np.testing.assert_allclose(factor.to_tensor(), tensor, rtol=1e-12, atol=1e-20)
+    assert np.isclose(factor.contract(w), np.einsum("ijk,i,j,k->", tensor, w, w, w), rtol=1e-10, atol=0)
+    np.testing.assert_allclose(factor.gradient(w), coskew_gradient(tensor, w), rtol=1e-10, atol=1e-22)
+
+
+def test_surrogate_weights_match_tensor_path():
+    pm = _math()
+    mu, sigma = pm.get_mean_returns(), pm.get_covariance_matrix()
+    constraints = {"risk_aversion": 2.0, "skew_preference": 3e4, "max_position_pct": 0.3}
+
+    w_factor = SurrogateOptimizer().solve(mu, sigma, pm.get_coskewness_factor(), constraints)
+    w_tensor = SurrogateOptimizer().solve(mu, sigma, pm.get_coskewness_tensor(), constraints)
+
+    np.testing.assert_allclose(w_factor, w_tensor, atol=1e-7)
+    assert abs(w_factor.sum() - 1.0) < 1e-8
+
+
+def test_zero_factor_and_polynomial_builder():
+    zero = CoskewFactor.zeros(4)
+    w = np.full(4, 0.25)
+    assert zero.contract(w) == 0.0
+    assert not zero.gradient(w).any()
+    assert as_coskew_tensor(zero).shape == (4, 4, 4)
+
+    pm = _math(n_assets=3)
+    factor = pm.get_coskewness_factor()
+    mu, sigma = np.zeros(3), np.zeros((3, 3))
+    assert build_polynomial(mu, sigma, factor, gamma_skew=1.0) == build_polynomial(
+        mu, sigma, pm.get_coskewness_tensor(), gamma_skew=1.0
+    )
+
+
+def test_kill_switch_restores_dense_tensor(monkeypatch):
+    pm = _math(n_assets=3)
+    assert isinstance(coskew_zeros(3), CoskewFactor)
+    assert isinstance(pm.get_coskewness(), CoskewFactor)
+
+    monkeypatch.setenv("COSKEW_TENSOR_FREE", "false")
+    assert coskew_zeros(3).shape == (3, 3, 3)
+    assert pm.get_coskewness().shape == (3, 3, 3)
+
+
+def test_kill_switch_drops_analytic_jacobian(monkeypatch):
+    pm = _math(n_assets=4)
+    args = (pm.get_mean_returns(), pm.get_covariance_matrix(), pm.get_coskewness(), {"skew_preference": 1.0})
+    with mock.patch.object(surrogate, "minimize", wraps=surrogate.minimize) as spy:
+        SurrogateOptimizer().solve(*args)
+        assert callable(spy.call_args.kwargs["jac"])
+
+        monkeypatch.setenv("COSKEW_TENSOR_FREE", "0")
+        SurrogateOptimizer().solve(*args)
+        assert spy.call_args.kwargs["jac"] is None
@@ -216,7 +216,7 @@ class _CapturingSupabase:
                 return _Result([dict(self.order_row)])
             if q._op == "update":
                 self.order_updates.append((dict(q._eq), q._payload))
-                return _Result(None)
+                return _Result([{**self.order_row, **q._payload}])
         if q._table == "risk_alerts":
             if q._op == "select":
                 if self.alert_select_raises:
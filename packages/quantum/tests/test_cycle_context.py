@@ -0,0 +1,153 @@
+"""Per-cycle symbol context (services/cycle_context.py).
+
+Proves: (1) bars/details are fetched once per key per cycle and concurrent
+callers share one provider call, (2) batch kinds fetch only the missing keys
+in one call and never re-ask for keys the provider did not return, (3) a
+failed fetch is re-raised, counted and retried (never memoized), (4) the
+views memoize their overrides and pass everything else through, and a
+universe prefetch (batch kinds + per-symbol details and bars) runs
+concurrently and turns the consumers' later reads into hits, (5) the kill
+switch keeps accounting but disables the memo.
+"""
+
+import threading
+import time
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from packages.quantum.services.cycle_context import CycleContext
+
+
+class _Truth:
+    def __init__(self):
+        self.bar_calls = []
+        self.snapshot_calls = []
+
+    def daily_bars(self, symbol, start, end):
+        self.bar_calls.append(symbol)
+        time.sleep(0.02)
+        return [{"close": 1.0}]
+
+    def snapshot_many(self, symbols):
+        self.snapshot_calls.append(list(symbols))
+        return {s: {"quote": {"mid": 1.0}} for s in symbols if s != "NOPE"}
+
+    def option_chain(self, symbol, **kw):
+        return ["chain", symbol]
+
+
+class _Polygon:
+    def __init__(self):
+        self.details_calls = 0
+
+    def get_ticker_details(self, symbol):
+        self.details_calls += 1
+        return {"type": "CS", "sic_description": "Software"}
+
+    def get_last_financials_date(self, symbol):
+        return None
+
+
+def test_bars_fetched_once_across_threads():
+    truth = _Truth()
+    ctx = CycleContext(truth_layer=truth)
+    start, end = datetime(2026, 1, 1, 9), datetime(2026, 3, 1, 9)
+
+    threads = [
+        threading.Thread(target=ctx.daily_bars, args=("SPY", start, end)) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Same trading days, different clock time: same key.
+    ctx.daily_bars("SPY", datetime(2026, 1, 1, 15), end)
+
+    assert truth.bar_calls == ["SPY"]
+    bars = ctx.stats()["kinds"]["bars"]
+    assert (bars["misses"], bars["hits"], bars["calls"]) == (1, 8, 1)
+    assert bars["top_keys"][0] == ["('SPY', '2026-01-01', '2026-03-01')", 8]
+
+
+def test_batch_kinds_fetch_only_missing_keys():
+    truth = _Truth()
+    ctx = CycleContext(truth_layer=truth)
+
+    basket = ctx.market_data_view().snapshot_many(["SPY", "QQQ", "NOPE"])
+    universe = ctx.snapshot_many(["SPY", "AAPL", "NOPE"])
+
+    assert set(basket) == {"SPY", "QQQ"}
+    assert set(universe) == {"SPY", "AAPL"}
+    assert truth.snapshot_calls == [["SPY", "QQQ", "NOPE"], ["AAPL"]]
+
+    iv_repo = mock.Mock()
+    iv_repo.get_iv_context_batch.side_effect = lambda syms: {s: {"iv_rank": 50} for s in syms}
+    ctx.bind(iv_repo=iv_repo, truth_layer=_Truth())
+    assert ctx.truth_layer is truth  # bind never replaces a bound provider
+    ctx.prefetch(["SPY", "AAPL"], details=False, earnings=False)
+    assert ctx.get_iv_context_batch(["AAPL", "SPY"]) == {s: {"iv_rank": 50} for s in ("AAPL", "SPY")}
+    iv_repo.get_iv_context_batch.assert_called_once()
+
+
+def test_failed_fetch_is_raised_counted_and_retried():
+    polygon = mock.Mock()
+    polygon.get_ticker_details.side_effect = [RuntimeError("429"), {"sector": "Tech"}]
+    ctx = CycleContext(market_data=polygon)
+
+    with pytest.raises(RuntimeError):
+        ctx.get_ticker_details("AAPL")
+    assert ctx.sector("AAPL") == "Tech"
+    assert ctx.sector("AAPL") == "Tech"
+
+    details = ctx.stats()["kinds"]["details"]
+    assert (details["calls"], details["errors"], details["hits"]) == (2, 1, 1)
+
+
+def test_views_memoize_overrides_and_pass_through():
+    polygon = _Polygon()
+    ctx = CycleContext(market_data=polygon, truth_layer=_Truth())
+
+    assert ctx.market_data_view().option_chain("SPY") == ["chain", "SPY"]
+    ctx.sector("AAPL")
+    ctx.polygon_view().get_ticker_details("AAPL")
+    assert polygon.details_calls == 1
+
+
+def test_prefetch_warms_universe_concurrently():
+    truth, polygon = _Truth(), _Polygon()
+    earnings = mock.Mock()
+    earnings.get_earnings_map.side_effect = lambda syms: {s: "2026-02-01" for s in syms}
+    ctx = CycleContext(market_data=polygon, truth_layer=truth, earnings_service=earnings)
+    universe = [f"S{i}" for i in range(16)]
+    window = (datetime(2026, 1, 1), datetime(2026, 3, 1))
+
+    started = time.monotonic()
+    ctx.prefetch(universe, earnings_symbols=universe[:3], bars=window)
+    # 16 bar fetches of 20ms each, overlapped on the pool.
+    assert time.monotonic() - started < 0.2
+
+    assert ctx.snapshot_many(universe).keys() == set(universe)
+    assert ctx.get_earnings_map(universe[:3]).keys() == set(universe[:3])
+    assert ctx.sector("S5") == "Software"
+    ctx.daily_bars("S5", *window)
+    earnings.get_earnings_map.assert_called_once_with(universe[:3])
+    assert len(truth.snapshot_calls) == 1
+    assert polygon.details_calls == 16 and len(truth.bar_calls) == 16
+    kinds = ctx.stats()["kinds"]
+    assert kinds["quotes"]["hits"] == 16 and kinds["bars"]["hits"] == 1
+
+
+def test_kill_switch_disables_memo_keeps_accounting(monkeypatch):
+    monkeypatch.setenv("CYCLE_CONTEXT_ENABLED", "off")
+    truth = _Truth()
+    ctx = CycleContext(truth_layer=truth)
+
+    ctx.snapshot_many(["SPY"])
+    ctx.snapshot_many(["SPY"])
+
+    assert truth.snapshot_calls == [["SPY"], ["SPY"]]
+    stats = ctx.stats()
+    assert stats["memoized"] is False
+    assert stats["kinds"]["quotes"]["calls"] == 2
@@ -0,0 +1,148 @@
+"""Tests for the range-aware DailyBarStore behind MarketDataTruthLayer.daily_bars.
+
+Proves: one contiguous series per symbol, sub-ranges served by slicing,
+only the missing head/tail fetched, failed segments never extend coverage,
+and the scanner's 90/150/365-day windows cost ONE /v2/aggs call.
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from packages.quantum.services.daily_bar_store import DailyBarStore
+from packages.quantum.services.market_data_cache import MarketDataCache
+from packages.quantum.services.market_data_truth_layer import MarketDataTruthLayer
+
+
+def _bars(start: date, end: date):
+    out = []
+    d = start
+    while d <= end:
+        if d.weekday() < 5:
+            out.append({"date": d.isoformat(), "close": 100.0 + d.toordinal() % 97})
+        d += timedelta(days=1)
+    return out
+
+
+class _RecordingFetcher:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def __call__(self, symbol, seg_start, seg_end):
+        self.calls.append((symbol, seg_start, seg_end))
+        if self.fail:
+            return None
+        return _bars(seg_start, seg_end)
+
+
+class TestDailyBarStore(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MarketDataCache(persist=False)
+        self.store = DailyBarStore(self.cache, ttl_seconds=3600)
+        self.end = date(2026, 3, 13)
+
+    @patch.dict("os.environ", {"DAILY_BAR_STORE_MIN_LOOKBACK_DAYS": "0"})
+    def test_sub_range_is_slice_without_fetch(self):
+        fetch = _RecordingFetcher()
+        full = self.store.get_range("SPY", self.end - timedelta(days=365), self.end, fetch)
+        sub = self.store.get_range("SPY", self.end - timedelta(days=30), self.end, fetch)
+
+        self.assertEqual(len(fetch.calls), 1)
+        self.assertEqual(sub, _bars(self.end - timedelta(days=30), self.end))
+        self.assertEqual(sub, [b for b in full if b["date"] >= sub[0]["date"]])
+
+    @patch.dict("os.environ", {"DAILY_BAR_STORE_MIN_LOOKBACK_DAYS": "0"})
+    def test_only_missing_head_and_tail_fetched(self):
+        fetch = _RecordingFetcher()
+        mid_start = self.end - timedelta(days=90)
+        mid_end = self.end - timedelta(days=10)
+        self.store.get_range("SPY", mid_start, mid_end, fetch)
+
+        wide_start = self.end - timedelta(days=150)
+        got = self.store.get_range("SPY", wide_start, self.end, fetch)
+
+        self.assertEqual(fetch.calls[1], ("SPY", wide_start, mid_start - timedelta(days=1)))
+        # Tail re-fetch starts AT the old covered end (refreshes a partial bar).
+        self.assertEqual(fetch.calls[2], ("SPY", mid_end, self.end))
+        self.assertEqual(got, _bars(wide_start, self.end))
+
+    def test_first_fetch_widened_to_min_lookback(self):
+        fetch = _RecordingFetcher()
+        self.store.get_range("SPY", self.end - timedelta(days=90), self.end, fetch)
+        self.store.get_range("SPY", self.end - timedelta(days=365), self.end, fetch)
+
+        self.assertEqual(len(fetch.calls), 1)
+        self.assertEqual(fetch.calls[0][1], self.end - timedelta(days=400))
+
+    @patch.dict("os.environ", {"DAILY_BAR_STORE_MIN_LOOKBACK_DAYS": "0"})
+    def test_failed_segment_does_not_extend_coverage(self):
+        ok = _RecordingFetcher()
+        self.store.get_range("SPY", self.end - timedelta(days=30), self.end, ok)
+
+        failing = _RecordingFetcher(fail=True)
+        got = self.store.get_range("SPY", self.end - timedelta(days=60), self.end, failing)
+        # Degrades to what is covered; the next call retries the head.
+        self.assertEqual(got, _bars(self.end - timedelta(days=30), self.end))
+        self.store.get_range("SPY", self.end - timedelta(days=60), self.end, ok)
+        self.assertEqual(len(ok.calls), 2)
+
+    def test_failed_first_fetch_returns_empty_and_stores_nothing(self):
+        got = self.store.get_range("SPY", self.end - timedelta(days=30), self.end,
+                                   _RecordingFetcher(fail=True))
+        self.assertEqual(got, [])
+        self.assertIsNone(self.cache.get("daily_bars_series", "SPY"))
+
+    def test_symbols_are_independent(self):
+        fetch = _RecordingFetcher()
+        self.store.get_range("SPY", self.end - timedelta(days=30), self.end, fetch)
+        self.store.get_range("QQQ", self.end - timedelta(days=30), self.end, fetch)
+        self.assertEqual([c[0] for c in fetch.calls], ["SPY", "QQQ"])
+
+
+class TestTruthLayerDailyBarsUsesStore(unittest.TestCase):
+
+    def _polygon_aggs(self, endpoint, params=None, retries=2):
+        self.aggs_calls.append(endpoint)
+        s_str, e_str = endpoint.rsplit("/", 2)[-2:]
+        bars = _bars(date.fromisoformat(s_str), date.fromisoformat(e_str))
+        return {"results": [
+            {"t": datetime.fromisoformat(b["date"]).timestamp() * 1000 + 12 * 3600 * 1000,
+             "o": b["close"], "h": b["close"], "l": b["close"], "c": b["close"], "v": 1}
+            for b in bars
+        ]}
+
+    def test_scanner_windows_cost_one_aggs_call(self):
+        self.aggs_calls = []
+        layer = MarketDataTruthLayer(api_key="test")
+        layer.cache = MarketDataCache(persist=False)
+        layer.bar_store.cache = layer.cache
+
+        with patch.object(layer, "_make_request", side_effect=self._polygon_aggs):
+            now = datetime.now()
+            ta = layer.daily_bars("SPY", now - timedelta(days=90), now)
+            layer.get_trend("SPY")
+            layer.iv_context("SPY")
+
+        self.assertEqual(len(self.aggs_calls), 1)
+        self.assertTrue(ta)
+        self.assertGreaterEqual(ta[0]["date"], (now - timedelta(days=90)).strftime("%Y-%m-%d"))
+
+    @patch.dict("os.environ", {"DAILY_BAR_STORE_ENABLED": "0"})
+    def test_kill_switch_restores_exact_range_cache(self):
+        self.aggs_calls = []
+        layer = MarketDataTruthLayer(api_key="test")
+        layer.cache = MarketDataCache(persist=False)
+
+        with patch.object(layer, "_make_request", side_effect=self._polygon_aggs):
+            now = datetime.now()
+            layer.daily_bars("SPY", now - timedelta(days=90), now)
+            layer.daily_bars("SPY", now - timedelta(days=90), now)
+            layer.daily_bars("SPY", now - timedelta(days=150), now)
+
+        self.assertEqual(len(self.aggs_calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Non-blocking Supabase access for the dashboard endpoints (services/db_async.py).
+
+Pins:
+- get_inbox issues its three trade_suggestions reads and the blocking
+  deployable-capital read concurrently, off the event loop: the loop keeps
+  serving other coroutines meanwhile
+- refresh_quote fetches the provider quote off the event loop too
+- every query of a request is timed under the endpoint, and stats() reports
+  the endpoint's wall-time percentiles
+- a PostgREST APIError still reaches the endpoint's own handler (502)
+- DB_ASYNC_ENABLED=0 runs the queries inline on the loop thread
+"""
+
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from fastapi import HTTPException
+from postgrest.exceptions import APIError
+
+from packages.quantum import dashboard_endpoints
+from packages.quantum.services import db_async
+
+QUERY_SECONDS = 0.2
+
+
+class _Query:
+    def __init__(self, supa, table):
+        self._supa, self._table, self._filters = supa, table, []
+
+    def __getattr__(self, name):
+        def chain(*args, **kwargs):
+            self._filters.append((name, args))
+            return self
+        return chain
+
+    def execute(self):
+        self._supa.threads.append(threading.current_thread().name)
+        if self._supa.error:
+            raise self._supa.error
+        time.sleep(QUERY_SECONDS)
+        return mock.Mock(data=[])
+
+
+class _Supa:
+    def __init__(self, error=None):
+        self.threads = []
+        self.error = error
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+class _Cash:
+    """Blocks like the broker get_account read behind CashService."""
+
+    def __init__(self, supabase):
+        self._supa = supabase
+
+    def get_deployable_capital_sync(self, user_id):
+        self._supa.threads.append(threading.current_thread().name)
+        time.sleep(QUERY_SECONDS)
+        return 500.0
+
+
+class _Polygon:
+    """Blocks like the provider HTTP call behind get_recent_quote."""
+
+    threads = []
+
+    def get_recent_quote(self, symbol):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(QUERY_SECONDS)
+        return {"symbol": symbol, "bid": 1.0, "ask": 1.1}
+
+
+class TestDashboardDbAsync(unittest.IsolatedAsyncioTestCase):
+    async def _inbox(self, supa):
+        with mock.patch.object(dashboard_endpoints, "CashService", _Cash):
+            return await dashboard_endpoints.get_inbox(
+                user_id="U", supabase=supa, include_backlog=False
+            )
+
+    async def test_inbox_reads_run_concurrently_off_the_loop(self):
+        supa = _Supa()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        started = time.monotonic()
+        with mock.patch.object(db_async.logger, "info") as log:
+            result = await self._inbox(supa)
+        elapsed = time.monotonic() - started
+        ticking.cancel()
+
+        self.assertEqual(result["meta"]["deployable_capital"], 500.0)
+        self.assertEqual(len(supa.threads), 4)
+        self.assertTrue(all(name.startswith("db-io") for name in supa.threads))
+        self.assertLess(elapsed, 2 * QUERY_SECONDS)
+        self.assertGreater(ticks, 5)
+
+        line = log.call_args.args[0]
+        self.assertIn("[DB_IO] endpoint=inbox queries=4", line)
+        self.assertGreaterEqual(db_async.stats()["inbox"]["requests"], 1)
+
+    async def test_refresh_quote_fetches_the_quote_off_the_loop(self):
+        supa = mock.Mock()
+        supa.table.return_value.select.return_value.eq.return_value.single.return_value \
+            .execute.return_value = mock.Mock(data={"user_id": "U", "symbol": "SPY"})
+        _Polygon.threads = []
+        with mock.patch.object(dashboard_endpoints, "PolygonService", _Polygon), \
+             mock.patch.object(dashboard_endpoints.TransactionCostModel, "estimate",
+                               return_value={"cost": 0.0}):
+            result = await dashboard_endpoints.refresh_quote(
+                suggestion_id="S", user_id="U", supabase=supa
+            )
+
+        self.assertEqual(result["quote"]["symbol"], "SPY")
+        self.assertEqual(len(_Polygon.threads), 1)
+        self.assertTrue(_Polygon.threads[0].startswith("db-io"))
+
+    async def test_request_timings_collect_gathered_queries(self):
+        supa = _Supa()
+        with db_async.track_request("probe") as timings:
+            await asyncio.gather(
+                db_async.run_query(supa.table("a").select("*"), "a"),
+                db_async.run_query(lambda: "direct", "b"),
+            )
+        recorded = {q["label"]: q for q in timings.queries}
+        self.assertEqual(set(recorded), {"a", "b"})
+        self.assertTrue(all(q["ok"] for q in timings.queries))
+        self.assertGreaterEqual(recorded["a"]["ms"], 900 * QUERY_SECONDS)
+
+    async def test_api_error_reaches_endpoint_handler(self):
+        supa = _Supa(error=APIError({"message": "JWT expired", "code": "PGRST301"}))
+        with self.assertRaises(HTTPException) as ctx:
+            await dashboard_endpoints.get_weekly_progress(user_id="U", supabase=supa)
+        self.assertEqual(ctx.exception.status_code, 502)
+
+    async def test_kill_switch_runs_inline(self):
+        supa = _Supa()
+        with mock.patch.dict(os.environ, {"DB_ASYNC_ENABLED": "0"}):
+            await self._inbox(supa)
+        self.assertEqual(set(supa.threads), {threading.current_thread().name})
+
+
+if __name__ == "__main__":
+    unittest.main()
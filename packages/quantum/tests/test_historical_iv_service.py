@@ -145,3 +145,17 @@ def test_compute_historical_iv_point_no_prices_returns_none():
     poly.get_option_historical_prices.side_effect = lambda *a, **kw: None
     svc = HistoricalIVService(polygon_service=poly)
     assert svc.compute_historical_iv_point("FAKE", as_of) is None
+
+
+def test_batch_and_scalar_inversion_produce_same_chain(monkeypatch):
+    as_of = date(2026, 4, 1)
+    poly = _build_fake_polygon(spot=100.0, sigma=0.25, as_of=as_of)
+    svc = HistoricalIVService(poly)
+
+    batch_chain = svc.reconstruct_chain_at_date("FAKE", as_of, spot=100.0)
+    monkeypatch.setenv("HISTORICAL_IV_BATCH_INVERSION", "0")
+    scalar_chain = svc.reconstruct_chain_at_date("FAKE", as_of, spot=100.0)
+
+    assert [c["details"] for c in batch_chain] == [c["details"] for c in scalar_chain]
+    for b, s in zip(batch_chain, scalar_chain):
+        assert abs(b["implied_volatility"] - s["implied_volatility"]) < 1e-5
@@ -0,0 +1,142 @@
+"""Event-driven JOB_CHAIN execution (services/job_dag_executor.py).
+
+Pins:
+- off by default: completions fire nothing and every job stays cron-driven
+- on: a succeeded/partial run fires its direct dependents (siblings
+  concurrently), a failed run fires nothing, only chain roots keep cron
+- the chain node comes from payload.origin.schedule_id, so the afternoon
+  exit evaluation (handler ``paper_exit_evaluate``) releases mark-to-market
+  and the morning one releases nothing
+- a failing fire never propagates to the upstream job
+- dependents carry the upstream run's schedule_slot, and their enqueue is
+  keyed to it: a re-fired upstream lands on the same job_runs row
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from packages.quantum.services import job_dag_executor as dag
+from packages.quantum.services.job_dependency_service import JobDependencyService
+
+
+SLOT = "cron:hour=14,minute=45;tz=America/Chicago;days=mon-fri"
+
+
+def _run(job_name, schedule_id=None, run_id="R1", schedule_slot=SLOT):
+    origin = {"origin": "scheduler", "schedule_id": schedule_id} if schedule_id else {"origin": "event"}
+    origin["schedule_slot"] = schedule_slot
+    return {"id": run_id, "job_name": job_name, "payload": {"origin": origin}}
+
+
+class _Recorder:
+    def __init__(self, delay=0.0, fail=()):
+        self.calls = []
+        self.threads = set()
+        self.delay = delay
+        self.fail = set(fail)
+        self._lock = threading.Lock()
+
+    def __call__(self, job_id, parent, parent_run_id, schedule_slot):
+        with self._lock:
+            self.calls.append((job_id, parent, parent_run_id, schedule_slot))
+            self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        if job_id in self.fail:
+            raise RuntimeError("connection refused")
+
+
+class TestJobDagExecutor(unittest.TestCase):
+    def setUp(self):
+        self._chain = dict(JobDependencyService.JOB_CHAIN)
+
+    def tearDown(self):
+        JobDependencyService.JOB_CHAIN = self._chain
+
+    def test_disabled_by_default(self):
+        fire = _Recorder()
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(dag.dispatch_ready_dependents(_run("paper_mark_to_market"), "succeeded", fire=fire), [])
+            self.assertTrue(dag.is_cron_driven("promotion_check"))
+        self.assertEqual(fire.calls, [])
+
+    def test_completion_fires_dependents(self):
+        fire = _Recorder()
+        with mock.patch.dict(os.environ, {"JOB_DAG_EXECUTION": "1"}):
+            fired = dag.dispatch_ready_dependents(_run("paper_mark_to_market"), "partial", fire=fire)
+            self.assertEqual(fired, ["daily_progression_eval"])
+            self.assertEqual(fire.calls, [("daily_progression_eval", "paper_mark_to_market", "R1", SLOT)])
+
+            for status in ("failed_retryable", "dead_lettered", "cancelled"):
+                self.assertEqual(dag.dispatch_ready_dependents(_run("paper_mark_to_market"), status, fire=fire), [])
+            self.assertEqual(dag.dispatch_ready_dependents(_run("promotion_check"), "succeeded", fire=fire), [])
+            self.assertEqual(len(fire.calls), 1)
+
+    def test_only_roots_stay_on_cron(self):
+        with mock.patch.dict(os.environ, {"JOB_DAG_EXECUTION": "1"}):
+            self.assertTrue(dag.is_cron_driven("paper_exit_evaluate_afternoon"))
+            self.assertTrue(dag.is_cron_driven("suggestions_open"))
+            self.assertTrue(dag.is_cron_driven("thesis_tracker"))  # outside the chain
+            self.assertFalse(dag.is_cron_driven("paper_mark_to_market"))
+            self.assertFalse(dag.is_cron_driven("promotion_check"))
+
+    def test_node_resolved_from_schedule_id(self):
+        fire = _Recorder()
+        with mock.patch.dict(os.environ, {"JOB_DAG_EXECUTION": "1"}):
+            afternoon = _run("paper_exit_evaluate", "paper_exit_evaluate_afternoon")
+            morning = _run("paper_exit_evaluate", "paper_exit_evaluate_morning")
+            self.assertEqual(dag.dispatch_ready_dependents(afternoon, "succeeded", fire=fire), ["paper_mark_to_market"])
+            self.assertEqual(dag.dispatch_ready_dependents(morning, "succeeded", fire=fire), [])
+        # A stray non-chain schedule id falls back to the handler name.
+        self.assertEqual(dag.chain_node_for(_run("policy_lab_eval", "manual")), "policy_lab_eval")
+
+    def test_sibling_branches_fire_concurrently_and_failures_are_contained(self):
+        JobDependencyService.JOB_CHAIN = dict(self._chain, **{
+            "branch_a": {"depends_on": "policy_lab_eval", "timeout_min": 5},
+            "branch_b": {"depends_on": "policy_lab_eval", "timeout_min": 5},
+        })
+        fire = _Recorder(delay=0.2, fail={"branch_b"})
+        with mock.patch.dict(os.environ, {"JOB_DAG_EXECUTION": "1"}):
+            started = time.monotonic()
+            fired = dag.dispatch_ready_dependents(_run("policy_lab_eval"), "succeeded", fire=fire)
+            elapsed = time.monotonic() - started
+        self.assertEqual(fired, ["promotion_check", "branch_a"])
+        self.assertEqual({c[0] for c in fire.calls}, {"promotion_check", "branch_a", "branch_b"})
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(len(fire.threads), 3)
+
+    def test_fire_dependent_passes_the_slot_through(self):
+        from packages.quantum import scheduler
+        with mock.patch.object(scheduler, "_fire_task") as fire_task:
+            scheduler.fire_dependent("daily_progression_eval", "paper_mark_to_market", "R1", SLOT)
+        kwargs = fire_task.call_args.kwargs
+        self.assertEqual(kwargs["schedule_slot"], SLOT)
+        self.assertEqual(kwargs["actor_class"], "job_dag:paper_mark_to_market")
+
+    def test_dependent_enqueue_is_keyed_to_the_upstream_slot(self):
+        def origin(**overrides):
+            base = {
+                "origin": "event", "trigger_actor_class": "job_dag:paper_mark_to_market",
+                "schedule_id": "daily_progression_eval", "schedule_slot": SLOT,
+            }
+            return dict(base, **overrides)
+
+        key = dag.dag_idempotency_key(origin(), "U")
+        # A re-fire of the same upstream slot maps to the same row ...
+        self.assertEqual(dag.dag_idempotency_key(origin(trigger_request_id="again"), "U"), key)
+        self.assertIn(SLOT, key)
+        # ... while another slot, node or user does not.
+        self.assertNotEqual(dag.dag_idempotency_key(origin(schedule_slot="cron:hour=8"), "U"), key)
+        self.assertNotEqual(dag.dag_idempotency_key(origin(schedule_id="policy_lab_eval"), "U"), key)
+        self.assertNotEqual(dag.dag_idempotency_key(origin(), "V"), key)
+        # Cron fires, other event fires and slot-less fires keep the endpoint key.
+        self.assertIsNone(dag.dag_idempotency_key(origin(origin="scheduler"), "U"))
+        self.assertIsNone(dag.dag_idempotency_key(origin(trigger_actor_class="new_scorable_close"), "U"))
+        self.assertIsNone(dag.dag_idempotency_key(origin(schedule_slot=None), "U"))
+        self.assertIsNone(dag.dag_idempotency_key(None, "U"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Lazy AST-scanned job handler registry (jobs/registry.py).
+
+Proves: (1) the lazy registry finds the same job_name -> module table as the
+eager import, (2) building it imports no handler module, (3) a handler is
+imported on first dispatch and keeps the runner's signature-based payload
+dispatch working, (4) the run(payload, ctx=None) contract is enforced from
+source, including JOB_NAME re-exported from another module.
+"""
+
+import inspect
+import subprocess
+import sys
+import textwrap
+
+from packages.quantum.jobs import registry
+from packages.quantum.jobs.registry import LazyHandler, _scan_module, discover_handlers
+
+
+def test_lazy_matches_eager_registry():
+    lazy = discover_handlers(lazy=True)
+    eager = discover_handlers(lazy=False)
+
+    assert set(lazy) == set(eager)
+    for job_name, handler in lazy.items():
+        assert isinstance(handler, LazyHandler)
+        assert handler.module_name == eager[job_name].__module__
+
+
+def test_building_registry_imports_no_handler_module():
+    code = textwrap.dedent(
+        """
+        import sys
+        from packages.quantum.jobs.registry import discover_handlers
+        handlers = discover_handlers()
+        loaded = [m for m in sys.modules if m.startswith("packages.quantum.jobs.handlers.")]
+        assert handlers and not loaded, loaded
+        """
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_lazy_handler_resolves_on_first_dispatch(tmp_path, monkeypatch):
+    pkg = tmp_path / "lazy_handlers_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "echo.py").write_text(
+        "JOB_NAME = 'echo'\n"
+        "def run(payload, ctx=None):\n"
+        "    return {'echo': payload}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    handler = LazyHandler("echo", "lazy_handlers_pkg.echo")
+    assert not handler.loaded
+    assert "payload" in inspect.signature(handler).parameters
+    assert handler(payload={"a": 1}) == {"echo": {"a": 1}}
+    assert handler.loaded and handler.import_seconds is not None
+
+
+def test_contract_enforced_from_source(tmp_path, monkeypatch):
+    (tmp_path / "no_payload.py").write_text("JOB_NAME = 'a'\ndef run(data, ctx=None):\n    pass\n")
+    (tmp_path / "ctx_required.py").write_text("JOB_NAME = 'b'\ndef run(payload, ctx):\n    pass\n")
+    (tmp_path / "no_run.py").write_text("JOB_NAME = 'c'\n")
+    (tmp_path / "dynamic.py").write_text("JOB_NAME = 'd' + 'e'\ndef run(payload):\n    pass\n")
+    (tmp_path / "helper.py").write_text("def util():\n    pass\n")
+    (tmp_path / "good.py").write_text("JOB_NAME = 'ok'\ndef run(payload, ctx=None):\n    pass\n")
+
+    assert _scan_module(str(tmp_path / "helper.py")) is None
+    assert _scan_module(str(tmp_path / "dynamic.py"))["static"] is False
+
+    # The manifest only imports modules it cannot read statically.
+    monkeypatch.setattr(registry, "_discover_handlers_eager", lambda names=None: {})
+    manifest = registry.HandlerManifest.build(str(tmp_path))
+    assert set(manifest.handlers) == {"ok"}
+    rejected = {m.rsplit(".", 1)[-1] for m in manifest.rejected}
+    assert rejected == {"no_payload", "ctx_required", "no_run"}
+    assert [m.rsplit(".", 1)[-1] for m in manifest.eager_modules] == ["dynamic"]
+
+
+def test_reexported_job_name_is_followed():
+    info = _scan_module(
+        registry._module_path("packages.quantum.jobs.handlers.shadow_fleet_evaluate")
+    )
+    assert info["static"] is True
+    assert info["job_name"] == "shadow_fleet_evaluate"
@@ -0,0 +1,225 @@
+"""Multi-slot DB-queue worker (jobs/worker_pool.py).
+
+Proves: (1) a long job does not block short jobs of another class and each
+class stays within its slot count, even when long jobs are queued ahead of
+every short one, (2) a wakeup claims immediately instead of waiting for the
+poll interval, (3) drain requeues jobs that never started and lets running
+jobs finish, (4) env parsing, (5) the filtered-claim fallback warns once.
+"""
+
+import queue
+import threading
+import time
+
+from packages.quantum.jobs import worker_pool
+from packages.quantum.jobs.worker_pool import (
+    LocalWakeup,
+    RedisWakeup,
+    SlotWorker,
+    get_job_classes,
+    get_slot_config,
+    notify_job_enqueued,
+)
+
+
+class _Queue:
+    def __init__(self, jobs=()):
+        self._q = queue.Queue()
+        for job in jobs:
+            self._q.put(job)
+
+    def put(self, job):
+        self._q.put(job)
+
+    def claim(self, job_names=None, exclude=None):
+        """FIFO claim of the oldest job matching the filter (claim_job_run_filtered)."""
+        with self._q.mutex:
+            for job in list(self._q.queue):
+                name = job["job_name"]
+                if job_names is not None and name not in job_names:
+                    continue
+                if exclude is not None and name in exclude:
+                    continue
+                self._q.queue.remove(job)
+                return job
+        return None
+
+    def claim_unfiltered(self, job_names=None, exclude=None):
+        """Legacy claim_job_run: ignores the class filter."""
+        try:
+            return self._q.get_nowait()
+        except queue.Empty:
+            return None
+
+
+class _Recorder:
+    def __init__(self, durations):
+        self.durations = durations
+        self.lock = threading.Lock()
+        self.finished = []
+        self.running = {}
+        self.max_running = {}
+        self.release = threading.Event()
+
+    def execute(self, job):
+        name = job["job_name"]
+        with self.lock:
+            self.running[name] = self.running.get(name, 0) + 1
+            self.max_running[name] = max(self.max_running.get(name, 0), self.running[name])
+        if self.durations.get(name) == "block":
+            self.release.wait(5)
+        else:
+            time.sleep(self.durations.get(name, 0.01))
+        with self.lock:
+            self.running[name] -= 1
+            self.finished.append((job["id"], time.monotonic()))
+
+
+def _start(worker):
+    t = threading.Thread(target=worker.run, daemon=True)
+    t.start()
+    return t
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_long_job_does_not_block_short_jobs():
+    jobs = [{"id": "bf1", "job_name": "iv_historical_backfill"},
+            {"id": "bf2", "job_name": "iv_historical_backfill"}]
+    jobs += [{"id": f"x{i}", "job_name": "paper_exit_evaluate"} for i in range(6)]
+    q = _Queue(jobs)
+    rec = _Recorder({"iv_historical_backfill": "block"})
+    worker = SlotWorker(q.claim, rec.execute, lambda job: None,
+                        slots={"default": 2, "long": 1, "exit": 2}, poll_seconds=0.05)
+    _start(worker)
+
+    assert _wait_for(lambda: len(rec.finished) == 6)
+    assert {j for j, _ in rec.finished} == {f"x{i}" for i in range(6)}
+    assert rec.max_running["iv_historical_backfill"] == 1
+    assert rec.max_running["paper_exit_evaluate"] <= 2
+
+    rec.release.set()
+    assert _wait_for(lambda: len(rec.finished) == 8)
+    worker.request_stop()
+    assert worker.drain(1.0) == []
+
+
+def test_queued_long_jobs_do_not_hold_short_job_claims():
+    jobs = [{"id": f"bf{i}", "job_name": "iv_historical_backfill"} for i in range(6)]
+    jobs += [{"id": f"x{i}", "job_name": "paper_exit_evaluate"} for i in range(3)]
+    q = _Queue(jobs)
+    rec = _Recorder({"iv_historical_backfill": "block"})
+    worker = SlotWorker(q.claim, rec.execute, lambda job: None,
+                        slots={"default": 1, "long": 1, "exit": 1}, poll_seconds=0.05)
+    _start(worker)
+
+    assert _wait_for(lambda: len(rec.finished) == 3)
+    # Only the running backfill was claimed; the rest stay in the DB queue.
+    assert worker.stats["claimed"] == 4
+    assert worker.in_flight() == 1
+
+    rec.release.set()
+    assert _wait_for(lambda: len(rec.finished) == 9)
+    worker.request_stop()
+    assert worker.drain(1.0) == []
+
+
+def test_wakeup_claims_without_waiting_for_poll():
+    q = _Queue()
+    rec = _Recorder({})
+    wakeup = LocalWakeup()
+    worker = SlotWorker(q.claim, rec.execute, lambda job: None,
+                        slots={"default": 1}, wakeup=wakeup, poll_seconds=30.0)
+    _start(worker)
+    time.sleep(0.05)
+
+    enqueued_at = time.monotonic()
+    q.put({"id": "j1", "job_name": "midday_scan"})
+    wakeup.notify()
+
+    assert _wait_for(lambda: rec.finished, timeout=2.0)
+    assert rec.finished[0][1] - enqueued_at < 1.0
+    worker.request_stop()
+    worker.drain(1.0)
+
+
+def test_drain_requeues_unstarted_and_finishes_running():
+    jobs = [{"id": f"b{i}", "job_name": "iv_historical_backfill"} for i in range(3)]
+    q = _Queue(jobs)
+    rec = _Recorder({"iv_historical_backfill": 0.2})
+    requeued = []
+    # Unfiltered claim (filtered RPC not deployed): a backfill claimed by the
+    # default class waits locally for the long slot.
+    worker = SlotWorker(q.claim_unfiltered, rec.execute, requeued.append,
+                        slots={"default": 1, "long": 1}, poll_seconds=0.05)
+    _start(worker)
+    assert _wait_for(lambda: worker.in_flight() == 2 and rec.running.get("iv_historical_backfill"))
+
+    worker.request_stop()
+    assert worker.drain(5.0) == []
+    assert [j["id"] for j in requeued] == ["b1"]
+    assert [j for j, _ in rec.finished] == ["b0"]
+    assert worker.stats["requeued"] == 1
+
+
+def test_env_parsing(monkeypatch):
+    monkeypatch.delenv("WORKER_SLOTS", raising=False)
+    assert get_slot_config() is None
+
+    monkeypatch.setenv("WORKER_SLOTS", "long=2, exit, bogus=x")
+    assert get_slot_config() == {"long": 2, "exit": 2, "default": 4}
+
+    monkeypatch.setenv("WORKER_JOB_CLASSES", "midday_scan=exit")
+    classes = get_job_classes()
+    assert classes["midday_scan"] == "exit"
+    assert classes["iv_historical_backfill"] == "long"
+
+
+def test_enqueue_notify_reuses_one_redis_connection(monkeypatch):
+    class _Pipe:
+        def lpush(self, *a): pass
+        def ltrim(self, *a): pass
+        def execute(self): pass
+
+    class _Conn:
+        def pipeline(self):
+            return _Pipe()
+
+    opened = []
+    monkeypatch.setenv("JOB_WAKEUP_CHANNEL", "redis")
+    monkeypatch.setattr(worker_pool, "_REDIS_PUBLISHER", None)
+    monkeypatch.setattr(RedisWakeup, "_conn", lambda self: opened.append(1) or _Conn())
+    for _ in range(5):
+        notify_job_enqueued("paper_exit_evaluate")
+    assert len(opened) == 1
+
+
+def test_filtered_claim_fallback_warns_once(monkeypatch, caplog):
+    from packages.quantum.jobs import db
+
+    class _Rpc:
+        def __init__(self, name):
+            self._name = name
+
+        def execute(self):
+            if self._name == "claim_job_run_filtered":
+                raise RuntimeError("function claim_job_run_filtered does not exist")
+            return type("Resp", (), {"data": [{"id": "job-1"}]})()
+
+    class _Client:
+        def rpc(self, name, params):
+            return _Rpc(name)
+
+    monkeypatch.setattr(db, "_filtered_claim_fallback_warned", False)
+    with caplog.at_level("WARNING", logger=db.logger.name):
+        claims = [db.claim_job_run_filtered(_Client(), "w", job_names=["a"]) for _ in range(3)]
+
+    assert claims == [{"id": "job-1"}] * 3
+    assert len([r for r in caplog.records if "falling back" in r.getMessage()]) == 1
@@ -0,0 +1,231 @@
+"""Keyset-paginated reader + local snapshot cache (services/keyset_reader.py).
+
+Proves: (1) KeysetPager streams a table completely in cursor order with ties on
+the leading key, and a NULL cursor value raises instead of skipping rows, (2)
+SnapshotCache fetches only rows past its high-water mark on a re-run, and a
+lookback re-reads late-committed rows without duplicating them, (3) the
+unified research reader returns the same rows in keyset mode as in offset mode
+and falls back to offset paging on a NULL cursor column, (4) UPDATE-able fleet
+runs are never served from the snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from packages.quantum.services.keyset_reader import (
+    KeysetCursorError,
+    KeysetPager,
+    SnapshotCache,
+    keyset_filter,
+)
+from scripts.analytics import unified_research_reader as reader
+from scripts.analytics.unified_research_reader import TableSpec, paginate
+
+
+def _split(expr):
+    """Split a PostgREST logic expression on top-level commas."""
+    parts, depth, quoted, start = [], 0, False, 0
+    for i, ch in enumerate(expr):
+        if ch == '"' and (i == 0 or expr[i - 1] != "\\"):
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ",":
+            parts.append(expr[start:i])
+            start = i + 1
+    parts.append(expr[start:])
+    return parts
+
+
+def _matches(row, term):
+    if term.startswith("and("):
+        return all(_matches(row, t) for t in _split(term[4:-1]))
+    column, op, raw = term.split(".", 2)
+    cell = row.get(column)
+    if cell is None:
+        return False
+    value = json.loads(raw)
+    if not isinstance(cell, str):
+        value = json.loads(value)
+    return cell > value if op == "gt" else cell == value
+
+
+class _Query:
+    def __init__(self, client, table):
+        self.client, self.table = client, table
+        self.preds, self._order, self._limit, self._range = [], [], None, None
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.preds.append(lambda r: r.get(column) == value)
+        return self
+
+    def gte(self, column, value):
+        self.preds.append(lambda r: r.get(column) is not None and r.get(column) >= value)
+        return self
+
+    def is_(self, column, value):
+        self.preds.append(lambda r: r.get(column) is None)
+        return self
+
+    def or_(self, expr):
+        self.preds.append(lambda r: any(_matches(r, t) for t in _split(expr)))
+        return self
+
+    def order(self, column, desc=False):
+        self._order.append(column)
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def execute(self):
+        self.client.calls.append(self.table)
+        rows = [dict(r) for r in self.client.tables[self.table]]
+        rows = [r for r in rows if all(p(r) for p in self.preds)]
+        rows.sort(key=lambda r: tuple((r.get(c) is None, r.get(c) or "") for c in self._order))
+        if self._range is not None:
+            rows = rows[self._range[0]:self._range[1] + 1]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        return SimpleNamespace(data=rows)
+
+
+class _Client:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+def _events(n, start=0):
+    # Three rows share each created_at, so paging must break ties on id.
+    base = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    return [
+        {"id": f"e{i:05d}", "created_at": (base + timedelta(seconds=i // 3)).isoformat(),
+         "user_id": "U" if i % 4 else "V", "n": i}
+        for i in range(start, start + n)
+    ]
+
+
+def test_keyset_filter_expression():
+    assert keyset_filter(("a", "b"), ("x", 3)) == 'a.gt."x",and(a.eq."x",b.gt."3")'
+
+
+def test_pager_streams_every_row_in_cursor_order():
+    rows = _events(2500)
+    client = _Client({"events": rows})
+    pager = KeysetPager(client, "events", "*", ("created_at", "id"), [("user_id", "U")],
+                        page_size=400)
+    got = list(pager)
+    want = sorted((r for r in rows if r["user_id"] == "U"),
+                  key=lambda r: (r["created_at"], r["id"]))
+    assert got == want
+    assert pager.pages == len(want) // 400 + 1
+    assert pager.last_key == (want[-1]["created_at"], want[-1]["id"])
+
+
+def test_pager_refuses_null_cursor():
+    rows = _events(10)
+    rows[4]["created_at"] = None
+    with pytest.raises(KeysetCursorError):
+        list(KeysetPager(_Client({"events": rows}), "events", "*", ("created_at", "id")))
+
+
+def test_snapshot_fetches_only_new_rows(tmp_path):
+    rows = _events(1200)
+    client = _Client({"events": rows})
+    cache = SnapshotCache(tmp_path / "snap.sqlite")
+    keys = ("created_at", "id")
+
+    first = cache.sync(client, "events", "*", keys, page_size=500)
+    assert (first["fetched"], first["incremental"]) == (1200, False)
+
+    rows.extend(_events(30, start=1200))
+    second = cache.sync(client, "events", "*", keys, page_size=500)
+    assert (second["fetched"], second["pages"], second["incremental"]) == (30, 1, True)
+    cached = list(cache.cached_rows(second["partition"]))
+    assert [r["n"] for r in cached] == list(range(1230))
+
+    # A row committed late with an earlier created_at is only seen via lookback,
+    # and re-read rows are upserted rather than duplicated.
+    late = dict(rows[-30], id="e99999", n=-1)
+    rows.append(late)
+    assert cache.sync(client, "events", "*", keys)["fetched"] == 0
+    third = cache.sync(client, "events", "*", keys, lookback_seconds=60)
+    cached = list(cache.cached_rows(third["partition"]))
+    assert len(cached) == 1231 and cached[-1]["id"] == "e99999"
+
+    # A different filter is its own partition.
+    scoped = cache.sync(client, "events", "*", keys, [("user_id", "V")])
+    assert scoped["partition"] != third["partition"] and not scoped["incremental"]
+    cache.close()
+
+
+def test_research_reader_keyset_matches_offset_and_snapshot(tmp_path, monkeypatch):
+    rows = _events(2100)
+    spec = TableSpec("events", "*", ("created_at", "id"), ("created_at", "id"))
+    client = _Client({"events": rows})
+
+    offset = paginate(client, spec, page_size=500)
+    keyset = paginate(client, spec, page_size=500, keyset=True)
+    assert keyset.status == "ok" and keyset.rows == offset.rows
+    assert (keyset.pages, keyset.truncated) == (offset.pages, False)
+
+    capped = paginate(client, spec, page_size=500, max_rows=1000, keyset=True)
+    assert (capped.n_fetched, capped.truncated) == (1000, True)
+
+    monkeypatch.setattr(reader, "SNAPSHOT_LOOKBACK_SECONDS", 60)
+    cache = SnapshotCache(tmp_path / "snap.sqlite")
+    paginate(client, spec, page_size=500, snapshot=cache)
+    client.calls.clear()
+    cached = paginate(client, spec, page_size=500, snapshot=cache)
+    # Two NULL probes plus one page re-reading the lookback window.
+    assert cached.rows == offset.rows and len(client.calls) == 3
+    cache.close()
+
+
+def test_research_reader_null_cursor_falls_back_to_offset():
+    rows = _events(700)
+    rows[650]["created_at"] = None
+    spec = TableSpec("events", "*", ("created_at", "id"))
+    client = _Client({"events": rows})
+    result = paginate(client, spec, page_size=300, keyset=True)
+    assert result.status == "ok"
+    assert result.rows == paginate(client, spec, page_size=300).rows
+    assert result.n_fetched == 700
+
+
+def test_research_reader_reads_updatable_fleet_runs_live(tmp_path):
+    spec = reader.TABLE_SPECS[reader.K_FLEET_RUNS]
+    assert spec.cursor == ()
+    assert reader.TABLE_SPECS[reader.K_FLEET_DECISIONS].cursor
+
+    runs = [
+        {"run_id": f"r{i}", "source_decision_id": f"d{i}", "shadow_micro_account_id": "A",
+         "status": "running", "created_at": f"2026-10-01T00:00:0{i}+00:00"}
+        for i in range(3)
+    ]
+    client = _Client({spec.table: runs})
+    cache = SnapshotCache(tmp_path / "snap.sqlite")
+    paginate(client, spec, snapshot=cache)
+    runs[0]["status"] = "completed"
+    again = paginate(client, spec, snapshot=cache)
+    assert [r["status"] for r in again.rows] == ["completed", "running", "running"]
+    cache.close()
@@ -4,7 +4,9 @@ import time
 import os
 import shutil
 import json
+import tempfile
 import threading
+import unittest.mock
 from datetime import datetime, timedelta
 from packages.quantum.services.market_data_cache import MarketDataCache, get_market_data_cache
 
@@ -16,8 +18,9 @@ class TestMarketDataCache(unittest.TestCase):
 
     def tearDown(self):
         # Clean up
-        if os.path.exists(self.test_cache_file):
-            os.remove(self.test_cache_file)
+        for path in (self.test_cache_file, self.test_cache_file + ".log"):
+            if os.path.exists(path):
+                os.remove(path)
         # Clear singleton if needed, though we use instance here
 
     def test_set_and_get(self):
@@ -97,5 +100,149 @@ class TestMarketDataCache(unittest.TestCase):
         # Not: start, start, end, end
         self.assertEqual(results, ["start", "end", "start", "end"])
 
+
+class TestMarketDataCacheAppendLog(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "cache.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _cache(self, **kw):
+        return MarketDataCache(file_path=self.path, persist=True, persist_mode="append_log", **kw)
+
+    def test_set_appends_instead_of_rewriting_snapshot(self):
+        cache = self._cache()
+        cache.set("NS", "k1", {"v": 1}, ttl_seconds=60)
+        cache.set("NS", "k2", {"v": 2}, ttl_seconds=60)
+
+        self.assertFalse(os.path.exists(self.path))
+        with open(cache.log_path) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    def test_restart_replays_log_last_write_wins(self):
+        cache = self._cache()
+        cache.set("NS", "k", "old", ttl_seconds=60)
+        cache.set("NS", "k", "new", ttl_seconds=60)
+        cache.set("GONE", "k", "v", ttl_seconds=60)
+        cache.clear_namespace("GONE")
+
+        reloaded = self._cache()
+        self.assertEqual(reloaded.get("NS", "k"), "new")
+        self.assertIsNone(reloaded.get("GONE", "k"))
+
+    def test_compaction_snapshots_and_truncates_log(self):
+        cache = self._cache(compact_min_records=5)
+        for i in range(12):
+            cache.set("NS", "same", i, ttl_seconds=60)
+
+        self.assertTrue(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+        with open(cache.log_path) as f:
+            self.assertLess(len(f.readlines()), 5)
+        self.assertEqual(self._cache().get("NS", "same"), 11)
+
+    def test_torn_trailing_record_is_skipped(self):
+        cache = self._cache()
+        cache.set("NS", "k", "v", ttl_seconds=60)
+        with open(cache.log_path, "a") as f:
+            f.write('{"k": "NS:broken", "e": {"da')
+
+        self.assertEqual(self._cache().get("NS", "k"), "v")
+
+    def test_evicted_and_expired_keys_stay_dead_after_restart(self):
+        cache = self._cache(namespace_limits={"SMALL": (2, 10**9)})
+        for k in ("a", "b", "c"):
+            cache.set("SMALL", k, k, ttl_seconds=60)
+        cache.set("NS", "short", "v", ttl_seconds=60)
+        cache._memory_cache[cache._get_namespaced_key("NS", "short")]["expiry"] = time.time() - 1
+        self.assertEqual(cache.sweep_expired(), 1)
+
+        with open(cache.log_path) as f:
+            tombstones = [json.loads(line) for line in f if '"d"' in line]
+        self.assertEqual(len(tombstones), 2)
+
+        reloaded = self._cache(namespace_limits={"SMALL": (10, 10**9)})
+        self.assertIsNone(reloaded.get("SMALL", "a"))
+        self.assertEqual(reloaded.get("SMALL", "c"), "c")
+        self.assertEqual(reloaded.get_stats()["total_entries"], 2)
+
+
+class TestMarketDataCacheBounds(unittest.TestCase):
+    def setUp(self):
+        self.cache = MarketDataCache(
+            persist=False,
+            namespace_limits={"SMALL": (3, 10**9), "TINY_BYTES": (100, 20000)},
+        )
+
+    def test_lru_evicts_least_recently_used_per_namespace(self):
+        for k in ("a", "b", "c"):
+            self.cache.set("SMALL", k, k, ttl_seconds=60)
+        self.cache.set("OTHER", "x", "x", ttl_seconds=60)
+
+        # Touch "a" so "b" becomes the LRU entry.
+        self.assertEqual(self.cache.get("SMALL", "a"), "a")
+        self.cache.set("SMALL", "d", "d", ttl_seconds=60)
+
+        self.assertIsNone(self.cache.get("SMALL", "b"))
+        self.assertEqual(self.cache.get("SMALL", "a"), "a")
+        self.assertEqual(self.cache.get("SMALL", "d"), "d")
+        # Other namespaces are unaffected by SMALL's bound.
+        self.assertEqual(self.cache.get("OTHER", "x"), "x")
+        self.assertEqual(self.cache.get_stats()["namespaces"]["SMALL"]["evictions"], 1)
+
+    def test_byte_budget_evicts_but_keeps_newest(self):
+        chain = [{"strike": float(i), "bid": 1.0, "ask": 1.1, "delta": 0.3} for i in range(10)]
+        for i in range(5):
+            self.cache.set("TINY_BYTES", f"chain{i}", chain, ttl_seconds=60)
+
+        stats = self.cache.get_stats()["namespaces"]["TINY_BYTES"]
+        self.assertLessEqual(stats["approx_bytes"], 20000)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertEqual(self.cache.get("TINY_BYTES", "chain4"), chain)
+
+        # A single payload over budget is still cached on its own.
+        huge = [chain] * 50
+        self.cache.set("TINY_BYTES", "huge", huge, ttl_seconds=60)
+        self.assertEqual(self.cache.get("TINY_BYTES", "huge"), huge)
+
+    def test_sweep_expired_drops_unread_entries(self):
+        self.cache.set("SWEEP", "old", "v", ttl_seconds=0)
+        self.cache.set("SWEEP", "fresh", "v", ttl_seconds=60)
+        time.sleep(0.01)
+
+        self.assertEqual(self.cache.sweep_expired(), 1)
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["total_entries"], 1)
+        self.assertEqual(stats["namespaces"]["SWEEP"]["entries"], 1)
+        self.assertEqual(stats["namespaces"]["SWEEP"]["expired"], 1)
+
+    def test_background_sweeper(self):
+        self.cache.set("SWEEP", "old", "v", ttl_seconds=0)
+        self.cache.start_sweeper(interval_seconds=0.02)
+        try:
+            deadline = time.time() + 2
+            while time.time() < deadline and self.cache.get_stats()["total_entries"]:
+                time.sleep(0.02)
+        finally:
+            self.cache.stop_sweeper()
+        self.assertEqual(self.cache.get_stats()["total_entries"], 0)
+
+    def test_hit_miss_counters(self):
+        self.cache.set("COUNT", "k", "v", ttl_seconds=60)
+        self.cache.get("COUNT", "k")
+        self.cache.get("COUNT", "k")
+        self.cache.get("COUNT", "missing")
+
+        ns = self.cache.get_stats()["namespaces"]["COUNT"]
+        self.assertEqual((ns["hits"], ns["misses"]), (2, 1))
+        self.assertAlmostEqual(ns["hit_rate"], 0.6667, places=4)
+
+    def test_limits_env_override(self):
+        with unittest.mock.patch.dict(os.environ, {"MARKET_DATA_CACHE_LIMITS": "option_chain=7:1024,bad"}):
+            cache = MarketDataCache(persist=False)
+        self.assertEqual(cache.get_limits("option_chain"), (7, 1024))
+
 if __name__ == '__main__':
     unittest.main()
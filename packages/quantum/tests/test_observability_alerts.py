@@ -14,6 +14,10 @@ Per Loud-Error Doctrine v1.0. Covers:
     6. Recursion prevention — when called from inside another except
        block, the helper does not recurse on its own write failure.
     7. ``supabase=None`` fail-soft — no crash; logs and returns.
+    8. Deferred alerts — queued off the caller's thread, coalesced per
+       (alert_type, severity, symbol, user_id), batch-inserted on flush, spilled
+       to the structured log on overflow / write failure; high/critical
+       and the kill switch stay synchronous.
 """
 
 import logging
@@ -285,5 +289,94 @@ class TestPytestEnvGuard(unittest.TestCase):
                 os.environ["ALERTS_ALLOW_ADMIN_UNDER_PYTEST"] = prior
 
 
+class TestDeferredAlertSink(unittest.TestCase):
+    def setUp(self):
+        from packages.quantum.observability import alerts
+        self.alerts = alerts
+        self._prior_sink = alerts._ALERT_SINK
+        alerts._ALERT_SINK = None
+
+    def tearDown(self):
+        if self.alerts._ALERT_SINK is not None:
+            self.alerts._ALERT_SINK.close()
+        self.alerts._ALERT_SINK = self._prior_sink
+
+    def test_deferred_warning_is_batched_and_coalesced(self):
+        supabase = MagicMock()
+        for _ in range(50):
+            alert(supabase, alert_type="polygon_circuit_open", message="open",
+                  severity="warning", symbol="SPY", defer=True)
+        alert(supabase, alert_type="polygon_circuit_open", message="open",
+              severity="warning", symbol="QQQ", defer=True)
+
+        # Nothing on the caller's thread.
+        supabase.table.return_value.insert.assert_not_called()
+        self.assertEqual(self.alerts.flush_alerts(), 2)
+
+        insert = supabase.table.return_value.insert
+        insert.assert_called_once()
+        rows = insert.call_args.args[0]
+        self.assertEqual([r["symbol"] for r in rows], ["SPY", "QQQ"])
+        self.assertEqual(rows[0]["metadata"]["coalesced_count"], 50)
+        self.assertIn("first_seen_at", rows[0]["metadata"])
+        self.assertNotIn("coalesced_count", rows[1]["metadata"])
+
+    def test_escalated_severity_is_not_folded_into_an_earlier_row(self):
+        supabase = MagicMock()
+        for severity in ("info", "warning", "info"):
+            alert(supabase, alert_type="polygon_circuit_open", message="open",
+                  severity=severity, symbol="SPY", defer=True)
+
+        self.assertEqual(self.alerts.flush_alerts(), 2)
+        rows = supabase.table.return_value.insert.call_args.args[0]
+        self.assertEqual([r["severity"] for r in rows], ["info", "warning"])
+        self.assertEqual(rows[0]["metadata"]["coalesced_count"], 2)
+
+    def test_deferred_alert_never_waits_on_a_slow_insert(self):
+        import time
+        supabase = MagicMock()
+        supabase.table.return_value.insert.return_value.execute.side_effect = (
+            lambda: time.sleep(0.2)
+        )
+        started = time.perf_counter()
+        for i in range(20):
+            alert(supabase, alert_type="t", message="m", severity="warning",
+                  symbol=f"S{i}", defer=True)
+        self.assertLess(time.perf_counter() - started, 0.1)
+        self.assertEqual(self.alerts.flush_alerts(), 20)
+
+    def test_high_severity_and_kill_switch_stay_synchronous(self):
+        import os
+        from unittest.mock import patch
+        supabase = MagicMock()
+        alert(supabase, alert_type="t", message="m", severity="high", defer=True)
+        supabase.table.return_value.insert.assert_called_once()
+
+        with patch.dict(os.environ, {"ALERT_SINK_BUFFERED": "off"}):
+            alert(supabase, alert_type="t", message="m", severity="warning", defer=True)
+        self.assertEqual(supabase.table.return_value.insert.call_count, 2)
+        self.assertIsNone(self.alerts._ALERT_SINK)
+
+    def test_overflow_and_write_failure_spill_to_log(self):
+        supabase = MagicMock()
+        supabase.table.return_value.insert.return_value.execute.side_effect = (
+            RuntimeError("db down")
+        )
+        self.alerts._ALERT_SINK = self.alerts._AlertSink(max_pending=1)
+        before = self.alerts.get_alert_write_failure_count()
+
+        with self.assertLogs("packages.quantum.observability.alerts", level="ERROR") as cm:
+            alert(supabase, alert_type="a", message="m", severity="warning", defer=True)
+            alert(supabase, alert_type="b", message="m", severity="warning", defer=True)
+            self.alerts._ALERT_SINK.close()
+
+        spilled = [r for r in cm.records if r.getMessage() == "alert_spilled"]
+        self.assertEqual(
+            sorted((r.intended_alert_type, r.spill_reason) for r in spilled),
+            [("a", "write_failed"), ("b", "overflow")],
+        )
+        self.assertEqual(self.alerts.get_alert_write_failure_count() - before, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,161 @@
+"""Columnar option chain (services/option_chain.py) and the scanner's indexed
+leg selection.
+
+Proves: (1) the chain is sorted by expiry/right/strike with input order kept
+among equal strikes, and its strike / |delta| lookups match brute-force
+``min`` scans including tie-breaking, (2) the condor selectors and
+``_select_legs_from_chain`` pick exactly the same legs with and without the
+index on nested and flat chains with partial greeks, (3) the kill switch and
+an unindexable chain fall back to the list scans.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from packages.quantum import options_scanner as scanner
+from packages.quantum.services.option_chain import OptionChain
+
+
+def _chain(seed, nested=True, n=60, expiry="2026-11-20"):
+    rng = random.Random(seed)
+    calls, puts = [], []
+    strikes = sorted(rng.choice(range(80, 121)) + rng.choice((0, 0.5)) for _ in range(n))
+    for i, strike in enumerate(strikes):
+        for right, out in (("call", calls), ("put", puts)):
+            moneyness = (strike - 100.0) / 10.0
+            delta = 1.0 / (1.0 + math.exp(moneyness))
+            delta = round(delta if right == "call" else delta - 1.0, 2)
+            if rng.random() < 0.15:
+                delta = None  # partial greeks: deep strikes lack delta
+            bid = round(rng.uniform(0.05, 5.0), 2)
+            ask = round(bid + rng.uniform(0.0, 0.3), 2) if rng.random() > 0.05 else None
+            ticker = f"O:X{expiry}{right[0]}{strike}-{i}"
+            if nested:
+                out.append({
+                    "contract": ticker, "strike": strike, "expiry": expiry, "right": right,
+                    "quote": {"bid": bid, "ask": ask, "mid": None, "last": None},
+                    "greeks": {"delta": delta, "gamma": 0.01, "vega": 0.1, "theta": -0.02},
+                    "iv": 0.3, "oi": i,
+                })
+            else:
+                out.append({
+                    "ticker": ticker, "strike": strike, "expiration": expiry, "type": right,
+                    "delta": delta, "gamma": 0.01, "vega": 0.1, "theta": -0.02,
+                    "bid": bid, "ask": ask, "price": bid,
+                })
+    return calls, puts
+
+
+def _accessors(nested):
+    kind = "nested" if nested else "flat"
+    names = ("delta", "bid", "ask", "ticker", "expiry", "gamma", "vega", "theta")
+    return [getattr(scanner, f"_get_{name}_{kind}") for name in names]
+
+
+def test_sorted_blocks_and_lookups_match_brute_force():
+    near_calls, near_puts = _chain(1, expiry="2026-11-20")
+    far_calls, far_puts = _chain(2, expiry="2026-12-18")
+    chain = OptionChain.from_contracts(far_puts + near_calls + far_calls + near_puts)
+
+    assert list(chain.expiries) == ["2026-11-20", "2026-12-18"]
+    # ``index`` counts contracts of one right in input order: near calls
+    # come first among the calls, far puts first among the puts.
+    assert chain.side("call", "2026-11-20").index.tolist() == list(range(len(near_calls)))
+    assert chain.side("put", "2026-12-18").index.tolist() == list(range(len(far_puts)))
+    assert len(chain.side("put", "2027-01-15")) == 0
+    merged = chain.side("call")
+    assert np.all(np.diff(merged.strike) >= 0) and len(merged) == 2 * len(near_calls)
+    assert [merged.pick(near_calls + far_calls, i)["strike"] for i in range(len(merged))] == merged.strike.tolist()
+    assert chain.nbytes() < 200 * len(chain)
+
+    side = chain.side("call", "2026-11-20")
+    strikes = [c["strike"] for c in near_calls]
+    for target in np.arange(75.0, 125.0, 0.25):
+        assert side.nearest_strike(target) == min(
+            range(len(strikes)), key=lambda i: abs(strikes[i] - target)
+        )
+        lo = side.above(100.0)
+        assert lo == sum(s <= 100.0 for s in strikes)
+        assert side.nearest_strike(target, lo=lo) == min(
+            range(lo, len(strikes)), key=lambda i: abs(strikes[i] - target)
+        )
+    deltas = [c["greeks"]["delta"] for c in near_calls]
+    for target in np.arange(0.0, 1.0, 0.005):
+        assert side.nearest_abs_delta(target) == min(
+            range(len(deltas)), key=lambda i: abs(abs(deltas[i] or 0) - target)
+        )
+
+
+@pytest.mark.parametrize("nested", [True, False])
+@pytest.mark.parametrize("seed", range(5))
+def test_condor_selection_matches_list_scans(nested, seed, monkeypatch):
+    calls, puts = _chain(seed, nested=nested)
+    chain = OptionChain.from_sides(calls, puts)
+    accessors = _accessors(nested)
+
+    for target_delta in (0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.5):
+        for width in (0.5, 1.0, 2.5, 5.0, 10.0, 50.0):
+            fast = scanner._select_iron_condor_legs_param(
+                calls, puts, target_delta, width, *accessors, chain=chain
+            )
+            slow = scanner._select_iron_condor_legs_param(
+                calls, puts, target_delta, width, *accessors
+            )
+            assert fast == slow, (target_delta, width)
+
+    indexed = scanner._select_best_iron_condor_ev_aware(calls, puts, 1.0, 100.0)
+    monkeypatch.setenv("OPTION_CHAIN_COLUMNAR", "0")
+    legacy = scanner._select_best_iron_condor_ev_aware(calls, puts, 1.0, 100.0)
+    assert indexed == legacy
+
+
+@pytest.mark.parametrize("nested", [True, False])
+def test_leg_selection_matches_list_scans(nested):
+    leg_defs = [
+        {"delta_target": d, "side": side, "type": kind}
+        for d in (0.1, 0.16, 0.3, 0.5, 0.7)
+        for side, kind in (("sell", "call"), ("buy", "put"))
+    ]
+    for seed in range(5):
+        calls, puts = _chain(seed, nested=nested)
+        # A greeks-less put side takes the moneyness fallback on both paths.
+        for p in puts:
+            if nested:
+                p["greeks"]["delta"] = None
+            else:
+                p["delta"] = None
+        chain = OptionChain.from_sides(calls, puts)
+        assert scanner._select_legs_from_chain(
+            calls, puts, leg_defs, 100.0, chain=chain
+        ) == scanner._select_legs_from_chain(calls, puts, leg_defs, 100.0)
+
+
+def test_index_falls_back_when_disabled_or_unindexable(monkeypatch):
+    calls, puts = _chain(0)
+    assert scanner._option_chain_index(calls, puts) is not None
+    assert scanner._option_chain_index([], []) is None
+
+    bad = [dict(calls[0], strike="n/a")] + calls[1:]
+    assert scanner._option_chain_index(bad, puts) is None
+    missing = [dict(calls[0], strike=None)] + calls[1:]
+    assert scanner._option_chain_index(missing, puts) is None
+
+    monkeypatch.setenv("OPTION_CHAIN_COLUMNAR", "off")
+    assert scanner._option_chain_index(calls, puts) is None
+
+
+def test_columns_read_mixed_and_non_numeric_values():
+    calls, puts = _chain(3, nested=False, n=8)
+    calls[0]["bid"] = "1.25"
+    calls[1]["delta"] = "n/a"
+    calls[2]["delta"] = {"bad": 1}
+    calls[3]["iv"], calls[3]["implied_volatility"] = None, 0.42
+    side = OptionChain.from_sides(calls, puts).side("call")
+
+    row = {int(i): k for k, i in enumerate(side.index)}
+    assert side.bid[row[0]] == 1.25
+    assert math.isnan(side.delta[row[1]]) and math.isnan(side.delta[row[2]])
+    assert side.iv[row[3]] == 0.42
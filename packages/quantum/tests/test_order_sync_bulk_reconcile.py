@@ -0,0 +1,294 @@
+"""Bulk order-status reconcile + trade-update stream (alpaca_order_sync).
+
+The per-order shape asked Alpaca about every pending order with get_order —
+API usage and fill latency grew linearly with open orders. The bulk shape
+sweeps open + recently-closed orders in a few paged list_orders calls and
+reconciles every user's rows from that in-memory map.
+
+Pins:
+- AlpacaClient.list_orders pages oldest-first on the submitted_at cursor
+- fetch_broker_orders sweeps OPEN + CLOSED-since-oldest-pending (less a
+  margin), keyed by alpaca_order_id
+- the job makes zero get_order calls when the sweep covers every row, and
+  still applies fills/cancels; an id the sweep lacks falls back to get_order
+- a still-working order whose broker state is unchanged is not rewritten
+- ALPACA_ORDER_SYNC_BULK=0 restores one get_order per order
+- the stream consumer applies a fill event without a broker call and
+  ignores non-state events / orders that are not pending
+- a fill reconciled concurrently by the stream and the cron runs its side
+  effects once: the status write is a compare-and-set
+"""
+
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from packages.quantum.brokers.alpaca_client import AlpacaClient
+from packages.quantum.brokers.alpaca_order_handler import (
+    BULK_SYNC_MARGIN_SECONDS,
+    fetch_broker_orders,
+    poll_pending_orders,
+)
+from packages.quantum.brokers.alpaca_trade_stream import TradeUpdateConsumer
+from packages.quantum.tests.test_paper_shadow_reconcile_isolation import _FakeSupabase
+
+NOW = datetime.now(timezone.utc)
+
+
+class _Update:
+    def __init__(self, supa, table, payload):
+        self._supa, self._table, self._payload = supa, table, payload
+        self._filters = {}
+
+    @property
+    def _id(self):
+        return self._filters.get("id")
+
+    def eq(self, col, val):
+        self._filters[col] = val
+        return self
+
+    def execute(self):
+        matched = [
+            row for row in self._supa._tables.get(self._table, [])
+            if all(row.get(c) == v for c, v in self._filters.items())
+        ]
+        if matched:
+            self._supa.updates.append((self._table, self._id, self._payload))
+        for row in matched:
+            row.update(self._payload)
+        return SimpleNamespace(data=matched)
+
+
+class _Supa(_FakeSupabase):
+    def __init__(self, tables):
+        super().__init__(tables)
+        self.updates = []
+
+    def table(self, name):
+        query = super().table(name)
+        query.update = lambda payload: _Update(self, name, payload)
+        return query
+
+
+def _row(oid, status="working", broker_status="new", minutes_ago=1, position_id="pos-1"):
+    return {
+        "id": oid, "user_id": "U", "portfolio_id": "port-live", "status": status,
+        "alpaca_order_id": f"ax-{oid}", "broker_status": broker_status, "filled_qty": 0,
+        "submitted_at": (NOW - timedelta(minutes=minutes_ago)).isoformat(),
+        "position_id": position_id, "side": "sell",
+        "order_json": {"symbol": "SPY", "time_in_force": "gtc"},
+    }
+
+
+def _broker(oid, status, filled_qty=0):
+    return {
+        "alpaca_order_id": f"ax-{oid}", "status": status, "filled_qty": filled_qty,
+        "filled_avg_price": 1.25 if filled_qty else None, "legs": [],
+    }
+
+
+def _tables(rows):
+    return {
+        "paper_portfolios": [{"id": "port-live", "user_id": "U", "routing_mode": "live_eligible"}],
+        "paper_orders": rows,
+        "paper_positions": [],
+    }
+
+
+def _alpaca(open_orders, closed_orders, single=None):
+    alpaca = mock.MagicMock()
+    alpaca.list_orders.side_effect = (
+        lambda status="all", after=None, **kw: open_orders if status == "open" else closed_orders
+    )
+    alpaca.get_order.side_effect = lambda aid: (single or {})[aid]
+    return alpaca
+
+
+def _run(supa, alpaca, env=None):
+    from packages.quantum.jobs.handlers import alpaca_order_sync
+
+    closed = []
+    with mock.patch.object(alpaca_order_sync, "get_admin_client", return_value=supa), \
+         mock.patch("packages.quantum.brokers.alpaca_client.get_alpaca_client",
+                    return_value=alpaca), \
+         mock.patch("packages.quantum.brokers.alpaca_order_handler._close_position_on_fill",
+                    side_effect=lambda client, pid, order, data: closed.append(pid)), \
+         mock.patch.dict(os.environ, {"RECONCILE_POSITIONS_ENABLED": "0",
+                                      "CLIENT_ORDER_ID_RECONCILE_ENABLED": "0",
+                                      **(env or {})}, clear=False):
+        return alpaca_order_sync.run({}), closed
+
+
+def _sdk_order(i):
+    ts = NOW + timedelta(seconds=i)
+    return SimpleNamespace(
+        id=f"ax-{i}", client_order_id=None, status="filled", symbol="SPY", qty=1,
+        filled_qty=1, filled_avg_price=1.0, type="limit", side="buy", limit_price=1.0,
+        time_in_force="day", submitted_at=ts, filled_at=ts, created_at=ts, legs=None,
+    )
+
+
+class TestListOrders(unittest.TestCase):
+    def test_pages_until_short_page(self):
+        orders = [_sdk_order(i) for i in range(5)]
+        requests = []
+
+        def get_orders(req):
+            requests.append(req)
+            # Alpaca's ``after`` is exclusive.
+            page = [o for o in orders if req.after is None or o.submitted_at > req.after]
+            return page[:req.limit]
+
+        client = AlpacaClient.__new__(AlpacaClient)
+        client._client = SimpleNamespace(get_orders=get_orders)
+        client._data_client = None
+
+        out = client.list_orders(status="closed", after=None, page_size=2)
+
+        self.assertEqual([o["alpaca_order_id"] for o in out], [f"ax-{i}" for i in range(5)])
+        self.assertTrue(all(r.nested and r.direction.value == "asc" for r in requests))
+        self.assertEqual(len(requests), 3)
+
+
+class TestFetchBrokerOrders(unittest.TestCase):
+    def test_open_plus_closed_since_oldest_pending(self):
+        alpaca = _alpaca([_broker("a", "new")], [_broker("b", "filled", 1)])
+        rows = [_row("a", minutes_ago=5), _row("b", minutes_ago=30), {"submitted_at": "garbage"}]
+
+        orders = fetch_broker_orders(alpaca, rows)
+
+        self.assertEqual(set(orders), {"ax-a", "ax-b"})
+        calls = alpaca.list_orders.call_args_list
+        self.assertEqual(calls[0].kwargs, {"status": "open"})
+        self.assertEqual(calls[1].kwargs["status"], "closed")
+        expected_after = datetime.fromisoformat(rows[1]["submitted_at"]) - timedelta(
+            seconds=BULK_SYNC_MARGIN_SECONDS
+        )
+        self.assertEqual(calls[1].kwargs["after"], expected_after)
+
+
+class TestBulkOrderSync(unittest.TestCase):
+    def test_sweep_replaces_per_order_polls(self):
+        supa = _Supa(_tables([
+            _row("fill", position_id="pos-fill"),
+            _row("cancel", position_id=None),
+            _row("rest", position_id=None),
+        ]))
+        alpaca = _alpaca(
+            [_broker("rest", "new")],
+            [_broker("fill", "filled", 1), _broker("cancel", "canceled")],
+        )
+
+        result, closed = _run(supa, alpaca)
+
+        alpaca.get_order.assert_not_called()
+        self.assertEqual(alpaca.list_orders.call_count, 2)
+        self.assertEqual(closed, ["pos-fill"])
+        self.assertEqual((result["fills"], result["cancels"], result["unchanged"]), (1, 1, 1))
+        self.assertEqual(result["writes_skipped"], 1)
+        self.assertEqual(result["bulk_broker_orders"], 3)
+        written = {oid: payload["status"] for _, oid, payload in supa.updates}
+        self.assertEqual(written, {"fill": "filled", "cancel": "cancelled"})
+
+    def test_missing_id_falls_back_to_get_order(self):
+        supa = _Supa(_tables([_row("old", status="submitted", position_id=None)]))
+        alpaca = _alpaca([], [], single={"ax-old": _broker("old", "new")})
+
+        result, _ = _run(supa, alpaca)
+
+        alpaca.get_order.assert_called_once_with("ax-old")
+        self.assertEqual(result["broker_fetches"], 1)
+        # submitted -> working is a real transition: written.
+        self.assertEqual([p["status"] for _, _, p in supa.updates], ["working"])
+
+    def test_kill_switch_polls_each_order(self):
+        supa = _Supa(_tables([_row("a", position_id=None), _row("b", position_id=None)]))
+        single = {"ax-a": _broker("a", "new"), "ax-b": _broker("b", "new")}
+        alpaca = _alpaca([], [], single=single)
+
+        result, _ = _run(supa, alpaca, env={"ALPACA_ORDER_SYNC_BULK": "0"})
+
+        alpaca.list_orders.assert_not_called()
+        self.assertEqual(alpaca.get_order.call_count, 2)
+        self.assertEqual(result["writes_skipped"], 0)
+        self.assertEqual(len(supa.updates), 2)
+
+
+class TestTradeUpdateConsumer(unittest.TestCase):
+    def test_fake_stream_applies_fills(self):
+        supa = _Supa(_tables([_row("fill", position_id="pos-fill"), _row("rest", position_id=None)]))
+        alpaca = _alpaca([], [])
+        consumer = TradeUpdateConsumer(alpaca, supa)
+        events = [
+            {"event": "new", "order": _broker("rest", "new")},
+            {"event": "fill", "order": _broker("fill", "filled", 1)},
+            {"event": "fill", "order": _broker("stranger", "filled", 1)},
+            {"event": "fill", "order": _broker("fill", "filled", 1)},  # replay: already terminal
+        ]
+
+        closed = []
+        with mock.patch("packages.quantum.brokers.alpaca_order_handler._close_position_on_fill",
+                        side_effect=lambda client, pid, order, data: closed.append(pid)):
+            counts = consumer.consume(events)
+
+        alpaca.get_order.assert_not_called()
+        self.assertEqual(closed, ["pos-fill"])
+        self.assertEqual(
+            {k: counts[k] for k in ("events", "ignored", "unknown_order", "applied", "fills")},
+            {"events": 4, "ignored": 1, "unknown_order": 2, "applied": 1, "fills": 1},
+        )
+        self.assertEqual([(oid, p["status"]) for _, oid, p in supa.updates], [("fill", "filled")])
+
+    def test_concurrent_reconciles_run_fill_side_effects_once(self):
+        class _RacingSupa(_Supa):
+            """Reads hand out row snapshots, and the first write to
+            ``paper_orders`` runs ``race`` before committing, so both
+            reconcilers read the pending row before either writes."""
+
+            race = None
+
+            def table(self, name):
+                query = super().table(name)
+                query._rows = [dict(r) for r in query._rows]
+                update = query.update
+
+                def racing_update(payload):
+                    pending = update(payload)
+                    execute = pending.execute
+
+                    def execute_after_race():
+                        race, self.race = self.race, None
+                        if race:
+                            race()
+                        return execute()
+
+                    pending.execute = execute_after_race
+                    return pending
+
+                query.update = racing_update
+                return query
+
+        supa = _RacingSupa(_tables([_row("fill", position_id="pos-fill")]))
+        alpaca = _alpaca([], [])
+        fill = _broker("fill", "filled", 1)
+        cron_results = []
+        supa.race = lambda: cron_results.append(
+            poll_pending_orders(alpaca, supa, "U", broker_orders={"ax-fill": fill})
+        )
+
+        closed = []
+        with mock.patch("packages.quantum.brokers.alpaca_order_handler._close_position_on_fill",
+                        side_effect=lambda client, pid, order, data: closed.append(pid)):
+            counts = TradeUpdateConsumer(alpaca, supa).consume([{"event": "fill", "order": fill}])
+
+        self.assertEqual(closed, ["pos-fill"])
+        self.assertEqual(cron_results[0]["fills"], 1)
+        self.assertEqual(counts["fills"], 0)
+        self.assertEqual([(oid, p["status"]) for _, oid, p in supa.updates], [("fill", "filled")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,7 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from packages.quantum.services.outcome_aggregator import OutcomeAggregator
-from packages.quantum.nested_logging import log_decision, log_outcome
+from packages.quantum.nested_logging import log_decision, log_outcome, log_outcomes_bulk
 
 class TestOutcomeLinking(unittest.TestCase):
 
@@ -21,6 +21,7 @@ class TestOutcomeLinking(unittest.TestCase):
             returned_id = log_decision(trace_id, "user1", "test_type", {})
             self.assertEqual(returned_id, trace_id)
 
+    @patch.dict(os.environ, {"OUTCOME_AGGREGATOR_BATCH": "0"})
     @patch('packages.quantum.services.outcome_aggregator.log_outcome')
     def test_morning_suggestion_linking(self, mock_log_outcome):
         """
@@ -101,5 +102,138 @@ class TestOutcomeLinking(unittest.TestCase):
         # Surprise should be 0.0 because no inference log
         self.assertEqual(call_kwargs['surprise_score'], 0.0)
 
+    @patch('packages.quantum.services.outcome_aggregator.log_outcomes_bulk')
+    @patch('packages.quantum.services.outcome_aggregator.log_outcome')
+    def test_batch_linking_joins_window_in_memory(self, mock_log_outcome, mock_bulk):
+        """
+        Batch mode: one in_() query per table for the whole window, the same
+        linking rules (execution by suggestion_id, else by trace_id, else the
+        suggestion as no_action), one bulk write, and no per-trace queries.
+        """
+        done, linked, by_trace, no_action = (str(uuid.uuid4()) for _ in range(4))
+        s_linked, s_no_action = str(uuid.uuid4()), str(uuid.uuid4())
+        e_linked, e_trace = str(uuid.uuid4()), str(uuid.uuid4())
+
+        rows = {
+            "decision_logs": [
+                {"trace_id": t, "decision_type": "morning_suggestion", "content": {}}
+                for t in (done, linked, by_trace, no_action, linked)
+            ],
+            ("outcomes_log", "trace_id"): [{"trace_id": done}],
+            ("inference_log", "trace_id"): [],
+            ("trade_suggestions", "trace_id"): [
+                {"id": s_linked, "trace_id": linked, "ticker": "SPY"},
+                {"id": s_no_action, "trace_id": no_action, "ticker": "QQQ"},
+            ],
+            ("trade_executions", "suggestion_id"): [
+                {"id": e_linked, "suggestion_id": s_linked, "symbol": "SPY", "quantity": 1, "fill_price": 1.0},
+            ],
+            ("trade_executions", "trace_id"): [
+                {"id": e_trace, "trace_id": by_trace, "symbol": "IWM", "quantity": 1, "fill_price": 1.0},
+            ],
+        }
+        in_calls = []
+
+        def table_side_effect(name):
+            query = MagicMock()
+            query.select.return_value.in_.return_value.gte.return_value.lte.return_value.execute.return_value.data = rows["decision_logs"]
+
+            def in_(column, values):
+                in_calls.append((name, column, list(values)))
+                result = MagicMock()
+                result.execute.return_value.data = [
+                    r for r in rows.get((name, column), []) if r.get(column) in values
+                ]
+                return result
+
+            query.select.return_value.in_.side_effect = in_ if name != "decision_logs" else None
+            query.select.return_value.eq.side_effect = AssertionError(f"per-trace query on {name}")
+            return query
+
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = table_side_effect
+        aggregator = OutcomeAggregator(mock_supabase, MagicMock())
+        aggregator._calculate_execution_pnl = MagicMock(return_value=(5.0, 0.01))
+        aggregator._calculate_counterfactual_pnl = MagicMock(return_value=(2.0, True))
+
+        loop = asyncio.new_event_loop()
+        try:
+            processed = loop.run_until_complete(aggregator.run(datetime.now(), datetime.now()))
+        finally:
+            loop.close()
+
+        self.assertEqual(processed, 3)
+        mock_log_outcome.assert_not_called()
+        mock_bulk.assert_called_once()
+        written = {str(r["trace_id"]): r for r in mock_bulk.call_args.args[0]}
+        self.assertEqual(set(written), {linked, by_trace, no_action})
+        self.assertEqual(str(written[linked]["related_id"]), e_linked)
+        self.assertEqual(str(written[by_trace]["related_id"]), e_trace)
+        self.assertEqual(written[no_action]["attribution_type"], "no_action")
+        self.assertEqual(str(written[no_action]["related_id"]), s_no_action)
+        # Trace fallback only for traces without suggestion-linked executions.
+        fallback = [c for c in in_calls if c[:2] == ("trade_executions", "trace_id")]
+        self.assertEqual(len(fallback), 1)
+        self.assertNotIn(linked, fallback[0][2])
+
+    @patch('packages.quantum.services.outcome_aggregator.log_outcomes_bulk')
+    def test_batch_skips_window_when_existence_lookup_fails(self, mock_bulk):
+        """
+        An outcomes_log lookup error must not read as "no outcomes yet": the
+        trace below already has an outcome, so recomputing the window would
+        write it again. The window is skipped and nothing is written.
+        """
+        logged = str(uuid.uuid4())
+        outcomes_log = [{"trace_id": logged}]
+
+        def table_side_effect(name):
+            query = MagicMock()
+            query.select.return_value.in_.return_value.gte.return_value.lte.return_value.execute.return_value.data = [
+                {"trace_id": logged, "decision_type": "morning_suggestion", "content": {}},
+            ]
+            if name == "outcomes_log":
+                query.select.return_value.in_.return_value.execute.side_effect = RuntimeError("statement timeout")
+            else:
+                query.select.return_value.in_.return_value.execute.return_value.data = []
+            return query
+
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = table_side_effect
+        aggregator = OutcomeAggregator(mock_supabase, MagicMock())
+
+        loop = asyncio.new_event_loop()
+        try:
+            processed = loop.run_until_complete(aggregator.run(datetime.now(), datetime.now()))
+        finally:
+            loop.close()
+
+        self.assertEqual(processed, 0)
+        mock_bulk.assert_not_called()
+        self.assertEqual(outcomes_log, [{"trace_id": logged}])
+        tables = [c.args[0] for c in mock_supabase.table.call_args_list]
+        self.assertNotIn("trade_suggestions", tables)
+
+    def test_bulk_write_never_overwrites_or_nulls_defaults(self):
+        """
+        log_outcomes_bulk keeps log_outcome's insert semantics: an existing
+        trace_id is skipped (first outcome wins), and keys missing from some
+        rows of a chunk fall back to column defaults instead of NULL.
+        """
+        with patch('packages.quantum.nested_logging._get_supabase_client') as mock_client:
+            upsert = mock_client.return_value.table.return_value.upsert
+            upsert.return_value.execute.return_value.data = [{"trace_id": "a"}]
+            written = log_outcomes_bulk([
+                dict(trace_id=uuid.uuid4(), realized_pl_1d=1.0, realized_vol_1d=0.1, surprise_score=0.0),
+                dict(trace_id=uuid.uuid4(), realized_pl_1d=2.0, realized_vol_1d=0.1, surprise_score=0.0,
+                     counterfactual_available=True, counterfactual_pl_1d=1.5),
+            ])
+
+        kwargs = upsert.call_args.kwargs
+        self.assertEqual(kwargs["on_conflict"], "trace_id")
+        self.assertTrue(kwargs["ignore_duplicates"])
+        self.assertFalse(kwargs["default_to_null"])
+        # Only the rows PostgREST actually inserted are counted.
+        self.assertEqual(written, 1)
+
 if __name__ == '__main__':
     unittest.main()
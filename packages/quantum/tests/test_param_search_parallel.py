@@ -0,0 +1,125 @@
+"""Process-pool ParamSearchRunner (services/param_search_parallel.py).
+
+Proves: (1) the snapshot answers every window exactly like the provider,
+(2) parallel single-mode and walk-forward searches return the same ordered
+results and best_params as the serial loop, (3) history is fetched once.
+"""
+
+import math
+from datetime import datetime, timedelta
+
+from packages.quantum.services.backtest_engine import BacktestEngine
+from packages.quantum.services.param_search_parallel import HistorySnapshot
+from packages.quantum.services.param_search_runner import ParamSearchRunner
+from packages.quantum.strategy_profiles import (
+    BacktestRequestV3,
+    ParamSearchConfig,
+    StrategyConfig,
+    WalkForwardConfig,
+)
+
+
+class _FakePolygon:
+    """Deterministic daily bars with PolygonService's window semantics."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_historical_prices(self, symbol, days=252, to_date=None):
+        self.calls += 1
+        if to_date.weekday() >= 5:
+            to_date = to_date - timedelta(days=to_date.weekday() - 4)
+        d = to_date - timedelta(days=days + 30)
+        dates, prices = [], []
+        while d <= to_date:
+            if d.weekday() < 5:
+                n = d.toordinal()
+                dates.append(d.strftime("%Y-%m-%d"))
+                prices.append(100.0 + 15.0 * math.sin(n / 9.0) + 0.05 * (n % 200))
+            d += timedelta(days=1)
+        returns = [(prices[i] - prices[i - 1]) / prices[i - 1] for i in range(1, len(prices))]
+        return {"symbol": symbol, "prices": prices, "volumes": [0] * len(prices),
+                "returns": returns, "dates": dates}
+
+
+def _config():
+    return StrategyConfig(
+        name="t", version=1, conviction_floor=0.5, conviction_slope=0.5,
+        max_risk_pct_per_trade=0.05, max_risk_pct_portfolio=0.5,
+        max_concurrent_positions=1, max_spread_bps=100, max_days_to_expiry=45,
+        min_underlying_liquidity=0.0, take_profit_pct=0.05, stop_loss_pct=0.05,
+        max_holding_days=10,
+    )
+
+
+_RANDOM_IDS = {"backtest_id", "trade_id"}
+
+
+def _drop_ids(value):
+    # uuid4 ids are minted per run; everything else must match exactly.
+    if isinstance(value, dict):
+        return {k: _drop_ids(v) for k, v in value.items() if k not in _RANDOM_IDS}
+    if isinstance(value, list):
+        return [_drop_ids(v) for v in value]
+    return value
+
+
+def _strip_ids(results):
+    return [(item["params"], _drop_ids(item["output"].model_dump())) for item in results]
+
+
+def _search(monkeypatch, request, parallel):
+    monkeypatch.setenv("PARAM_SEARCH_PARALLEL", "1" if parallel else "0")
+    poly = _FakePolygon()
+    runner = ParamSearchRunner(BacktestEngine(polygon_service=poly), max_workers=2)
+    return runner.run_search(request, _config()), poly
+
+
+def test_snapshot_slices_match_provider_windows():
+    poly = _FakePolygon()
+    snap = HistorySnapshot.prefetch(poly, "SPY", "2024-01-01", "2024-12-31", lookback_days=120)
+    assert poly.calls == 1
+
+    for start, end in [("2024-01-01", "2024-12-31"), ("2024-03-02", "2024-06-15"),
+                       ("2024-08-10", "2024-11-30")]:
+        end_dt = datetime.strptime(end, "%Y-%m-%d")
+        days = (end_dt - (datetime.strptime(start, "%Y-%m-%d") - timedelta(days=120))).days + 10
+        assert snap.get_historical_prices("SPY", days=days, to_date=end_dt) == \
+            poly.get_historical_prices("SPY", days=days, to_date=end_dt)
+
+    assert snap.get_historical_prices("QQQ", days=30, to_date=datetime(2024, 6, 1)) is None
+
+
+def test_parallel_grid_matches_serial(monkeypatch):
+    request = BacktestRequestV3(
+        start_date="2024-01-01", end_date="2024-12-31", ticker="SPY",
+        param_search=ParamSearchConfig(
+            method="grid",
+            space={"conviction_floor": [0.3, 0.5, 0.7], "take_profit_pct": [0.03, 0.08]},
+        ),
+    )
+    serial, serial_poly = _search(monkeypatch, request, parallel=False)
+    parallel, parallel_poly = _search(monkeypatch, request, parallel=True)
+
+    assert _strip_ids(parallel.results) == _strip_ids(serial.results)
+    assert parallel.best_params == serial.best_params
+    assert serial_poly.calls == 6
+    assert parallel_poly.calls == 1
+
+
+def test_parallel_walk_forward_matches_serial(monkeypatch):
+    request = BacktestRequestV3(
+        start_date="2023-06-01", end_date="2024-12-31", ticker="SPY",
+        run_mode="walk_forward",
+        walk_forward=WalkForwardConfig(
+            train_days=120, test_days=60, step_days=90, min_trades_per_fold=1,
+        ),
+        param_search=ParamSearchConfig(method="grid", space={"take_profit_pct": [0.03, 0.08]}),
+    )
+    serial, _ = _search(monkeypatch, request, parallel=False)
+    parallel, parallel_poly = _search(monkeypatch, request, parallel=True)
+
+    assert _strip_ids(parallel.results) == _strip_ids(serial.results)
+    assert parallel.best_params == serial.best_params
+    assert parallel.results[0]["output"].aggregate_metrics["total_folds"] > 1
+    assert parallel_poly.calls == 1
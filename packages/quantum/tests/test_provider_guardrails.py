@@ -77,7 +77,11 @@ class TestGuardrailAlerts(unittest.TestCase):
         _BREAKERS.clear()
 
     def _last_alert_record(self):
-        return self._supabase_mock.table.return_value.insert.call_args.args[0]
+        # Guardrail alerts are deferred to the buffered sink: drain it, then
+        # read the last row of the batched insert.
+        self._alerts_module.flush_alerts()
+        rows = self._supabase_mock.table.return_value.insert.call_args.args[0]
+        return rows[-1] if isinstance(rows, list) else rows
 
     def test_path_a_circuit_open_writes_alert(self):
         """When breaker is OPEN, the decorator returns fallback AND
@@ -61,7 +61,12 @@ def armed_supabase(monkeypatch):
 
 
 def _last_alert_record(supabase_mock):
-    return supabase_mock.table.return_value.insert.call_args.args[0]
+    # Guardrail alerts are deferred to the buffered sink: drain it, then read
+    # the last row of the batched insert.
+    from packages.quantum.observability.alerts import flush_alerts
+    flush_alerts()
+    rows = supabase_mock.table.return_value.insert.call_args.args[0]
+    return rows[-1] if isinstance(rows, list) else rows
 
 
 class _FakePolygon:
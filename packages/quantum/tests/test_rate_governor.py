@@ -0,0 +1,165 @@
+"""Shared token-bucket rate governor (services/rate_governor.py).
+
+Proves: (1) a bucket grants its burst then throttles until refill, (2) lane
+reserves keep headroom for exits and a queued higher lane is served first,
+(3) a provider 429 blocks the bucket for Retry-After via GovernedSession,
+(4) an unreachable Redis backend degrades to local buckets and a slow one
+does not serialize other buckets behind it, (5) the kill switch and job
+lanes, (6) buckets without a documented limit are unmetered until tuned.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from packages.quantum.services.rate_governor import (
+    GovernedSession,
+    RateGovernor,
+    _RedisBuckets,
+    classify_polygon_endpoint,
+    current_lane,
+    rate_lane,
+    rate_lane_for_job,
+)
+
+
+def _bucket_env(monkeypatch, rps, burst, name="TEST_QUOTES"):
+    monkeypatch.setenv(f"RATE_GOVERNOR_{name}_RPS", str(rps))
+    monkeypatch.setenv(f"RATE_GOVERNOR_{name}_BURST", str(burst))
+
+
+def test_burst_then_refill(monkeypatch):
+    _bucket_env(monkeypatch, rps=20, burst=4)
+    gov = RateGovernor()
+
+    with rate_lane("exit"):
+        assert all(gov.acquire("test", "quotes", timeout=0) for _ in range(4))
+        assert gov.acquire("test", "quotes", timeout=0) is False
+        started = time.monotonic()
+        assert gov.acquire("test", "quotes", timeout=1.0)
+    assert 0.02 < time.monotonic() - started < 0.5
+
+    stats = gov.stats()["test:quotes"]
+    assert stats["granted"] == 5 and stats["timeouts"] == 1 and stats["waited"] == 1
+
+
+def test_lane_reserve_and_priority(monkeypatch):
+    _bucket_env(monkeypatch, rps=10, burst=8)
+    gov = RateGovernor()
+
+    # Backfill must leave half the burst; exits can still spend it.
+    granted = 0
+    while gov.acquire("test", "quotes", lane="backfill", timeout=0):
+        granted += 1
+    assert granted == 4
+    assert sum(gov.acquire("test", "quotes", lane="exit", timeout=0) for _ in range(4)) == 4
+
+    order = []
+
+    def wait(lane):
+        if gov.acquire("test", "quotes", lane=lane, timeout=3.0):
+            order.append(lane)
+
+    threads = [threading.Thread(target=wait, args=(lane,)) for lane in ("backfill", "scan", "exit")]
+    for t in threads:
+        t.start()
+        time.sleep(0.01)
+    for t in threads:
+        t.join()
+    assert order == ["exit", "scan", "backfill"]
+
+
+class _StaticAdapter(HTTPAdapter):
+    def __init__(self, status, headers=None):
+        super().__init__()
+        self.status, self.headers, self.urls = status, headers or {}, []
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers.update(self.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def test_governed_session_penalizes_429(monkeypatch):
+    _bucket_env(monkeypatch, rps=100, burst=100, name="POLYGON_QUOTES")
+    gov = RateGovernor()
+    session = GovernedSession("polygon", governor=gov)
+    adapter = _StaticAdapter(429, {"Retry-After": "0.3"})
+    session.mount("https://", adapter)
+
+    assert session.get("https://api.polygon.io/v3/snapshot?ticker.any_of=SPY").status_code == 429
+    assert gov.acquire("polygon", "quotes", lane="exit", timeout=0) is False
+    assert gov.acquire("polygon", "aggs", timeout=0) is True
+    assert gov.stats()["polygon:quotes"]["throttled"] == 1
+    time.sleep(0.35)
+    assert gov.acquire("polygon", "quotes", lane="exit", timeout=0) is True
+
+    assert classify_polygon_endpoint("https://api.polygon.io/v2/aggs/ticker/SPY/range/1/day/a/b") == "aggs"
+    assert classify_polygon_endpoint("https://api.polygon.io/v2/last/nbbo/SPY") == "quotes"
+    assert classify_polygon_endpoint("https://api.polygon.io/vX/reference/financials") == "reference"
+
+
+def test_unreachable_redis_degrades_to_local(monkeypatch):
+    _bucket_env(monkeypatch, rps=10, burst=2)
+    gov = RateGovernor("redis", redis_buckets=_RedisBuckets("redis://127.0.0.1:1"))
+
+    assert gov.acquire("test", "quotes", lane="exit", timeout=0)
+    assert gov.acquire("test", "quotes", lane="exit", timeout=0)
+    assert gov.acquire("test", "quotes", lane="exit", timeout=0) is False
+    assert gov.stats()["test:quotes"]["redis_errors"] == 1
+
+
+def test_slow_redis_round_trip_does_not_hold_the_lock(monkeypatch):
+    _bucket_env(monkeypatch, rps=100, burst=100)
+    _bucket_env(monkeypatch, rps=100, burst=100, name="TEST_AGGS")
+
+    class _SlowRedis:
+        def take(self, key, rate, burst, reserve):
+            if key[1] == "quotes":
+                time.sleep(0.5)
+            return 0.0
+
+    gov = RateGovernor("redis", redis_buckets=_SlowRedis())
+    slow = threading.Thread(target=gov.acquire, args=("test", "quotes"))
+    slow.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    assert gov.acquire("test", "aggs", timeout=0)
+    assert time.monotonic() - started < 0.2
+    slow.join()
+
+
+def test_undocumented_buckets_are_unmetered(monkeypatch):
+    for name in ("POLYGON_QUOTES", "POLYGON_AGGS"):
+        monkeypatch.delenv(f"RATE_GOVERNOR_{name}_RPS", raising=False)
+    gov = RateGovernor()
+    assert all(gov.acquire("polygon", "aggs", lane="backfill", timeout=0) for _ in range(500))
+
+    gov.penalize("polygon", "aggs", retry_after=0.2)
+    assert gov.acquire("polygon", "aggs", timeout=0) is False
+    time.sleep(0.25)
+    assert gov.acquire("polygon", "aggs", timeout=0)
+    assert gov.acquire("alpaca", "trading", timeout=0)  # documented: metered
+
+
+def test_kill_switch_and_job_lanes(monkeypatch):
+    _bucket_env(monkeypatch, rps=1, burst=1)
+    monkeypatch.setenv("RATE_GOVERNOR", "off")
+    gov = RateGovernor()
+    assert all(gov.acquire("test", "quotes", timeout=0) for _ in range(10))
+    assert gov.stats() == {}
+
+    assert rate_lane_for_job("paper_exit_evaluate") == "exit"
+    assert rate_lane_for_job("iv_historical_backfill") == "backfill"
+    assert rate_lane_for_job("midday_scan") == "scan"
+    with rate_lane("risk"):
+        assert current_lane() == "risk"
+        with rate_lane("bogus"):
+            assert current_lane() == "risk"
+    assert current_lane() == "scan"
@@ -0,0 +1,153 @@
+"""Staged scan pipeline (services/scan_pipeline.py).
+
+Proves: (1) the pipelined scan produces the same candidates and rejection
+counts as the legacy single-pool path, (2) chain prefetch uses exactly the
+arguments process_symbol uses (so the evaluator's call is a cache hit),
+(3) per-provider concurrency is bounded regardless of pool size.
+"""
+
+import threading
+import time
+import types
+
+from packages.quantum import options_scanner
+from packages.quantum.analytics.regime_engine_v3 import RegimeState
+from packages.quantum.services.scan_pipeline import (
+    ProviderLimiter,
+    prefetch_sector_map,
+    spot_for_chain,
+)
+
+
+class _FakeTruthLayer:
+    chain_calls = []
+    _lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def normalize_symbol(self, s):
+        return s
+
+    def snapshot_many(self, symbols):
+        out = {}
+        for s in symbols:
+            if s == "NOQ":
+                continue
+            out[s] = {"quote": {"bid": 99.0, "ask": 101.0, "last": 100.0, "mid": 100.0}}
+        return out
+
+    def daily_bars(self, symbol, start, end):
+        if symbol == "SHORT":
+            return [{"close": 100.0}] * 10
+        return [{"close": 100.0 + i} for i in range(60)]
+
+    def option_chain(self, symbol, **kwargs):
+        with self._lock:
+            self.chain_calls.append((symbol, tuple(sorted(kwargs.items()))))
+        return []
+
+
+class _FakePolygon:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_recent_quote(self, symbol):
+        return {}
+
+    def get_historical_prices(self, symbol, days=90):
+        return {"prices": []}
+
+    def get_option_chain(self, symbol, **kwargs):
+        return []
+
+    def get_ticker_details(self, symbol):
+        return {"sic_description": f"sector-{symbol}"}
+
+
+class _FakeRegimeEngine:
+    def __init__(self, *args, **kwargs):
+        self.iv_repo = None
+
+    def compute_symbol_snapshot(self, symbol, global_snapshot, existing_bars=None, iv_context=None):
+        return types.SimpleNamespace(iv_rank=45.0)
+
+    def get_effective_regime(self, symbol_snapshot, global_snapshot):
+        return RegimeState.NORMAL
+
+
+class _FakeEarningsService:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_earnings_map(self, symbols):
+        return {}
+
+
+SYMBOLS = ["SPY", "QQQ", "IWM", "NOQ", "SHORT"]
+
+
+def _run_scan(monkeypatch, pipeline: str):
+    monkeypatch.setenv("SCANNER_PIPELINE_ENABLED", pipeline)
+    monkeypatch.setattr(options_scanner, "MarketDataTruthLayer", _FakeTruthLayer)
+    monkeypatch.setattr(options_scanner, "PolygonService", _FakePolygon)
+    monkeypatch.setattr(options_scanner, "RegimeEngineV3", _FakeRegimeEngine)
+    monkeypatch.setattr(options_scanner, "EarningsCalendarService", _FakeEarningsService)
+    _FakeTruthLayer.chain_calls = []
+
+    candidates, rej_stats = options_scanner.scan_for_opportunities(
+        symbols=list(SYMBOLS),
+        supabase_client=None,
+        global_snapshot=types.SimpleNamespace(state=RegimeState.NORMAL),
+    )
+    return candidates, rej_stats.to_dict(), list(_FakeTruthLayer.chain_calls)
+
+
+def test_pipeline_matches_legacy_path(monkeypatch):
+    legacy_cands, legacy_stats, legacy_chain_calls = _run_scan(monkeypatch, "0")
+    piped_cands, piped_stats, piped_chain_calls = _run_scan(monkeypatch, "1")
+
+    assert piped_cands == legacy_cands
+    assert piped_stats["rejection_counts"] == legacy_stats["rejection_counts"]
+    assert piped_stats["symbols_processed"] == legacy_stats["symbols_processed"]
+
+    # Every chain the evaluator asked for was prefetched with identical
+    # arguments; symbols that never reach the chain step were not.
+    assert set(piped_chain_calls) == set(legacy_chain_calls)
+    assert {c[0] for c in piped_chain_calls} == {"SPY", "QQQ", "IWM"}
+
+
+def test_spot_for_chain_mirrors_process_symbol():
+    assert spot_for_chain(None) == (False, None)
+    assert spot_for_chain({"quote": {"last": 10.0, "bid": 9.0}}) == (True, 10.0)
+    assert spot_for_chain({"quote": {"mid": 10.5, "bid": 9.0}}) == (True, 10.5)
+    # Only bid/ask: price derived for viability, bid passed as spot.
+    assert spot_for_chain({"quote": {"bid": 9.0, "ask": 11.0}}) == (True, 9.0)
+    # No usable quote -> process_symbol falls back to PolygonService.
+    assert spot_for_chain({"quote": {"bid": 0, "ask": 11.0}}) == (False, None)
+
+
+def test_sector_prefetch_bounded_per_provider_and_ordered():
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    class _SlowDetails:
+        def get_ticker_details(self, sym):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.01)
+            with lock:
+                in_flight["now"] -= 1
+            if sym == "BAD":
+                raise RuntimeError("boom")
+            return None if sym == "NONE" else {"sector": f"s-{sym}"}
+
+    symbols = [f"S{i}" for i in range(20)] + ["BAD", "NONE"]
+    sector_map = prefetch_sector_map(
+        _SlowDetails(), symbols, ProviderLimiter({"polygon": 3}), max_workers=16
+    )
+
+    assert in_flight["max"] <= 3
+    assert list(sector_map) == [f"S{i}" for i in range(20)]
+    assert sector_map["S7"] == "s-S7"
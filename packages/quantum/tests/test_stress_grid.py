@@ -0,0 +1,172 @@
+"""Full-revaluation stress grid (risk/stress_grid.py).
+
+Proves: (1) every grid cell equals a scalar Black-Scholes revaluation of the
+legs (including decay steps past expiry, which take intrinsic), (2) the
+surface is zero at the unshocked cell and non-linear in spot for a short
+condor, (3) missing spot / leg IV is typed unavailable and withholds the book
+surface, (4) deduplicated contracts still give every position its own
+surface, (5) check_all_envelopes attaches the observe-only digest, and the
+monitor feeds the inputs from its snapshot batch.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from packages.quantum.jobs.handlers.intraday_risk_monitor import IntradayRiskMonitor
+from packages.quantum.risk.risk_envelope import (
+    EnvelopeConfig,
+    check_all_envelopes,
+    stress_grid_inputs,
+)
+from packages.quantum.risk.stress_grid import StressGridConfig, compute_stress_grid
+from packages.quantum.services.bs_inversion import bs_call_price
+from packages.quantum.services.cache_key_builder import normalize_symbol
+
+AS_OF = date(2026, 11, 16)
+
+
+def _occ(right, strike, expiry="261218"):
+    return f"SPY{expiry}{right}{int(round(strike * 1000)):08d}"
+
+
+def _condor(pid="c1", spot=500.0, expiry="261218", offset=0.0, quantity=-1):
+    legs = [
+        ("P", spot - 30 - offset, "sell", 0.22),
+        ("P", spot - 35 - offset, "buy", 0.24),
+        ("C", spot + 30 + offset, "sell", 0.16),
+        ("C", spot + 35 + offset, "buy", 0.15),
+    ]
+    return {
+        "id": pid,
+        "quantity": quantity,
+        "avg_entry_price": 1.50,
+        "underlying_price": spot,
+        "legs": [
+            {"symbol": _occ(right, k, expiry), "action": action, "quantity": abs(quantity), "iv": iv}
+            for right, k, action, iv in legs
+        ],
+    }
+
+
+def _grid(positions, equity=100_000, config=None):
+    grid_positions, unavailable = stress_grid_inputs(positions, as_of=AS_OF)
+    return compute_stress_grid(grid_positions, equity, config or StressGridConfig(), unavailable)
+
+
+def _scalar_value(right, strike, spot, years, sigma):
+    if years <= 0:
+        return max(spot - strike, 0.0) if right == "C" else max(strike - spot, 0.0)
+    call = bs_call_price(spot, strike, years, 0.0, 0.0, sigma)
+    return call if right == "C" else call - spot + strike
+
+
+def _scalar_pnl(pos, grid, i, j, k, days_to_expiry):
+    total = 0.0
+    for leg in pos["legs"]:
+        sym = leg["symbol"]
+        right, strike = sym[9], int(sym[10:]) / 1000.0
+        sign = -1 if leg["action"] == "sell" else 1
+        t0 = days_to_expiry / 365.0
+        spot = pos["underlying_price"] * (1 + grid.spot_shifts[i])
+        sigma = max(leg["iv"] + grid.vol_shifts[j], 0.01)
+        years = t0 - grid.decay_days[k] / 365.0
+        base = _scalar_value(right, strike, pos["underlying_price"], t0, leg["iv"])
+        total += sign * 100 * (_scalar_value(right, strike, spot, years, sigma) - base)
+    return total
+
+
+def test_grid_matches_scalar_revaluation_including_expiry():
+    # Expires in 3 days: the 5- and 10-day decay steps are past expiry.
+    pos = _condor(expiry="261119")
+    grid = _grid([pos])
+
+    assert grid.book_pnl.shape == (41, 21, 5)
+    for i in range(0, 41, 4):
+        for j in range(0, 21, 5):
+            for k in range(5):
+                assert grid.book_pnl[i, j, k] == pytest.approx(
+                    _scalar_pnl(pos, grid, i, j, k, 3), abs=1e-6
+                )
+
+
+def test_short_condor_surface_is_centered_and_nonlinear():
+    grid = _grid([_condor()])
+    s0 = int(np.flatnonzero(grid.spot_shifts == 0)[0])
+    v0 = int(np.flatnonzero(grid.vol_shifts == 0)[0])
+
+    assert grid.book_pnl[s0, v0, 0] == pytest.approx(0.0, abs=1e-9)
+    # Theta: a short condor gains as days pass at unchanged spot/vol.
+    assert grid.book_pnl[s0, v0, -1] > 0
+    # Non-linear: the loss accelerates through the short strike (-6%) and
+    # saturates at the long wing, never past the 5-wide spread's $500.
+    pnl = lambda shift: grid.book_pnl[int(np.flatnonzero(np.isclose(grid.spot_shifts, shift))[0]), v0, 0]
+    assert pnl(-0.20) < pnl(-0.10) < pnl(-0.04) < 0
+    assert abs(pnl(-0.20) - pnl(-0.18)) < abs(pnl(-0.08) - pnl(-0.06))
+    assert pnl(-0.20) > -500.0
+
+    worst = grid.worst_cells()
+    assert len(worst) == 5
+    assert worst[0]["pnl"] == pytest.approx(float(grid.book_pnl.min()), abs=0.01)
+    assert [c["pnl"] for c in worst] == sorted(c["pnl"] for c in worst)
+
+
+def test_missing_inputs_are_typed_unavailable():
+    no_spot = _condor("no_spot")
+    no_spot.pop("underlying_price")
+    no_iv = _condor("no_iv")
+    no_iv["legs"][2].pop("iv")
+
+    grid = _grid([_condor("ok"), no_spot, no_iv], equity=50_000)
+
+    assert grid.position_ids == ["ok"]
+    assert grid.book_pnl is None
+    assert grid.unavailable["no_spot"]["reason"] == "spot_missing"
+    assert grid.unavailable["no_iv"] == {"reason": "iv_missing", "missing_field": "iv", "legs_missing": 1}
+    summary = grid.summary()
+    assert summary["available"] is False and summary["worst_cells"] == []
+    assert set(summary["position_worst"]) == {"ok"}
+
+
+def test_shared_contracts_priced_once_but_attributed_per_position():
+    a, b = _condor("a"), _condor("b", quantity=-2)
+    other = _condor("c", offset=10.0)
+    grid = _grid([a, b, other])
+    solo = _grid([a])
+
+    np.testing.assert_allclose(grid.position_pnl[0], solo.book_pnl, atol=1e-9)
+    np.testing.assert_allclose(grid.position_pnl[1], 2 * solo.book_pnl, atol=1e-9)
+    np.testing.assert_allclose(grid.book_pnl, grid.position_pnl.sum(axis=0), atol=1e-9)
+
+
+def test_check_all_envelopes_attaches_observe_only_digest(monkeypatch):
+    positions = [_condor("a"), _condor("b", offset=5.0)]
+    result = check_all_envelopes(positions, equity=100_000, config=EnvelopeConfig())
+
+    assert result.stress_grid["available"] is True
+    assert result.stress_grid["positions_priced"] == 2
+    assert "stress_grid" in result.to_dict()
+    assert all(v.envelope != "stress_grid" for v in result.violations)
+
+    monkeypatch.setenv("RISK_STRESS_GRID", "0")
+    off = check_all_envelopes(positions, equity=100_000, config=EnvelopeConfig())
+    assert off.stress_grid == {}
+    assert off.stress_results == result.stress_results
+
+
+def test_monitor_annotates_grid_inputs_from_snapshot_batch():
+    pos = _condor()
+    pos.pop("underlying_price")
+    for leg in pos["legs"]:
+        leg.pop("iv")
+    snapshots = {"SPY": {"quote": {"bid": 499.9, "ask": 500.1, "mid": 500.0}}}
+    for leg in pos["legs"][:3]:
+        snapshots[normalize_symbol(leg["symbol"])] = {"quote": {"bid": 1.0, "ask": 1.1}, "iv": 0.2}
+
+    underlyings = IntradayRiskMonitor._stress_underlyings([pos])
+    IntradayRiskMonitor._annotate_stress_inputs([pos], snapshots, underlyings)
+
+    assert underlyings == {id(pos): "SPY"}
+    assert pos["underlying_price"] == pytest.approx(500.0)
+    assert [leg.get("iv") for leg in pos["legs"]] == [0.2, 0.2, 0.2, None]
@@ -9,6 +9,8 @@ Tests:
 - Lineage signing
 """
 
+import random
+
 import pytest
 from datetime import datetime, timezone, timedelta
 
@@ -31,6 +33,8 @@ from packages.quantum.services.surface_geometry_v4 import (
     compute_log_moneyness,
     svi_total_variance,
     fit_svi,
+    _fit_svi_python,
+    _fit_svi_vectorized,
     find_atm_iv,
     SURFACE_VERSION,
 )
@@ -228,6 +232,30 @@ class TestFitSVI:
         params = fit_svi([0.0, 0.1], [0.01, 0.011], "TEST", "2024-01-01")
         assert params is None
 
+    def test_vectorized_fit_matches_python_reference_exactly(self):
+        """Vectorized path reproduces the seeded coordinate descent bit-for-bit."""
+        rng = random.Random(7)
+        for case in range(25):
+            n = rng.randint(3, 80)
+            k_obs = sorted(rng.uniform(-0.5, 0.5) for _ in range(n))
+            a, b = 0.02 + 0.05 * rng.random(), 0.1 + 0.3 * rng.random()
+            rho, m, sig = rng.uniform(-0.7, 0.3), rng.uniform(-0.1, 0.1), 0.05 + 0.3 * rng.random()
+            w_obs = [
+                svi_total_variance(k, a, b, rho, m, sig) + rng.gauss(0, 0.002)
+                for k in k_obs
+            ]
+            expected = _fit_svi_python(k_obs, w_obs, "TEST", f"exp{case}")
+            actual = _fit_svi_vectorized(k_obs, w_obs, "TEST", f"exp{case}")
+            assert actual == expected
+
+    def test_python_fallback_switch(self, monkeypatch):
+        k_obs = [-0.2, -0.1, 0.0, 0.1, 0.2]
+        w_obs = [0.005, 0.004, 0.0033, 0.004, 0.005]
+        monkeypatch.setenv("SVI_FIT_VECTORIZED", "0")
+        legacy = fit_svi(k_obs, w_obs, "TEST", "2024-01-01")
+        monkeypatch.delenv("SVI_FIT_VECTORIZED")
+        assert fit_svi(k_obs, w_obs, "TEST", "2024-01-01") == legacy
+
 
 # =============================================================================
 # Unit Tests - Butterfly Arbitrage (w(k) convexity)
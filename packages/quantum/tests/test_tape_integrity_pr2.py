@@ -20,7 +20,7 @@ import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
 
-from packages.quantum.services.replay.blob_store import BlobStore, _decode_bytea
+from packages.quantum.services.replay.blob_store import BlobStore, _decode_bytea, compress_blob
 from packages.quantum.services.replay.decision_context import DecisionContext
 
 
@@ -159,6 +159,60 @@ class TestBlobBoundaryRoundTrip(unittest.TestCase):
         self.assertEqual(store.commit(_JSONBoundaryClient()), 0)
         self.assertEqual(store.unpersisted_of([blob_hash]), [blob_hash])
 
+    def test_persisted_blob_is_hashed_not_recompressed(self):
+        store = BlobStore()
+        obj = {"chain": [{"strike": 500.0 + i, "iv": 0.2} for i in range(50)]}
+        target = "packages.quantum.services.replay.blob_store.compress_blob"
+        with patch(target, wraps=compress_blob) as spy:
+            first_hash, compressed, _ = store.put(obj)
+            staged_hash, staged, _ = store.put(obj)
+            store.commit(_JSONBoundaryClient())
+            again_hash, again, size = store.put(obj)
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(first_hash, staged_hash)
+        self.assertEqual(first_hash, again_hash)
+        self.assertEqual(staged, compressed)
+        self.assertEqual(again, b"")
+        self.assertGreater(size, 0)
+        self.assertEqual(store.get_pending_hashes(), [])
+
+    def test_codec_recorded_and_read_back(self):
+        obj = {"a": 1, "b": [1.5, 2]}
+        with patch.dict(os.environ, {"REPLAY_BLOB_COMPRESSION": "gzip",
+                                     "REPLAY_GZIP_LEVEL": "1"}):
+            store = BlobStore()
+            blob_hash, _, _ = store.put(obj)
+            client = _JSONBoundaryClient()
+            store.commit(client)
+
+        row = client.writes["data_blobs"][0][1][0]
+        self.assertEqual(row["compression"], "gzip")
+
+        class _GetClient:
+            def table(self, name):
+                class _Q:
+                    def select(self, *_a):
+                        return self
+
+                    def eq(self, *_a):
+                        return self
+
+                    def single(self):
+                        return self
+
+                    def execute(self):
+                        return _Result({"payload": row["payload"],
+                                        "compression": row["compression"]})
+                return _Q()
+
+        self.assertEqual(BlobStore().get(_GetClient(), blob_hash),
+                         {"a": 1, "b": ["1.500000", 2]})
+
+    def test_unknown_codec_rejected(self):
+        with self.assertRaises(ValueError):
+            BlobStore().put({"a": 1}, compression="lz4")
+
 
 # ---------------------------------------------------------------------------
 # Atomicity gate: origin-injected blob failure -> typed capture_partial
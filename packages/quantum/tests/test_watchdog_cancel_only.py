@@ -83,9 +83,10 @@ def _mock_supabase(
                     ):
                         raise fail_update_exc
                     updates.append((name, payload))
-                    return MagicMock()
+                    return MagicMock(data=[{**order, **payload}])
 
-                up.eq.return_value.execute.side_effect = commit_update
+                up.eq.return_value = up
+                up.execute.side_effect = commit_update
                 return up
 
             chain.update.side_effect = capture_update
@@ -35,10 +35,10 @@ def _load_orchestrator_source() -> str:
         return f.read()
 
 
-def _function_block(src: str, fn_name: str, max_chars: int = 8000) -> str:
+def _function_block(src: str, fn_name: str, max_chars: int = 8500) -> str:
     """Return a window starting at the function definition.
 
-    The default 8000-char window comfortably covers both run_morning_cycle
+    The default 8500-char window comfortably covers both run_morning_cycle
     and run_midday_cycle through their post-positions-fetch
     initialization. The midday cycle has ~4000 chars of preamble (parallel
     reads, regime/progression setup) before the concurrency gate; the
@@ -21,9 +21,12 @@ report, so an operator reads ONE artifact instead of four ad-hoc query sets:
 WHY A LIVE PAGINATED READER (mirrors ``single_leg_shadow_report`` +
 ``monday_evidence_reader`` conventions):
   - Service-role Supabase client; SELECTs only. Every evidence query PAGINATES
-    explicitly (``.range()`` offset loop) with a hard row cap and TYPED
-    truncation accounting, so no PostgREST default row ceiling can silently
-    truncate a distribution.
+    explicitly (keyset cursor on the spec's unique order tuple, or the legacy
+    ``.range()`` offset loop) with a hard row cap and TYPED truncation
+    accounting, so no PostgREST default row ceiling can silently truncate a
+    distribution. ``--snapshot-cache`` keeps the append-only decisions sink
+    (``fleet_policy_decisions``, UPDATE/DELETE blocked by trigger) in a local
+    sqlite snapshot so a nightly run only fetches rows it has not seen.
   - The three lane tables are built by sibling lanes TONIGHT and may not exist
     yet. A missing relation is classified (``to_regclass``-equivalent, from the
     PostgREST/Postgres "relation absent" signatures) as a TYPED ``UNAVAILABLE``
@@ -86,6 +89,10 @@ MODEL_VERSION = "unified-research-reader/1.0"
 PAGE_SIZE = 1000
 MAX_ROWS = 100_000
 
+# Snapshot re-sync reaches this far behind the cached created_at mark so a row
+# committed late with an earlier created_at is still picked up.
+SNAPSHOT_LOOKBACK_SECONDS = 3600
+
 # ── six-state section vocabulary (EXACTLY these) ────────────────────────────
 ACTUAL = "ACTUAL"
 COUNTERFACTUAL = "COUNTERFACTUAL"
@@ -115,11 +122,17 @@ K_MICRO = "micro_accounts"
 # ── contract table/column/order specs (frozen sibling-lane contracts) ───────
 # Ordering columns are the contract's UNIQUE idempotency tuples so pagination is
 # stable+unique (no page overlap/skip); Python re-sorts for render determinism.
+# ``cursor`` is set only on sinks whose rows never change after insert and that
+# carry a monotonic (created_at, id) key: those partitions may be served from a
+# local snapshot (``--snapshot-cache``) that only fetches rows past its
+# high-water mark. A sink with UPDATE-able rows must leave it unset, or the
+# snapshot keeps each row as first seen.
 @dataclass(frozen=True)
 class TableSpec:
     table: str
     columns: str
     order: Tuple[str, ...]
+    cursor: Tuple[str, ...] = ()
 
 
 TABLE_SPECS: Dict[str, TableSpec] = {
@@ -169,6 +182,9 @@ TABLE_SPECS: Dict[str, TableSpec] = {
                 "counts", "created_at",
             ]
         ),
+        # No ``cursor``: a run's ``status`` / ``counts`` are updated when it
+        # finishes (shadow_fleet_evaluate), so a snapshot would freeze runs
+        # in their starting state. Always read live.
         ("source_decision_id", "shadow_micro_account_id"),
     ),
     K_FLEET_DECISIONS: TableSpec(
@@ -182,6 +198,7 @@ TABLE_SPECS: Dict[str, TableSpec] = {
             ]
         ),
         ("decision_event_id", "shadow_micro_account_id"),
+        ("created_at", "id"),
     ),
     # Pre-existing fleet readiness tables (columns confirmed live).
     K_FLEETS: TableSpec(
@@ -262,6 +279,82 @@ def _rows(response: Any) -> List[Dict[str, Any]]:
     return [dict(r) for r in data] if isinstance(data, list) else []
 
 
+def _paginate_offset(
+    client: Any,
+    spec: TableSpec,
+    filters: Sequence[Tuple[str, Any]],
+    page_size: int,
+    max_rows: int,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    rows: List[Dict[str, Any]] = []
+    offset = 0
+    pages = 0
+    truncated = False
+    while True:
+        query = client.table(spec.table).select(spec.columns)
+        for col, val in filters:
+            query = query.eq(col, val)
+        for col in spec.order:
+            query = query.order(col)
+        query = query.range(offset, offset + page_size - 1)
+        batch = _rows(query.execute())
+        pages += 1
+        rows.extend(batch)
+        if len(batch) < page_size:
+            break  # exhausted the relation
+        offset += page_size
+        if offset >= max_rows:
+            truncated = True  # stopped by cap; more rows likely exist
+            break
+    return rows, pages, truncated
+
+
+def _paginate_keyset(
+    client: Any,
+    spec: TableSpec,
+    filters: Sequence[Tuple[str, Any]],
+    page_size: int,
+    max_rows: int,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """Cursor-paged on ``spec.order``; falls back to the offset loop when a
+    cursor column holds NULL (keyset paging would skip those rows)."""
+    from packages.quantum.services.keyset_reader import KeysetCursorError, KeysetPager
+
+    pager = KeysetPager(
+        client, spec.table, spec.columns, spec.order, filters, page_size=page_size,
+    )
+    rows: List[Dict[str, Any]] = []
+    try:
+        for row in pager:
+            rows.append(row)
+            if len(rows) >= max_rows:
+                return rows, pager.pages, True  # stopped by cap
+    except KeysetCursorError:
+        return _paginate_offset(client, spec, filters, page_size, max_rows)
+    return rows, pager.pages, False
+
+
+def _read_snapshot(
+    client: Any,
+    spec: TableSpec,
+    filters: Sequence[Tuple[str, Any]],
+    page_size: int,
+    max_rows: int,
+    snapshot: Any,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """Top up the local snapshot past its high-water mark, then read the whole
+    cached partition (re-sorted by ``spec.order`` like a live page walk)."""
+    info = snapshot.sync(
+        client, spec.table, spec.columns, spec.cursor, filters,
+        page_size=page_size, lookback_seconds=SNAPSHOT_LOOKBACK_SECONDS,
+    )
+    rows = sorted(
+        snapshot.cached_rows(info["partition"]),
+        key=lambda r: tuple((r.get(c) is None, str(r.get(c) or "")) for c in spec.order),
+    )
+    return rows, info["pages"], False
+
+
 def paginate(
     client: Any,
     spec: TableSpec,
@@ -269,36 +362,36 @@ def paginate(
     *,
     page_size: int = PAGE_SIZE,
     max_rows: int = MAX_ROWS,
+    keyset: bool = False,
+    snapshot: Any = None,
 ) -> FetchResult:
-    """Fully page a table via ``.range()`` with a hard cap.
+    """Fully page a table with a hard cap.
 
     Pages while batches are full; stops on a short batch (genuinely exhausted,
-    ``truncated=False``) OR when ``offset`` reaches ``max_rows`` (``truncated=
-    True`` — a lower bound, MORE rows likely exist). A missing relation returns
+    ``truncated=False``) OR when ``max_rows`` is reached (``truncated=True`` —
+    a lower bound, MORE rows likely exist). A missing relation returns
     ``status='table_absent'``; any other error ``status='failed'`` — never a
     silent empty list.
+
+    Default is the ``.range()`` offset loop. ``keyset=True`` pages by a cursor
+    on ``spec.order`` instead (one index seek per page, see
+    ``services/keyset_reader``). A ``snapshot`` (``SnapshotCache``) serves
+    specs with a ``cursor`` from the local cache, fetching only new rows.
     """
-    rows: List[Dict[str, Any]] = []
-    offset = 0
     pages = 0
-    truncated = False
     try:
-        while True:
-            query = client.table(spec.table).select(spec.columns)
-            for col, val in filters:
-                query = query.eq(col, val)
-            for col in spec.order:
-                query = query.order(col)
-            query = query.range(offset, offset + page_size - 1)
-            batch = _rows(query.execute())
-            pages += 1
-            rows.extend(batch)
-            if len(batch) < page_size:
-                break  # exhausted the relation
-            offset += page_size
-            if offset >= max_rows:
-                truncated = True  # stopped by cap; more rows likely exist
-                break
+        if snapshot is not None and spec.cursor:
+            rows, pages, truncated = _read_snapshot(
+                client, spec, filters, page_size, max_rows, snapshot,
+            )
+        elif keyset:
+            rows, pages, truncated = _paginate_keyset(
+                client, spec, filters, page_size, max_rows,
+            )
+        else:
+            rows, pages, truncated = _paginate_offset(
+                client, spec, filters, page_size, max_rows,
+            )
         if len(rows) > max_rows:
             rows = rows[:max_rows]
             truncated = True
@@ -316,6 +409,8 @@ def fetch_all(
     decision_id: Optional[str] = None,
     page_size: int = PAGE_SIZE,
     max_rows: int = MAX_ROWS,
+    keyset: bool = False,
+    snapshot: Any = None,
 ) -> Dict[str, FetchResult]:
     """Fetch every sink independently (paginated). Impure; each sink's typed
     status is preserved so a downstream section abstains precisely.
@@ -324,6 +419,8 @@ def fetch_all(
     ``decision_id`` filters Lane B ``regime.cycle_id`` and Lane C
     ``fleet_runs.source_decision_id`` (fleet_decisions is post-filtered by run
     membership in ``build_report`` when scoped).
+
+    ``keyset`` / ``snapshot`` select the paging mode (see ``paginate``).
     """
     scan_filters: List[Tuple[str, Any]] = []
     if cycle_date:
@@ -346,6 +443,7 @@ def fetch_all(
         key: paginate(
             client, TABLE_SPECS[key], filters,
             page_size=page_size, max_rows=max_rows,
+            keyset=keyset, snapshot=snapshot,
         )
         for key, filters in plan.items()
     }
@@ -1084,6 +1182,12 @@ def main(argv: Optional[List[str]] = None) -> int:
                     help=f"pagination page size (default {PAGE_SIZE})")
     ap.add_argument("--max-rows", type=int, default=MAX_ROWS,
                     help=f"hard row cap per query (default {MAX_ROWS})")
+    ap.add_argument("--pagination", choices=("keyset", "offset"), default="keyset",
+                    help="keyset (cursor, default) or legacy .range() offset paging")
+    ap.add_argument("--snapshot-cache",
+                    help="local sqlite snapshot file; append-only sinks (fleet "
+                         "decisions) are then read from it and only rows past "
+                         "its high-water mark are fetched")
     args = ap.parse_args(argv)
 
     try:
@@ -1103,13 +1207,24 @@ def main(argv: Optional[List[str]] = None) -> int:
     from supabase import create_client
 
     client = create_client(url, key)
-    fetched = fetch_all(
-        client,
-        cycle_date=args.cycle_date,
-        decision_id=args.decision_id,
-        page_size=args.page_size,
-        max_rows=args.max_rows,
-    )
+    snapshot = None
+    if args.snapshot_cache:
+        from packages.quantum.services.keyset_reader import SnapshotCache
+
+        snapshot = SnapshotCache(args.snapshot_cache)
+    try:
+        fetched = fetch_all(
+            client,
+            cycle_date=args.cycle_date,
+            decision_id=args.decision_id,
+            page_size=args.page_size,
+            max_rows=args.max_rows,
+            keyset=args.pagination == "keyset",
+            snapshot=snapshot,
+        )
+    finally:
+        if snapshot is not None:
+            snapshot.close()
     report = build_report(
         fetched,
         generated_at=_now_iso(),
@@ -0,0 +1,50 @@
+-- Class-scoped claims for the multi-slot DB-queue worker (jobs/worker_pool.py).
+--
+-- claim_job_run(p_worker_id) always returns the oldest runnable row, so a
+-- worker whose "exit" slots are free but whose "long" slot is busy could only
+-- claim the next backfill and hold it locally — head-of-line blocking the
+-- slot worker exists to remove. claim_job_run_filtered restricts the pick to
+-- a job_name set (p_job_names) or to everything outside one (p_exclude_job_names),
+-- so each class claims only while it has a free slot.
+--
+-- ADDITIVE-ONLY: claim_job_run is unchanged and remains what the serial
+-- worker calls. Same ordering, locking and attempt accounting.
+
+CREATE OR REPLACE FUNCTION public.claim_job_run_filtered(
+    p_worker_id text,
+    p_job_names text[] DEFAULT NULL,
+    p_exclude_job_names text[] DEFAULT NULL
+)
+RETURNS SETOF public.job_runs
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_job_id uuid;
+BEGIN
+    SELECT id INTO v_job_id
+    FROM public.job_runs
+    WHERE status IN ('queued', 'failed_retryable')
+      AND (run_after IS NULL OR run_after <= now())
+      AND attempt < max_attempts
+      AND (p_job_names IS NULL OR job_name = ANY (p_job_names))
+      AND (p_exclude_job_names IS NULL OR NOT (job_name = ANY (p_exclude_job_names)))
+    ORDER BY scheduled_for ASC, created_at ASC
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED;
+
+    IF v_job_id IS NOT NULL THEN
+        RETURN QUERY
+        UPDATE public.job_runs
+        SET status = 'running',
+            locked_by = p_worker_id,
+            locked_at = now(),
+            started_at = COALESCE(started_at, now()),
+            attempt = attempt + 1
+        WHERE id = v_job_id
+        RETURNING *;
+    ELSE
+        RETURN;
+    END IF;
+END;
+$$;